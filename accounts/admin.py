@@ -4,7 +4,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-from .models import User, CandidateProfile, ClientProfile, RecruiterProfile, Task
+from .models import User, CandidateProfile, ClientProfile, RecruiterProfile, Task, OutboxEmail, PhotoTask
 from .forms import AdminUserCreationForm, AdminUserChangeForm, CandidateProfileForm, ClientProfileForm, \
     RecruiterProfileForm, TaskForm
 
@@ -23,12 +23,14 @@ Imports explanation:
 4. from django.core.exceptions import ValidationError
    - ValidationError: Wyjątek podnoszony, gdy dane nie przechodzą walidacji. Używany do sygnalizowania błędów walidacji w formularzach i modelach.
 
-5. from .models import User, CandidateProfile, ClientProfile, RecruiterProfile, Task
+5. from .models import User, CandidateProfile, ClientProfile, RecruiterProfile, Task, OutboxEmail, PhotoTask
    - User: Model reprezentujący użytkownika w systemie.
    - CandidateProfile: Model reprezentujący profil kandydata.
    - ClientProfile: Model reprezentujący profil klienta.
    - RecruiterProfile: Model reprezentujący profil rekrutera.
    - Task: Model reprezentujący zadanie.
+   - OutboxEmail: Model reprezentujący wiadomość e-mail oczekującą na wysłanie.
+   - PhotoTask: Model reprezentujący zdjęcie profilowe oczekujące na przetworzenie.
 
 6. from .forms import AdminUserCreationForm, AdminUserChangeForm, CandidateProfileForm, ClientProfileForm, RecruiterProfileForm, TaskForm
    - AdminUserCreationForm: Formularz tworzenia użytkownika przez administratora.
@@ -141,9 +143,35 @@ class TaskAdmin(admin.ModelAdmin):
     form = TaskForm
 
 
+class OutboxEmailAdmin(admin.ModelAdmin):
+    """
+    Panel administracyjny dla kolejki wiadomości e-mail.
+
+    Umożliwia podgląd wysłanych i nieudanych wiadomości oraz błędów wysyłki.
+    """
+    list_display = ('subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at')
+    search_fields = ('subject', 'last_error')
+    list_filter = ('status',)
+    ordering = ('-created_at',)
+
+
+class PhotoTaskAdmin(admin.ModelAdmin):
+    """
+    Panel administracyjny dla kolejki zdjęć profilowych.
+
+    Umożliwia podgląd przetworzonych i nieudanych zdjęć oraz błędów przetwarzania.
+    """
+    list_display = ('name', 'status', 'attempts', 'next_attempt_at', 'created_at', 'processed_at')
+    search_fields = ('name', 'last_error')
+    list_filter = ('status',)
+    ordering = ('-created_at',)
+
+
 # Rejestracja modeli w panelu administracyjnym
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(CandidateProfile, CandidateProfileAdmin)
 admin.site.register(ClientProfile, ClientProfileAdmin)
 admin.site.register(RecruiterProfile, RecruiterProfileAdmin)
 admin.site.register(Task, TaskAdmin)
+admin.site.register(OutboxEmail, OutboxEmailAdmin)
+admin.site.register(PhotoTask, PhotoTaskAdmin)
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_save, post_save
 
 
 class Accounts1Config(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        from accounts.photos import PROFILE_MODELS, mark_uploaded_photo, enqueue_uploaded_photo
+
+        # Nowo przesłane zdjęcia profilowe trafiają do kolejki przetwarzania (miniatury, usunięcie EXIF)
+        for model in PROFILE_MODELS:
+            pre_save.connect(mark_uploaded_photo, sender=model, dispatch_uid=f'photos_mark_{model.__name__}')
+            post_save.connect(enqueue_uploaded_photo, sender=model, dispatch_uid=f'photos_enqueue_{model.__name__}')
@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.photos import backfill_photos, process_photos
+
+
+class Command(BaseCommand):
+    """
+    Komenda przetwarzająca zdjęcia profilowe z kolejki (model PhotoTask): poprawa orientacji, usunięcie EXIF
+    i utworzenie miniatur.
+
+    Użycie:
+        python manage.py process_profile_photos [--batch-size 20]
+        python manage.py process_profile_photos --backfill
+        python manage.py process_profile_photos --watch [--interval 5]
+    """
+    help = 'Przetwarza zdjęcia profilowe z kolejki: poprawia orientację, usuwa EXIF i tworzy miniatury.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Liczba zdjęć przetwarzanych w jednej transakcji (domyślnie PHOTO_QUEUE_BATCH_SIZE).')
+        parser.add_argument('--backfill', action='store_true',
+                            help='Przed przetwarzaniem dodaje do kolejki zdjęcia istniejących profili.')
+        parser.add_argument('--watch', action='store_true',
+                            help='Działa bez końca i co --interval sekund sprawdza kolejkę.')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Odstęp między sprawdzeniami kolejki w trybie --watch (sekundy).')
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            added = backfill_photos()
+            self.stdout.write(f'Dodano do kolejki zdjęcia istniejących profili: {added}.')
+        while True:
+            processed, failed = process_photos(options['batch_size'])
+            if processed or failed or not options['watch']:
+                self.stdout.write(self.style.SUCCESS(f'Przetworzono zdjęcia: {processed}, nieudane próby: {failed}.'))
+            if not options['watch']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.outbox import send_outbox_emails
+
+
+class Command(BaseCommand):
+    """
+    Komenda wysyłająca wiadomości e-mail z kolejki (model OutboxEmail).
+
+    Użycie:
+        python manage.py send_outbox_emails [--batch-size 100]
+        python manage.py send_outbox_emails --watch [--interval 5]
+    """
+    help = 'Wysyła zaległe wiadomości e-mail z kolejki partiami przez jedno połączenie SMTP.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Liczba wiadomości wysyłanych przez jedno połączenie (domyślnie '
+                                 'EMAIL_OUTBOX_BATCH_SIZE).')
+        parser.add_argument('--watch', action='store_true',
+                            help='Działa bez końca i co --interval sekund sprawdza kolejkę.')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Odstęp między sprawdzeniami kolejki w trybie --watch (sekundy).')
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_outbox_emails(options['batch_size'])
+            if sent or failed or not options['watch']:
+                self.stdout.write(self.style.SUCCESS(f'Wysłano wiadomości: {sent}, nieudane próby: {failed}.'))
+            if not options['watch']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:35
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Temat')),
+                ('body', models.TextField(verbose_name='Treść')),
+                ('from_email', models.CharField(blank=True, max_length=255, null=True, verbose_name='Nadawca')),
+                ('recipients', models.JSONField(verbose_name='Odbiorcy')),
+                ('status', models.CharField(choices=[('pending', 'Oczekująca'), ('sent', 'Wysłana'), ('failed', 'Nieudana')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Liczba prób')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Następna próba')),
+                ('last_error', models.TextField(blank=True, verbose_name='Ostatni błąd')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Data utworzenia')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Data wysłania')),
+            ],
+            options={
+                'verbose_name': 'wiadomość e-mail w kolejce',
+                'verbose_name_plural': 'wiadomości e-mail w kolejce',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_outboxemail'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_by', 'due_date', 'id'], name='task_created_by_due_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-17 13:12
+
+import kirismor.excerpts
+from django.db import migrations
+from kirismor.excerpts import backfill_excerpts
+
+
+def fill_excerpts(apps, schema_editor):
+    """
+    Uzupełnia skróty istniejących wierszy.
+    """
+    for model_name in ('RecruiterProfile', 'Task'):
+        backfill_excerpts(apps.get_model('accounts', model_name), schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recruiterprofile',
+            name='bio_excerpt',
+            field=kirismor.excerpts.ExcerptField(source='bio'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='excerpt',
+            field=kirismor.excerpts.ExcerptField(source='description'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.4 on 2026-10-17 13:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_excerpts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PhotoTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Plik')),
+                ('status', models.CharField(choices=[('pending', 'Oczekujące'), ('done', 'Przetworzone'), ('failed', 'Nieudane')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Liczba prób')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Następna próba')),
+                ('last_error', models.TextField(blank=True, verbose_name='Ostatni błąd')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Data utworzenia')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Data przetworzenia')),
+            ],
+            options={
+                'verbose_name': 'zdjęcie w kolejce',
+                'verbose_name_plural': 'zdjęcia w kolejce',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='photo_status_next_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.4 on 2026-10-17 13:23
+
+import kirismor.media
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_phototask'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidateprofile',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, upload_to=kirismor.media.HashedUploadTo('profiles/'), verbose_name='Zdjęcie'),
+        ),
+        migrations.AlterField(
+            model_name='clientprofile',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, upload_to=kirismor.media.HashedUploadTo('profiles/'), verbose_name='Zdjęcie'),
+        ),
+        migrations.AlterField(
+            model_name='recruiterprofile',
+            name='photo',
+            field=models.ImageField(blank=True, null=True, upload_to=kirismor.media.HashedUploadTo('profiles/'), verbose_name='Zdjęcie'),
+        ),
+    ]
@@ -2,10 +2,12 @@ from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, Permis
 from django.core.validators import validate_email, MinLengthValidator, RegexValidator
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
-import hashlib
-import time
+from kirismor.tokens import make_token
+from kirismor.excerpts import ExcerptField
+from kirismor.media import HashedUploadTo
 
 
 class MyUserManager(BaseUserManager):
@@ -78,7 +80,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         is_staff (bool): Czy użytkownik jest członkiem personelu.
         is_superuser (bool): Czy użytkownik jest superużytkownikiem.
         is_verified (bool): Czy adres e-mail użytkownika został zweryfikowany.
-        verification_token (str): Token weryfikacyjny adresu e-mail użytkownika.
+        verification_token (str): Token weryfikacyjny adresu e-mail użytkownika (tylko tokeny wysłane przed
+            wprowadzeniem podpisanych tokenów; nowe tokeny nie są zapisywane w bazie danych).
         role (str): Rola użytkownika (kandydat, klient, rekruter).
     """
     email = models.EmailField(verbose_name='adres e-mail', max_length=255, unique=True)
@@ -95,6 +98,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     )
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, verbose_name=_("Rola"))
     objects = MyUserManager()
+    # Zastosowanie podpisanego tokenu weryfikacyjnego (kirismor.tokens)
+    VERIFICATION_TOKEN_PURPOSE = 'verify-email'
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
@@ -129,14 +134,15 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def generate_verification_token(self):
         """
-        Generuje token weryfikacyjny dla adresu e-mail użytkownika.
+        Generuje podpisany token weryfikacyjny dla adresu e-mail użytkownika.
+
+        Token zawiera identyfikator użytkownika i czas utworzenia, więc nie jest zapisywany w bazie danych,
+        a weryfikacja wyszukuje użytkownika po kluczu głównym.
 
         Returns:
             str: Wygenerowany token.
         """
-        timestamp = int(time.time())
-        token_string = f"{self.email}{timestamp}"
-        return hashlib.sha256(token_string.encode('utf-8')).hexdigest()
+        return make_token(self.VERIFICATION_TOKEN_PURPOSE, self.pk)
 
     def change_password(self, new_password):
         """
@@ -177,7 +183,7 @@ class CandidateProfile(models.Model):
     first_name = models.CharField(max_length=100, verbose_name=_("Imię"), validators=[min_length_validator_2])
     last_name = models.CharField(max_length=100, verbose_name=_("Nazwisko"), validators=[min_length_validator_2])
     phone_number = models.CharField(max_length=15, verbose_name=_("Numer telefonu"), validators=[phone_validator])
-    photo = models.ImageField(upload_to='profiles/', blank=True, null=True, verbose_name=_("Zdjęcie"))
+    photo = models.ImageField(upload_to=HashedUploadTo('profiles/'), blank=True, null=True, verbose_name=_("Zdjęcie"))
     location = models.CharField(max_length=100, verbose_name=_("Lokalizacja"))
     bio = models.TextField(verbose_name=_("Biografia"))
     date_of_birth = models.DateField(null=True, verbose_name=_("Data urodzenia"))
@@ -203,7 +209,7 @@ class ClientProfile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True,
                                 related_name='client_profile')
     phone_number = models.CharField(max_length=15, verbose_name=_("Numer telefonu"), validators=[phone_validator])
-    photo = models.ImageField(upload_to='profiles/', blank=True, null=True, verbose_name=_("Zdjęcie"))
+    photo = models.ImageField(upload_to=HashedUploadTo('profiles/'), blank=True, null=True, verbose_name=_("Zdjęcie"))
     location = models.CharField(max_length=100, verbose_name=_("Lokalizacja"))
     bio = models.TextField(verbose_name=_("Biografia"))
     company_name = models.CharField(max_length=100, verbose_name=_("Nazwa firmy"))
@@ -225,15 +231,17 @@ class RecruiterProfile(models.Model):
         photo (ImageField): Zdjęcie rekrutera.
         location (str): Lokalizacja rekrutera.
         bio (str): Biografia rekrutera.
+        bio_excerpt (str): Początek biografii wyświetlany na liście rekruterów (aktualizowany przy zapisie).
     """
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True,
                                 related_name='recruiter_profile')
     first_name = models.CharField(max_length=100, verbose_name=_("Imię"), validators=[min_length_validator_2])
     last_name = models.CharField(max_length=100, verbose_name=_("Nazwisko"), validators=[min_length_validator_2])
     phone_number = models.CharField(max_length=15, verbose_name=_("Numer telefonu"), validators=[phone_validator])
-    photo = models.ImageField(upload_to='profiles/', blank=True, null=True, verbose_name=_("Zdjęcie"))
+    photo = models.ImageField(upload_to=HashedUploadTo('profiles/'), blank=True, null=True, verbose_name=_("Zdjęcie"))
     location = models.CharField(max_length=100, verbose_name=_("Lokalizacja"))
     bio = models.TextField(verbose_name=_("Biografia"))
+    bio_excerpt = ExcerptField(source='bio')
 
     def __str__(self):
         return f"Profil rekrutera: {self.first_name} {self.last_name}"
@@ -250,6 +258,7 @@ class Task(models.Model):
         priority (str): Priorytet zadania (niski, średni, wysoki).
         due_date (date): Termin wykonania zadania.
         status (str): Status zadania (otwarte, w trakcie realizacji, zakończone).
+        excerpt (str): Początek opisu wyświetlany na liście zadań (aktualizowany przy zapisie).
     """
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='created_tasks', on_delete=models.CASCADE,
                                    verbose_name=_('Utworzone przez'))
@@ -268,6 +277,13 @@ class Task(models.Model):
         ('completed', _('Zakończone')),
     ]
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='open', verbose_name=_('Status'))
+    excerpt = ExcerptField(source='description')
+
+    class Meta:
+        indexes = [
+            # Zadania rekrutera (TaskListView) sortowane po terminie wykonania
+            models.Index(fields=['created_by', 'due_date', 'id'], name='task_created_by_due_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -294,3 +310,99 @@ class Task(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class OutboxEmail(models.Model):
+    """
+    Wiadomość e-mail oczekująca na wysłanie (kolejka wiadomości w bazie danych).
+
+    Widoki zapisują wiadomość w tej samej transakcji co zmiany danych i od razu zwracają odpowiedź, a komenda
+    send_outbox_emails wysyła zaległe wiadomości partiami przez jedno połączenie SMTP.
+
+    Attributes:
+        subject (str): Temat wiadomości.
+        body (str): Treść wiadomości.
+        from_email (str): Adres nadawcy.
+        recipients (list): Adresy odbiorców.
+        status (str): Status wiadomości (oczekująca, wysłana, nieudana).
+        attempts (int): Liczba nieudanych prób wysłania.
+        next_attempt_at (datetime): Najwcześniejszy czas kolejnej próby wysłania.
+        last_error (str): Opis ostatniego błędu wysyłki.
+        created_at (datetime): Data dodania wiadomości do kolejki.
+        sent_at (datetime): Data wysłania wiadomości.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _('Oczekująca')),
+        (STATUS_SENT, _('Wysłana')),
+        (STATUS_FAILED, _('Nieudana')),
+    ]
+    subject = models.CharField(max_length=255, verbose_name=_('Temat'))
+    body = models.TextField(verbose_name=_('Treść'))
+    from_email = models.CharField(max_length=255, blank=True, null=True, verbose_name=_('Nadawca'))
+    recipients = models.JSONField(verbose_name=_('Odbiorcy'))
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING,
+                              verbose_name=_('Status'))
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_('Liczba prób'))
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name=_('Następna próba'))
+    last_error = models.TextField(blank=True, verbose_name=_('Ostatni błąd'))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Data utworzenia'))
+    sent_at = models.DateTimeField(blank=True, null=True, verbose_name=_('Data wysłania'))
+
+    class Meta:
+        verbose_name = _('wiadomość e-mail w kolejce')
+        verbose_name_plural = _('wiadomości e-mail w kolejce')
+        indexes = [
+            # Komenda wysyłająca pobiera oczekujące wiadomości, których czas kolejnej próby już minął
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_next_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)}"
+
+
+class PhotoTask(models.Model):
+    """
+    Zdjęcie profilowe oczekujące na przetworzenie (kolejka zadań w bazie danych).
+
+    Zapis profilu z nowym zdjęciem dodaje zadanie do kolejki i od razu zwraca odpowiedź, a komenda
+    process_profile_photos poprawia orientację zdjęcia, usuwa metadane EXIF i tworzy miniatury (accounts.photos).
+
+    Attributes:
+        name (str): Nazwa pliku zdjęcia w magazynie plików (wartość kolumny ImageField).
+        status (str): Status zadania (oczekujące, przetworzone, nieudane).
+        attempts (int): Liczba nieudanych prób przetworzenia.
+        next_attempt_at (datetime): Najwcześniejszy czas kolejnej próby przetworzenia.
+        last_error (str): Opis ostatniego błędu przetwarzania.
+        created_at (datetime): Data dodania zadania do kolejki.
+        processed_at (datetime): Data przetworzenia zdjęcia.
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _('Oczekujące')),
+        (STATUS_DONE, _('Przetworzone')),
+        (STATUS_FAILED, _('Nieudane')),
+    ]
+    name = models.CharField(max_length=255, unique=True, verbose_name=_('Plik'))
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING,
+                              verbose_name=_('Status'))
+    attempts = models.PositiveIntegerField(default=0, verbose_name=_('Liczba prób'))
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name=_('Następna próba'))
+    last_error = models.TextField(blank=True, verbose_name=_('Ostatni błąd'))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Data utworzenia'))
+    processed_at = models.DateTimeField(blank=True, null=True, verbose_name=_('Data przetworzenia'))
+
+    class Meta:
+        verbose_name = _('zdjęcie w kolejce')
+        verbose_name_plural = _('zdjęcia w kolejce')
+        indexes = [
+            # Komenda przetwarzająca pobiera oczekujące zdjęcia, których czas kolejnej próby już minął
+            models.Index(fields=['status', 'next_attempt_at'], name='photo_status_next_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,151 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+from accounts.models import OutboxEmail
+
+"""
+Imports explanation:
+
+1. from datetime import timedelta
+   - Klasa reprezentująca odstęp czasu.
+   - Używana do wyznaczania czasu kolejnej próby wysłania wiadomości.
+
+2. from django.conf import settings
+   - Moduł ustawień Django.
+   - Używany do odczytu ustawień kolejki wiadomości (rozmiar partii, liczba prób, opóźnienie ponowień).
+
+3. from django.core.mail import EmailMessage, get_connection
+   - Klasa wiadomości e-mail i funkcja zwracająca połączenie ze skonfigurowanym backendem poczty.
+   - Używane do wysyłania całej partii wiadomości przez jedno połączenie SMTP.
+
+4. from django.db import transaction
+   - Moduł transakcji Django.
+   - Używany do pobierania partii wiadomości z blokadą wierszy (SELECT ... FOR UPDATE SKIP LOCKED).
+
+5. from django.utils import timezone
+   - Moduł obsługi stref czasowych Django.
+   - Używany do pobierania bieżącego czasu.
+
+6. from accounts.models import OutboxEmail
+   - Model wiadomości e-mail oczekującej na wysłanie.
+"""
+
+
+def enqueue_email(subject, message, from_email, recipient_list):
+    """
+    Dodaje wiadomość e-mail do kolejki zamiast wysyłać ją podczas obsługi żądania.
+
+    Wiadomość jest zapisywana w bieżącej transakcji, więc trafia do kolejki tylko wtedy, gdy zmiany danych zostaną
+    zatwierdzone. Wysyłką zajmuje się komenda send_outbox_emails.
+
+    Args:
+        subject (str): Temat wiadomości.
+        message (str): Treść wiadomości.
+        from_email (str): Adres nadawcy.
+        recipient_list (list): Adresy odbiorców.
+
+    Returns:
+        OutboxEmail: Zapisana wiadomość.
+    """
+    return OutboxEmail.objects.create(subject=str(subject), body=str(message), from_email=from_email,
+                                      recipients=list(recipient_list))
+
+
+def retry_delay(attempts):
+    """
+    Zwraca opóźnienie kolejnej próby wysłania: EMAIL_OUTBOX_RETRY_DELAY podwajane po każdej nieudanej próbie.
+
+    Args:
+        attempts (int): Liczba dotychczasowych nieudanych prób.
+
+    Returns:
+        timedelta: Opóźnienie kolejnej próby.
+    """
+    return timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def _mark_failed(email, error, now):
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = OutboxEmail.STATUS_FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+    email.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def send_outbox_batch(batch_size=None):
+    """
+    Wysyła jedną partię oczekujących wiadomości przez jedno połączenie z serwerem poczty.
+
+    - Pobiera wiadomości, których czas kolejnej próby minął, blokując je (SKIP LOCKED), aby kilka równoległych
+      procesów nie wysłało tej samej wiadomości.
+    - Nieudana wiadomość otrzymuje kolejną próbę z wykładniczo rosnącym opóźnieniem, a po
+      EMAIL_OUTBOX_MAX_ATTEMPTS próbach status 'failed'.
+
+    Args:
+        batch_size (int): Maksymalna liczba wiadomości w partii (domyślnie EMAIL_OUTBOX_BATCH_SIZE).
+
+    Returns:
+        tuple: Liczba wysłanych i liczba nieudanych wiadomości.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    sent = failed = 0
+    with transaction.atomic():
+        now = timezone.now()
+        batch = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        if not batch:
+            return sent, failed
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            # Serwer poczty jest niedostępny - cała partia zostanie ponowiona później
+            for email in batch:
+                _mark_failed(email, str(error), now)
+            return sent, len(batch)
+
+        try:
+            for email in batch:
+                message = EmailMessage(email.subject, email.body, email.from_email, email.recipients,
+                                       connection=connection)
+                try:
+                    message.send()
+                except Exception as error:
+                    _mark_failed(email, str(error), now)
+                    failed += 1
+                else:
+                    email.status = OutboxEmail.STATUS_SENT
+                    email.sent_at = timezone.now()
+                    email.save(update_fields=['status', 'sent_at'])
+                    sent += 1
+        finally:
+            connection.close()
+    return sent, failed
+
+
+def send_outbox_emails(batch_size=None):
+    """
+    Wysyła wszystkie wiadomości gotowe do wysłania, partia po partii.
+
+    Args:
+        batch_size (int): Maksymalna liczba wiadomości w partii (domyślnie EMAIL_OUTBOX_BATCH_SIZE).
+
+    Returns:
+        tuple: Łączna liczba wysłanych i nieudanych wiadomości.
+    """
+    total_sent = total_failed = 0
+    while True:
+        sent, failed = send_outbox_batch(batch_size)
+        total_sent += sent
+        total_failed += failed
+        # Nieudane wiadomości mają przesunięty czas kolejnej próby, więc nie wrócą w tym przebiegu
+        if not sent and not failed:
+            return total_sent, total_failed
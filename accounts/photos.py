@@ -0,0 +1,366 @@
+import hashlib
+import io
+import posixpath
+from datetime import timedelta
+from functools import partial
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+from accounts.models import PhotoTask, CandidateProfile, ClientProfile, RecruiterProfile
+from kirismor.media import rehash_name
+
+"""
+Imports explanation:
+
+1. import hashlib
+   - Moduł funkcji skrótu.
+   - Używany do budowy krótkich kluczy pamięci podręcznej z nazwy pliku.
+
+2. import io
+   - Moduł strumieni w pamięci.
+   - Używany do kodowania obrazów przed zapisem w magazynie plików.
+
+3. import posixpath
+   - Operacje na ścieżkach w formacie POSIX (nazwy plików w magazynie plików zawsze używają '/').
+   - Używany do budowy nazw miniatur.
+
+4. from datetime import timedelta
+   - Klasa reprezentująca odstęp czasu.
+   - Używana do wyznaczania czasu kolejnej próby przetworzenia zdjęcia.
+
+5. from functools import partial
+   - Funkcja wiążąca argumenty z funkcją.
+   - Używana do przekazania zadania kolejki do funkcji zapisującej nową nazwę zdjęcia.
+
+6. from django.conf import settings
+   - Moduł ustawień Django.
+   - Używany do odczytu rozmiarów miniatur i ustawień kolejki zdjęć.
+
+7. from django.core.cache import cache
+   - Domyślna pamięć podręczna Django.
+   - Używana do zapamiętania, że miniatury zdjęcia są gotowe.
+
+8. from django.core.files.base import ContentFile
+   - Plik z zawartością w pamięci.
+   - Używany do zapisu zakodowanych obrazów w magazynie plików.
+
+9. from django.core.files.storage import default_storage
+   - Domyślny magazyn plików (MEDIA_ROOT).
+   - Używany do odczytu zdjęć oraz zapisu miniatur.
+
+10. from django.db import transaction
+    - Moduł transakcji Django.
+    - Używany do pobierania partii zdjęć z blokadą wierszy (SELECT ... FOR UPDATE SKIP LOCKED), punktów zapisu
+      dla każdego zdjęcia i usuwania oryginału po zatwierdzeniu transakcji.
+
+11. from django.utils import timezone
+    - Moduł obsługi stref czasowych Django.
+    - Używany do pobierania bieżącego czasu.
+
+12. from PIL import Image, ImageOps
+    - Biblioteka Pillow: odczyt i zapis obrazów oraz operacje na nich.
+    - Używana do poprawy orientacji zdjęć, usuwania metadanych EXIF i tworzenia miniatur.
+
+13. from accounts.models import PhotoTask, CandidateProfile, ClientProfile, RecruiterProfile
+    - PhotoTask: Model zdjęcia oczekującego na przetworzenie.
+    - CandidateProfile, ClientProfile, RecruiterProfile: Modele profili ze zdjęciem (kolumna photo).
+
+14. from kirismor.media import rehash_name
+    - rehash_name: Funkcja zwracająca nazwę pliku z sumą kontrolną nowej zawartości (pliki z sumą kontrolną w nazwie
+      są przechowywane przez przeglądarki bez ponownego sprawdzania).
+"""
+
+# Modele profili, których zdjęcia są przetwarzane
+PROFILE_MODELS = (CandidateProfile, ClientProfile, RecruiterProfile)
+
+# Formaty miniatur: rozszerzenie pliku, format Pillow i typ MIME (WebP dla przeglądarek, które go obsługują)
+THUMBNAIL_FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpg': ('JPEG', 'image/jpeg'),
+}
+
+THUMBNAIL_DIRECTORY = 'thumbnails'
+
+
+def thumbnail_name(name, size, extension):
+    """
+    Zwraca nazwę pliku miniatury zdjęcia, np. 'profiles/anna.png' -> 'thumbnails/profiles/anna-200.webp'.
+
+    Args:
+        name (str): Nazwa pliku zdjęcia w magazynie plików.
+        size (int): Szerokość (i wysokość) miniatury w pikselach.
+        extension (str): Rozszerzenie z THUMBNAIL_FORMATS.
+
+    Returns:
+        str: Nazwa pliku miniatury.
+    """
+    stem = posixpath.splitext(name)[0]
+    return posixpath.join(THUMBNAIL_DIRECTORY, f'{stem}-{size}.{extension}')
+
+
+def _ready_key(name):
+    return 'photos:ready:' + hashlib.md5(name.encode('utf-8')).hexdigest()
+
+
+def thumbnails_ready(name):
+    """
+    Sprawdza, czy miniatury zdjęcia zostały utworzone.
+
+    Wynik pozytywny jest zapamiętywany w pamięci podręcznej, więc strony list nie sprawdzają magazynu plików
+    dla każdego wiersza. Wynik negatywny nie jest zapamiętywany - miniatury pojawiają się po przetworzeniu kolejki.
+    """
+    if not name:
+        return False
+    key = _ready_key(name)
+    if cache.get(key):
+        return True
+    ready = default_storage.exists(thumbnail_name(name, settings.PHOTO_THUMBNAIL_SIZES[-1], 'jpg'))
+    if ready:
+        cache.set(key, True, None)
+    return ready
+
+
+def fallback_size(size):
+    """
+    Zwraca rozmiar miniatury dla przeglądarek bez obsługi srcset: najmniejszą miniaturę wystarczającą
+    dla ekranów o podwójnej gęstości pikseli przy wyświetlanym rozmiarze `size`.
+    """
+    sizes = settings.PHOTO_THUMBNAIL_SIZES
+    return next((candidate for candidate in sizes if candidate >= 2 * int(size)), sizes[-1])
+
+
+def thumbnail_url(size):
+    """
+    Przekształcenie kolumny zdjęcia (kirismor.projection) zwracające adres URL miniatury JPEG dla wyświetlanego
+    rozmiaru `size` lub oryginalnego zdjęcia, jeśli nie zostało jeszcze przetworzone.
+    """
+    def transform(name):
+        if not name:
+            return None
+        if thumbnails_ready(name):
+            name = thumbnail_name(name, fallback_size(size), 'jpg')
+        return default_storage.url(name)
+    return transform
+
+
+def _replace(name, content):
+    # Nadpisuje plik o podanej nazwie (magazyn plików nadaje nową nazwę, jeśli plik już istnieje)
+    if default_storage.exists(name):
+        default_storage.delete(name)
+    return default_storage.save(name, ContentFile(content))
+
+
+def _encode(image, image_format, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def _flatten(image):
+    # JPEG nie obsługuje przezroczystości - przezroczyste tło zastępujemy białym
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def _write_thumbnails(image, name):
+    quality = settings.PHOTO_THUMBNAIL_QUALITY
+    webp_source = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    jpeg_source = _flatten(image)
+    for size in settings.PHOTO_THUMBNAIL_SIZES:
+        for extension, (image_format, _) in THUMBNAIL_FORMATS.items():
+            source = webp_source if image_format == 'WEBP' else jpeg_source
+            thumbnail = ImageOps.fit(source, (size, size), Image.LANCZOS)
+            content = _encode(thumbnail, image_format, quality=quality,
+                              **({'optimize': True, 'progressive': True} if image_format == 'JPEG' else {}))
+            _replace(thumbnail_name(name, size, extension), content)
+
+
+def process_photo(name, renamed=None):
+    """
+    Przetwarza zdjęcie profilowe zapisane w magazynie plików.
+
+    - Obraca zdjęcie zgodnie ze znacznikiem orientacji EXIF i zapisuje je ponownie bez metadanych EXIF
+      (m.in. bez położenia GPS), jeśli oryginał je zawierał. Plik z sumą kontrolną w nazwie (kirismor.media)
+      otrzymuje nową nazwę.
+    - Tworzy kwadratowe miniatury o szerokościach PHOTO_THUMBNAIL_SIZES w formatach WebP i JPEG
+      (kadrowanie do środka, jak object-fit: cover w szablonach).
+    - Dopiero po zapisaniu miniatur profile są przepinane na nowy plik, a oryginał jest usuwany po zatwierdzeniu
+      transakcji. Błąd przetwarzania zostawia profile i oryginał bez zmian, więc kolejna próba zaczyna od nowa.
+
+    Args:
+        name (str): Nazwa pliku zdjęcia w magazynie plików.
+        renamed (callable): Funkcja wywoływana z nową nazwą zaraz po przepięciu profili (np. zapis nazwy zadania).
+
+    Returns:
+        str: Nazwa przetworzonego zdjęcia (nowa, jeśli plik został zapisany pod nową nazwą).
+    """
+    with default_storage.open(name, 'rb') as file:
+        image = Image.open(file)
+        image.load()
+
+    new_name = None
+    # Zdjęcia z telefonów bywają odczytywane jako MPO (JPEG z dodatkowymi klatkami) - zapisujemy je jako JPEG
+    original_format = 'JPEG' if image.format == 'MPO' else image.format
+    if image.getexif() or 'exif' in image.info:
+        image = ImageOps.exif_transpose(image)
+        image.info.pop('exif', None)
+        options = {'quality': 90} if original_format == 'JPEG' else {}
+        content = _encode(_flatten(image) if original_format == 'JPEG' else image, original_format, **options)
+        rehashed = rehash_name(name, content)
+        if rehashed == name:
+            _replace(name, content)
+        else:
+            new_name = default_storage.save(rehashed, ContentFile(content))
+
+    try:
+        _write_thumbnails(image, new_name or name)
+    except Exception:
+        if new_name:
+            default_storage.delete(new_name)
+        raise
+
+    if new_name:
+        for model in PROFILE_MODELS:
+            model.objects.filter(photo=name).update(photo=new_name)
+        if renamed:
+            renamed(new_name)
+        old_name, name = name, new_name
+        transaction.on_commit(lambda: default_storage.delete(old_name))
+    cache.set(_ready_key(name), True, None)
+    return name
+
+
+def enqueue_photo(name):
+    """
+    Dodaje zdjęcie do kolejki przetwarzania (ponownie, jeśli plik o tej nazwie był już przetworzony).
+
+    Args:
+        name (str): Nazwa pliku zdjęcia w magazynie plików.
+
+    Returns:
+        PhotoTask: Zadanie w kolejce.
+    """
+    cache.delete(_ready_key(name))
+    task, _ = PhotoTask.objects.update_or_create(
+        name=name,
+        defaults={'status': PhotoTask.STATUS_PENDING, 'attempts': 0, 'next_attempt_at': timezone.now(),
+                  'last_error': '', 'processed_at': None},
+    )
+    return task
+
+
+def mark_uploaded_photo(sender, instance, **kwargs):
+    """
+    Sygnał pre_save profilu: zapamiętuje, czy zapis zawiera nowo przesłane zdjęcie (plik jeszcze niezapisany
+    w magazynie plików).
+    """
+    instance._photo_uploaded = bool(instance.photo) and not instance.photo._committed
+
+
+def enqueue_uploaded_photo(sender, instance, **kwargs):
+    """
+    Sygnał post_save profilu: dodaje nowo przesłane zdjęcie do kolejki przetwarzania.
+    """
+    if getattr(instance, '_photo_uploaded', False):
+        instance._photo_uploaded = False
+        enqueue_photo(instance.photo.name)
+
+
+def backfill_photos():
+    """
+    Dodaje do kolejki zdjęcia istniejących profili, które nie mają jeszcze zadania przetwarzania.
+
+    Returns:
+        int: Liczba dodanych zdjęć.
+    """
+    names = set()
+    for model in PROFILE_MODELS:
+        names.update(model.objects.exclude(photo='').exclude(photo__isnull=True)
+                     .values_list('photo', flat=True).distinct())
+    names -= set(PhotoTask.objects.filter(name__in=names).values_list('name', flat=True))
+    PhotoTask.objects.bulk_create([PhotoTask(name=name) for name in sorted(names)], ignore_conflicts=True)
+    return len(names)
+
+
+def _rename_task(task, name):
+    task.name = name
+    task.save(update_fields=['name'])
+
+
+def _mark_failed(task, error, now):
+    task.attempts += 1
+    task.last_error = error
+    if task.attempts >= settings.PHOTO_QUEUE_MAX_ATTEMPTS:
+        task.status = PhotoTask.STATUS_FAILED
+    else:
+        task.next_attempt_at = now + timedelta(seconds=settings.PHOTO_QUEUE_RETRY_DELAY)
+    task.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def process_photo_batch(batch_size=None):
+    """
+    Przetwarza jedną partię oczekujących zdjęć.
+
+    Zdjęcia są pobierane z blokadą wierszy (SKIP LOCKED), więc kilka równoległych procesów nie przetwarza tego
+    samego zdjęcia. Nieudane zdjęcie (np. uszkodzony plik) otrzymuje kolejną próbę po PHOTO_QUEUE_RETRY_DELAY
+    sekundach, a po PHOTO_QUEUE_MAX_ATTEMPTS próbach status 'failed'. Strony wyświetlają wtedy oryginalne zdjęcie.
+
+    Args:
+        batch_size (int): Maksymalna liczba zdjęć w partii (domyślnie PHOTO_QUEUE_BATCH_SIZE).
+
+    Returns:
+        tuple: Liczba przetworzonych i liczba nieudanych zdjęć.
+    """
+    batch_size = batch_size or settings.PHOTO_QUEUE_BATCH_SIZE
+    processed = failed = 0
+    with transaction.atomic():
+        now = timezone.now()
+        batch = list(
+            PhotoTask.objects.select_for_update(skip_locked=True)
+            .filter(status=PhotoTask.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        for task in batch:
+            name = task.name
+            try:
+                # Osobny punkt zapisu dla każdego zdjęcia: błąd wycofuje tylko zmiany tego zdjęcia
+                with transaction.atomic():
+                    task.name = process_photo(name, renamed=partial(_rename_task, task))
+            except Exception as error:
+                task.name = name
+                _mark_failed(task, f'{type(error).__name__}: {error}', now)
+                failed += 1
+            else:
+                task.status = PhotoTask.STATUS_DONE
+                task.processed_at = timezone.now()
+                task.save(update_fields=['name', 'status', 'processed_at'])
+                processed += 1
+    return processed, failed
+
+
+def process_photos(batch_size=None):
+    """
+    Przetwarza wszystkie zdjęcia gotowe do przetworzenia, partia po partii.
+
+    Args:
+        batch_size (int): Maksymalna liczba zdjęć w partii (domyślnie PHOTO_QUEUE_BATCH_SIZE).
+
+    Returns:
+        tuple: Łączna liczba przetworzonych i nieudanych zdjęć.
+    """
+    total_processed = total_failed = 0
+    while True:
+        processed, failed = process_photo_batch(batch_size)
+        total_processed += processed
+        total_failed += failed
+        # Nieudane zdjęcia mają przesunięty czas kolejnej próby, więc nie wrócą w tym przebiegu
+        if not processed and not failed:
+            return total_processed, total_failed
@@ -0,0 +1,83 @@
+from django import template
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+from accounts.photos import THUMBNAIL_FORMATS, fallback_size, thumbnail_name, thumbnails_ready
+
+"""
+Imports explanation:
+
+1. from django import template
+   - Moduł szablonów Django.
+   - Używany do rejestracji znacznika profile_photo.
+
+2. from django.conf import settings
+   - Moduł ustawień Django.
+   - Używany do odczytu rozmiarów miniatur (PHOTO_THUMBNAIL_SIZES).
+
+3. from django.core.files.storage import default_storage
+   - Domyślny magazyn plików (MEDIA_ROOT).
+   - Używany do budowy adresów URL miniatur.
+
+4. from django.utils.html import format_html, format_html_join
+   - Funkcje budujące bezpieczny kod HTML z wartościami zabezpieczonymi przed wstrzyknięciem.
+
+5. from accounts.photos import THUMBNAIL_FORMATS, fallback_size, thumbnail_name, thumbnails_ready
+   - THUMBNAIL_FORMATS: Formaty miniatur (rozszerzenie, format Pillow, typ MIME).
+   - fallback_size: Funkcja zwracająca rozmiar miniatury dla przeglądarek bez obsługi srcset.
+   - thumbnail_name: Funkcja zwracająca nazwę pliku miniatury.
+   - thumbnails_ready: Funkcja sprawdzająca, czy miniatury zdjęcia zostały utworzone.
+
+Użycie:
+    {% load photos %}
+    {% profile_photo recruiter.photo 85 alt=recruiter.first_name css_class="rounded-circle" %}
+"""
+
+register = template.Library()
+
+
+def _srcset(name, extension):
+    return ', '.join(f'{default_storage.url(thumbnail_name(name, size, extension))} {size}w'
+                     for size in settings.PHOTO_THUMBNAIL_SIZES)
+
+
+@register.simple_tag
+def profile_photo(photo, size, alt='', css_class='', lazy=True):
+    """
+    Wyświetla kwadratowe zdjęcie profilowe o boku `size` pikseli.
+
+    Po przetworzeniu zdjęcia (accounts.photos) zwraca element <picture> z miniaturami WebP i JPEG w atrybutach
+    srcset, z których przeglądarka wybiera najmniejszą wystarczającą dla gęstości pikseli ekranu. Zanim zdjęcie
+    zostanie przetworzone, zwraca oryginalne zdjęcie.
+
+    Args:
+        photo (FieldFile): Zdjęcie profilowe (kolumna ImageField).
+        size (int): Wyświetlany rozmiar zdjęcia w pikselach CSS.
+        alt (str): Tekst alternatywny.
+        css_class (str): Klasy CSS elementu <img>.
+        lazy (bool): Czy wczytywać zdjęcie dopiero przy przewinięciu strony (loading="lazy"). Zdjęcia widoczne
+            od razu po wczytaniu strony (np. na stronie profilu) powinny używać lazy=False.
+
+    Returns:
+        str: Kod HTML zdjęcia (pusty, jeśli profil nie ma zdjęcia).
+    """
+    if not photo:
+        return ''
+    attributes = format_html(
+        'alt="{}" class="{}" width="{}" height="{}" style="width: {}px; height: {}px; object-fit: cover;" '
+        'loading="{}" decoding="async"',
+        alt, css_class, size, size, size, size, 'lazy' if lazy else 'eager',
+    )
+    if not thumbnails_ready(photo.name):
+        return format_html('<img src="{}" {}>', photo.url, attributes)
+
+    sources = format_html_join(
+        '', '<source type="{}" srcset="{}" sizes="{}px">',
+        ((mime_type, _srcset(photo.name, extension), size)
+         for extension, (_, mime_type) in THUMBNAIL_FORMATS.items() if extension != 'jpg'),
+    )
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}px" {}></picture>',
+        sources, default_storage.url(thumbnail_name(photo.name, fallback_size(size), 'jpg')),
+        _srcset(photo.name, 'jpg'), size, attributes,
+    )
@@ -2,6 +2,7 @@ import pytest
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from accounts.models import User, CandidateProfile, ClientProfile, RecruiterProfile, Task
+from kirismor.tokens import get_object_for_token
 from datetime import date
 
 User = get_user_model()
@@ -78,7 +79,9 @@ def test_user_full_name_recruiter():
 def test_user_verification_token_generation():
     user = User.objects.create_user(email='user@example.com', password='password123')
     token = user.generate_verification_token()
-    assert len(token) == 64
+    assert get_object_for_token(User, User.VERIFICATION_TOKEN_PURPOSE, token) == user
+    user.refresh_from_db()
+    assert user.verification_token is None
 
 @pytest.mark.django_db
 def test_create_user_without_email():
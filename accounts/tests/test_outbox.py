@@ -0,0 +1,157 @@
+import socketserver
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from accounts.models import OutboxEmail
+from accounts.outbox import enqueue_email, send_outbox_batch
+from jobs.models import Job
+
+User = get_user_model()
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Minimalna obsługa protokołu SMTP, wystarczająca dla smtplib i backendu SMTP Django.
+    """
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode('ascii'))
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply('220 localhost')
+        recipients = []
+        while True:
+            line = self.rfile.readline().decode('utf-8').rstrip('\r\n')
+            command = line[:4].upper()
+            if not line or command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            if command in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif command == 'RCPT':
+                address = line.split(':', 1)[1].strip('<> ')
+                if address in server.rejected:
+                    self.reply('550 Mailbox unavailable')
+                else:
+                    recipients.append(address)
+                    self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while (data_line := self.rfile.readline().decode('utf-8')) not in ('.\r\n', ''):
+                    data.append(data_line)
+                time.sleep(server.delay)
+                server.messages.append((recipients, ''.join(data)))
+                recipients = []
+                self.reply('250 OK')
+            else:
+                # MAIL, RSET, NOOP
+                recipients = [] if command == 'RSET' else recipients
+                self.reply('250 OK')
+
+
+@pytest.fixture
+def smtp_server(settings):
+    """
+    Lokalny serwer SMTP zapisujący odebrane wiadomości i liczbę połączeń.
+    """
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), SMTPHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.messages = []
+    server.rejected = set()
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.server_address
+    settings.EMAIL_USE_TLS = False
+    settings.EMAIL_HOST_USER = 'noreply@example.com'
+    settings.EMAIL_HOST_PASSWORD = ''
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def job(db):
+    recruiter = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    return Job.objects.create(title='Oferta', recruiter=recruiter, description='Opis', requirements='Wymagania')
+
+
+@pytest.mark.django_db
+def test_request_does_not_wait_for_mail_delivery(client, smtp_server, job):
+    smtp_server.delay = 1
+    start = time.monotonic()
+    response = client.post(reverse('jobs:guest_feedback', args=[job.id]),
+                           {'email': 'guest@example.com', 'message': 'Wiadomość'})
+    assert time.monotonic() - start < smtp_server.delay
+    assert response.status_code == 302
+    assert smtp_server.connections == 0
+
+    email = OutboxEmail.objects.get()
+    assert email.recipients == ['guest@example.com']
+    assert '/jobs/guest/feedback/verify/' in email.body
+
+    call_command('send_outbox_emails')
+    email.refresh_from_db()
+    assert email.status == OutboxEmail.STATUS_SENT
+    assert email.body.split()[-1] in smtp_server.messages[0][1]
+
+
+@pytest.mark.django_db
+def test_batch_uses_one_connection(smtp_server):
+    for number in range(5):
+        enqueue_email('Temat', f'Treść {number}', 'noreply@example.com', [f'user{number}@example.com'])
+
+    assert send_outbox_batch(batch_size=3) == (3, 0)
+    assert send_outbox_batch(batch_size=3) == (2, 0)
+    assert send_outbox_batch(batch_size=3) == (0, 0)
+    assert smtp_server.connections == 2
+    assert [recipients for recipients, _ in smtp_server.messages] == [[f'user{number}@example.com']
+                                                                     for number in range(5)]
+
+
+@pytest.mark.django_db
+def test_failed_message_is_retried_with_backoff(smtp_server, settings):
+    settings.EMAIL_OUTBOX_MAX_ATTEMPTS = 2
+    settings.EMAIL_OUTBOX_RETRY_DELAY = 60
+    smtp_server.rejected = {'bad@example.com'}
+    bad = enqueue_email('Temat', 'Treść', 'noreply@example.com', ['bad@example.com'])
+    good = enqueue_email('Temat', 'Treść', 'noreply@example.com', ['good@example.com'])
+
+    assert send_outbox_batch() == (1, 1)
+    bad.refresh_from_db()
+    assert (bad.status, bad.attempts) == (OutboxEmail.STATUS_PENDING, 1)
+    assert bad.next_attempt_at > timezone.now() + timedelta(seconds=50)
+    assert 'bad@example.com' in bad.last_error
+    assert OutboxEmail.objects.get(pk=good.pk).status == OutboxEmail.STATUS_SENT
+
+    # Wiadomość nie jest ponawiana przed upływem opóźnienia
+    assert send_outbox_batch() == (0, 0)
+
+    OutboxEmail.objects.filter(pk=bad.pk).update(next_attempt_at=timezone.now())
+    assert send_outbox_batch() == (0, 1)
+    bad.refresh_from_db()
+    assert (bad.status, bad.attempts) == (OutboxEmail.STATUS_FAILED, 2)
+
+
+@pytest.mark.django_db
+def test_unavailable_server_postpones_whole_batch(settings, smtp_server):
+    enqueue_email('Temat', 'Treść', 'noreply@example.com', ['user@example.com'])
+    smtp_server.shutdown()
+    smtp_server.server_close()
+
+    assert send_outbox_batch() == (0, 1)
+    email = OutboxEmail.objects.get()
+    assert (email.status, email.attempts) == (OutboxEmail.STATUS_PENDING, 1)
+    assert email.next_attempt_at > timezone.now()
@@ -0,0 +1,148 @@
+import io
+import posixpath
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from PIL import Image
+from accounts.models import ClientProfile, PhotoTask, RecruiterProfile
+from accounts import photos
+from accounts.photos import thumbnail_name, thumbnail_url
+
+User = get_user_model()
+
+TEMPLATE = Template('{% load photos %}{% profile_photo profile.photo 85 alt="Anna" css_class="rounded-circle" %}')
+
+
+@pytest.fixture(autouse=True)
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.PHOTO_THUMBNAIL_SIZES = [100, 200]
+    cache.clear()
+    return tmp_path
+
+
+def camera_photo(width=60, height=40):
+    """
+    Zdjęcie JPEG z aparatu: obrócone znacznikiem orientacji EXIF (6 = obrót o 90°) i z położeniem GPS.
+    """
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    exif[0x8825] = {1: 'N', 2: (52.0, 13.0, 0.0)}
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), (200, 30, 30)).save(buffer, 'JPEG', exif=exif)
+    return SimpleUploadedFile('anna.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+
+def recruiter_profile(photo):
+    user = User.objects.create_user(email='recruiter@example.com', password=None, role='recruiter')
+    return RecruiterProfile.objects.create(user=user, first_name='Anna', last_name='Nowak',
+                                           phone_number='+48123456789', location='Kraków', bio='Bio', photo=photo)
+
+
+@pytest.mark.django_db
+def test_uploaded_photo_is_processed_off_request(django_capture_on_commit_callbacks):
+    profile = recruiter_profile(camera_photo())
+    task = PhotoTask.objects.get()
+    assert task.name == profile.photo.name and task.status == PhotoTask.STATUS_PENDING
+    html = TEMPLATE.render(Context({'profile': profile}))
+    assert f'src="{profile.photo.url}"' in html and 'loading="lazy"' in html and '<picture>' not in html
+
+    # Zapis profilu bez nowego zdjęcia nie dodaje zadania ponownie
+    profile.bio = 'Nowe bio'
+    profile.save()
+    PhotoTask.objects.update(status=PhotoTask.STATUS_DONE)
+    profile.save()
+    assert PhotoTask.objects.get().status == PhotoTask.STATUS_DONE
+    PhotoTask.objects.update(status=PhotoTask.STATUS_PENDING)
+
+    uploaded_name = profile.photo.name
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('process_profile_photos')
+    # Zapis bez EXIF zmienia zawartość, więc zdjęcie otrzymuje nową nazwę z sumą kontrolną
+    profile.refresh_from_db()
+    assert profile.photo.name != uploaded_name and not default_storage.exists(uploaded_name)
+    assert PhotoTask.objects.get().name == profile.photo.name
+    assert PhotoTask.objects.get().status == PhotoTask.STATUS_DONE
+
+    with default_storage.open(profile.photo.name) as file:
+        original = Image.open(file)
+        assert original.size == (40, 60)
+        assert not original.getexif()
+    for size in (100, 200):
+        for extension, image_format in (('webp', 'WEBP'), ('jpg', 'JPEG')):
+            with default_storage.open(thumbnail_name(profile.photo.name, size, extension)) as file:
+                thumbnail = Image.open(file)
+                assert (thumbnail.format, thumbnail.size) == (image_format, (size, size))
+                assert not thumbnail.getexif()
+
+    html = TEMPLATE.render(Context({'profile': profile}))
+    webp_srcset = ', '.join(f"{default_storage.url(thumbnail_name(profile.photo.name, size, 'webp'))} {size}w"
+                            for size in (100, 200))
+    assert f'<source type="image/webp" srcset="{webp_srcset}" sizes="85px">' in html
+    assert f'src="{default_storage.url(thumbnail_name(profile.photo.name, 200, "jpg"))}"' in html
+    assert 'width="85" height="85"' in html and 'loading="lazy"' in html
+    assert thumbnail_url(85)(profile.photo.name) == default_storage.url(thumbnail_name(profile.photo.name, 200, 'jpg'))
+
+
+@pytest.mark.django_db
+def test_failed_thumbnails_keep_original_photo(monkeypatch, django_capture_on_commit_callbacks):
+    profile = recruiter_profile(camera_photo())
+    uploaded_name = profile.photo.name
+
+    def broken(image, name):
+        raise OSError('Brak miejsca na dysku')
+
+    monkeypatch.setattr(photos, '_write_thumbnails', broken)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('process_profile_photos')
+    profile.refresh_from_db()
+    task = PhotoTask.objects.get()
+    assert profile.photo.name == uploaded_name == task.name and default_storage.exists(uploaded_name)
+    assert (task.status, task.attempts) == (PhotoTask.STATUS_PENDING, 1)
+    assert default_storage.listdir('profiles')[1] == [posixpath.basename(uploaded_name)]
+
+    monkeypatch.undo()
+    PhotoTask.objects.update(next_attempt_at=task.created_at)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command('process_profile_photos')
+    profile.refresh_from_db()
+    assert PhotoTask.objects.get().name == profile.photo.name != uploaded_name
+    assert default_storage.exists(thumbnail_name(profile.photo.name, 200, 'jpg'))
+    assert not default_storage.exists(uploaded_name)
+
+
+@pytest.mark.django_db
+def test_backfill_existing_photos(media):
+    (media / 'profiles').mkdir()
+    Image.new('RGBA', (300, 200), (0, 0, 255, 128)).save(media / 'profiles' / 'logo.png')
+    user = User.objects.create_user(email='client@example.com', password=None, role='client')
+    profile = ClientProfile.objects.create(user=user, phone_number='+48123456789', location='Gdańsk', bio='Bio',
+                                           company_name='Firma', industry='IT', photo='profiles/logo.png')
+    assert not PhotoTask.objects.exists()
+    assert thumbnail_url(85)(profile.photo.name) == '/media/profiles/logo.png'
+
+    call_command('process_profile_photos', '--backfill')
+    call_command('process_profile_photos', '--backfill')
+    assert PhotoTask.objects.get().status == PhotoTask.STATUS_DONE
+    with default_storage.open(thumbnail_name('profiles/logo.png', 100, 'webp')) as file:
+        assert Image.open(file).mode == 'RGBA'
+    with default_storage.open(thumbnail_name('profiles/logo.png', 100, 'jpg')) as file:
+        assert Image.open(file).getpixel((50, 50)) != (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_broken_photo_is_retried_and_falls_back_to_original(settings):
+    settings.PHOTO_QUEUE_MAX_ATTEMPTS = 2
+    settings.PHOTO_QUEUE_RETRY_DELAY = 0
+    profile = recruiter_profile(SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg'))
+
+    call_command('process_profile_photos')
+    task = PhotoTask.objects.get()
+    assert (task.status, task.attempts) == (PhotoTask.STATUS_FAILED, 2)
+    assert 'UnidentifiedImageError' in task.last_error
+    assert f'src="{profile.photo.url}"' in TEMPLATE.render(Context({'profile': profile}))
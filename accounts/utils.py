@@ -1,26 +1,20 @@
-import time
-from django.core.mail import send_mail
 from django.conf import settings
 from django.utils.translation import gettext as _
+from accounts.outbox import enqueue_email
 
 """
 Imports explanation:
 
-1. import time
-   - Moduł czasu wbudowany w Pythona.
-   - Używany do dodania opóźnienia przed wysłaniem emaila.
-
-2. from django.core.mail import send_mail
-   - Funkcja Django do wysyłania emaili.
-   - Używana do wysyłania emaili za pomocą skonfigurowanych ustawień SMTP.
-
-3. from django.conf import settings
+1. from django.conf import settings
    - Moduł ustawień Django.
-   - Używany do uzyskiwania dostępu do ustawień konfiguracyjnych projektu, takich jak adres URL witryny i dane SMTP.
+   - Używany do uzyskiwania dostępu do ustawień konfiguracyjnych projektu, takich jak adres URL witryny i nadawca.
 
-4. from django.utils.translation import gettext as _
+2. from django.utils.translation import gettext as _
    - Funkcja Django do tłumaczenia tekstu.
    - Używana do internacjonalizacji i tłumaczenia tekstu w aplikacjach Django.
+
+3. from accounts.outbox import enqueue_email
+   - Funkcja dodająca wiadomość e-mail do kolejki wysyłanej przez komendę send_outbox_emails.
 """
 
 
@@ -28,14 +22,13 @@ def send_verification_email(user):
     """
     Wysyła email weryfikacyjny do użytkownika.
 
-    Generuje token weryfikacyjny, zapisuje go w bazie danych i wysyła email z linkiem weryfikacyjnym do użytkownika.
+    Generuje podpisany token weryfikacyjny (bez zapisu w bazie danych) i dodaje email z linkiem weryfikacyjnym
+    do kolejki wiadomości. Email wysyła komenda send_outbox_emails, więc żądanie nie czeka na serwer SMTP.
 
     Args:
         user (User): Obiekt użytkownika, do którego ma być wysłany email weryfikacyjny.
     """
     token = user.generate_verification_token()
-    user.verification_token = token
-    user.save()
 
     verification_link = f"{settings.SITE_URL}/accounts/verify/{token}/"
     subject = _('Zweryfikuj swój email')
@@ -44,6 +37,4 @@ def send_verification_email(user):
     from_email = settings.EMAIL_HOST_USER
     recipient_list = [user.email]
 
-    time.sleep(2)  # Dodaj niewielkie opóźnienie przed wysłaniem emaila
-
-    send_mail(subject, message, from_email, recipient_list, fail_silently=False)
+    enqueue_email(subject, message, from_email, recipient_list)
@@ -2,20 +2,26 @@ from django.contrib import messages
 from django.contrib.auth import logout, login, update_session_auth_hash
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.serializers import serialize
 from django.db.models import Q
-from django.http import Http404, JsonResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import redirect, render, get_object_or_404
 from django.urls import reverse_lazy
+from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView, ListView
 from accounts.forms import (
     RecruiterProfileForm, TaskForm, ClientProfileForm,
     CandidateProfileForm, UserLoginForm, UserRegistrationForm, PasswordChangeForm
 )
 from accounts.models import RecruiterProfile, Task, ClientProfile, CandidateProfile, User
-from jobs.models import Job
+from accounts.photos import thumbnail_url
+from jobs.featured import get_featured_jobs
 from kirismor import settings
-from news.models import News
+from kirismor.page_cache import cache_anonymous_page
+from kirismor.db_router import replica_reads
+from kirismor.pagination import PaginationMixin, cursor_json
+from kirismor.projection import Column, Projection, date_format, json_response, truncate
+from kirismor.tokens import get_object_for_token
+from news.feed import feed_context
 from django.utils import translation
 from accounts.utils import send_verification_email
 from django.conf import settings
@@ -38,25 +44,24 @@ Imports explanation:
 4. from django.contrib.auth.mixins import LoginRequiredMixin
    - LoginRequiredMixin: Mixin używany w klasach opartych na widokach, wymagający zalogowania użytkownika do dostępu do widoku.
 
-5. from django.core.serializers import serialize
-   - serialize: Funkcja służąca do serializacji danych modelu do formatu JSON.
-
-6. from django.db.models import Q
+5. from django.db.models import Q
    - Q: Narzędzie do tworzenia złożonych zapytań SQL za pomocą operatorów OR i NOT.
 
-7. from django.http import Http404, JsonResponse, HttpResponseRedirect
+6. from django.http import Http404, HttpResponseRedirect
    - Http404: Wyjątek rzucany, gdy żądany zasób nie istnieje.
-   - JsonResponse: Funkcja Django do zwracania odpowiedzi w formacie JSON.
    - HttpResponseRedirect: Funkcja Django do przekierowywania na inny adres URL.
 
-8. from django.shortcuts import redirect, render, get_object_or_404
+7. from django.shortcuts import redirect, render, get_object_or_404
    - redirect: Funkcja do przekierowywania na inny adres URL.
    - render: Funkcja do renderowania szablonów HTML.
    - get_object_or_404: Funkcja do pobierania obiektów z bazy danych, rzucająca wyjątek 404, jeśli obiekt nie istnieje.
 
-9. from django.urls import reverse_lazy
+8. from django.urls import reverse_lazy
    - reverse_lazy: Funkcja do odwracania adresów URL, używana do generowania adresów URL na podstawie nazw wzorców.
 
+9. from django.utils.decorators import method_decorator
+   - method_decorator: Funkcja przekształcająca dekorator widoku funkcyjnego w dekorator metody klasy widoku.
+
 10. from django.views.generic import TemplateView, ListView
     - TemplateView: Klasa bazowa dla widoków generycznych, używana do wyświetlania prostych stron.
     - ListView: Klasa bazowa dla widoków generycznych, używana do wyświetlania listy elementów.
@@ -80,31 +85,56 @@ Imports explanation:
     - CandidateProfile: Model danych dla profilu kandydata.
     - User: Model danych dla użytkownika.
 
-13. from jobs.models import Job
-    - Job: Model danych dla ofert pracy.
+13. from accounts.photos import thumbnail_url
+    - thumbnail_url: Przekształcenie kolumny zdjęcia zwracające adres URL miniatury (lub oryginału, jeśli zdjęcie nie
+      zostało jeszcze przetworzone).
+
+14. from jobs.featured import get_featured_jobs
+    - get_featured_jobs: Funkcja zwracająca migawkę wyróżnionych ofert pracy do karuzeli na stronie głównej.
 
-14. from kirismor import settings
+15. from kirismor import settings
     - settings: Moduł ustawień projektu kirismor.
 
-15. from news.models import News
-    - News: Model danych dla aktualności i informacji.
+16. from kirismor.page_cache import cache_anonymous_page
+    - cache_anonymous_page: Dekorator zapisujący w pamięci podręcznej strony wyświetlane anonimowym użytkownikom.
+
+17. from kirismor.db_router import replica_reads
+    - replica_reads: Dekorator kierujący odczyty widoku (listy rekruterów i klientów) do repliki bazy danych.
+
+18. from kirismor.pagination import PaginationMixin, cursor_json
+    - PaginationMixin: Wspólny mixin paginacji (linki paginacji dla AJAX oraz opcjonalny tryb kursorowy ?cursor=).
+    - cursor_json: Funkcja zwracająca kursory następnej i poprzedniej strony do odpowiedzi JSON.
 
-16. from django.utils import translation
+19. from kirismor.projection import Column, Projection, date_format, json_response, truncate
+    - Column, Projection: Deklaratywna projekcja kolumn modelu dla odpowiedzi AJAX (zapytanie .values() zamiast
+      obiektów modeli).
+    - date_format, truncate: Przekształcenia wartości kolumn (format daty, skrócenie tekstu).
+    - json_response: Funkcja zwracająca odpowiedź JSON zakodowaną jednokrotnie.
+
+20. from kirismor.tokens import get_object_for_token
+    - get_object_for_token: Funkcja sprawdzająca podpisany token weryfikacyjny i pobierająca użytkownika po kluczu
+      głównym (z obsługą tokenów zapisanych w bazie danych przed wprowadzeniem podpisów).
+
+21. from news.feed import feed_context
+    - feed_context: Funkcja zwracająca kanał aktualności roli z pamięci podręcznej (kontekst panelu kontrolnego).
+
+22. from django.utils import translation
     - translation: Moduł Django do zarządzania tłumaczeniami.
 
-17. from accounts.utils import send_verification_email
+23. from accounts.utils import send_verification_email
     - send_verification_email: Funkcja użytkowa do wysyłania emaili weryfikacyjnych.
 
-18. from django.conf import settings
+24. from django.conf import settings
     - settings: Moduł ustawień Django.
 
-19. from django.utils.translation import gettext as _
+25. from django.utils.translation import gettext as _
     - gettext as _: Funkcja Django do tłumaczenia tekstu, używana do internacjonalizacji.
 """
 
 '---------------------------------------------------STRONA GŁÓWNA------------------------------------------------------'
 
 
+@method_decorator(cache_anonymous_page('jobs'), name='dispatch')
 class HomeView(TemplateView):
     """
     Widok strony głównej serwisu. Wyświetla główną stronę aplikacji.
@@ -115,7 +145,8 @@ class HomeView(TemplateView):
     def get_context_data(self, **kwargs):
         """
         Przygotowuje i zwraca kontekst danych dla szablonu.
-        W kontekście zwracane są oferty pracy, które mają status 'OPEN', co oznacza, że są aktualnie otwarte.
+        W kontekście zwracana jest migawka wyróżnionych ofert pracy do karuzeli (jobs.featured), przechowywana
+        w pamięci podręcznej, dzięki czemu strona główna nie wykonuje zapytań do bazy danych.
 
         Args:
             **kwargs: Parametry kontekstowe przekazywane do widoku.
@@ -128,10 +159,11 @@ class HomeView(TemplateView):
         Wywołanie metody get_context_data z klasy bazowej TemplateView.
         Używa super() do odwołania się do metody klasy rodzica.
         """
-        context['jobs'] = Job.objects.filter(status=Job.JobStatus.OPEN)
+        context['featured_jobs'] = get_featured_jobs()
         return context
 
 
+@method_decorator(cache_anonymous_page('static'), name='dispatch')
 class AboutView(TemplateView):
     """
     Widok strony 'O nas'. Służy do przedstawienia informacji o firmie lub organizacji.
@@ -140,6 +172,7 @@ class AboutView(TemplateView):
     template_name = 'home/about_us.html'
 
 
+@method_decorator(cache_anonymous_page('static'), name='dispatch')
 class ContactView(TemplateView):
     """
     Widok strony kontaktowej. Umożliwia użytkownikom znajdowanie sposobów kontaktu z firmą lub organizacją.
@@ -151,41 +184,29 @@ class ContactView(TemplateView):
 '-----------------------------------------NASI KLIENCI I NASI REKRUTERZY-----------------------------------------------'
 
 
-class PaginationMixin:
+class AjaxPaginationMixin(PaginationMixin):
     """
-    Mixin do paginacji. Umożliwia generowanie linków do paginacji na listach, takich jak lista użytkowników.
+    Mixin paginacji dla list przełączanych żądaniami AJAX (static/js/accounts.js): odpowiedź JSON jest zwracana
+    dla żądań z nagłówkiem X-Requested-With.
     """
 
-    def generate_pagination_html(self, page_obj):
-        """
-        Generuje HTML dla linków paginacji. Tworzy linki do poprzedniej, aktualnych i następnej strony, jeśli istnieją.
+    def is_json_request(self):
+        return self.request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
-        Args:
-            page_obj (Page): Obiekt strony zawierający informacje o bieżącej stronie.
 
-        Returns:
-            str: HTML zawierający linki do paginacji.
-        """
-        paginator = page_obj.paginator
-        pagination_html = ''
-        if page_obj.has_previous():
-            pagination_html += f'<a class="btn btn-secondary pagination-link" href="?page={page_obj.previous_page_number()}">Previous</a>'
-        for num in paginator.page_range:
-            pagination_html += f'<a class="pagination-link" href="?page={num}">{num}</a>'
-        if page_obj.has_next():
-            pagination_html += f'<a class="btn btn-secondary ms-auto pagination-link" href="?page={page_obj.next_page_number()}">Next</a>'
-        return pagination_html
-
-
-class RecruiterListView(PaginationMixin, ListView):
+@replica_reads
+class RecruiterListView(AjaxPaginationMixin, ListView):
     """
     Widok listy rekruterów. Wyświetla stronę z listą rekruterów, z możliwością paginacji.
     Używa szablonu 'home/recruiters.html' i modelu RecruiterProfile.
+    Odpowiedź AJAX zawiera tylko kolumny z `projection`.
     """
     model = RecruiterProfile
     template_name = 'home/recruiters.html'
     context_object_name = 'recruiters'
     paginate_by = 5
+    projection = Projection(RecruiterProfile, id='user_id', first_name='first_name', last_name='last_name', bio='bio',
+                            photo=Column(transform=thumbnail_url(85)))
 
     def get_queryset(self):
         """
@@ -207,25 +228,29 @@ class RecruiterListView(PaginationMixin, ListView):
         Returns:
             HttpResponse: Odpowiedź zawierająca dane rekruterów i linki do paginacji w formacie JSON lub HTML.
         """
-        if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if self.is_json_request():
             page_obj = context['page_obj']
-            recruiters = serialize('json', page_obj.object_list)
+            recruiters = self.projection.rows(page_obj.object_list)
             pagination_html = self.generate_pagination_html(page_obj)
-            return JsonResponse({'recruiters': recruiters, 'pagination': pagination_html})
+            return json_response({'recruiters': recruiters, 'pagination': pagination_html})
         return super().render_to_response(context, **response_kwargs)
     # Wywołanie metody render_to_response z klasy bazowej ListView.
     # Używa super() do odwołania się do metody klasy rodzica.
 
 
-class ClientListView(PaginationMixin, ListView):
+@replica_reads
+class ClientListView(AjaxPaginationMixin, ListView):
     """
     Widok listy klientów. Wyświetla stronę z listą klientów, z możliwością paginacji.
     Używa szablonu 'home/client_list.html' i modelu ClientProfile.
+    Odpowiedź AJAX zawiera tylko kolumny z `projection`.
     """
     model = ClientProfile
     template_name = 'home/client_list.html'
     context_object_name = 'clients'
     paginate_by = 5
+    projection = Projection(ClientProfile, id='user_id', company_name='company_name', bio='bio',
+                            photo=Column(transform=thumbnail_url(85)))
 
     def get_queryset(self):
         """
@@ -247,11 +272,11 @@ class ClientListView(PaginationMixin, ListView):
         Returns:
             HttpResponse: Odpowiedź zawierająca dane klientów i linki do paginacji w formacie JSON lub HTML.
         """
-        if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        if self.is_json_request():
             page_obj = context['page_obj']
-            clients = serialize('json', page_obj.object_list)
+            clients = self.projection.rows(page_obj.object_list)
             pagination_html = self.generate_pagination_html(page_obj)
-            return JsonResponse({'clients': clients, 'pagination': pagination_html})
+            return json_response({'clients': clients, 'pagination': pagination_html})
         return super().render_to_response(context, **response_kwargs)
     # 'Wywołanie metody render_to_response z klasy bazowej ListView.'
     # 'Używa super() do odwołania się do metody klasy rodzica.'
@@ -347,9 +372,10 @@ def verify_email_view(request, token):
     """
     Obsługuje proces weryfikacji email.
 
-    - Pobiera użytkownika na podstawie tokena weryfikacyjnego.
+    - Sprawdza podpis i ważność tokena weryfikacyjnego i pobiera użytkownika po kluczu głównym
+      (tokeny sprzed wprowadzenia podpisów są wyszukiwane w polu verification_token).
     - Ustawia użytkownika jako zweryfikowanego i aktywnego.
-    - Usuwa token weryfikacyjny i zapisuje zmiany w bazie danych.
+    - Usuwa dotychczasowy token weryfikacyjny i zapisuje zmiany w bazie danych.
     - Przekierowuje na stronę potwierdzenia weryfikacji.
 
     Args:
@@ -359,7 +385,7 @@ def verify_email_view(request, token):
     Returns:
         HttpResponse: Przekierowanie do strony potwierdzenia weryfikacji.
     """
-    user = get_object_or_404(User, verification_token=token)
+    user = get_object_for_token(User, User.VERIFICATION_TOKEN_PURPOSE, token, legacy_field='verification_token')
     user.is_verified = True
     user.verification_token = None
     user.is_active = True  # Aktywuje użytkownika po weryfikacji email.
@@ -456,8 +482,9 @@ def dashboard_view(request):
     """
     Wyświetla panel kontrolny użytkownika.
 
-    - Pobiera rolę użytkownika z sesji.
-    - Pobiera listę wiadomości odpowiednich dla roli użytkownika, posortowanych według daty dodania (od najnowszych).
+    - Pobiera rolę użytkownika.
+    - Pobiera kanał aktualności roli z pamięci podręcznej (news.feed): najnowsze wiadomości, posortowane według daty
+      dodania (od najnowszych), i adres starszych wiadomości.
     - Renderuje stronę panelu kontrolnego z rolą użytkownika i listą wiadomości.
 
     Args:
@@ -467,8 +494,7 @@ def dashboard_view(request):
         HttpResponse: Odpowiedź HTTP z renderowaną stroną panelu kontrolnego.
     """
     role = request.user.role
-    news_list = News.objects.filter(role=role).order_by('-date_posted')
-    return render(request, 'dashboard/dashboard.html', {'role': role, 'news_list': news_list})
+    return render(request, 'dashboard/dashboard.html', {'role': role, **feed_context(role)})
 
 
 '------------------------------------------SZCZEGÓŁY PROFILU, ZMIANA DANYCH-------------------------------------------'
@@ -559,7 +585,7 @@ def profile_edit_view(request):
 '-----------------------------------------ZADANIA REKRUTERA-----------------------------------------------------------'
 
 
-class TaskListView(LoginRequiredMixin, ListView):
+class TaskListView(LoginRequiredMixin, AjaxPaginationMixin, ListView):
     """
     Klasa odpowiadająca za wyświetlanie listy zadań stworzonych przez zalogowanego użytkownika.
     Umożliwia paginację oraz filtrowanie zadań na podstawie zapytań przekazywanych w URL.
@@ -569,11 +595,18 @@ class TaskListView(LoginRequiredMixin, ListView):
         template_name (str): Nazwa szablonu używanego do renderowania strony.
         context_object_name (str): Nazwa używana do przekazywania listy zadań do szablonu.
         paginate_by (int): Liczba elementów na stronie.
+        cursor_ordering (tuple): Klucz sortowania w trybie paginacji kursorowej (?cursor=).
+        projection (Projection): Kolumny zadań w odpowiedzi AJAX.
     """
     model = Task
     template_name = 'tasks/task_list.html'
     context_object_name = 'tasks'
     paginate_by = 5
+    cursor_ordering = ('due_date', 'id')
+    pagination_params = ('q',)
+    projection = Projection(Task, id='id', title='title', description=Column('excerpt', transform=truncate(30)),
+                            priority=Column(display=True), status=Column(display=True),
+                            due_date=Column(transform=date_format('%d %b %Y')))
 
     def get_queryset(self):
         """
@@ -584,7 +617,8 @@ class TaskListView(LoginRequiredMixin, ListView):
             QuerySet: Przefiltrowany zbiór zadań.
         """
         search_query = self.request.GET.get('q', '')
-        queryset = Task.objects.filter(created_by=self.request.user).order_by('due_date')  # Пример сортировки
+        queryset = Task.objects.filter(created_by=self.request.user).defer('description').order_by('due_date')
+        # Lista wyświetla skrót opisu (Task.excerpt), pełny opis jest pobierany tylko na stronie szczegółów
         if search_query:
             queryset = queryset.filter(Q(title__icontains=search_query) | Q(description__icontains=search_query))
         return queryset
@@ -600,33 +634,13 @@ class TaskListView(LoginRequiredMixin, ListView):
         Returns:
             JsonResponse lub HttpResponse: Odpowiedź zawierająca dane zadań w formacie JSON lub renderowana strona HTML.
         """
-        if self.request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-            tasks = [{
-                'id': task.id,
-                'title': task.title,
-                'description': task.description[:30],
-                'priority': task.get_priority_display(),
-                'status': task.get_status_display(),
-                'due_date': task.due_date.strftime('%d %b %Y') if task.due_date else ''
-            } for task in context['tasks']]
-
-            pagination_html = ''
-            page_obj = context['page_obj']
-            paginator = context['paginator']
+        if self.is_json_request():
+            tasks = self.projection.rows(context['tasks'])
 
-            # Dodanie linku do poprzedniej strony, jeśli istnieje
-            if page_obj.has_previous():
-                pagination_html += f'<a class="btn btn-secondary pagination-link" href="?page={page_obj.previous_page_number()}">Previous</a>'
-
-            # Dodanie linków do wszystkich stron
-            for num in paginator.page_range:
-                pagination_html += f'<a class="pagination-link" href="?page={num}">{num}</a>'
-
-            # Dodanie linku do następnej strony, jeśli istnieje
-            if page_obj.has_next():
-                pagination_html += f'<a class="btn btn-secondary ms-auto pagination-link" href="?page={page_obj.next_page_number()}">Next</a>'
+            page_obj = context['page_obj']
+            pagination_html = self.generate_pagination_html(page_obj)
 
-            return JsonResponse({'tasks': tasks, 'pagination': pagination_html})
+            return json_response({'tasks': tasks, 'pagination': pagination_html, **cursor_json(page_obj)})
 
         return super().render_to_response(context, **response_kwargs)
 
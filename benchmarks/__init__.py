@@ -0,0 +1,14 @@
+"""
+Benchmarki wydajności aplikacji KIRIS M.O.R.
+
+Każdy moduł w tym pakiecie jest samodzielnym skryptem uruchamianym z katalogu głównego projektu, np.:
+
+    python -m benchmarks.job_search --sizes 10000 100000
+    python -m benchmarks.views --tiers small medium --output views.json
+    python -m benchmarks.connections --repeat 200
+    python -m benchmarks.list_payload --tiers small --output list_payload.json
+
+Benchmarki pracują na osobnej, tymczasowej bazie testowej (patrz benchmarks.common.temporary_database),
+więc nie modyfikują danych w bazie skonfigurowanej w kirismor.settings (benchmarks.connections wykonuje na niej
+jedynie SELECT 1).
+"""
@@ -0,0 +1,144 @@
+import contextlib
+import json
+import math
+import os
+import time
+import tracemalloc
+
+import django
+
+"""
+Importy:
+- import contextlib: Importuje narzędzia do tworzenia menedżerów kontekstu.
+- import json: Importuje moduł json, używany do zapisu wyników benchmarków.
+- import math: Importuje funkcje matematyczne, używane do obliczania percentyli.
+- import os: Importuje moduł os, używany do ustawienia zmiennej DJANGO_SETTINGS_MODULE.
+- import time: Importuje moduł time, używany do pomiaru czasu.
+- import tracemalloc: Importuje śledzenie alokacji pamięci, używane do pomiaru szczytowego zużycia pamięci.
+- import django: Importuje Django, aby zainicjalizować aplikacje przed importem modeli.
+"""
+
+
+def setup_django():
+    """
+    Inicjalizuje Django dla skryptów uruchamianych poza manage.py.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kirismor.settings')
+    django.setup()
+
+
+@contextlib.contextmanager
+def temporary_database(keepdb=False):
+    """
+    Tworzy tymczasową bazę testową (z migracjami) na czas trwania benchmarku i usuwa ją po zakończeniu.
+
+    Args:
+        keepdb (bool): Czy zachować bazę po zakończeniu (przydatne przy wielokrotnych uruchomieniach).
+    """
+    from django.db import connection
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+def percentile(samples, pct):
+    """
+    Zwraca percentyl (metoda najbliższej pozycji) z listy próbek.
+
+    Args:
+        samples (list): Lista zmierzonych wartości.
+        pct (float): Percentyl w zakresie 0-100.
+
+    Returns:
+        float: Wartość percentyla lub 0.0 dla pustej listy.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def measure(func, repeat):
+    """
+    Wywołuje funkcję `repeat` razy i zwraca czasy wykonania w milisekundach.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings):
+    """
+    Zwraca podsumowanie próbek czasowych (p50/p95/p99 w milisekundach).
+    """
+    return {
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'samples': len(timings),
+    }
+
+
+def write_results(path, results):
+    """
+    Zapisuje wyniki benchmarku do pliku JSON (jeśli podano ścieżkę).
+    """
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def read_results(path):
+    """
+    Wczytuje wyniki benchmarku zapisane przez write_results.
+    """
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def peak_memory(func):
+    """
+    Wywołuje funkcję i zwraca szczytowe zużycie pamięci przez alokacje Pythona w czasie wywołania (KiB).
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def find_regressions(results, baseline, keys, thresholds):
+    """
+    Porównuje wyniki z wynikami bazowymi (np. z poprzedniego commita).
+
+    Args:
+        results (list): Wiersze bieżących wyników.
+        baseline (list): Wiersze wyników bazowych.
+        keys (tuple): Pola identyfikujące wiersz, np. ('tier', 'view').
+        thresholds (dict): Dopuszczalny względny wzrost każdej porównywanej miary (większa wartość jest gorsza),
+            np. {'p95_ms': 0.2, 'queries': 0}: czas o 20%, liczba zapytań wcale.
+
+    Returns:
+        list: Opisy regresji; pusta lista, jeśli żadna miara nie wzrosła ponad próg.
+    """
+    previous = {tuple(row[key] for key in keys): row for row in baseline}
+    regressions = []
+    for row in results:
+        base = previous.get(tuple(row[key] for key in keys))
+        if base is None:
+            continue
+        for metric, threshold in thresholds.items():
+            if metric in base and row[metric] > base[metric] * (1 + threshold):
+                name = ' '.join(str(row[key]) for key in keys)
+                regressions.append(f'{name}: {metric} {base[metric]} -> {row[metric]}')
+    return regressions
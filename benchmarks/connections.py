@@ -0,0 +1,84 @@
+import argparse
+
+from benchmarks.common import setup_django, measure, summarize, write_results
+
+"""
+Benchmark narzutu połączenia z bazą danych na żądanie: CONN_MAX_AGE = 0 (nowe połączenie w każdym żądaniu)
+kontra połączenia trwałe (CONN_MAX_AGE > 0, z kontrolą stanu CONN_HEALTH_CHECKS lub bez).
+
+Każda próba odtwarza cykl żądania Django: sygnał request_started, jedno zapytanie SELECT 1 i sygnał
+request_finished. Na obu sygnałach close_old_connections zamyka połączenia, których czas życia minął, tak jak
+w serwerze aplikacji (klient testowy Django odłącza te sygnały, więc nie nadaje się do tego pomiaru).
+Różnica p50 między trybami to koszt nawiązania połączenia (TCP, uwierzytelnienie) ponoszony w każdym żądaniu.
+
+Benchmark wykonuje tylko SELECT 1 na bazie skonfigurowanej w kirismor.settings (lub --database).
+
+Użycie:
+    python -m benchmarks.connections --repeat 200 --output connections.json
+"""
+
+MODES = [
+    ('per-request', 0, False),
+    ('persistent', 600, False),
+    ('persistent+health-checks', 600, True),
+]
+
+
+def request_cycle(connection):
+    """
+    Odtwarza cykl jednego żądania z jednym zapytaniem SQL.
+    """
+    from django.core import signals
+
+    signals.request_started.send(sender=None)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+    finally:
+        signals.request_finished.send(sender=None)
+
+
+def run(alias, repeat):
+    from django.db import connections
+
+    connection = connections[alias]
+    original = {key: connection.settings_dict[key] for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+    results = []
+    try:
+        for mode, max_age, health_checks in MODES:
+            connection.close()
+            connection.settings_dict.update(CONN_MAX_AGE=max_age, CONN_HEALTH_CHECKS=health_checks)
+            request_cycle(connection)  # rozgrzewka
+            row = {'mode': mode, 'conn_max_age': max_age, 'health_checks': health_checks,
+                   **summarize(measure(lambda: request_cycle(connection), repeat))}
+            results.append(row)
+            print(f"{mode:<26} p50={row['p50_ms']:>8.3f} ms  p95={row['p95_ms']:>8.3f} ms  p99={row['p99_ms']:>8.3f} ms")
+    finally:
+        connection.close()
+        connection.settings_dict.update(original)
+
+    baseline = results[0]['p50_ms']
+    for row in results[1:]:
+        row['saved_per_request_ms'] = round(baseline - row['p50_ms'], 3)
+        print(f"{row['mode']:<26} oszczędność na żądanie: {row['saved_per_request_ms']:.3f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark narzutu połączenia z bazą danych na żądanie.')
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--database', default='default', help='Alias bazy danych z ustawienia DATABASES.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connections
+
+    results = run(args.database, args.repeat)
+    write_results(args.output, {'benchmark': 'connections', 'vendor': connections[args.database].vendor,
+                                'results': results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import random
+
+from benchmarks.common import setup_django, temporary_database, measure, summarize, write_results
+
+"""
+Benchmark wyszukiwania ofert pracy: dotychczasowe icontains (legacy_search) kontra indeks pełnotekstowy
+(search_jobs). Dla każdego rozmiaru zbioru mierzy p50/p95 zapytania wykonywanego przez JobListView
+i PublicJobListView: COUNT(*) dla paginatora oraz pobranie pierwszej strony wyników.
+
+Użycie:
+    python -m benchmarks.job_search --sizes 10000 100000 1000000 --repeat 20 --output search.json
+"""
+
+WORDS = (
+    'python django magazynier kierowca spawacz operator cnc elektryk monter kucharz kelner sprzedawca '
+    'księgowa programista tester analityk logistyk pakowacz brygadzista hydraulik malarz stolarz '
+    'opiekunka pielęgniarka recepcjonista fryzjer kasjer ochroniarz sprzątanie produkcja budowa '
+    'zmiana nocna weekend zakwaterowanie transport umowa premia doświadczenie angielski niemiecki'
+).split()
+
+QUERIES = ['python', 'spawacz', 'operator cnc', 'zmiana nocna', 'niemiecki premia', 'xyzbrak']
+
+
+def random_text(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def populate(size, recruiter, rng, chunk_size=5000):
+    """
+    Uzupełnia tabelę ofert pracy do zadanego rozmiaru (dane deterministyczne dzięki ziarnu generatora).
+    """
+    from jobs.models import Job
+
+    existing = Job.objects.count()
+    while existing < size:
+        batch = min(chunk_size, size - existing)
+        Job.objects.bulk_create([
+            Job(
+                title=random_text(rng, 3).capitalize(),
+                recruiter=recruiter,
+                description=random_text(rng, 120),
+                requirements=random_text(rng, 40),
+                salary=rng.randint(3000, 15000),
+                status=rng.choice(['open', 'open', 'open', 'closed']),
+            )
+            for _ in range(batch)
+        ])
+        existing += batch
+
+
+def run(sizes, repeat, page_size, seed):
+    from django.contrib.auth import get_user_model
+    from jobs.models import Job
+    from jobs.search import search_jobs, legacy_search
+
+    rng = random.Random(seed)
+    recruiter = get_user_model().objects.create_user(email='bench@example.com', password='bench', role='recruiter')
+    results = []
+    for size in sorted(sizes):
+        populate(size, recruiter, rng)
+        open_jobs = Job.objects.filter(status=Job.JobStatus.OPEN)
+        for query in QUERIES:
+            for path, search in (('legacy', legacy_search), ('fulltext', search_jobs)):
+                def view_query():
+                    queryset = search(open_jobs, query)
+                    queryset.count()
+                    list(queryset[:page_size])
+
+                row = {'size': size, 'query': query, 'path': path, **summarize(measure(view_query, repeat))}
+                results.append(row)
+                print(f"{size:>9} {path:<9} {query:<18} p50={row['p50_ms']:>9.2f} ms  p95={row['p95_ms']:>9.2f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark wyszukiwania ofert pracy.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--page-size', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keepdb', action='store_true', help='Nie usuwaj bazy testowej po zakończeniu.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    args = parser.parse_args()
+
+    setup_django()
+    with temporary_database(keepdb=args.keepdb):
+        results = run(args.sizes, args.repeat, args.page_size, args.seed)
+    write_results(args.output, {'benchmark': 'job_search', 'results': results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import sys
+from contextlib import contextmanager
+
+from benchmarks.common import setup_django, temporary_database, write_results, read_results, peak_memory, \
+    find_regressions
+
+"""
+Benchmark ilości danych pobieranych z bazy danych przez strony list (bajty wartości w wierszach wyniku na stronę).
+
+Dla każdej listy wykonuje żądanie GET (jako najbardziej obciążony użytkownik danej roli, patrz benchmarks.views),
+zapisuje wykonane zapytania SELECT (kirismor.query_monitor), wykonuje je ponownie i sumuje rozmiar zwróconych
+wartości: tekst w UTF-8, bajty bez zmian, pozostałe typy jako długość ich zapisu tekstowego. Jest to przybliżenie
+danych przesyłanych z bazy danych do aplikacji, niezależne od protokołu sterownika.
+
+Każda lista jest mierzona dwukrotnie: z pomijaniem długich kolumn tekstowych (QuerySet.defer, stan bieżący) oraz
+z wyłączonym defer (stan sprzed wprowadzenia skrótów kirismor.excerpts; wiersze zawierają dodatkowo kolumnę skrótu).
+Dla obu wariantów podawane jest też szczytowe zużycie pamięci żądania.
+
+Generator danych (kirismor.datagen) tworzy teksty do 300 znaków, a opisy ofert mogą mieć do 2000 znaków,
+więc na danych produkcyjnych różnica jest zwykle większa.
+
+Użycie:
+    python -m benchmarks.list_payload --tiers small --output list_payload.json
+    python -m benchmarks.list_payload --tiers small --baseline list_payload.json --threshold 0.1
+"""
+
+LISTS = [
+    ('JobListView', 'jobs:job_list', 'candidate'),
+    ('PublicJobListView', 'jobs:public_job_list', None),
+    ('recruiter_job_list_view', 'jobs:recruiter_job_list', 'recruiter'),
+    ('recruiter_applications_view', 'jobs:recruiter_applications', 'recruiter'),
+    ('TaskListView', 'accounts:task_list', 'recruiter'),
+    ('recruiter_list_view', 'requests:recruiter_list', 'client'),
+]
+
+
+@contextmanager
+def without_defer():
+    """
+    Tymczasowo wyłącza QuerySet.defer (zapytania pobierają wszystkie kolumny modeli).
+    """
+    from django.db.models.query import QuerySet
+
+    original = QuerySet.defer
+    QuerySet.defer = lambda self, *fields: self
+    try:
+        yield
+    finally:
+        QuerySet.defer = original
+
+
+def value_size(value):
+    """
+    Zwraca rozmiar wartości kolumny w bajtach.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(str(value).encode('utf-8'))
+
+
+def page_payload(client, url):
+    """
+    Wykonuje żądanie GET i zwraca liczbę zapytań, liczbę wierszy i rozmiar danych zwróconych przez zapytania SELECT.
+    """
+    from django.core.cache import caches
+    from django.db import connections
+    from benchmarks.views import BENCHMARK_CACHES
+    from kirismor.query_monitor import record_queries
+
+    for alias in BENCHMARK_CACHES:
+        caches[alias].clear()
+    with record_queries() as recorder:
+        response = client.get(url)
+    if response.status_code != 200:
+        raise RuntimeError(f'{url}: odpowiedź {response.status_code}')
+
+    rows = size = 0
+    for alias, sql, params, _ in recorder.queries:
+        if not sql.lstrip().upper().startswith('SELECT'):
+            continue
+        with connections[alias].cursor() as cursor:
+            cursor.execute(sql, params)
+            for row in cursor.fetchall():
+                rows += 1
+                size += sum(value_size(value) for value in row)
+    return {'queries': recorder.count, 'rows': rows, 'bytes': size}
+
+
+def measure_list(client, url):
+    """
+    Mierzy stronę listy z pomijaniem długich kolumn i bez niego.
+    """
+    from benchmarks.views import timed_request
+
+    payload = page_payload(client, url)
+    memory = peak_memory(lambda: timed_request(client, url, warm=False))
+    with without_defer():
+        full = page_payload(client, url)
+        full_memory = peak_memory(lambda: timed_request(client, url, warm=False))
+    return {
+        'queries': payload['queries'],
+        'rows': payload['rows'],
+        'bytes': payload['bytes'],
+        'bytes_full': full['bytes'],
+        'saved_pct': round(100 * (1 - payload['bytes'] / full['bytes']), 1) if full['bytes'] else 0.0,
+        'peak_memory_kb': memory,
+        'peak_memory_full_kb': full_memory,
+    }
+
+
+def run(tiers, seed, chunk_size):
+    from django.urls import reverse
+    from benchmarks.views import TIERS, busiest_users, client_for
+    from kirismor.datagen import generate, scaled_counts
+
+    results = []
+    generated = 0
+    for number, tier in enumerate(sorted(tiers, key=TIERS.get)):
+        generate(scaled_counts(TIERS[tier] - generated), seed=seed + number, chunk_size=chunk_size,
+                 prefix=f'bench-{tier}')
+        generated = TIERS[tier]
+        users = busiest_users()
+
+        for view, url_name, role in LISTS:
+            url = reverse(url_name)
+            client = client_for(users[role] if role else None)
+            client.get(url)  # rozgrzewka: wczytanie szablonów i połączenie z bazą
+            row = {'tier': tier, 'view': view, **measure_list(client, url)}
+            results.append(row)
+            print(f"{tier:<7} {view:<28} rows={row['rows']:>4}  {row['bytes']:>9} B  (bez defer {row['bytes_full']:>9} B, "
+                  f"-{row['saved_pct']:>5.1f}%)  mem={row['peak_memory_kb']:>8.1f} KiB "
+                  f"(bez defer {row['peak_memory_full_kb']:>8.1f} KiB)")
+    return results
+
+
+def main():
+    from benchmarks.views import TIERS, BENCHMARK_CACHES
+
+    parser = argparse.ArgumentParser(description='Benchmark ilości danych pobieranych przez strony list.')
+    parser.add_argument('--tiers', nargs='+', choices=list(TIERS), default=['small'])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--keepdb', action='store_true', help='Nie usuwaj bazy testowej po zakończeniu.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    parser.add_argument('--baseline', help='Plik JSON z wynikami poprzedniego uruchomienia do porównania.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Dopuszczalny względny wzrost liczby bajtów na stronę względem --baseline (0.1 = 10%%).')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver'], CACHES=BENCHMARK_CACHES):
+        with temporary_database(keepdb=args.keepdb):
+            results = run(args.tiers, args.seed, args.chunk_size)
+    write_results(args.output, {'benchmark': 'list_payload', 'results': results})
+
+    if args.baseline:
+        regressions = find_regressions(results, read_results(args.baseline)['results'], ('tier', 'view'),
+                                       {'bytes': args.threshold, 'queries': 0})
+        for regression in regressions:
+            print(f'REGRESJA {regression}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
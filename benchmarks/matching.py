@@ -0,0 +1,122 @@
+import argparse
+import random
+
+from benchmarks.common import setup_django, temporary_database, measure, summarize, write_results
+
+"""
+Benchmark dopasowania kandydatów do ofert pracy (jobs.matching): przebudowa wszystkich wektorów TF-IDF
+(rebuild_match_vectors), aktualizacja wektora jednej oferty po zapisie, najlepsi kandydaci dla oferty
+(best_candidates) i polecane oferty dla kandydata (recommended_jobs).
+
+Umiejętności i wymagania są losowane ze słownika SKILLS i VOCABULARY_SIZE rzadszych słów z rozkładem
+zbliżonym do prawa Zipfa (kilka popularnych technologii i długi ogon specjalizacji).
+
+Użycie:
+    python -m benchmarks.matching --candidates 100000 --jobs 50000 --repeat 10 --output matching.json
+"""
+
+SKILLS = (
+    'python django flask sql postgresql mysql javascript typescript react angular vue node.js java spring kotlin '
+    'c# .net c++ go rust php laravel docker kubernetes aws azure linux git excel sap księgowość logistyka '
+    'spawanie cnc elektryka hydraulika wózek_widłowy prawo_jazdy_c angielski niemiecki obsługa_klienta sprzedaż'
+).split()
+
+# Liczba dodatkowych (rzadszych) słów w słowniku umiejętności
+VOCABULARY_SIZE = 5000
+
+# Liczba ofert i kandydatów, dla których mierzone są zapytania
+SAMPLES = 5
+
+
+def vocabulary():
+    words = SKILLS + [f'specjalizacja{number}' for number in range(VOCABULARY_SIZE)]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def random_skills(rng, words, weights, count):
+    return ', '.join(rng.choices(words, weights, k=count))
+
+
+def populate(candidates, jobs, rng, chunk_size=5000):
+    """
+    Tworzy kandydatów z profilami i oferty pracy przez bulk_create (bez sygnałów, wektory buduje rebuild).
+    """
+    from django.contrib.auth import get_user_model
+    from accounts.models import CandidateProfile
+    from jobs.models import Job
+
+    User = get_user_model()
+    words, weights = vocabulary()
+    recruiter = User.objects.create_user(email='bench-recruiter@example.com', password=None, role='recruiter')
+    for start in range(0, candidates, chunk_size):
+        users = User.objects.bulk_create([
+            User(email=f'bench{number}@example.com', role='candidate', is_active=True)
+            for number in range(start, min(start + chunk_size, candidates))
+        ])
+        CandidateProfile.objects.bulk_create([
+            CandidateProfile(user=user, first_name='Jan', last_name='Kowalski', phone_number='+48123456789',
+                             location='Warszawa', bio='Bio',
+                             skills=random_skills(rng, words, weights, rng.randint(3, 12)))
+            for user in users
+        ])
+    for start in range(0, jobs, chunk_size):
+        Job.objects.bulk_create([
+            Job(title=random_skills(rng, words, weights, 2).replace(',', ''), recruiter=recruiter,
+                description='Opis', requirements=random_skills(rng, words, weights, rng.randint(4, 15)),
+                salary=rng.randint(3000, 15000), status=rng.choice(['open', 'open', 'open', 'closed']))
+            for _ in range(min(chunk_size, jobs - start))
+        ])
+
+
+def run(candidates, jobs, repeat, seed, samples=SAMPLES):
+    from django.conf import settings
+    from accounts.models import CandidateProfile
+    from jobs import matching
+    from jobs.models import Job
+
+    rng = random.Random(seed)
+    populate(candidates, jobs, rng)
+    results = []
+
+    def report(operation, timings, **extra):
+        row = {'operation': operation, 'candidates': candidates, 'jobs': jobs, **summarize(timings), **extra}
+        results.append(row)
+        print(f"{operation:<20} p50={row['p50_ms']:>10.2f} ms  p95={row['p95_ms']:>10.2f} ms")
+
+    job_ids = rng.sample(list(Job.objects.filter(status='open').values_list('id', flat=True)), samples)
+    profile_ids = rng.sample(list(CandidateProfile.objects.values_list('pk', flat=True)), samples)
+    report('rebuild', measure(matching.rebuild_match_vectors, 1))
+    timings, matched = [], []
+    for job_id in job_ids:
+        timings += measure(lambda: matching.best_candidates(job_id, limit=settings.MATCH_RESULTS_LIMIT), repeat)
+        matched.append(len(matching.best_candidates(job_id)))
+    report('best_candidates', timings, matched=matched)
+    timings, matched = [], []
+    for profile_id in profile_ids:
+        timings += measure(lambda: matching.recommended_jobs(profile_id, limit=settings.MATCH_RESULTS_LIMIT), repeat)
+        matched.append(len(matching.recommended_jobs(profile_id)))
+    report('recommended_jobs', timings, matched=matched)
+    job = Job.objects.get(id=job_ids[0])
+    report('update_job_vector', measure(lambda: matching.update_job_vector(job), repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dopasowania kandydatów do ofert pracy.')
+    parser.add_argument('--candidates', type=int, default=100000)
+    parser.add_argument('--jobs', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keepdb', action='store_true', help='Nie usuwaj bazy testowej po zakończeniu.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    args = parser.parse_args()
+
+    setup_django()
+    with temporary_database(keepdb=args.keepdb):
+        results = run(args.candidates, args.jobs, args.repeat, args.seed)
+    write_results(args.output, {'benchmark': 'matching', 'results': results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+import argparse
+import random
+from decimal import Decimal
+
+from benchmarks.common import setup_django, temporary_database, measure, summarize, write_results
+from benchmarks.job_search import WORDS
+
+"""
+Benchmark dopasowania oferty pracy do zapisanych wyszukiwań (jobs.alerts): indeks odwrócony słów zapytań
+(matching_searches, jedno zapytanie po kluczach z prefiksów słów oferty) kontra sprawdzenie każdego zapisanego
+wyszukiwania po kolei (scan - koszt rośnie liniowo z liczbą wyszukiwań). Dla każdego rozmiaru zbioru mierzy
+p50/p95 dopasowania kilku ofert i podaje liczbę dopasowanych wyszukiwań (obie ścieżki muszą dać ten sam wynik).
+
+Słownik zapytań to słowa z benchmarks.job_search i VOCABULARY_SIZE rzadszych słów, więc większość wyszukiwań
+nie pasuje do danej oferty, tak jak w przypadku rzeczywistych zapisanych wyszukiwań.
+
+Użycie:
+    python -m benchmarks.saved_searches --sizes 10000 100000 1000000 --repeat 10 --output saved_searches.json
+"""
+
+# Liczba dodatkowych (rzadszych) słów w słowniku zapytań i ofert
+VOCABULARY_SIZE = 20000
+
+# Liczba kandydatów, do których należą zapisane wyszukiwania
+USERS = 1000
+
+
+def vocabulary():
+    return WORDS + [f'umiejetnosc{number}' for number in range(VOCABULARY_SIZE)]
+
+
+def random_query(rng, words):
+    terms = rng.sample(words, rng.choice((1, 1, 2, 2, 3)))
+    # Część słów jest zapisana jako prefiks, tak jak wpisują je użytkownicy wyszukiwarki
+    return ' '.join(term[:rng.randint(3, len(term))] if rng.random() < 0.3 else term for term in terms)
+
+
+def populate(size, users, rng, words, chunk_size=10000):
+    """
+    Uzupełnia tabelę zapisanych wyszukiwań do zadanego rozmiaru (bez SavedSearch.save, wpisy indeksu odwróconego
+    są zapisywane przez bulk_create).
+    """
+    from jobs.models import SavedSearch, SavedSearchTerm
+    from jobs.search import tokenize_query
+
+    existing = SavedSearch.objects.count()
+    while existing < size:
+        batch = []
+        for _ in range(min(chunk_size, size - existing)):
+            query = random_query(rng, words)
+            min_salary = Decimal(rng.randrange(3000, 15000, 500)) if rng.random() < 0.3 else None
+            batch.append(SavedSearch(user=rng.choice(users), query=query, min_salary=min_salary,
+                                     term_count=len(tokenize_query(query))))
+        searches = SavedSearch.objects.bulk_create(batch)
+        SavedSearchTerm.objects.bulk_create([
+            SavedSearchTerm(search=search, term=term) for search in searches for term in tokenize_query(search.query)
+        ])
+        existing += len(batch)
+
+
+def scan(job):
+    """
+    Dopasowanie bez indeksu: sprawdza każde zapisane wyszukiwanie (punkt odniesienia).
+    """
+    from jobs.alerts import job_terms, term_prefixes
+    from jobs.models import SavedSearch, SavedSearchTerm
+
+    prefixes = term_prefixes(job_terms(job))
+    terms = {}
+    for search_id, term in SavedSearchTerm.objects.values_list('search_id', 'term').iterator(chunk_size=10000):
+        terms.setdefault(search_id, []).append(term)
+
+    matched = []
+    searches = SavedSearch.objects.values_list('id', 'user_id', 'min_salary').iterator(chunk_size=10000)
+    for search_id, user_id, min_salary in searches:
+        search_terms = terms.get(search_id)
+        if user_id == job.recruiter_id or not search_terms or not all(term in prefixes for term in search_terms):
+            continue
+        if min_salary is None or (job.salary is not None and job.salary >= min_salary):
+            matched.append(search_id)
+    return matched
+
+
+def run(sizes, repeat, jobs, seed, scan_limit):
+    from django.contrib.auth import get_user_model
+    from jobs.alerts import matching_searches
+    from jobs.models import Job
+
+    User = get_user_model()
+    rng = random.Random(seed)
+    words = vocabulary()
+    users = User.objects.bulk_create([User(email=f'bench{number}@example.com', role='candidate')
+                                      for number in range(USERS)])
+    recruiter = User.objects.create_user(email='bench-recruiter@example.com', password=None, role='recruiter')
+    sample_jobs = [
+        Job.objects.create(
+            title=' '.join(rng.choice(words) for _ in range(3)).capitalize(), recruiter=recruiter,
+            description=' '.join(rng.choice(words) for _ in range(120)),
+            requirements=' '.join(rng.choice(words) for _ in range(40)),
+            salary=rng.randint(3000, 15000),
+        )
+        for _ in range(jobs)
+    ]
+
+    results = []
+    for size in sorted(sizes):
+        populate(size, users, rng, words)
+        for number, job in enumerate(sample_jobs):
+            paths = [('percolator', lambda: list(matching_searches(job).values_list('id', flat=True)))]
+            if size <= scan_limit:
+                paths.append(('scan', lambda: scan(job)))
+            for path, match in paths:
+                row = {'size': size, 'job': number, 'path': path, 'matches': len(match()),
+                       **summarize(measure(match, repeat))}
+                results.append(row)
+                print(f"{size:>9} {path:<11} oferta {number}  dopasowania={row['matches']:>6}  "
+                      f"p50={row['p50_ms']:>9.2f} ms  p95={row['p95_ms']:>9.2f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dopasowania ofert do zapisanych wyszukiwań.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--jobs', type=int, default=3, help='Liczba dopasowywanych ofert.')
+    parser.add_argument('--scan-limit', type=int, default=100000,
+                        help='Największy rozmiar zbioru mierzony również ścieżką scan.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keepdb', action='store_true', help='Nie usuwaj bazy testowej po zakończeniu.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    args = parser.parse_args()
+
+    setup_django()
+    with temporary_database(keepdb=args.keepdb):
+        results = run(args.sizes, args.repeat, args.jobs, args.seed, args.scan_limit)
+    write_results(args.output, {'benchmark': 'saved_searches', 'results': results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import (setup_django, temporary_database, summarize, write_results, read_results, peak_memory,
+                               find_regressions)
+
+"""
+Benchmark czasu odpowiedzi widoków list na danych z generatora (kirismor.datagen) w kilku skalach.
+
+Dla każdego widoku mierzy p50/p95/p99 czasu odpowiedzi klienta testowego Django, liczbę zapytań SQL na żądanie,
+szczytowe zużycie pamięci jednego żądania oraz przepustowość (żądania/s, także przy --threads > 1). Widoki są
+wywoływane jako najbardziej obciążony użytkownik danej roli (np. rekruter z największą liczbą ofert).
+Pamięć podręczna jest czyszczona przed każdym żądaniem (chyba że podano --warm), więc mierzony jest koszt widoku.
+
+Wyniki można porównać z poprzednim uruchomieniem (--baseline): wzrost p95 lub pamięci ponad --threshold albo
+jakikolwiek wzrost liczby zapytań kończy benchmark kodem 1.
+
+Użycie:
+    python -m benchmarks.views --tiers small medium --repeat 30 --output views.json
+    python -m benchmarks.views --tiers small --threads 4 --baseline views.json --threshold 0.2
+"""
+
+# Skala danych generatora (kirismor.datagen.BASE_COUNTS) dla każdego poziomu
+TIERS = {'small': 0.1, 'medium': 1, 'large': 10}
+
+VIEWS = [
+    ('JobListView', 'jobs:job_list', 'candidate'),
+    ('PublicJobListView', 'jobs:public_job_list', None),
+    ('recruiter_applications_view', 'jobs:recruiter_applications', 'recruiter'),
+    ('recruiter_list_view', 'requests:recruiter_list', 'client'),
+    ('TaskListView', 'accounts:task_list', 'recruiter'),
+    ('all_news_view', 'news:all_news_view', None),
+    ('dashboard_view', 'accounts:dashboard', 'candidate'),
+]
+
+# Osobna pamięć podręczna benchmarku: czyszczenie nie może dotknąć pamięci skonfigurowanej w kirismor.settings
+BENCHMARK_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'benchmark-{alias}'}
+    for alias in ('default', 'pages')
+}
+
+
+def busiest_users():
+    """
+    Zwraca użytkowników każdej roli z największą liczbą powiązanych wierszy (najdroższy przypadek widoku).
+    """
+    from django.contrib.auth import get_user_model
+    from django.db.models import Count
+
+    users = get_user_model().objects.order_by('pk')
+    return {
+        'recruiter': users.filter(role='recruiter').annotate(total=Count('jobs_managed')).order_by('-total').first(),
+        'candidate': users.filter(role='candidate').annotate(total=Count('applications')).order_by('-total').first(),
+        'client': users.filter(role='client').annotate(total=Count('job_requests')).order_by('-total').first(),
+    }
+
+
+def client_for(user):
+    """
+    Zwraca klienta testowego zalogowanego jako `user` (lub anonimowego dla None).
+    """
+    from django.test import Client
+
+    client = Client()
+    if user is not None:
+        client.force_login(user)
+    return client
+
+
+def timed_request(client, url, warm):
+    """
+    Wykonuje żądanie GET i zwraca (czas w milisekundach, liczba zapytań SQL).
+    """
+    from django.core.cache import caches
+    from kirismor.query_monitor import record_queries
+
+    if not warm:
+        for alias in BENCHMARK_CACHES:
+            caches[alias].clear()
+    with record_queries() as recorder:
+        start = time.perf_counter()
+        response = client.get(url)
+        elapsed = (time.perf_counter() - start) * 1000
+    if response.status_code != 200:
+        raise RuntimeError(f'{url}: odpowiedź {response.status_code}')
+    return elapsed, recorder.count
+
+
+def measure_view(url, user, repeat, threads, warm):
+    """
+    Wykonuje `repeat` żądań (rozłożonych na `threads` wątków) i zwraca czasy, liczby zapytań i czas całkowity.
+    """
+    from django.db import connection
+
+    def worker(requests):
+        client = client_for(user)
+        try:
+            return [timed_request(client, url, warm) for _ in range(requests)]
+        finally:
+            if threads > 1:
+                connection.close()
+
+    shares = [repeat // threads + (1 if number < repeat % threads else 0) for number in range(threads)]
+    started = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(threads) as executor:
+            samples = [sample for chunk in executor.map(worker, shares) for sample in chunk]
+    else:
+        samples = worker(repeat)
+    return samples, time.perf_counter() - started
+
+
+def run(tiers, repeat, threads, warm, seed, chunk_size):
+    from django.urls import reverse
+    from kirismor.datagen import generate, scaled_counts
+
+    results = []
+    generated = 0
+    for number, tier in enumerate(sorted(tiers, key=TIERS.get)):
+        # Kolejne poziomy dogenerowują brakujące dane zamiast tworzyć bazę od nowa
+        generate(scaled_counts(TIERS[tier] - generated), seed=seed + number, chunk_size=chunk_size,
+                 prefix=f'bench-{tier}')
+        generated = TIERS[tier]
+        users = busiest_users()
+
+        for view, url_name, role in VIEWS:
+            url = reverse(url_name)
+            user = users[role] if role else None
+            client = client_for(user)
+            timed_request(client, url, warm)  # rozgrzewka: wczytanie szablonów i połączenie z bazą
+            samples, seconds = measure_view(url, user, repeat, threads, warm)
+            row = {
+                'tier': tier,
+                'view': view,
+                'threads': threads,
+                **summarize([elapsed for elapsed, _ in samples]),
+                'queries': max(queries for _, queries in samples),
+                'peak_memory_kb': peak_memory(lambda: timed_request(client, url, warm)),
+                'requests_per_second': round(len(samples) / seconds, 1),
+            }
+            results.append(row)
+            print(f"{tier:<7} {view:<28} p50={row['p50_ms']:>8.2f} ms  p95={row['p95_ms']:>8.2f} ms  "
+                  f"p99={row['p99_ms']:>8.2f} ms  queries={row['queries']:>3}  mem={row['peak_memory_kb']:>8.1f} KiB  "
+                  f"{row['requests_per_second']:>7.1f} req/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark czasu odpowiedzi widoków list.')
+    parser.add_argument('--tiers', nargs='+', choices=list(TIERS), default=['small', 'medium'])
+    parser.add_argument('--repeat', type=int, default=30, help='Liczba żądań do każdego widoku.')
+    parser.add_argument('--threads', type=int, default=1, help='Liczba wątków wysyłających żądania równocześnie.')
+    parser.add_argument('--warm', action='store_true', help='Nie czyść pamięci podręcznej przed żądaniami.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    parser.add_argument('--keepdb', action='store_true', help='Nie usuwaj bazy testowej po zakończeniu.')
+    parser.add_argument('--output', help='Ścieżka pliku JSON z wynikami.')
+    parser.add_argument('--baseline', help='Plik JSON z wynikami poprzedniego uruchomienia do porównania.')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Dopuszczalny względny wzrost p95 i pamięci względem --baseline (0.2 = 20%%).')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    # DEBUG = False jak w produkcji (bez zapisu connection.queries); 'testserver' to host klienta testowego
+    with override_settings(DEBUG=False, ALLOWED_HOSTS=['testserver'], CACHES=BENCHMARK_CACHES):
+        with temporary_database(keepdb=args.keepdb):
+            results = run(args.tiers, args.repeat, args.threads, args.warm, args.seed, args.chunk_size)
+    write_results(args.output, {'benchmark': 'views', 'results': results})
+
+    if args.baseline:
+        regressions = find_regressions(results, read_results(args.baseline)['results'], ('tier', 'view', 'threads'),
+                                       {'p95_ms': args.threshold, 'peak_memory_kb': args.threshold, 'queries': 0})
+        for regression in regressions:
+            print(f'REGRESJA {regression}')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,10 @@
 from django.contrib import admin
-from .models import Job, Application, GuestFeedback, TempGuestFeedback, Like, Favorite
+from .models import Job, Application, GuestFeedback, TempGuestFeedback, Like, Favorite, SavedSearch
 
 """
 Importy:
 - from django.contrib import admin: Importuje moduł administracyjny Django, który umożliwia tworzenie panelu administracyjnego dla modeli.
-- from .models import Job, Application, GuestFeedback, TempGuestFeedback, Like, Favorite: Importuje modele, które będą zarządzane przez panel administracyjny.
+- from .models import Job, Application, GuestFeedback, TempGuestFeedback, Like, Favorite, SavedSearch: Importuje modele, które będą zarządzane przez panel administracyjny.
 """
 
 
@@ -114,6 +114,24 @@ class FavoriteAdmin(admin.ModelAdmin):
     ordering = ('created_at',)
 
 
+class SavedSearchAdmin(admin.ModelAdmin):
+    """
+    Konfiguracja administracyjna dla modelu SavedSearch.
+
+    Atrybuty:
+        list_display (tuple): Pola wyświetlane w widoku listy.
+        search_fields (tuple): Pola, które można przeszukiwać.
+        list_filter (tuple): Pola, według których można filtrować.
+        ordering (tuple): Kolejność sortowania w widoku listy.
+        fields (tuple): Pola wyświetlane w formularzu edycji.
+    """
+    list_display = ('user', 'query', 'min_salary', 'created_at')
+    search_fields = ('user__email', 'query')
+    list_filter = ('created_at',)
+    ordering = ('created_at',)
+    fields = ('user', 'query', 'min_salary')
+
+
 # Rejestracja modeli i ich konfiguracji w panelu administracyjnym
 admin.site.register(Job, JobAdmin)
 admin.site.register(Application, ApplicationAdmin)
@@ -121,3 +139,4 @@ admin.site.register(GuestFeedback, GuestFeedbackAdmin)
 admin.site.register(TempGuestFeedback, TempGuestFeedbackAdmin)
 admin.site.register(Like, LikeAdmin)
 admin.site.register(Favorite, FavoriteAdmin)
+admin.site.register(SavedSearch, SavedSearchAdmin)
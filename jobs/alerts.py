@@ -0,0 +1,184 @@
+import re
+from itertools import groupby, islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from accounts.outbox import enqueue_email
+from jobs.models import PendingJobAlert, SavedSearch, SavedSearchMatch
+
+"""
+Importy:
+- import re: Importuje wyrażenia regularne, używane do podziału tekstu oferty na słowa.
+- from itertools import groupby, islice: Importuje grupowanie dopasowań według kandydata i dzielenie wyników
+  na partie.
+- from django.conf import settings: Importuje ustawienia projektu (rozmiar partii, liczba ofert w powiadomieniu,
+  adres strony, nadawca).
+- from django.db import transaction: Importuje moduł transakcji, używany do pobierania kolejki z blokadą wierszy
+  i do zapisu powiadomienia razem z oznaczeniem dopasowań.
+- from django.db.models import Count, F, Q: Importuje wyrażenia używane w zapytaniu dopasowującym ofertę
+  do zapisanych wyszukiwań.
+- from django.urls import reverse: Importuje funkcję budującą adresy ofert w powiadomieniu.
+- from django.utils import timezone: Importuje bieżący czas, zapisywany przy oznaczaniu dopasowań.
+- from django.utils.translation import gettext as _: Importuje funkcję tłumaczenia tekstów powiadomienia.
+- from accounts.outbox import enqueue_email: Importuje kolejkę wiadomości e-mail (wysyłka komendą send_outbox_emails).
+- from jobs.models import PendingJobAlert, SavedSearch, SavedSearchMatch: Importuje modele kolejki ofert
+  do dopasowania, zapisanych wyszukiwań i dopasowań.
+
+Moduł zawiera powiadomienia o nowych ofertach pracy dla zapisanych wyszukiwań kandydatów (odwrócone wyszukiwanie,
+tzw. perkolacja: to oferta jest "zapytaniem" do zbioru zapisanych wyszukiwań):
+- queue_job_alerts: dodaje utworzoną lub ponownie otwartą ofertę do kolejki (widoki common_create_job_view
+  i update_job_status).
+- matching_searches / percolate_job: dopasowanie oferty do zapisanych wyszukiwań przez indeks odwrócony
+  słów zapytań (SavedSearchTerm). Słowa zapytania są prefiksami, tak jak w wyszukiwaniu ofert (jobs.search),
+  więc zbiór kluczy to wszystkie prefiksy słów oferty; koszt zależy od liczby słów oferty, a nie od liczby
+  zapisanych wyszukiwań.
+- send_job_alert_digests: jedno zbiorcze powiadomienie e-mail na kandydata z ofertami dopasowanymi od
+  poprzedniego powiadomienia.
+"""
+
+# Maksymalna długość słowa oferty branego pod uwagę (dłuższe słowa nie są dopasowywane przez słowa zapytań)
+MAX_TERM_LENGTH = 100
+
+
+def job_terms(job):
+    """
+    Zwraca zbiór słów oferty (małymi literami) z pól przeszukiwanych przez wyszukiwarkę ofert: tytułu, wymagań,
+    opisu i wynagrodzenia.
+    """
+    text = ' '.join([job.title, job.requirements, job.description, '' if job.salary is None else str(job.salary)])
+    return {term for term in re.findall(r'\w+', text.lower()) if len(term) <= MAX_TERM_LENGTH}
+
+
+def term_prefixes(terms):
+    """
+    Zwraca wszystkie prefiksy słów, np. {'python'} -> {'p', 'py', 'pyt', 'pyth', 'pytho', 'python'}.
+    Słowo zapytania 'pyth' pasuje do oferty, jeśli jest jednym z prefiksów jej słów.
+    """
+    return {term[:length] for term in terms for length in range(1, len(term) + 1)}
+
+
+def matching_searches(job):
+    """
+    Zwraca zapisane wyszukiwania pasujące do oferty: wszystkie słowa zapytania są prefiksami słów oferty,
+    a wynagrodzenie oferty jest nie mniejsze niż minimalne wynagrodzenie wyszukiwania (jeśli je podano).
+    Wyszukiwania autora oferty są pomijane.
+
+    Zapytanie wybiera z indeksu odwróconego (SavedSearchTerm.term) wpisy o kluczach z term_prefixes i zlicza
+    je dla każdego wyszukiwania; wyszukiwanie pasuje, gdy liczba trafionych słów równa się liczbie jego słów.
+
+    Args:
+        job (Job): Oferta pracy.
+
+    Returns:
+        QuerySet: Zapisane wyszukiwania (SavedSearch) pasujące do oferty.
+    """
+    prefixes = term_prefixes(job_terms(job))
+    if not prefixes:
+        return SavedSearch.objects.none()
+    salary = Q(min_salary__isnull=True)
+    if job.salary is not None:
+        salary |= Q(min_salary__lte=job.salary)
+    return (
+        SavedSearch.objects.filter(terms__term__in=prefixes)
+        .annotate(hits=Count('terms'))
+        .filter(salary, hits=F('term_count'))
+        .exclude(user=job.recruiter_id)
+    )
+
+
+def queue_job_alerts(job):
+    """
+    Dodaje otwartą ofertę do kolejki dopasowania (zapisywana w bieżącej transakcji). Dopasowanie i powiadomienia
+    wykonuje komenda send_job_alerts, więc żądanie nie czeka na dopasowanie.
+
+    Args:
+        job (Job): Utworzona lub ponownie otwarta oferta pracy.
+    """
+    if job.is_open():
+        PendingJobAlert.objects.get_or_create(job=job)
+
+
+def percolate_job(job):
+    """
+    Zapisuje dopasowania oferty do zapisanych wyszukiwań (partiami po JOB_ALERT_BATCH_SIZE wierszy).
+    Oferta dopasowana wcześniej do tego samego wyszukiwania (np. ponownie otwarta) nie jest dodawana ponownie.
+
+    Args:
+        job (Job): Oferta pracy.
+
+    Returns:
+        int: Liczba pasujących zapisanych wyszukiwań.
+    """
+    search_ids = matching_searches(job).values_list('id', flat=True).iterator()
+    matched = 0
+    while batch := list(islice(search_ids, settings.JOB_ALERT_BATCH_SIZE)):
+        SavedSearchMatch.objects.bulk_create([SavedSearchMatch(search_id=search_id, job=job) for search_id in batch],
+                                             ignore_conflicts=True)
+        matched += len(batch)
+    return matched
+
+
+def percolate_pending_jobs():
+    """
+    Dopasowuje oferty z kolejki do zapisanych wyszukiwań, pobierając je po jednej z blokadą (SKIP LOCKED),
+    aby kilka równoległych procesów nie dopasowało tej samej oferty.
+
+    Returns:
+        int: Liczba dopasowanych ofert.
+    """
+    processed = 0
+    while True:
+        with transaction.atomic():
+            pending = (PendingJobAlert.objects.select_for_update(skip_locked=True).select_related('job')
+                       .order_by('created_at').first())
+            if pending is None:
+                return processed
+            if pending.job.is_open():
+                percolate_job(pending.job)
+            pending.delete()
+        processed += 1
+
+
+def _digest_message(user, jobs):
+    lines = [_('Nowe oferty pracy pasujące do Twoich zapisanych wyszukiwań:'), '']
+    for job in jobs:
+        lines.append(f"- {job.title}: {settings.SITE_URL}{reverse('jobs:job_detail', kwargs={'job_id': job.pk})}")
+    lines += ['', _('Zapisanymi wyszukiwaniami możesz zarządzać tutaj: {url}').format(
+        url=f"{settings.SITE_URL}{reverse('jobs:saved_search_list')}")]
+    return '\n'.join(lines)
+
+
+def send_job_alert_digests():
+    """
+    Dodaje do kolejki wiadomości e-mail jedno zbiorcze powiadomienie na kandydata z otwartymi ofertami
+    dopasowanymi od poprzedniego powiadomienia (najnowsze, najwyżej JOB_ALERT_DIGEST_LIMIT ofert) i oznacza
+    dopasowania jako wysłane w tej samej transakcji.
+
+    Returns:
+        int: Liczba powiadomień dodanych do kolejki.
+    """
+    started = timezone.now()
+    pending = (
+        SavedSearchMatch.objects.filter(notified_at__isnull=True, created_at__lte=started)
+        .select_related('job', 'search__user')
+        .only('id', 'job__id', 'job__title', 'job__status', 'job__created_at', 'search__user__id',
+              'search__user__email', 'search__user__is_active')
+        .order_by('search__user_id', '-job__created_at', '-job_id')
+    )
+    digests = 0
+    for _user_id, matches in groupby(pending.iterator(), key=lambda match: match.search.user_id):
+        matches = list(matches)
+        user = matches[0].search.user
+        jobs = list({match.job.pk: match.job for match in matches if match.job.is_open()}.values())
+        with transaction.atomic():
+            if jobs and user.is_active:
+                enqueue_email(_('Nowe oferty pracy dla Twoich zapisanych wyszukiwań'),
+                              _digest_message(user, jobs[:settings.JOB_ALERT_DIGEST_LIMIT]),
+                              settings.EMAIL_HOST_USER, [user.email])
+                digests += 1
+            SavedSearchMatch.objects.filter(id__in=[match.id for match in matches]).update(notified_at=started)
+    return digests
@@ -1,6 +1,40 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, post_save, post_delete, pre_delete
 
 
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
+
+    def ready(self):
+        from accounts.models import CandidateProfile, User
+        from jobs import matching
+        from jobs.featured import invalidate_featured_jobs
+        from jobs.models import Job, Application
+        from jobs.search import ensure_sqlite_triggers
+        from kirismor import counting, page_cache
+
+        # SQLite usuwa wyzwalacze FTS5 przy przebudowie tabeli jobs_job, więc odtwarzamy je po każdej migracji
+        post_migrate.connect(ensure_sqlite_triggers, sender=self, dispatch_uid='jobs_ensure_sqlite_triggers')
+
+        # Liczniki paginacji (kirismor.counting) są unieważniane po dodaniu, usunięciu lub zmianie statusu, a liczniki
+        # wyszukiwania aplikacji rekrutera również po zmianie tytułu oferty oraz nazwiska lub e-maila kandydata
+        counting.track_model(Job, fields=('status', 'title'))
+        counting.track_model(Application)
+        counting.track_model(CandidateProfile, fields=('first_name', 'last_name'))
+        counting.track_model(User, fields=('email',))
+
+        # Migawka wyróżnionych ofert na stronie głównej jest odbudowywana po dodaniu, zmianie lub zamknięciu oferty
+        post_save.connect(invalidate_featured_jobs, sender=Job, dispatch_uid='jobs_featured_save')
+        post_delete.connect(invalidate_featured_jobs, sender=Job, dispatch_uid='jobs_featured_delete')
+
+        # Strony publiczne zapisane w pamięci podręcznej (kirismor.page_cache): listy ofert i strona szczegółów oferty
+        page_cache.track_model(Job, 'jobs', 'job:{instance.pk}')
+
+        # Wektory dopasowania kandydatów do ofert (jobs.matching) są aktualizowane po zapisie profilu lub oferty
+        post_save.connect(matching.candidate_profile_saved, sender=CandidateProfile,
+                          dispatch_uid='jobs_matching_profile_save')
+        post_save.connect(matching.job_saved, sender=Job, dispatch_uid='jobs_matching_job_save')
+        pre_delete.connect(matching.candidate_profile_deleted, sender=CandidateProfile,
+                           dispatch_uid='jobs_matching_profile_delete')
+        pre_delete.connect(matching.job_deleted, sender=Job, dispatch_uid='jobs_matching_job_delete')
@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Substr
+from jobs.models import Job
+
+"""
+Importy:
+- from django.conf import settings: Importuje ustawienia projektu (liczba ofert w karuzeli i czas przechowywania).
+- from django.core.cache import cache: Importuje domyślną pamięć podręczną, w której przechowywana jest migawka ofert.
+- from django.db import transaction: Importuje moduł transakcji, używany do odbudowy migawki po zatwierdzeniu zmian.
+- from django.db.models import F: Importuje wyrażenie F, używane do obliczania popularności z liczników oferty.
+- from django.db.models.functions import Substr: Importuje funkcję Substr, dzięki której baza danych zwraca tylko
+  początek długich pól tekstowych.
+- from jobs.models import Job: Importuje model Job.
+
+Moduł zawiera migawkę wyróżnionych ofert pracy wyświetlanych w karuzeli na stronie głównej (HomeView).
+Migawka ma ograniczony rozmiar, zawiera tylko pola potrzebne karuzeli i jest przechowywana w pamięci podręcznej,
+więc w stanie ustalonym strona główna nie wykonuje zapytań do bazy danych.
+"""
+
+# Klucz migawki w pamięci podręcznej
+FEATURED_CACHE_KEY = 'jobs:featured'
+
+# Maksymalna długość fragmentów opisu i wymagań wyświetlanych w karuzeli
+EXCERPT_LENGTH = 300
+
+# Liczba najnowszych otwartych ofert branych pod uwagę przy rankingu popularności (ogranicza koszt odbudowy)
+CANDIDATES = 500
+
+# Pola, których zmiana wymaga odbudowy migawki
+FEATURED_FIELDS = {'title', 'description', 'requirements', 'status'}
+
+
+def build_featured_jobs(limit=None):
+    """
+    Oblicza migawkę wyróżnionych ofert pracy: spośród CANDIDATES najnowszych otwartych ofert wybiera najpopularniejsze
+    (polubienia i dodania do ulubionych), a przy równej popularności najnowsze.
+
+    Args:
+        limit (int): Maksymalna liczba ofert (domyślnie FEATURED_JOBS_LIMIT).
+
+    Returns:
+        list: Lista słowników z polami id, title, description i requirements (skróconymi do EXCERPT_LENGTH).
+    """
+    limit = limit or settings.FEATURED_JOBS_LIMIT
+    candidates = Job.objects.filter(status=Job.JobStatus.OPEN).order_by('-created_at', '-id').values('id')[:CANDIDATES]
+    jobs = Job.objects.filter(id__in=candidates).annotate(
+        popularity=F('likes_count') + F('favorites_count'),
+        # Jeden znak więcej niż fragment, aby szablon mógł oznaczyć skrócony tekst wielokropkiem
+        description_excerpt=Substr('description', 1, EXCERPT_LENGTH + 1),
+        requirements_excerpt=Substr('requirements', 1, EXCERPT_LENGTH + 1),
+    ).order_by('-popularity', '-created_at', '-id').values(
+        'id', 'title', 'description_excerpt', 'requirements_excerpt'
+    )[:limit]
+    return [
+        {
+            'id': job['id'],
+            'title': job['title'],
+            'description': job['description_excerpt'],
+            'requirements': job['requirements_excerpt'],
+        }
+        for job in jobs
+    ]
+
+
+def refresh_featured_jobs():
+    """
+    Odbudowuje migawkę wyróżnionych ofert i zapisuje ją w pamięci podręcznej.
+
+    Returns:
+        list: Nowa migawka.
+    """
+    featured = build_featured_jobs()
+    cache.set(FEATURED_CACHE_KEY, featured, settings.FEATURED_JOBS_TIMEOUT)
+    return featured
+
+
+def get_featured_jobs():
+    """
+    Zwraca migawkę wyróżnionych ofert z pamięci podręcznej, odbudowując ją, jeśli jej brakuje.
+
+    Returns:
+        list: Lista wyróżnionych ofert pracy.
+    """
+    featured = cache.get(FEATURED_CACHE_KEY)
+    if featured is None:
+        featured = refresh_featured_jobs()
+    return featured
+
+
+def invalidate_featured_jobs(**kwargs):
+    """
+    Usuwa migawkę z pamięci podręcznej i odbudowuje ją po zatwierdzeniu transakcji.
+    Podłączone do sygnałów post_save i post_delete modelu Job w JobsConfig.ready.
+    """
+    update_fields = kwargs.get('update_fields')
+    if not kwargs.get('created') and update_fields is not None and not FEATURED_FIELDS & set(update_fields):
+        return
+    cache.delete(FEATURED_CACHE_KEY)
+    transaction.on_commit(refresh_featured_jobs)
@@ -1,12 +1,14 @@
 from django import forms
 from django.utils.translation import gettext_lazy as _
-from .models import Job, Application, GuestFeedback
+from .models import Job, Application, GuestFeedback, SavedSearch
+from .search import tokenize_query
 
 """
 Importy:
 - from django import forms: Importuje moduł formularzy Django, który umożliwia tworzenie i zarządzanie formularzami.
 - from django.utils.translation import gettext_lazy as _: Importuje funkcję tłumaczenia, która umożliwia międzynarodowe tłumaczenie tekstów.
-- from .models import Job, Application, GuestFeedback: Importuje modele, które będą używane w formularzach.
+- from .models import Job, Application, GuestFeedback, SavedSearch: Importuje modele, które będą używane w formularzach.
+- from .search import tokenize_query: Importuje podział zapytania wyszukiwania na słowa, używany do walidacji słów kluczowych zapisanego wyszukiwania.
 """
 
 
@@ -116,3 +118,42 @@ class GuestFeedbackForm(forms.ModelForm):
                 'placeholder': _('Wprowadź numer telefonu')
             }),
         }
+
+
+class SavedSearchForm(forms.ModelForm):
+    """
+    Formularz do zapisywania wyszukiwań ofert pracy przez kandydata.
+
+    Meta klasa:
+        model (SavedSearch): Model, który formularz reprezentuje.
+        fields (list): Lista pól modelu, które będą uwzględnione w formularzu.
+        labels (dict): Słownik mapujący nazwy pól na etykiety do wyświetlenia w formularzu.
+        widgets (dict): Słownik określający widgety formularza dla poszczególnych pól.
+    """
+
+    class Meta:
+        model = SavedSearch
+        fields = ['query', 'min_salary']
+        labels = {
+            'query': _('Słowa kluczowe'),
+            'min_salary': _('Minimalne wynagrodzenie (opcjonalnie)'),
+        }
+        widgets = {
+            'query': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': _('Wprowadź słowa kluczowe')
+            }),
+            'min_salary': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'placeholder': _('Wprowadź minimalne wynagrodzenie')
+            }),
+        }
+
+    def clean_query(self):
+        """
+        Sprawdza, czy słowa kluczowe zawierają co najmniej jedno słowo.
+        """
+        query = self.cleaned_data['query']
+        if not tokenize_query(query):
+            raise forms.ValidationError(_('Wprowadź co najmniej jedno słowo kluczowe.'))
+        return query
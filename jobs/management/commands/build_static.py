@@ -0,0 +1,58 @@
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from kirismor.staticfiles import derivative_name
+
+
+class Command(BaseCommand):
+    """
+    Komenda budująca pliki statyczne do wdrożenia (kirismor.staticfiles): zbiera je do STATIC_ROOT (collectstatic),
+    buduje zminifikowane pakiety CSS i pochodne obrazów, nadaje nazwy z sumą kontrolną zawartości i zapisuje
+    warianty .gz/.br, a na końcu wypisuje rozmiary plików przed i po budowaniu.
+
+    Użycie:
+        python manage.py build_static [--clear]
+    """
+    help = 'Buduje pliki statyczne: nazwy z sumą kontrolną, pakiety CSS, pochodne obrazów oraz warianty .gz i .br.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true',
+                            help='Usuwa dotychczasowe pliki z STATIC_ROOT przed budowaniem.')
+
+    def size(self, name):
+        path = staticfiles_storage.path(staticfiles_storage.stored_name(name))
+        return os.path.getsize(path)
+
+    def compressed_size(self, name):
+        path = staticfiles_storage.path(staticfiles_storage.stored_name(name))
+        sizes = [os.path.getsize(path + extension) for extension in ('.br', '.gz') if os.path.exists(path + extension)]
+        return min(sizes) if sizes else self.size(name)
+
+    def handle(self, *args, **options):
+        call_command('collectstatic', interactive=False, clear=options['clear'],
+                     verbosity=max(options['verbosity'] - 1, 0))
+        if not getattr(staticfiles_storage, 'is_built', None):
+            self.stdout.write(self.style.WARNING('STORAGES["staticfiles"] nie buduje pakietów ani pochodnych obrazów.'))
+            return
+        if not options['verbosity']:
+            return
+
+        for bundle, sources in settings.STATIC_BUNDLES.items():
+            source_size = sum(os.path.getsize(finders.find(source)) for source in sources if finders.find(source))
+            self.stdout.write(f'{staticfiles_storage.stored_name(bundle)}: {source_size} B -> {self.size(bundle)} B '
+                              f'(skompresowany {self.compressed_size(bundle)} B)')
+        for name, widths in settings.STATIC_IMAGE_WIDTHS.items():
+            source = finders.find(name)
+            if not source:
+                continue
+            for width in widths:
+                derivatives = ', '.join(f'{derivative} {self.size(derivative)} B' for derivative in
+                                        (derivative_name(name, width), derivative_name(name, width, 'webp')))
+                self.stdout.write(f'{name} ({os.path.getsize(source)} B) -> {derivatives}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Pliki statyczne zbudowane w {settings.STATIC_ROOT} (plików: {len(staticfiles_storage.hashed_files)}).'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from jobs.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Komenda odbudowująca dokumenty wyszukiwania pełnotekstowego dla wszystkich ofert pracy.
+
+    Użycie:
+        python manage.py rebuild_job_search_index
+    """
+    help = 'Odbudowuje indeks wyszukiwania pełnotekstowego ofert pracy (tsvector w PostgreSQL, FTS5 w SQLite).'
+
+    def handle(self, *args, **options):
+        rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'Indeks wyszukiwania odbudowany ({connection.vendor}).'))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs import matching
+
+
+class Command(BaseCommand):
+    """
+    Komenda przeliczająca od nowa wektory TF-IDF dopasowania kandydatów do ofert pracy (jobs.matching).
+
+    Wektory są aktualizowane przy zapisie profilu kandydata lub oferty, ale z wagami IDF z chwili zapisu;
+    komenda przelicza wszystkie wektory z aktualnymi wagami (np. co noc) oraz uzupełnia wektory danych
+    dodanych przez bulk_create (migracje, generate_data).
+
+    Użycie:
+        python manage.py rebuild_match_vectors [--batch-size 10000]
+    """
+    help = 'Przelicza wektory dopasowania kandydatów do ofert pracy (TF-IDF umiejętności i wymagań).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='Liczba dokumentów zapisywanych w jednej partii (domyślnie MATCH_BATCH_SIZE).')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        documents, terms = matching.rebuild_match_vectors(options['batch_size'])
+        engine = 'NumPy' if matching.np is not None else 'Python'
+        self.stdout.write(self.style.SUCCESS(
+            f'Wektory przeliczone: {documents} dokumentów, {terms} słów ({engine}, '
+            f'{time.monotonic() - started:.1f} s).'))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from jobs.reactions import flush_counters, reconcile_counters
+
+
+class Command(BaseCommand):
+    """
+    Komenda przeliczająca liczniki polubień i ulubionych ofert pracy na podstawie tabel Like i Favorite.
+
+    Użycie:
+        python manage.py reconcile_job_counters [--batch-size 10000]
+        python manage.py reconcile_job_counters --flush
+    """
+    help = 'Przelicza liczniki polubień i ulubionych ofert pracy lub zapisuje zbuforowane zmiany liczników (--flush).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help='Liczba ofert aktualizowanych jednym zapytaniem.')
+        parser.add_argument('--flush', action='store_true',
+                            help='Tylko zapisuje do bazy zbuforowane zmiany liczników popularnych ofert.')
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            flushed = flush_counters()
+            self.stdout.write(self.style.SUCCESS(f'Zapisano zbuforowane liczniki: {flushed}.'))
+            return
+        updated = reconcile_counters(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Przeliczono liczniki ofert pracy: {updated}.'))
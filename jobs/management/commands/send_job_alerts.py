@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.alerts import percolate_pending_jobs, send_job_alert_digests
+
+
+class Command(BaseCommand):
+    """
+    Komenda powiadomień o nowych ofertach pracy dla zapisanych wyszukiwań (jobs.alerts): dopasowuje oferty
+    z kolejki (model PendingJobAlert) do zapisanych wyszukiwań, a następnie dodaje do kolejki wiadomości e-mail
+    jedno zbiorcze powiadomienie na kandydata. Odstęp między uruchomieniami (np. cron co godzinę lub --watch)
+    wyznacza częstotliwość powiadomień.
+
+    Użycie:
+        python manage.py send_job_alerts
+        python manage.py send_job_alerts --watch [--interval 3600]
+    """
+    help = 'Dopasowuje nowe oferty pracy do zapisanych wyszukiwań i dodaje zbiorcze powiadomienia do kolejki e-mail.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--watch', action='store_true',
+                            help='Działa bez końca i co --interval sekund wysyła powiadomienia.')
+        parser.add_argument('--interval', type=float, default=3600,
+                            help='Odstęp między powiadomieniami w trybie --watch (sekundy).')
+
+    def handle(self, *args, **options):
+        while True:
+            jobs = percolate_pending_jobs()
+            digests = send_job_alert_digests()
+            if jobs or digests or not options['watch']:
+                self.stdout.write(self.style.SUCCESS(
+                    f'Dopasowane oferty: {jobs}, powiadomienia dodane do kolejki: {digests}.'))
+            if not options['watch']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from kirismor.template_cache import clear_fragments, warm_templates
+
+
+class Command(BaseCommand):
+    """
+    Komenda uruchamiana przy wdrożeniu (kirismor.template_cache): kompiluje wszystkie szablony z katalogu
+    templates/, przerywa wdrożenie przy błędzie składni i czyści zapamiętane fragmenty szablonów (menu nawigacji,
+    stopka), aby strony nie zawierały fragmentów z poprzedniej wersji.
+
+    Szablony skompilowane przez komendę pozostają w pamięci jej procesu; procesy serwera kompilują je przy starcie
+    (TEMPLATE_WARMUP w kirismor/wsgi.py).
+
+    Użycie:
+        python manage.py warm_templates [--keep-fragments]
+    """
+    help = 'Kompiluje wszystkie szablony i czyści pamięć podręczną fragmentów szablonów.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep-fragments', action='store_true',
+                            help='Nie czyści pamięci podręcznej fragmentów szablonów.')
+
+    def handle(self, *args, **options):
+        compiled, errors, elapsed = warm_templates()
+        if errors:
+            raise CommandError('\n'.join(f'{name}: {error}' for name, error in errors.items()))
+        if not options['keep_fragments']:
+            clear_fragments()
+        if options['verbosity']:
+            self.stdout.write(self.style.SUCCESS(f'Skompilowano szablonów: {compiled} ({elapsed:.2f} s).'))
@@ -0,0 +1,354 @@
+import heapq
+import math
+import re
+from collections import Counter
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+import numpy as np
+from accounts.models import CandidateProfile
+from jobs.models import CandidateMatchTerm, Job, JobMatchTerm, MatchTerm
+
+"""
+Importy:
+- import heapq: Importuje kolejkę priorytetową, używaną do wyboru słów wektora zapytania o największych wagach.
+- import math: Importuje funkcję logarytmu, używaną do obliczenia wag IDF słów.
+- import re: Importuje wyrażenia regularne, używane do podziału umiejętności i wymagań na słowa.
+- from collections import Counter: Importuje licznik wystąpień słów w dokumencie i liczby dokumentów ze słowem.
+- from itertools import islice: Importuje dzielenie dokumentów i składowych wektorów na partie.
+- from django.conf import settings: Importuje ustawienia projektu (rozmiar partii).
+- from django.db import transaction: Importuje moduł transakcji, w której przebudowywane są wszystkie wektory.
+- from django.db.models import F: Importuje wyrażenie F, używane do zmiany liczby dokumentów słowa w bazie danych.
+- import numpy as np: Importuje obliczenia wektorowe wag TF-IDF i podobieństw kosinusowych.
+- from accounts.models import CandidateProfile: Importuje model profilu kandydata (pole skills).
+- from jobs.models import CandidateMatchTerm, Job, JobMatchTerm, MatchTerm: Importuje modele ofert pracy,
+  składowych wektorów kandydatów i ofert oraz słownika.
+
+Moduł zawiera dopasowanie kandydatów do ofert pracy na podstawie umiejętności kandydata (CandidateProfile.skills)
+i tytułu oraz wymagań oferty (Job.title, Job.requirements):
+- normalize_terms: podział tekstu na znormalizowane słowa (małe litery, synonimy, bez słów pomijanych).
+- Wektory TF-IDF (waga = (1 + log tf) * idf, długość 1) są przechowywane jako rzadkie wektory w bazie danych:
+  niezerowe składowe w CandidateMatchTerm i JobMatchTerm, liczby dokumentów słów w MatchTerm.
+  update_candidate_vector / update_job_vector aktualizują wektor po zapisie profilu lub oferty (sygnały
+  w JobsConfig.ready), a rebuild_match_vectors (komenda rebuild_match_vectors) przelicza wszystkie wektory
+  z aktualnymi wagami IDF, np. co noc lub po imporcie danych przez bulk_create.
+- best_candidates / recommended_jobs: podobieństwo kosinusowe jako iloczyn macierzy rzadkiej (składowe
+  dokumentów zawierających słowa zapytania, pobierane z indeksu po słowie) i wektora zapytania, liczony
+  partiami (NumPy: np.bincount po identyfikatorach dokumentów).
+"""
+
+# Słowa (po zamianie na małe litery): litery, cyfry i podkreślenia oraz znaki '+' i '#' (c++, c#) i kropki
+# wewnątrz słowa (node.js, asp.net)
+TOKEN_PATTERN = re.compile(r'\w[\w+#]*(?:\.\w[\w+#]*)*')
+
+# Maksymalna długość słowa (tak jak pole term modeli)
+MAX_TERM_LENGTH = 100
+
+# Maksymalna liczba słów wektora zapytania (o największych wagach) w best_candidates i recommended_jobs
+MAX_QUERY_TERMS = 200
+
+# Słowa pomijane: spójniki, przyimki i ogólne słowa ogłoszeń, które nie opisują umiejętności
+STOP_WORDS = frozenset({
+    'a', 'i', 'w', 'z', 'o', 'na', 'do', 'od', 'po', 'we', 'ze', 'lub', 'oraz', 'albo', 'jak', 'dla', 'przy',
+    'min', 'np', 'itp', 'rok', 'lata', 'lat', 'mile', 'widziana', 'widziane', 'widziany', 'znajomość', 'znajomości',
+    'doświadczenie', 'doświadczenia', 'umiejętność', 'umiejętności', 'praktyczna', 'dobra', 'bardzo', 'język',
+    'języka', 'an', 'and', 'or', 'the', 'of', 'in', 'on', 'to', 'with', 'for', 'at', 'as', 'is', 'be', 'years',
+    'year', 'experience', 'knowledge', 'skills', 'good', 'strong', 'plus', 'nice', 'have',
+})
+
+# Synonimy i skróty zamieniane na jedną postać
+SYNONYMS = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'k8s': 'kubernetes',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'ml': 'machine_learning',
+    'angielski': 'english',
+    'niemiecki': 'german',
+}
+
+
+def normalize_terms(text):
+    """
+    Dzieli tekst umiejętności lub wymagań na znormalizowane słowa (z powtórzeniami).
+
+    Args:
+        text (str): Umiejętności kandydata albo tytuł i wymagania oferty.
+
+    Returns:
+        list: Słowa małymi literami, po zamianie synonimów, bez słów pomijanych i samych liczb.
+    """
+    terms = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        term = SYNONYMS.get(token, token)
+        if term not in STOP_WORDS and not term.isdigit() and len(term) <= MAX_TERM_LENGTH:
+            terms.append(term)
+    return terms
+
+
+def term_frequencies(text):
+    """
+    Zwraca liczbę wystąpień każdego znormalizowanego słowa tekstu (Counter).
+    """
+    return Counter(normalize_terms(text or ''))
+
+
+def job_text(title, requirements):
+    """
+    Zwraca tekst oferty pracy, z którego budowany jest jej wektor (tytuł i wymagania).
+    """
+    return f'{title} {requirements}'
+
+
+def inverse_document_frequency(document_count, documents):
+    """
+    Zwraca wagę IDF słowa występującego w `document_count` z `documents` dokumentów (wygładzoną, co najmniej 1).
+    """
+    return math.log((1 + max(documents, document_count)) / (1 + document_count)) + 1
+
+
+def current_idf(terms):
+    """
+    Zwraca wagi IDF słów według bieżących liczb dokumentów w słowniku (MatchTerm).
+    """
+    documents = CandidateProfile.objects.count() + Job.objects.count()
+    counts = dict(MatchTerm.objects.filter(term__in=terms).values_list('term', 'document_count'))
+    return {term: inverse_document_frequency(counts.get(term, 0), documents) for term in terms}
+
+
+def weigh(documents, idf):
+    """
+    Oblicza wektory TF-IDF partii dokumentów: waga = (1 + log tf) * idf, podzielona przez długość wektora
+    dokumentu (po normalizacji iloczyn skalarny wektorów jest podobieństwem kosinusowym).
+
+    Args:
+        documents (list): Pary (identyfikator dokumentu, Counter słów).
+        idf (dict): Wagi IDF wszystkich słów dokumentów.
+
+    Returns:
+        list: Trójki (identyfikator dokumentu, słowo, waga) - niezerowe składowe wektorów.
+    """
+    owners, terms, frequencies = [], [], []
+    for index, (_, counts) in enumerate(documents):
+        for term, count in counts.items():
+            owners.append(index)
+            terms.append(term)
+            frequencies.append(count)
+    if not terms:
+        return []
+    indexes = np.array(owners, dtype=np.int64)
+    weights = (1 + np.log(np.array(frequencies, dtype=np.float64))) * np.array([idf[term] for term in terms])
+    norms = np.sqrt(np.bincount(indexes, weights=weights * weights, minlength=len(documents)))
+    weights = (weights / norms[indexes]).tolist()
+    return [(documents[owner][0], term, weight) for owner, term, weight in zip(owners, terms, weights)]
+
+
+def _store_vector(model, owner_field, owner_id, counts):
+    """
+    Zapisuje wektor dokumentu i aktualizuje liczby dokumentów słów, które pojawiły się w dokumencie lub z niego
+    zniknęły.
+    """
+    vector = model.objects.filter(**{owner_field: owner_id})
+    old_terms = set(vector.values_list('term', flat=True))
+    new_terms = set(counts)
+    added, removed = new_terms - old_terms, old_terms - new_terms
+    if added:
+        MatchTerm.objects.bulk_create([MatchTerm(term=term) for term in added], ignore_conflicts=True)
+        MatchTerm.objects.filter(term__in=added).update(document_count=F('document_count') + 1)
+    if removed:
+        MatchTerm.objects.filter(term__in=removed, document_count__gt=0).update(
+            document_count=F('document_count') - 1)
+    vector.delete()
+    if new_terms:
+        model.objects.bulk_create([
+            model(**{owner_field: owner_id, 'term': term, 'weight': weight})
+            for _, term, weight in weigh([(owner_id, counts)], current_idf(new_terms))
+        ])
+
+
+def _forget_vector(model, owner_field, owner_id):
+    terms = model.objects.filter(**{owner_field: owner_id}).values('term')
+    MatchTerm.objects.filter(term__in=terms, document_count__gt=0).update(document_count=F('document_count') - 1)
+
+
+def update_candidate_vector(profile):
+    """
+    Aktualizuje wektor umiejętności kandydata (z wagami IDF według bieżącego słownika).
+    """
+    _store_vector(CandidateMatchTerm, 'profile_id', profile.pk, term_frequencies(profile.skills))
+
+
+def update_job_vector(job):
+    """
+    Aktualizuje wektor tytułu i wymagań oferty pracy (z wagami IDF według bieżącego słownika).
+    """
+    _store_vector(JobMatchTerm, 'job_id', job.pk, term_frequencies(job_text(job.title, job.requirements)))
+
+
+def candidate_profile_saved(sender, instance, update_fields=None, **kwargs):
+    """
+    Podłączone do sygnału post_save modelu CandidateProfile w JobsConfig.ready.
+    """
+    if update_fields is None or 'skills' in update_fields:
+        update_candidate_vector(instance)
+
+
+def job_saved(sender, instance, update_fields=None, **kwargs):
+    """
+    Podłączone do sygnału post_save modelu Job w JobsConfig.ready.
+    """
+    if update_fields is None or {'title', 'requirements'} & set(update_fields):
+        update_job_vector(instance)
+
+
+def candidate_profile_deleted(sender, instance, **kwargs):
+    """
+    Zmniejsza liczby dokumentów słów usuwanego profilu. Podłączone do sygnału pre_delete (składowe wektora są
+    usuwane kaskadowo przed post_delete).
+    """
+    _forget_vector(CandidateMatchTerm, 'profile_id', instance.pk)
+
+
+def job_deleted(sender, instance, **kwargs):
+    """
+    Zmniejsza liczby dokumentów słów usuwanej oferty. Podłączone do sygnału pre_delete.
+    """
+    _forget_vector(JobMatchTerm, 'job_id', instance.pk)
+
+
+def _candidate_documents():
+    rows = CandidateProfile.objects.order_by().values_list('pk', 'skills')
+    return ((pk, term_frequencies(skills)) for pk, skills in rows.iterator(chunk_size=settings.MATCH_BATCH_SIZE))
+
+
+def _job_documents():
+    rows = Job.objects.order_by().values_list('pk', 'title', 'requirements')
+    return ((pk, term_frequencies(job_text(title, requirements)))
+            for pk, title, requirements in rows.iterator(chunk_size=settings.MATCH_BATCH_SIZE))
+
+
+def rebuild_match_vectors(batch_size=None):
+    """
+    Przelicza od nowa słownik i wektory wszystkich kandydatów i ofert pracy (jedna transakcja). Pierwsze
+    przejście liczy dokumenty zawierające każde słowo, drugie zapisuje wektory partiami po `batch_size`
+    dokumentów.
+
+    Args:
+        batch_size (int): Liczba dokumentów w partii (domyślnie MATCH_BATCH_SIZE).
+
+    Returns:
+        tuple: (liczba dokumentów, liczba słów w słowniku).
+    """
+    batch_size = batch_size or settings.MATCH_BATCH_SIZE
+    sources = ((CandidateMatchTerm, 'profile_id', _candidate_documents), (JobMatchTerm, 'job_id', _job_documents))
+    with transaction.atomic():
+        document_counts = Counter()
+        documents = 0
+        for _, _, source in sources:
+            for _, counts in source():
+                document_counts.update(counts.keys())
+                documents += 1
+        idf = {term: inverse_document_frequency(count, documents) for term, count in document_counts.items()}
+
+        CandidateMatchTerm.objects.all().delete()
+        JobMatchTerm.objects.all().delete()
+        MatchTerm.objects.all().delete()
+        MatchTerm.objects.bulk_create([MatchTerm(term=term, document_count=count)
+                                       for term, count in document_counts.items()], batch_size=batch_size)
+        for model, owner_field, source in sources:
+            pending = source()
+            while batch := list(islice(pending, batch_size)):
+                model.objects.bulk_create([model(**{owner_field: owner_id, 'term': term, 'weight': weight})
+                                           for owner_id, term, weight in weigh(batch, idf)], batch_size=batch_size)
+    return documents, len(document_counts)
+
+
+def rank(entries, query, limit=None):
+    """
+    Mnoży macierz rzadką (składowe wektorów dokumentów) przez wektor zapytania i zwraca dokumenty według
+    malejącego iloczynu skalarnego (podobieństwa kosinusowego). Składowe są przetwarzane partiami po
+    MATCH_BATCH_SIZE wierszy.
+
+    Args:
+        entries (iterable): Trójki (identyfikator dokumentu, słowo, waga) ze słowami zapytania.
+        query (dict): Wektor zapytania {słowo: waga}.
+        limit (int): Maksymalna liczba wyników (None - wszystkie).
+
+    Returns:
+        list: Pary (identyfikator dokumentu, podobieństwo) posortowane malejąco według podobieństwa, a przy
+            równym podobieństwie rosnąco według identyfikatora.
+    """
+    entries = iter(entries)
+    owners, products = [], []
+    while batch := list(islice(entries, settings.MATCH_BATCH_SIZE)):
+        ids, terms, weights = zip(*batch)
+        owners.append(np.array(ids, dtype=np.int64))
+        products.append(np.array(weights) * np.array([query[term] for term in terms]))
+    if not owners:
+        return []
+    ids, inverse = np.unique(np.concatenate(owners), return_inverse=True)
+    scores = np.round(np.bincount(inverse, weights=np.concatenate(products)), 6)
+    if limit is not None and limit < len(ids):
+        # Wyniki nie gorsze od limit-tego najlepszego (razem z remisami), posortowane niżej
+        threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+        selected = scores >= threshold
+        ids, scores = ids[selected], scores[selected]
+    order = np.lexsort((ids, -scores))[:limit]
+    return list(zip(ids[order].tolist(), scores[order].tolist()))
+
+
+def _query_vector(vector):
+    return dict(heapq.nlargest(MAX_QUERY_TERMS, vector.values_list('term', 'weight'), key=lambda item: item[1]))
+
+
+def best_candidates(job_id, limit=None, profile_ids=None):
+    """
+    Zwraca kandydatów (aktywne konta) najlepiej pasujących do oferty pracy.
+
+    Args:
+        job_id (int): Identyfikator oferty pracy.
+        limit (int): Maksymalna liczba kandydatów (None - wszyscy pasujący).
+        profile_ids (iterable): Ogranicza wynik do podanych profili (np. kandydatów, którzy aplikowali).
+
+    Returns:
+        list: Pary (identyfikator profilu kandydata, podobieństwo od 0 do 1) - tylko kandydaci z co najmniej
+            jednym wspólnym słowem.
+    """
+    query = _query_vector(JobMatchTerm.objects.filter(job_id=job_id))
+    if not query:
+        return []
+    entries = CandidateMatchTerm.objects.filter(term__in=list(query), profile__user__is_active=True)
+    if profile_ids is not None:
+        entries = entries.filter(profile_id__in=list(profile_ids))
+    entries = entries.values_list('profile_id', 'term', 'weight').iterator(chunk_size=settings.MATCH_BATCH_SIZE)
+    return rank(entries, query, limit)
+
+
+def recommended_jobs(profile_id, limit=None):
+    """
+    Zwraca otwarte oferty pracy najlepiej pasujące do umiejętności kandydata.
+
+    Args:
+        profile_id (int): Identyfikator profilu kandydata (równy identyfikatorowi użytkownika).
+        limit (int): Maksymalna liczba ofert (None - wszystkie pasujące).
+
+    Returns:
+        list: Pary (identyfikator oferty, podobieństwo od 0 do 1).
+    """
+    query = _query_vector(CandidateMatchTerm.objects.filter(profile_id=profile_id))
+    if not query:
+        return []
+    entries = JobMatchTerm.objects.filter(term__in=list(query), job__status=Job.JobStatus.OPEN)
+    entries = entries.values_list('job_id', 'term', 'weight').iterator(chunk_size=settings.MATCH_BATCH_SIZE)
+    return rank(entries, query, limit)
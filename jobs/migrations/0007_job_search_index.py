@@ -0,0 +1,20 @@
+from django.db import migrations
+
+from jobs.search import install_search_index, uninstall_search_index
+
+
+class Migration(migrations.Migration):
+    """
+    Dokument wyszukiwania pełnotekstowego dla ofert pracy.
+
+    - PostgreSQL: kolumna jobs_job.search_vector (tsvector) z indeksem GIN, aktualizowana wyzwalaczem.
+    - SQLite: tabela cienia FTS5 jobs_job_fts z wyzwalaczami synchronizującymi.
+    """
+
+    dependencies = [
+        ('jobs', '0006_remove_guestfeedback_verification_token'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index, elidable=False),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:29
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    """
+    Wypełnia nowe liczniki na podstawie istniejących polubień i ulubionych.
+    """
+    Job = apps.get_model('jobs', 'Job')
+    counters = {}
+    for model_name, field in (('Like', 'likes_count'), ('Favorite', 'favorites_count')):
+        model = apps.get_model('jobs', model_name)
+        counted = model.objects.filter(job=OuterRef('pk')).order_by().values('job').annotate(total=Count('pk'))
+        counters[field] = Coalesce(Subquery(counted.values('total')), Value(0))
+    Job.objects.using(schema_editor.connection.alias).update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='favorites_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_reaction_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tempguestfeedback',
+            name='verification_token',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
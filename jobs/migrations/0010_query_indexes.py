@@ -0,0 +1,35 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_tempguestfeedback_token_blank'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', '-created_at', '-id'], name='application_job_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applicant', 'job'], name='application_applicant_job_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='guestfeedback',
+            index=models.Index(fields=['email', 'is_verified'], name='guestfeedback_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='job_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['recruiter', 'title'], name='job_recruiter_title_idx'),
+        ),
+    ]
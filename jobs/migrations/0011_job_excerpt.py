@@ -0,0 +1,28 @@
+# Generated by Django 5.0.4 on 2026-10-17 13:12
+
+import kirismor.excerpts
+from django.db import migrations
+from kirismor.excerpts import backfill_excerpts
+
+
+def fill_excerpts(apps, schema_editor):
+    """
+    Uzupełnia skróty istniejących wierszy.
+    """
+    backfill_excerpts(apps.get_model('jobs', 'Job'), schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='excerpt',
+            field=kirismor.excerpts.ExcerptField(source='description'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
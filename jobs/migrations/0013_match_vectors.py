@@ -0,0 +1,48 @@
+# Generated by Django 5.0.4 on 2026-10-17 13:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_hashed_photo_names'),
+        ('jobs', '0012_saved_searches'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchTerm',
+            fields=[
+                ('term', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('document_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CandidateMatchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_terms', to='accounts.candidateprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'profile'], name='candidatematchterm_term_idx')],
+                'unique_together': {('profile', 'term')},
+            },
+        ),
+        migrations.CreateModel(
+            name='JobMatchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_terms', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'job'], name='jobmatchterm_term_idx')],
+                'unique_together': {('job', 'term')},
+            },
+        ),
+    ]
@@ -2,9 +2,10 @@ from django.db import models
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
-import hashlib
-import time
 from django.contrib.auth import get_user_model
+from kirismor.tokens import make_token
+from kirismor.excerpts import ExcerptField
+from jobs.search import tokenize_query
 
 """
 Importy:
@@ -12,9 +13,10 @@ Importy:
 - from django.conf import settings: Importuje ustawienia projektu Django, które mogą być używane w modelach.
 - from django.utils.translation import gettext_lazy as _: Importuje funkcję tłumaczenia, umożliwiającą międzynarodowe tłumaczenie tekstów.
 - from django.core.exceptions import ValidationError: Importuje wyjątek walidacji, używany do walidowania danych w modelach.
-- import hashlib: Importuje moduł hashlib do generowania skrótów (hash) z danych, takich jak tokeny weryfikacyjne.
-- import time: Importuje moduł time, używany do generowania znaczników czasu.
 - from django.contrib.auth import get_user_model: Importuje funkcję, która zwraca bieżący model użytkownika Django.
+- from kirismor.tokens import make_token: Importuje funkcję tworzącą podpisane tokeny weryfikacyjne.
+- from kirismor.excerpts import ExcerptField: Importuje pole ze skrótem długiego tekstu, wyświetlanym na listach zamiast pełnej treści.
+- from jobs.search import tokenize_query: Importuje podział zapytania wyszukiwania na słowa, używany do indeksowania zapisanych wyszukiwań.
 """
 
 User = get_user_model()  # Pobiera bieżący model użytkownika
@@ -32,8 +34,14 @@ class Job(models.Model):
         salary (Decimal): Wynagrodzenie oferowane za pracę.
         created_at (DateTime): Data utworzenia oferty pracy.
         status (str): Status oferty pracy (otwarta/zamknięta).
+        likes_count (int): Liczba polubień (licznik utrzymywany przez jobs.reactions).
+        favorites_count (int): Liczba dodań do ulubionych (licznik utrzymywany przez jobs.reactions).
+        excerpt (str): Początek opisu wyświetlany na listach ofert (aktualizowany przy zapisie).
     """
 
+    # Liczniki zmieniane wyłącznie wyrażeniami F() w jobs.reactions; zwykły zapis oferty ich nie nadpisuje
+    COUNTER_FIELDS = ('likes_count', 'favorites_count')
+
     class JobStatus(models.TextChoices):
         OPEN = 'open', _('Otwarta')
         CLOSED = 'closed', _('Zamknięta')
@@ -45,6 +53,17 @@ class Job(models.Model):
     salary = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, default='open', choices=JobStatus.choices)
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    favorites_count = models.PositiveIntegerField(default=0, editable=False)
+    excerpt = ExcerptField(source='description')
+
+    class Meta:
+        indexes = [
+            # Listy otwartych ofert (JobListView, PublicJobListView, karuzela) sortowane od najnowszych
+            models.Index(fields=['status', '-created_at', '-id'], name='job_status_created_idx'),
+            # Lista ofert rekrutera (recruiter_job_list_view) sortowana po tytule
+            models.Index(fields=['recruiter', 'title'], name='job_recruiter_title_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -81,11 +100,26 @@ class Job(models.Model):
         if self.status not in [choice[0] for choice in self.JobStatus.choices]:
             raise ValidationError(f"Invalid status: {self.status}")
 
+    def popularity(self):
+        """
+        Zwraca popularność oferty pracy (liczba polubień i dodań do ulubionych).
+
+        Returns:
+            int: Popularność oferty.
+        """
+        return self.likes_count + self.favorites_count
+
     def save(self, *args, **kwargs):
         """
         Zapisuje ofertę pracy po walidacji.
+        Przy aktualizacji istniejącej oferty pomija liczniki, aby nie nadpisać ich nieaktualnymi wartościami.
         """
         self.full_clean()
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
 
@@ -114,6 +148,14 @@ class Application(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, default='submitted', choices=ApplicationStatus.choices)
 
+    class Meta:
+        indexes = [
+            # Aplikacje na oferty rekrutera (recruiter_applications_view) sortowane od najnowszych
+            models.Index(fields=['job', '-created_at', '-id'], name='application_job_created_idx'),
+            # Aplikacje kandydata na otwarte oferty (application_list_view)
+            models.Index(fields=['applicant', 'job'], name='application_applicant_job_idx'),
+        ]
+
     def is_accepted(self):
         """
         Sprawdza, czy aplikacja została zaakceptowana.
@@ -174,6 +216,12 @@ class GuestFeedback(models.Model):
     phone_number = models.CharField(max_length=15, blank=True)
     is_verified = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Sprawdzenie, czy gość ma już zweryfikowaną opinię (guest_feedback_view)
+            models.Index(fields=['email', 'is_verified'], name='guestfeedback_email_idx'),
+        ]
+
     def __str__(self):
         return f'Feedback from {self.email} for {self.job.title}'
 
@@ -188,25 +236,27 @@ class TempGuestFeedback(models.Model):
         message (TextField): Wiadomość gościa.
         created_at (DateTime): Data utworzenia opinii.
         phone_number (str): Numer telefonu gościa.
-        verification_token (str): Token weryfikacyjny.
+        verification_token (str): Token weryfikacyjny (tylko tokeny wysłane przed wprowadzeniem podpisanych tokenów).
     """
+    # Zastosowanie podpisanego tokenu weryfikacyjnego (kirismor.tokens)
+    VERIFICATION_TOKEN_PURPOSE = 'verify-feedback'
+
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='temp_guest_feedbacks')
     email = models.EmailField(unique=True)
     message = models.TextField(max_length=2000)
     created_at = models.DateTimeField(auto_now_add=True)
     phone_number = models.CharField(max_length=15, blank=True)
-    verification_token = models.CharField(max_length=64)
+    verification_token = models.CharField(max_length=64, blank=True)
 
     def generate_verification_token(self):
         """
-        Generuje token weryfikacyjny oparty na emailu i znaczniku czasu.
+        Generuje podpisany token weryfikacyjny zawierający identyfikator opinii i znacznik czasu.
+        Token nie jest zapisywany w bazie danych.
 
         Returns:
             str: Wygenerowany token weryfikacyjny.
         """
-        timestamp = int(time.time())
-        token_string = f"{self.email}{timestamp}"
-        return hashlib.sha256(token_string.encode('utf-8')).hexdigest()
+        return make_token(self.VERIFICATION_TOKEN_PURPOSE, self.pk)
 
     def __str__(self):
         return f'Temporary Feedback from {self.email} for {self.job.title}'
@@ -250,3 +300,175 @@ class Favorite(models.Model):
 
     def __str__(self):
         return f"{self.user.email} favorited {self.job.title}"
+
+
+class SavedSearch(models.Model):
+    """
+    Model reprezentujący zapisane wyszukiwanie kandydata.
+
+    Nowe i ponownie otwarte oferty pracy są dopasowywane do zapisanych wyszukiwań (jobs.alerts), a kandydat
+    otrzymuje zbiorcze powiadomienie e-mail o dopasowanych ofertach.
+
+    Atrybuty:
+        user (ForeignKey): Kandydat, który zapisał wyszukiwanie.
+        query (str): Słowa kluczowe (tak jak parametr 'q' listy ofert pracy).
+        min_salary (Decimal): Minimalne wynagrodzenie; oferty bez wynagrodzenia go nie spełniają.
+        term_count (int): Liczba słów zapytania (wszystkie muszą wystąpić w ofercie).
+        created_at (DateTime): Data zapisania wyszukiwania.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='saved_searches')
+    query = models.CharField(max_length=100, verbose_name=_('Słowa kluczowe'))
+    min_salary = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True,
+                                     verbose_name=_('Minimalne wynagrodzenie'))
+    term_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Lista zapisanych wyszukiwań kandydata (saved_search_list_view)
+            models.Index(fields=['user', '-created_at'], name='savedsearch_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.email}: {self.query}"
+
+    def save(self, *args, **kwargs):
+        """
+        Zapisuje wyszukiwanie i odbudowuje jego wpisy w indeksie odwróconym (SavedSearchTerm).
+        """
+        terms = tokenize_query(self.query)
+        self.term_count = len(terms)
+        super().save(*args, **kwargs)
+        self.terms.all().delete()
+        SavedSearchTerm.objects.bulk_create([SavedSearchTerm(search=self, term=term) for term in terms])
+
+
+class SavedSearchTerm(models.Model):
+    """
+    Wpis indeksu odwróconego zapisanych wyszukiwań: słowo zapytania i wyszukiwanie, które je zawiera.
+
+    Dopasowanie oferty wyszukuje w indeksie słowa oferty, więc jego koszt zależy od liczby słów oferty,
+    a nie od liczby zapisanych wyszukiwań.
+
+    Atrybuty:
+        search (ForeignKey): Zapisane wyszukiwanie.
+        term (str): Słowo zapytania (małymi literami).
+    """
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=100)
+
+    class Meta:
+        unique_together = ('search', 'term')
+        indexes = [
+            # Wyszukiwanie słów oferty w indeksie odwróconym (jobs.alerts.matching_searches)
+            models.Index(fields=['term', 'search'], name='savedsearchterm_term_idx'),
+        ]
+
+    def __str__(self):
+        return self.term
+
+
+class SavedSearchMatch(models.Model):
+    """
+    Model reprezentujący ofertę pracy dopasowaną do zapisanego wyszukiwania, oczekującą na zbiorcze powiadomienie.
+
+    Atrybuty:
+        search (ForeignKey): Zapisane wyszukiwanie.
+        job (ForeignKey): Dopasowana oferta pracy.
+        created_at (DateTime): Data dopasowania.
+        notified_at (DateTime): Data dodania oferty do powiadomienia (puste - oczekuje na powiadomienie).
+    """
+    search = models.ForeignKey(SavedSearch, on_delete=models.CASCADE, related_name='matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='saved_search_matches')
+    created_at = models.DateTimeField(auto_now_add=True)
+    notified_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ('search', 'job')
+        indexes = [
+            # Dopasowania oczekujące na powiadomienie (jobs.alerts.send_job_alert_digests)
+            models.Index(fields=['notified_at', 'search'], name='savedsearchmatch_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.search} -> {self.job.title}"
+
+
+class PendingJobAlert(models.Model):
+    """
+    Oferta pracy utworzona lub ponownie otwarta, oczekująca na dopasowanie do zapisanych wyszukiwań
+    (kolejka w bazie danych przetwarzana przez komendę send_job_alerts).
+
+    Atrybuty:
+        job (OneToOneField): Oferta pracy.
+        created_at (DateTime): Data dodania do kolejki.
+    """
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, primary_key=True, related_name='pending_alert')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.job.title
+
+
+class MatchTerm(models.Model):
+    """
+    Słowo słownika dopasowania kandydatów do ofert pracy (jobs.matching) z liczbą dokumentów (profili kandydatów
+    i ofert pracy), w których występuje. Liczba dokumentów wyznacza wagę IDF słowa.
+
+    Atrybuty:
+        term (str): Znormalizowane słowo umiejętności lub wymagań.
+        document_count (int): Liczba profili kandydatów i ofert pracy zawierających słowo.
+    """
+    term = models.CharField(max_length=100, primary_key=True)
+    document_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.term
+
+
+class CandidateMatchTerm(models.Model):
+    """
+    Niezerowa składowa wektora TF-IDF umiejętności kandydata (wektory mają długość 1).
+
+    Atrybuty:
+        profile (ForeignKey): Profil kandydata.
+        term (str): Znormalizowane słowo umiejętności.
+        weight (float): Waga TF-IDF słowa.
+    """
+    profile = models.ForeignKey('accounts.CandidateProfile', on_delete=models.CASCADE, related_name='match_terms')
+    term = models.CharField(max_length=100)
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ('profile', 'term')
+        indexes = [
+            # Kandydaci ze słowami wymagań oferty (jobs.matching.best_candidates)
+            models.Index(fields=['term', 'profile'], name='candidatematchterm_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id}: {self.term}"
+
+
+class JobMatchTerm(models.Model):
+    """
+    Niezerowa składowa wektora TF-IDF tytułu i wymagań oferty pracy (wektory mają długość 1).
+
+    Atrybuty:
+        job (ForeignKey): Oferta pracy.
+        term (str): Znormalizowane słowo tytułu lub wymagań.
+        weight (float): Waga TF-IDF słowa.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='match_terms')
+    term = models.CharField(max_length=100)
+    weight = models.FloatField()
+
+    class Meta:
+        unique_together = ('job', 'term')
+        indexes = [
+            # Oferty ze słowami umiejętności kandydata (jobs.matching.recommended_jobs)
+            models.Index(fields=['term', 'job'], name='jobmatchterm_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id}: {self.term}"
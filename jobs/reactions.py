@@ -0,0 +1,405 @@
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+from jobs.models import Job, Like, Favorite
+
+"""
+Importy:
+- from functools import partial: Importuje funkcję partial, używaną do odłożenia zapisu zmiany licznika do bufora
+  do chwili zatwierdzenia transakcji.
+- from django.conf import settings: Importuje ustawienia projektu (progi buforowania liczników).
+- from django.core.cache import cache: Importuje domyślną pamięć podręczną, w której przechowywane są zbiory ofert
+  polubionych przez użytkowników oraz bufor zmian liczników popularnych ofert.
+- from django.db import connection, transaction: Importuje połączenie z bazą danych (zapytania INSERT/DELETE
+  z RETURNING) oraz obsługę transakcji (buforowanie zmian liczników dopiero po zatwierdzeniu transakcji).
+- from django.db.models import Count, F, OuterRef, Subquery, Value: Importuje wyrażenia używane do atomowej
+  aktualizacji liczników i do ich ponownego przeliczenia.
+- from django.db.models.functions import Coalesce, Greatest: Importuje funkcje zamieniające brak wierszy na zero
+  i chroniące licznik przed spadkiem poniżej zera.
+- from django.utils import timezone: Importuje funkcję timezone.now, używaną jako data utworzenia reakcji.
+- from jobs.models import Job, Like, Favorite: Importuje modele ofert pracy, polubień i ulubionych.
+
+Moduł zawiera logikę reakcji na oferty pracy (polubienia i ulubione):
+- set_reactions / toggle_reaction: dodają lub usuwają reakcje jednym zapytaniem INSERT ... ON CONFLICT DO NOTHING
+  lub DELETE (z RETURNING), bez wcześniejszego pobierania ofert, i aktualizują liczniki wyrażeniem F().
+- user_reaction_ids: zbiór identyfikatorów ofert, na które zareagował użytkownik (w pamięci podręcznej, usuwany
+  po zatwierdzeniu każdej zmiany reakcji użytkownika i ładowany ponownie z bazy danych).
+- adjust_counter / adjust_counters / flush_counters: liczniki wielu ofert są zmieniane jednym zapytaniem UPDATE.
+  Zmiany liczników popularnych ("gorących") ofert są zbierane w pamięci podręcznej i zapisywane do bazy partiami,
+  aby ograniczyć rywalizację o blokadę wiersza. Bufor wymaga pamięci podręcznej współdzielonej przez procesy
+  z atomowym incr (SHARED_CACHE_BACKENDS); w innym przypadku liczniki są zawsze zapisywane bezpośrednio w bazie.
+- reconcile_counters: ponowne przeliczenie liczników na podstawie tabel Like i Favorite.
+"""
+
+# Rodzaje reakcji: model reakcji i licznik w modelu Job
+KINDS = {
+    'like': (Like, 'likes_count'),
+    'favorite': (Favorite, 'favorites_count'),
+}
+
+# Czas przechowywania zbioru ofert, na które zareagował użytkownik (sekundy)
+USER_SET_TIMEOUT = 24 * 60 * 60
+
+# Backendy pamięci podręcznej współdzielonej przez wszystkie procesy, z atomowym incr. Tylko z nimi bufor zmian
+# liczników jest widoczny dla komendy reconcile_job_counters i nie gubi równoczesnych zmian (locmem jest prywatny
+# dla procesu, a incr w backendzie file nie jest atomowy).
+SHARED_CACHE_BACKENDS = (
+    'django.core.cache.backends.redis.RedisCache',
+    'django.core.cache.backends.memcached.PyMemcacheCache',
+    'django.core.cache.backends.memcached.PyLibMCCache',
+)
+
+
+def _user_set_key(user_id, kind):
+    return f'jobs:{kind}:user:{user_id}'
+
+
+def _pending_key(job_id, field, direction):
+    return f'jobs:counters:{field}:{direction}:{job_id}'
+
+
+def _rate_key(job_id, field):
+    return f'jobs:counters:rate:{field}:{job_id}'
+
+
+def user_reaction_ids(user, kind):
+    """
+    Zwraca zbiór identyfikatorów ofert, które użytkownik polubił ('like') lub dodał do ulubionych ('favorite').
+    Zbiór jest przechowywany w pamięci podręcznej, więc lista ofert nie wykonuje dla niego zapytań.
+
+    Args:
+        user (User): Zalogowany użytkownik.
+        kind (str): Rodzaj reakcji ('like' lub 'favorite').
+
+    Returns:
+        frozenset: Identyfikatory ofert pracy.
+    """
+    key = _user_set_key(user.pk, kind)
+    job_ids = cache.get(key)
+    if job_ids is None:
+        model, _ = KINDS[kind]
+        job_ids = frozenset(model.objects.filter(user=user).values_list('job_id', flat=True))
+        cache.set(key, job_ids, USER_SET_TIMEOUT)
+    return job_ids
+
+
+def _invalidate_user_set(user, kind):
+    # Zbiór jest usuwany (nie poprawiany) po zatwierdzeniu transakcji: równoczesne reakcje nie nadpisują swoich
+    # zmian, a wycofana transakcja nie zostawia w nim reakcji, której nie ma w bazie danych
+    key = _user_set_key(user.pk, kind)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def counter_buffering_enabled():
+    """
+    Sprawdza, czy zmiany liczników popularnych ofert mogą być buforowane: próg JOB_COUNTER_HOT_THRESHOLD jest
+    ustawiony, a domyślna pamięć podręczna jest współdzielona przez procesy (SHARED_CACHE_BACKENDS).
+    """
+    return bool(settings.JOB_COUNTER_HOT_THRESHOLD) and settings.CACHES['default']['BACKEND'] in SHARED_CACHE_BACKENDS
+
+
+def _is_hot(job_id, field):
+    """
+    Zlicza zmiany licznika oferty w bieżącym oknie czasowym i sprawdza, czy oferta jest "gorąca".
+    """
+    if not counter_buffering_enabled():
+        return False
+    threshold = settings.JOB_COUNTER_HOT_THRESHOLD
+    key = _rate_key(job_id, field)
+    if cache.add(key, 1, settings.JOB_COUNTER_HOT_WINDOW):
+        return False
+    try:
+        return cache.incr(key) > threshold
+    except ValueError:
+        return False
+
+
+def adjust_counter(job_id, field, delta):
+    """
+    Zmienia licznik oferty o `delta`.
+
+    Zwykle wykonuje atomowe UPDATE ... SET field = field + delta. Dla ofert "gorących" (więcej niż
+    JOB_COUNTER_HOT_THRESHOLD zmian w oknie JOB_COUNTER_HOT_WINDOW) zmiana trafia do bufora w pamięci podręcznej,
+    który jest zapisywany jednym zapytaniem po zebraniu JOB_COUNTER_BATCH_SIZE zmian lub przez flush_counters.
+    Zmiana trafia do bufora dopiero po zatwierdzeniu transakcji, więc wycofana reakcja nie zmienia licznika.
+
+    Args:
+        job_id (int): Identyfikator oferty pracy.
+        field (str): Nazwa licznika ('likes_count' lub 'favorites_count').
+        delta (int): Zmiana licznika.
+    """
+    adjust_counters([job_id], field, delta)
+
+
+def adjust_counters(job_ids, field, delta):
+    """
+    Zmienia liczniki wielu ofert o tę samą wartość `delta` jednym zapytaniem UPDATE ... WHERE id IN (...).
+    Zmiany ofert "gorących" trafiają do bufora tak jak w adjust_counter.
+
+    Args:
+        job_ids (iterable): Identyfikatory ofert pracy.
+        field (str): Nazwa licznika ('likes_count' lub 'favorites_count').
+        delta (int): Zmiana licznika.
+    """
+    cold = []
+    for job_id in job_ids:
+        if _is_hot(job_id, field):
+            transaction.on_commit(partial(_buffer_delta, job_id, field, delta))
+        else:
+            cold.append(job_id)
+    if cold:
+        Job.objects.filter(pk__in=cold).update(**{field: Greatest(F(field) + delta, Value(0))})
+
+
+def _buffer_delta(job_id, field, delta):
+    # Przyrosty i spadki są trzymane w osobnych, nieujemnych licznikach (memcached nie obsługuje wartości ujemnych)
+    key = _pending_key(job_id, field, 'added' if delta > 0 else 'removed')
+    if not cache.add(key, abs(delta), None):
+        try:
+            cache.incr(key, abs(delta))
+        except ValueError:
+            cache.add(key, abs(delta), None)
+    if abs(pending_deltas([job_id]).get((job_id, field), 0)) >= settings.JOB_COUNTER_BATCH_SIZE:
+        _flush_one(job_id, field)
+
+
+def _flush_one(job_id, field):
+    delta = 0
+    for direction, sign in (('added', 1), ('removed', -1)):
+        key = _pending_key(job_id, field, direction)
+        amount = cache.get(key, 0)
+        if not amount:
+            continue
+        # Odejmujemy tylko pobraną wartość, aby nie zgubić zmian dodanych w międzyczasie
+        try:
+            cache.decr(key, amount)
+        except ValueError:
+            # Klucz usunięty w międzyczasie z pamięci podręcznej - pobrana wartość jest jedynym zapisem zmian
+            pass
+        delta += sign * amount
+    if delta:
+        Job.objects.filter(pk=job_id).update(**{field: Greatest(F(field) + delta, Value(0))})
+    return bool(delta)
+
+
+def _job_id_batches(batch_size):
+    last_id = 0
+    while True:
+        ids = list(Job.objects.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return
+        yield ids
+        last_id = ids[-1]
+
+
+def flush_counters(batch_size=1000):
+    """
+    Zapisuje do bazy wszystkie zbuforowane zmiany liczników. Bufory są wyszukiwane jednym get_many na partię
+    ofert, bez wspólnego rejestru w pamięci podręcznej (jego aktualizacja nie byłaby atomowa).
+
+    Args:
+        batch_size (int): Liczba ofert sprawdzanych jednym odczytem z pamięci podręcznej.
+
+    Returns:
+        int: Liczba zaktualizowanych liczników.
+    """
+    if not counter_buffering_enabled():
+        return 0
+    flushed = 0
+    for ids in _job_id_batches(batch_size):
+        for job_id, field in pending_deltas(ids):
+            flushed += _flush_one(job_id, field)
+    return flushed
+
+
+def pending_deltas(job_ids):
+    """
+    Zwraca niezapisane zmiany liczników dla podanych ofert.
+
+    Returns:
+        dict: Słownik {(job_id, field): delta}.
+    """
+    if not counter_buffering_enabled():
+        return {}
+    keys = {
+        _pending_key(job_id, field, direction): (job_id, field, sign)
+        for job_id in job_ids for _, field in KINDS.values() for direction, sign in (('added', 1), ('removed', -1))
+    }
+    deltas = {}
+    for key, amount in cache.get_many(keys).items():
+        job_id, field, sign = keys[key]
+        deltas[(job_id, field)] = deltas.get((job_id, field), 0) + sign * amount
+    return {counter: delta for counter, delta in deltas.items() if delta}
+
+
+def apply_pending_counts(jobs):
+    """
+    Dolicza do liczników wyświetlanych ofert zmiany czekające w buforze (bez zapytań do bazy danych).
+
+    Args:
+        jobs (iterable): Obiekty Job z bieżącej strony lub wiersze projekcji (słowniki z kluczem 'id').
+
+    Returns:
+        iterable: Te same obiekty z uzupełnionymi licznikami.
+    """
+    jobs = list(jobs)
+    ids = [job['id'] if isinstance(job, dict) else job.pk for job in jobs]
+    for (job_id, field), delta in pending_deltas(ids).items():
+        for job, pk in zip(jobs, ids):
+            if pk != job_id:
+                continue
+            if isinstance(job, dict):
+                job[field] += delta
+            else:
+                setattr(job, field, getattr(job, field) + delta)
+    return jobs
+
+
+def _insert_reactions(model, user, job_ids):
+    """
+    Dodaje reakcje jednym zapytaniem INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING.
+    Nieistniejące oferty są pomijane przez SELECT, a istniejące reakcje przez ON CONFLICT, więc równoczesne
+    żądania (np. podwójne kliknięcie) nie powodują IntegrityError.
+
+    Returns:
+        list: Identyfikatory ofert, dla których reakcja została faktycznie dodana.
+    """
+    if connection.vendor not in ('postgresql', 'sqlite'):
+        added = []
+        for job_id in Job.objects.filter(pk__in=job_ids).values_list('pk', flat=True):
+            with transaction.atomic():
+                if model.objects.get_or_create(user=user, job_id=job_id)[1]:
+                    added.append(job_id)
+        return added
+
+    table = model._meta.db_table
+    placeholders = ', '.join(['%s'] * len(job_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {table} (user_id, job_id, created_at) '
+            f'SELECT %s, id, %s FROM {Job._meta.db_table} WHERE id IN ({placeholders}) '
+            f'ON CONFLICT (user_id, job_id) DO NOTHING RETURNING job_id',
+            [user.pk, timezone.now(), *job_ids],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _delete_reactions(model, user, job_ids):
+    """
+    Usuwa reakcje jednym zapytaniem DELETE ... RETURNING.
+
+    Returns:
+        list: Identyfikatory ofert, dla których reakcja została faktycznie usunięta.
+    """
+    if connection.vendor not in ('postgresql', 'sqlite'):
+        reactions = model.objects.filter(user=user, job_id__in=job_ids)
+        removed = list(reactions.values_list('job_id', flat=True))
+        reactions.delete()
+        return removed
+
+    placeholders = ', '.join(['%s'] * len(job_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {model._meta.db_table} WHERE user_id = %s AND job_id IN ({placeholders}) '
+            f'RETURNING job_id',
+            [user.pk, *job_ids],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def reaction_counts(job_ids, kind):
+    """
+    Zwraca bieżące liczniki reakcji dla podanych ofert (wraz ze zmianami czekającymi w buforze).
+
+    Returns:
+        dict: Słownik {job_id: licznik}. Brak klucza oznacza nieistniejącą ofertę.
+    """
+    _, field = KINDS[kind]
+    counts = dict(Job.objects.filter(pk__in=job_ids).values_list('pk', field))
+    for (job_id, pending_field), delta in pending_deltas(counts).items():
+        if pending_field == field:
+            counts[job_id] += delta
+    return counts
+
+
+def set_reactions(user, job_ids, kind, active):
+    """
+    Ustawia reakcję użytkownika na wiele ofert pracy naraz i aktualizuje liczniki ofert.
+    Liczniki zmieniają się tylko dla wierszy faktycznie dodanych lub usuniętych.
+
+    Args:
+        user (User): Zalogowany użytkownik.
+        job_ids (iterable): Identyfikatory ofert pracy.
+        kind (str): Rodzaj reakcji ('like' lub 'favorite').
+        active (bool): True - dodaje reakcję, False - usuwa ją.
+
+    Returns:
+        list: Identyfikatory ofert, których stan się zmienił.
+    """
+    model, field = KINDS[kind]
+    job_ids = sorted({int(job_id) for job_id in job_ids})
+    if not job_ids:
+        return []
+    changed = _insert_reactions(model, user, job_ids) if active else _delete_reactions(model, user, job_ids)
+    if changed:
+        adjust_counters(changed, field, 1 if active else -1)
+        _invalidate_user_set(user, kind)
+    return changed
+
+
+def toggle_reaction(user, job_id, kind):
+    """
+    Przełącza reakcję użytkownika na ofertę pracy: usuwa istniejącą lub dodaje brakującą.
+
+    Returns:
+        bool: Nowy stan reakcji (True - aktywna).
+    """
+    if set_reactions(user, [job_id], kind, active=False):
+        return False
+    set_reactions(user, [job_id], kind, active=True)
+    return True
+
+
+def add_reaction(user, job_id, kind):
+    """
+    Zapisuje reakcję użytkownika na ofertę pracy i zwiększa licznik oferty.
+
+    Args:
+        user (User): Zalogowany użytkownik.
+        job_id (int): Identyfikator oferty pracy.
+        kind (str): Rodzaj reakcji ('like' lub 'favorite').
+
+    Returns:
+        bool: True, jeśli reakcja została dodana, False, jeśli już istniała.
+    """
+    return bool(set_reactions(user, [job_id], kind, active=True))
+
+
+def reconcile_counters(batch_size=10000):
+    """
+    Przelicza liczniki wszystkich ofert na podstawie tabel Like i Favorite, partiami według identyfikatora.
+    Zbuforowane zmiany są odrzucane, ponieważ są już zawarte w tabelach reakcji.
+
+    Args:
+        batch_size (int): Liczba ofert aktualizowanych jednym zapytaniem.
+
+    Returns:
+        int: Liczba przeliczonych ofert.
+    """
+    counters = {}
+    for model, field in KINDS.values():
+        counted = model.objects.filter(job=OuterRef('pk')).order_by().values('job').annotate(total=Count('pk'))
+        counters[field] = Coalesce(Subquery(counted.values('total')), Value(0))
+
+    updated = 0
+    for ids in _job_id_batches(batch_size):
+        if counter_buffering_enabled():
+            cache.delete_many([_pending_key(job_id, field, direction) for job_id in ids for _, field in KINDS.values()
+                               for direction in ('added', 'removed')])
+        updated += Job.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]).update(**counters)
+    return updated
@@ -0,0 +1,234 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+"""
+Importy:
+- import re: Importuje moduł wyrażeń regularnych, używany do dzielenia zapytania na słowa.
+- from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField: Importuje narzędzia
+  wyszukiwania pełnotekstowego PostgreSQL (zapytanie, ranking i typ kolumny tsvector).
+- from django.db import connection: Importuje bieżące połączenie z bazą danych, aby rozpoznać silnik bazy.
+- from django.db.models import Q: Importuje klasę Q, używaną w zapasowym wyszukiwaniu przez icontains.
+- from django.db.models.expressions import RawSQL: Importuje wyrażenie RawSQL do odwołania do kolumny
+  search_vector, której nie ma w modelu Job.
+"""
+
+# Maksymalna długość zapytania wyszukiwania (tak jak dotychczas w widokach)
+MAX_QUERY_LENGTH = 100
+
+# Maksymalna liczba słów branych pod uwagę w zapytaniu
+MAX_QUERY_TERMS = 8
+
+# Konfiguracja tekstowa PostgreSQL. Oferty są wielojęzyczne, więc nie używamy stemmingu konkretnego języka.
+SEARCH_CONFIG = 'simple'
+
+# Nazwa tabeli cienia FTS5 używanej w SQLite (tworzona w migracji 0007_job_search_index)
+FTS_TABLE = 'jobs_job_fts'
+
+# Wagi kolumn dla funkcji bm25 w SQLite: title, requirements, description, salary
+FTS_WEIGHTS = (10.0, 4.0, 1.0, 1.0)
+
+
+def tokenize_query(search_query):
+    """
+    Dzieli zapytanie wyszukiwania na znormalizowane słowa.
+
+    Args:
+        search_query (str): Zapytanie wpisane przez użytkownika.
+
+    Returns:
+        list: Lista unikalnych słów (małymi literami) w kolejności wystąpienia.
+    """
+    terms = []
+    for term in re.findall(r'\w+', search_query[:MAX_QUERY_LENGTH].lower()):
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_QUERY_TERMS]
+
+
+def _postgres_search(queryset, terms):
+    """
+    Wyszukuje oferty pracy w kolumnie tsvector (indeks GIN) i sortuje je według trafności.
+    Każde słowo jest traktowane jako prefiks, aby wyniki pojawiały się już podczas pisania.
+    """
+    raw_query = ' & '.join(f'{term}:*' for term in terms)
+    query = SearchQuery(raw_query, search_type='raw', config=SEARCH_CONFIG)
+    document = RawSQL(f'{queryset.model._meta.db_table}.search_vector', [], output_field=SearchVectorField())
+    return queryset.alias(document=document).filter(document=query).annotate(
+        rank=SearchRank(document, query)
+    ).order_by('-rank', '-created_at')
+
+
+def _sqlite_search(queryset, terms):
+    """
+    Wyszukuje oferty pracy w tabeli cienia FTS5 i sortuje je według bm25 (niższa wartość = lepsze dopasowanie).
+    Tabela FTS5 jest dołączana do zapytania, dzięki czemu MATCH i ranking są liczone raz dla całego wyniku.
+    """
+    match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+    weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+    table = queryset.model._meta.db_table
+    return queryset.extra(
+        tables=[FTS_TABLE],
+        where=[f'{FTS_TABLE}.rowid = {table}.id', f'{FTS_TABLE} MATCH %s'],
+        params=[match],
+        select={'rank': f'bm25({FTS_TABLE}, {weights})'},
+    ).order_by('rank', '-created_at')
+
+
+def legacy_search(queryset, search_query):
+    """
+    Dotychczasowe wyszukiwanie przez icontains na czterech kolumnach.
+    Używane dla silników baz danych bez indeksu pełnotekstowego oraz jako punkt odniesienia w benchmarku.
+    """
+    return queryset.filter(
+        Q(salary__icontains=search_query) |
+        Q(title__icontains=search_query) |
+        Q(description__icontains=search_query) |
+        Q(requirements__icontains=search_query)
+    ).order_by('-created_at')
+
+
+def search_jobs(queryset, search_query):
+    """
+    Filtruje oferty pracy z użyciem indeksu pełnotekstowego i sortuje je według trafności.
+
+    - PostgreSQL: kolumna tsvector `search_vector` z indeksem GIN.
+    - SQLite: tabela cienia FTS5 `jobs_job_fts`.
+    - Inne silniki: zapasowe wyszukiwanie przez icontains.
+
+    Dokument wyszukiwania jest utrzymywany przez wyzwalacze bazy danych, więc działa również dla
+    bulk_create i QuerySet.update.
+
+    Args:
+        queryset (QuerySet): Zestaw ofert pracy do przefiltrowania.
+        search_query (str): Zapytanie wyszukiwania.
+
+    Returns:
+        QuerySet: Oferty pracy pasujące do zapytania, posortowane według trafności.
+    """
+    terms = tokenize_query(search_query)
+    if not terms:
+        return queryset.order_by('-created_at')
+    if connection.vendor == 'postgresql':
+        return _postgres_search(queryset, terms)
+    if connection.vendor == 'sqlite':
+        return _sqlite_search(queryset, terms)
+    return legacy_search(queryset, search_query[:MAX_QUERY_LENGTH])
+
+
+POSTGRES_DOCUMENT_SQL = (
+    "setweight(to_tsvector('simple', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({row}requirements, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce({row}description, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce({row}salary::text, '')), 'D')"
+)
+
+POSTGRES_INSTALL_SQL = [
+    'ALTER TABLE jobs_job ADD COLUMN IF NOT EXISTS search_vector tsvector',
+    'CREATE OR REPLACE FUNCTION jobs_job_search_vector_update() RETURNS trigger AS $$ '
+    'BEGIN NEW.search_vector := ' + POSTGRES_DOCUMENT_SQL.format(row='NEW.') + '; RETURN NEW; END '
+    '$$ LANGUAGE plpgsql',
+    'DROP TRIGGER IF EXISTS jobs_job_search_vector_trigger ON jobs_job',
+    'CREATE TRIGGER jobs_job_search_vector_trigger BEFORE INSERT OR UPDATE OF title, requirements, description, '
+    'salary ON jobs_job FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector_update()',
+    'UPDATE jobs_job SET search_vector = ' + POSTGRES_DOCUMENT_SQL.format(row=''),
+    'CREATE INDEX IF NOT EXISTS jobs_job_search_vector_gin ON jobs_job USING gin (search_vector)',
+]
+
+POSTGRES_UNINSTALL_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_job_search_vector_trigger ON jobs_job',
+    'DROP FUNCTION IF EXISTS jobs_job_search_vector_update()',
+    'DROP INDEX IF EXISTS jobs_job_search_vector_gin',
+    'ALTER TABLE jobs_job DROP COLUMN IF EXISTS search_vector',
+]
+
+SQLITE_TABLE_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "title, requirements, description, salary, content='jobs_job', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')"
+)
+
+# Wyzwalacze tworzone z IF NOT EXISTS, ponieważ SQLite usuwa je razem ze starą tabelą,
+# gdy migracja Django przebudowuje tabelę jobs_job (patrz JobsConfig.ready).
+SQLITE_TRIGGERS_SQL = [
+    f"CREATE TRIGGER IF NOT EXISTS jobs_job_fts_insert AFTER INSERT ON jobs_job BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, requirements, description, salary) "
+    f"VALUES (new.id, new.title, new.requirements, new.description, new.salary); END",
+    f"CREATE TRIGGER IF NOT EXISTS jobs_job_fts_delete AFTER DELETE ON jobs_job BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, requirements, description, salary) "
+    f"VALUES ('delete', old.id, old.title, old.requirements, old.description, old.salary); END",
+    f"CREATE TRIGGER IF NOT EXISTS jobs_job_fts_update AFTER UPDATE OF title, requirements, description, salary "
+    f"ON jobs_job BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, requirements, description, salary) "
+    f"VALUES ('delete', old.id, old.title, old.requirements, old.description, old.salary); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, requirements, description, salary) "
+    f"VALUES (new.id, new.title, new.requirements, new.description, new.salary); END",
+]
+
+SQLITE_UNINSTALL_SQL = [
+    'DROP TRIGGER IF EXISTS jobs_job_fts_insert',
+    'DROP TRIGGER IF EXISTS jobs_job_fts_delete',
+    'DROP TRIGGER IF EXISTS jobs_job_fts_update',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+
+def install_search_index(apps, schema_editor):
+    """
+    Tworzy dokument wyszukiwania dla ofert pracy (używane w migracji 0007_job_search_index).
+
+    - PostgreSQL: kolumna tsvector, wyzwalacz aktualizujący ją i indeks GIN.
+    - SQLite: tabela cienia FTS5 z wyzwalaczami synchronizującymi.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for sql in POSTGRES_INSTALL_SQL:
+            schema_editor.execute(sql)
+    elif vendor == 'sqlite':
+        schema_editor.execute(SQLITE_TABLE_SQL)
+        for sql in SQLITE_TRIGGERS_SQL:
+            schema_editor.execute(sql)
+        schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')")
+
+
+def uninstall_search_index(apps, schema_editor):
+    """
+    Usuwa dokument wyszukiwania (cofnięcie migracji 0007_job_search_index).
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for sql in POSTGRES_UNINSTALL_SQL:
+            schema_editor.execute(sql)
+    elif vendor == 'sqlite':
+        for sql in SQLITE_UNINSTALL_SQL:
+            schema_editor.execute(sql)
+
+
+def ensure_sqlite_triggers(using='default', **kwargs):
+    """
+    Odtwarza wyzwalacze FTS5 po migracjach, które przebudowały tabelę jobs_job w SQLite.
+    Podłączone do sygnału post_migrate w JobsConfig.ready.
+    """
+    from django.db import connections
+
+    db = connections[using]
+    if db.vendor != 'sqlite' or FTS_TABLE not in db.introspection.table_names():
+        return
+    with db.cursor() as cursor:
+        for sql in SQLITE_TRIGGERS_SQL:
+            cursor.execute(sql)
+
+
+def rebuild_search_index():
+    """
+    Odbudowuje dokumenty wyszukiwania dla wszystkich ofert pracy.
+    Przydatne po imporcie danych z pominięciem wyzwalaczy lub po zmianie wag.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('UPDATE jobs_job SET search_vector = ' + POSTGRES_DOCUMENT_SQL.format(row=''))
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')")
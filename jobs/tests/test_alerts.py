@@ -0,0 +1,121 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from accounts.models import OutboxEmail
+from jobs.alerts import matching_searches
+from jobs.models import Job, PendingJobAlert, SavedSearch, SavedSearchMatch
+
+User = get_user_model()
+
+
+def make_user(email, role):
+    user = User.objects.create_user(email=email, password='password', role=role)
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def recruiter():
+    return make_user('recruiter@example.com', 'recruiter')
+
+
+@pytest.fixture
+def candidates():
+    return [make_user(f'candidate{number}@example.com', 'candidate') for number in range(2)]
+
+
+def create_job(recruiter, **fields):
+    return Job.objects.create(**{'title': 'Programista Python', 'recruiter': recruiter,
+                                 'description': 'Praca z Django i PostgreSQL', 'requirements': 'Doświadczenie',
+                                 'salary': Decimal('8000.00'), **fields})
+
+
+@pytest.mark.django_db
+def test_saved_search_matches_prefixes_of_all_terms_and_salary(recruiter, candidates):
+    first, second = candidates
+    prefix = SavedSearch.objects.create(user=first, query='pyth djan')
+    salary = SavedSearch.objects.create(user=first, query='python', min_salary=Decimal('7500'))
+    SavedSearch.objects.create(user=second, query='python java')
+    SavedSearch.objects.create(user=second, query='python', min_salary=Decimal('9000'))
+    SavedSearch.objects.create(user=recruiter, query='python')
+
+    assert prefix.term_count == 2
+    assert set(prefix.terms.values_list('term', flat=True)) == {'pyth', 'djan'}
+    job = create_job(recruiter)
+    assert set(matching_searches(job)) == {prefix, salary}
+
+    prefix.query = 'java'
+    prefix.save()
+    assert set(matching_searches(job)) == {salary}
+
+
+@pytest.mark.django_db
+def test_created_and_reopened_jobs_are_queued(recruiter):
+    client = Client()
+    client.force_login(recruiter)
+    client.post(reverse('jobs:create_job'), {'title': 'Nowa oferta', 'description': 'Opis',
+                                             'requirements': 'Wymagania', 'salary': '6000.00', 'status': 'open'})
+    job = Job.objects.get(title='Nowa oferta')
+    assert PendingJobAlert.objects.filter(job=job).exists()
+
+    PendingJobAlert.objects.all().delete()
+    fields = {'title': job.title, 'description': job.description, 'requirements': job.requirements,
+              'salary': '6000.00'}
+    client.post(reverse('jobs:update_job_status', args=[job.id]), {**fields, 'status': 'closed'})
+    assert not PendingJobAlert.objects.exists()
+    client.post(reverse('jobs:update_job_status', args=[job.id]), {**fields, 'status': 'open'})
+    assert PendingJobAlert.objects.filter(job=job).exists()
+
+
+@pytest.mark.django_db
+def test_send_job_alerts_sends_one_digest_per_candidate(recruiter, candidates):
+    first, second = candidates
+    SavedSearch.objects.create(user=first, query='python')
+    SavedSearch.objects.create(user=first, query='django')
+    SavedSearch.objects.create(user=second, query='java')
+    jobs = [create_job(recruiter, title=f'Programista Python {number}') for number in range(2)]
+    for job in jobs:
+        PendingJobAlert.objects.create(job=job)
+
+    call_command('send_job_alerts', verbosity=0)
+    assert not PendingJobAlert.objects.exists()
+    assert SavedSearchMatch.objects.count() == 4
+    assert not SavedSearchMatch.objects.filter(notified_at__isnull=True).exists()
+    email = OutboxEmail.objects.get()
+    assert email.recipients == [first.email]
+    assert all(reverse('jobs:job_detail', args=[job.id]) in email.body for job in jobs)
+
+    PendingJobAlert.objects.create(job=jobs[0])
+    call_command('send_job_alerts', verbosity=0)
+    assert OutboxEmail.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_saved_search_views(recruiter, candidates):
+    first, second = candidates
+    client = Client()
+    client.force_login(first)
+    response = client.get(reverse('jobs:saved_search_list'), {'q': 'python django'})
+    assert response.status_code == 200
+    assert response.context['form'].initial['query'] == 'python django'
+
+    response = client.post(reverse('jobs:saved_search_list'), {'query': 'python django', 'min_salary': ''})
+    assert response.status_code == 302
+    saved_search = SavedSearch.objects.get(user=first)
+    assert saved_search.term_count == 2
+
+    response = client.post(reverse('jobs:saved_search_list'), {'query': '!!!', 'min_salary': ''})
+    assert response.status_code == 200 and response.context['form'].errors
+
+    other = Client()
+    other.force_login(second)
+    assert other.post(reverse('jobs:saved_search_delete', args=[saved_search.id])).status_code == 404
+    client.post(reverse('jobs:saved_search_delete', args=[saved_search.id]))
+    assert not SavedSearch.objects.exists()
+
+    client.force_login(recruiter)
+    assert client.get(reverse('jobs:saved_search_list')).status_code == 403
@@ -0,0 +1,63 @@
+import pytest
+from django.core.cache import cache, caches
+from benchmarks import list_payload, matching, saved_searches, views
+from benchmarks.common import find_regressions
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    cache.clear()
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+@pytest.mark.django_db
+def test_view_benchmark_reports_every_view(monkeypatch):
+    monkeypatch.setattr(views, 'TIERS', {'tiny': 0.01})
+    results = views.run(['tiny'], repeat=3, threads=1, warm=False, seed=1, chunk_size=500)
+    assert [row['view'] for row in results] == [view for view, _, _ in views.VIEWS]
+    for row in results:
+        assert row['samples'] == 3
+        assert row['queries'] > 0
+        assert row['peak_memory_kb'] > 0
+        assert row['p50_ms'] <= row['p95_ms'] <= row['p99_ms']
+
+
+def test_find_regressions():
+    baseline = [{'tier': 'small', 'view': 'JobListView', 'p95_ms': 10.0, 'queries': 6}]
+    thresholds = {'p95_ms': 0.2, 'queries': 0}
+    keys = ('tier', 'view')
+    assert find_regressions([{**baseline[0], 'p95_ms': 11.9}], baseline, keys, thresholds) == []
+    assert find_regressions([{**baseline[0], 'p95_ms': 12.5}], baseline, keys, thresholds) == \
+        ['small JobListView: p95_ms 10.0 -> 12.5']
+    assert find_regressions([{**baseline[0], 'queries': 7}], baseline, keys, thresholds) == \
+        ['small JobListView: queries 6 -> 7']
+    assert find_regressions([{**baseline[0], 'view': 'all_news_view', 'p95_ms': 99}], baseline, keys,
+                            thresholds) == []
+
+
+@pytest.mark.django_db
+def test_list_payload_benchmark_compares_deferred_columns(monkeypatch):
+    monkeypatch.setattr(views, 'TIERS', {'tiny': 0.01})
+    results = list_payload.run(['tiny'], seed=1, chunk_size=500)
+    assert [row['view'] for row in results] == [view for view, _, _ in list_payload.LISTS]
+    for row in results:
+        assert 0 < row['bytes'] < row['bytes_full']
+
+
+@pytest.mark.django_db
+def test_saved_searches_benchmark_percolator_matches_scan():
+    results = saved_searches.run([300], repeat=2, jobs=2, seed=1, scan_limit=1000)
+    matches = {(row['job'], row['path']): row['matches'] for row in results}
+    assert set(matches) == {(job, path) for job in range(2) for path in ('percolator', 'scan')}
+    assert all(matches[job, 'percolator'] == matches[job, 'scan'] for job in range(2))
+
+
+@pytest.mark.django_db
+def test_matching_benchmark_reports_every_operation():
+    results = matching.run(candidates=60, jobs=30, repeat=2, seed=1, samples=2)
+    assert [row['operation'] for row in results] == ['rebuild', 'best_candidates', 'recommended_jobs',
+                                                     'update_job_vector']
+    for row in results:
+        assert row['p50_ms'] <= row['p95_ms']
+        if 'matched' in row:
+            assert len(row['matched']) == 2
@@ -0,0 +1,128 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from accounts.models import CandidateProfile
+from jobs.models import Job, Application
+from kirismor import counting
+from kirismor.pagination import CountedPaginator
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def recruiter():
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def jobs(recruiter):
+    return [
+        Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis',
+                           requirements='Wymagania', salary=Decimal('5000.00'))
+        for number in range(3)
+    ]
+
+
+def open_jobs():
+    return Job.objects.filter(status=Job.JobStatus.OPEN).order_by('-created_at')
+
+
+@pytest.mark.django_db
+def test_count_is_cached(jobs, django_assert_num_queries):
+    assert CountedPaginator(open_jobs(), 10, count_key='test').count == 3
+    with django_assert_num_queries(0):
+        paginator = CountedPaginator(open_jobs(), 10, count_key='test')
+        assert paginator.count == 3
+        assert paginator.count_is_exact
+
+
+@pytest.mark.django_db
+def test_count_is_keyed_by_filter(jobs):
+    assert counting.count_rows(open_jobs(), 'test') == (3, True)
+    assert counting.count_rows(open_jobs().filter(title='Oferta 1'), 'test') == (1, True)
+
+
+@pytest.mark.django_db
+def test_count_is_invalidated_on_create_and_status_change(recruiter, jobs):
+    assert counting.count_rows(open_jobs(), 'test') == (3, True)
+
+    Job.objects.create(title='Nowa', recruiter=recruiter, description='Opis', requirements='Wymagania')
+    assert counting.count_rows(open_jobs(), 'test') == (4, True)
+
+    jobs[0].close_job()
+    assert counting.count_rows(open_jobs(), 'test') == (3, True)
+
+    jobs[1].delete()
+    assert counting.count_rows(open_jobs(), 'test') == (2, True)
+
+
+@pytest.mark.django_db
+def test_unrelated_field_update_keeps_count(jobs):
+    counting.count_rows(open_jobs(), 'test')
+    version = counting.model_version(Job)
+    jobs[0].description = 'Zmieniony opis'
+    jobs[0].save(update_fields=['description'])
+    assert counting.model_version(Job) == version
+
+
+@pytest.mark.django_db
+def test_estimate_is_used_above_threshold(jobs, monkeypatch, settings):
+    settings.COUNT_ESTIMATE_THRESHOLD = 1000
+    monkeypatch.setattr(counting, 'estimate_count', lambda queryset: 250000)
+    paginator = CountedPaginator(open_jobs(), 10, count_key='test')
+    assert paginator.count == 250000
+    assert not paginator.count_is_exact
+
+    monkeypatch.setattr(counting, 'estimate_count', lambda queryset: 500)
+    cache.clear()
+    paginator = CountedPaginator(open_jobs(), 10, count_key='test')
+    assert paginator.count == 3
+    assert paginator.count_is_exact
+
+
+@pytest.mark.django_db
+def test_views_expose_exact_count(recruiter, jobs):
+    client = Client()
+    data = client.get(reverse('jobs:public_job_list'), {'json': 'true'}).json()
+    assert data['count'] == 3
+    assert data['count_is_exact'] is True
+
+    client.login(email='recruiter@example.com', password='password')
+    Application.objects.create(job=jobs[0], applicant=recruiter, status='submitted')
+    data = client.get(reverse('jobs:recruiter_applications'), {'json': 'true'}).json()
+    assert data['count'] == 1
+    assert data['count_is_exact'] is True
+
+
+@pytest.mark.django_db
+def test_application_search_count_follows_job_title_and_candidate_name(recruiter, jobs):
+    candidate = User.objects.create_user(email='candidate@example.com', password='password', role='candidate')
+    profile = CandidateProfile.objects.create(user=candidate, first_name='Anna', last_name='Nowak',
+                                              phone_number='+48123456789', location='Kraków', bio='Bio')
+    Application.objects.create(job=jobs[0], applicant=candidate, status='submitted')
+    client = Client()
+    client.login(email='recruiter@example.com', password='password')
+    url = reverse('jobs:recruiter_applications')
+
+    def count(search):
+        return client.get(url, {'json': 'true', 'search': search}).json()['count']
+
+    assert (count('Programista'), count('Kowalska')) == (0, 0)
+    jobs[0].title = 'Programista'
+    jobs[0].save(update_fields=['title'])
+    profile.last_name = 'Kowalska'
+    profile.save(update_fields=['last_name'])
+    assert (count('Programista'), count('Kowalska')) == (1, 1)
@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, F
+from accounts.models import CandidateProfile, ClientProfile, RecruiterProfile
+from jobs.models import Job, Application
+from kirismor.datagen import generate, scaled_counts
+from requests.models import JobRequestStatusUpdate
+
+User = get_user_model()
+
+COUNTS = {'candidates': 20, 'recruiters': 5, 'clients': 3, 'jobs': 50, 'tasks': 10, 'applications': 1000,
+          'guest_feedbacks': 40, 'job_requests': 10, 'status_updates': 20, 'news': 6}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    cache.clear()
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+def snapshot():
+    """
+    Zwraca wygenerowane dane bez kluczy głównych i dat (obiekty są identyfikowane kolejnością utworzenia).
+    """
+    jobs = {pk: number for number, pk in enumerate(Job.objects.order_by('pk').values_list('pk', flat=True))}
+    users = {pk: number for number, pk in enumerate(User.objects.order_by('pk').values_list('pk', flat=True))}
+    return (
+        list(Job.objects.order_by('pk').values_list('title', 'salary', 'status')),
+        [(jobs[job_id], users[applicant_id], status, cover_letter) for job_id, applicant_id, status, cover_letter
+         in Application.objects.order_by('pk').values_list('job_id', 'applicant_id', 'status', 'cover_letter')],
+        list(CandidateProfile.objects.order_by('pk').values_list('first_name', 'last_name', 'location')),
+    )
+
+
+@pytest.mark.django_db
+def test_generate_creates_requested_counts():
+    results = generate(COUNTS, seed=1, chunk_size=7)
+    assert {row['phase']: row['objects'] for row in results} == COUNTS
+    assert User.objects.filter(role='candidate').count() == CandidateProfile.objects.count() == 20
+    assert RecruiterProfile.objects.count() == 5
+    assert ClientProfile.objects.count() == 3
+    assert Application.objects.count() == 1000
+    # Aplikacje są składane po publikacji oferty, a aktualizacje statusu pochodzą od rekrutera zapotrzebowania
+    assert not Application.objects.filter(created_at__lt=F('job__created_at')).exists()
+    assert not JobRequestStatusUpdate.objects.exclude(updated_by=F('job_request__recruiter')).exists()
+    assert Job.objects.values('created_at').distinct().count() == 50
+
+
+@pytest.mark.django_db
+def test_generate_is_deterministic():
+    generate(COUNTS, seed=3, chunk_size=100)
+    first = snapshot()
+    User.objects.all().delete()
+    generate(COUNTS, seed=3, chunk_size=100)
+    assert snapshot() == first
+
+    User.objects.all().delete()
+    generate(COUNTS, seed=4, chunk_size=100)
+    assert snapshot() != first
+
+
+@pytest.mark.django_db
+def test_job_popularity_is_skewed():
+    generate(COUNTS, seed=1)
+    applications = sorted(Job.objects.annotate(total=Count('applications')).values_list('total', flat=True))
+    assert applications[-1] > 10 * applications[len(applications) // 2]
+
+
+@pytest.mark.django_db
+def test_command_reports_throughput():
+    out = StringIO()
+    call_command('generate_data', '--scale', '0.01', '--factor', 'applications=0.5', '--seed', '2', stdout=out)
+    counts = scaled_counts(0.01, {'applications': 0.5})
+    assert Job.objects.count() == counts['jobs'] == 100
+    assert Application.objects.count() == counts['applications'] == 500
+    assert 'wierszy/s' in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_command_rejects_invalid_options():
+    with pytest.raises(CommandError):
+        call_command('generate_data', '--factor', 'unknown=2')
+    with pytest.raises(CommandError):
+        call_command('generate_data', '--factor', 'jobs=0')
+    with pytest.raises(CommandError):
+        call_command('generate_data', '--workers', '2')
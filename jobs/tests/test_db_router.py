@@ -0,0 +1,104 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connections, router
+from django.test import Client
+from django.urls import reverse
+from accounts.models import RecruiterProfile
+from jobs.models import Job
+from kirismor.db_router import PIN_COOKIE, choose_replica, reset_health
+from kirismor.query_monitor import record_queries
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    cache.clear()
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def replica(settings, transactional_db):
+    """
+    Druga baza danych 'replica' wskazująca te same dane co baza testowa (jak replika bez opóźnienia).
+    """
+    connections.settings['replica'] = dict(connections['default'].settings_dict)
+    settings.DATABASE_REPLICAS = ['replica']
+    reset_health()
+    yield 'replica'
+    connections['replica'].close()
+    del connections.settings['replica']
+    if hasattr(connections._connections, 'replica'):
+        delattr(connections._connections, 'replica')
+    reset_health()
+
+
+@pytest.fixture
+def recruiter(transactional_db):
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    RecruiterProfile.objects.create(user=user, first_name='Anna', last_name='Nowak', phone_number='+48123456789',
+                                    location='Kraków', bio='Bio')
+    Job.objects.create(title='Oferta', recruiter=user, description='Opis', requirements='Wymagania')
+    return user
+
+
+def table_aliases(recorder, table):
+    return {alias for alias, sql, _, _ in recorder.queries if sql.startswith('SELECT') and f'"{table}"' in sql}
+
+
+def test_marked_views_read_from_replica(replica, recruiter):
+    client = Client()
+    with record_queries() as recorder:
+        assert client.get(reverse('jobs:public_job_list')).status_code == 200
+    assert table_aliases(recorder, 'jobs_job') == {'replica'}
+
+    job = Job.objects.get()
+    with record_queries() as recorder:
+        assert client.get(reverse('jobs:public_job_detail', args=[job.id])).status_code == 200
+    assert table_aliases(recorder, 'jobs_job') == {'default'}
+
+
+def test_writes_go_to_primary(replica, recruiter):
+    job = Job.objects.using('replica').get()
+    assert router.db_for_write(Job, instance=job) == 'default'
+
+
+def test_write_pins_user_to_primary(replica, recruiter, settings):
+    settings.DATABASE_REPLICA_PIN_SECONDS = 7
+    client_user = User.objects.create_user(email='client@example.com', password='password', role='client',
+                                           is_active=True)
+    client = Client()
+    client.force_login(client_user)
+
+    with record_queries() as recorder:
+        assert client.get(reverse('requests:recruiter_list')).status_code == 200
+    assert table_aliases(recorder, 'accounts_recruiterprofile') == {'replica'}
+
+    # Dodanie do ulubionych (zapis w żądaniu GET) przypina użytkownika do bazy głównej
+    response = client.get(reverse('requests:add_to_favorites', args=[recruiter.pk]))
+    assert response.cookies[PIN_COOKIE]['max-age'] == 7
+    with record_queries() as recorder:
+        response = client.get(reverse('requests:recruiter_list'))
+    assert table_aliases(recorder, 'accounts_recruiterprofile') == {'default'}
+    assert response.context['page_obj'][0].is_favorite
+
+    del client.cookies[PIN_COOKIE]
+    with record_queries() as recorder:
+        client.get(reverse('requests:recruiter_list'))
+    assert table_aliases(recorder, 'accounts_recruiterprofile') == {'replica'}
+
+
+def test_post_request_pins_user(replica, recruiter):
+    job = Job.objects.get()
+    response = Client().post(reverse('jobs:guest_feedback', args=[job.id]), {})
+    assert PIN_COOKIE in response.cookies
+
+
+def test_unhealthy_replica_falls_back_to_primary(replica, recruiter):
+    connections.settings['replica']['NAME'] = '/nonexistent/directory/replica.sqlite3'
+    assert choose_replica() is None
+
+    with record_queries() as recorder:
+        assert Client().get(reverse('jobs:public_job_list')).status_code == 200
+    assert table_aliases(recorder, 'jobs_job') == {'default'}
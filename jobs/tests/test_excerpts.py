@@ -0,0 +1,50 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from accounts.models import RecruiterProfile, Task
+from jobs.models import Job
+from kirismor.excerpts import EXCERPT_LENGTH, backfill_excerpts
+from kirismor.query_monitor import record_queries
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter(db):
+    user = User.objects.create_user(email='recruiter@example.com', password=None, role='recruiter', is_active=True)
+    RecruiterProfile.objects.create(user=user, first_name='Anna', last_name='Nowak', phone_number='+48123456789',
+                                    location='Kraków', bio='Biografia ' * 50)
+    return user
+
+
+def test_excerpt_follows_source_on_save(recruiter):
+    job = Job.objects.create(title='Oferta', recruiter=recruiter, description='a' * 1000, requirements='Wymagania')
+    assert Job.objects.get().excerpt == 'a' * EXCERPT_LENGTH
+
+    job.description = 'Krótki opis'
+    job.save()
+    assert Job.objects.get().excerpt == 'Krótki opis'
+    assert recruiter.recruiter_profile.bio_excerpt == ('Biografia ' * 50)[:EXCERPT_LENGTH]
+
+
+def test_excerpt_is_set_by_bulk_create_and_backfill(recruiter):
+    Job.objects.bulk_create([Job(title=f'Oferta {n}', recruiter=recruiter, description=f'Opis {n}',
+                                 requirements='Wymagania') for n in range(3)])
+    assert sorted(Job.objects.values_list('excerpt', flat=True)) == ['Opis 0', 'Opis 1', 'Opis 2']
+
+    Job.objects.update(description='Nowy opis', excerpt='')
+    assert backfill_excerpts(Job) == 3
+    assert set(Job.objects.values_list('excerpt', flat=True)) == {'Nowy opis'}
+
+
+def test_lists_do_not_load_long_text_columns(client, recruiter):
+    Job.objects.create(title='Oferta', recruiter=recruiter, description='Opis oferty', requirements='Wymagania')
+    Task.objects.create(title='Zadanie', description='Opis zadania', priority='low', due_date='2024-05-01',
+                        created_by=recruiter)
+    client.force_login(recruiter)
+    for url, text in ((reverse('jobs:job_list'), 'Opis oferty'), (reverse('jobs:recruiter_job_list'), 'Oferta'),
+                      (reverse('accounts:task_list'), 'Opis zadania')):
+        with record_queries() as recorder:
+            response = client.get(url)
+        assert text in response.content.decode()
+        assert not any('"description"' in sql or '"requirements"' in sql for _, sql, _, _ in recorder.queries)
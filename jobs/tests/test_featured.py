@@ -0,0 +1,70 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from jobs.featured import build_featured_jobs, get_featured_jobs, EXCERPT_LENGTH
+from jobs.models import Job
+from jobs.reactions import add_reaction
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def recruiter():
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def jobs(recruiter):
+    return [
+        Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis ' * 200,
+                           requirements='Wymagania', salary=Decimal('5000.00'))
+        for number in range(4)
+    ]
+
+
+@pytest.mark.django_db
+def test_featured_jobs_are_ranked_and_capped(recruiter, jobs, settings):
+    settings.FEATURED_JOBS_LIMIT = 3
+    add_reaction(recruiter, jobs[0].id, 'like')
+    add_reaction(recruiter, jobs[0].id, 'favorite')
+    add_reaction(recruiter, jobs[1].id, 'like')
+    jobs[3].close_job()
+
+    featured = build_featured_jobs()
+    assert [job['id'] for job in featured] == [jobs[0].id, jobs[1].id, jobs[2].id]
+    assert set(featured[0]) == {'id', 'title', 'description', 'requirements'}
+    assert len(featured[0]['description']) == EXCERPT_LENGTH + 1
+
+
+@pytest.mark.django_db
+def test_home_page_uses_cached_snapshot(jobs, django_assert_num_queries):
+    client = Client()
+    client.get(reverse('home'))
+    with django_assert_num_queries(0):
+        response = client.get(reverse('home'))
+    assert response.status_code == 200
+    assert 'Oferta 3' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_snapshot_is_rebuilt_on_create_and_close(recruiter, jobs):
+    assert len(get_featured_jobs()) == 4
+
+    Job.objects.create(title='Nowa oferta', recruiter=recruiter, description='Opis', requirements='Wymagania')
+    assert 'Nowa oferta' in [job['title'] for job in get_featured_jobs()]
+
+    jobs[0].close_job()
+    assert jobs[0].id not in [job['id'] for job in get_featured_jobs()]
@@ -0,0 +1,122 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from accounts.models import CandidateProfile
+from jobs import matching
+from jobs.models import Application, Job, JobMatchTerm, MatchTerm
+
+User = get_user_model()
+
+
+def make_user(email, role):
+    user = User.objects.create_user(email=email, password='password', role=role)
+    user.is_active = True
+    user.save()
+    return user
+
+
+def make_candidate(name, skills):
+    user = make_user(f'{name}@example.com', 'candidate')
+    return CandidateProfile.objects.create(user=user, first_name=name.capitalize(), last_name='Kowalski',
+                                           phone_number='+48123456789', location='Warszawa', bio='Bio',
+                                           skills=skills)
+
+
+@pytest.fixture
+def recruiter():
+    return make_user('recruiter@example.com', 'recruiter')
+
+
+@pytest.fixture
+def profiles():
+    return {
+        'anna': make_candidate('anna', 'Python, Django, PostgreSQL, Docker'),
+        'jan': make_candidate('jan', 'Python, Excel'),
+        'ewa': make_candidate('ewa', 'Spawanie, prawo jazdy kat. C'),
+    }
+
+
+def create_job(recruiter, title, requirements, **fields):
+    return Job.objects.create(title=title, recruiter=recruiter, description='Opis', requirements=requirements,
+                              salary=Decimal('8000.00'), **fields)
+
+
+def test_normalize_terms():
+    assert matching.normalize_terms('Znajomość JS, Node.js oraz C++/C#; 3 lata doświadczenia z k8s.') == \
+        ['javascript', 'node.js', 'c++', 'c#', 'kubernetes']
+
+
+@pytest.mark.django_db
+def test_vectors_are_updated_on_save_and_delete(recruiter, profiles):
+    job = create_job(recruiter, 'Programista Python', 'Python, Django')
+    weights = dict(job.match_terms.values_list('term', 'weight'))
+    assert set(weights) == {'programista', 'python', 'django'}
+    assert sum(weight * weight for weight in weights.values()) == pytest.approx(1)
+    assert MatchTerm.objects.get(term='python').document_count == 3
+
+    job.requirements = 'Java'
+    job.save()
+    assert set(job.match_terms.values_list('term', flat=True)) == {'programista', 'python', 'java'}
+    assert MatchTerm.objects.get(term='django').document_count == 1
+
+    job.delete()
+    assert MatchTerm.objects.get(term='python').document_count == 2
+    assert not JobMatchTerm.objects.exists()
+
+
+@pytest.mark.django_db
+def test_best_candidates_and_recommended_jobs(recruiter, profiles):
+    job = create_job(recruiter, 'Programista Python', 'Python, Django, PostgreSQL')
+    welder = create_job(recruiter, 'Spawacz', 'Spawanie, prawo jazdy kat. C')
+    create_job(recruiter, 'Programista Django', 'Python, Django', status='closed')
+
+    ranked = matching.best_candidates(job.id)
+    assert [profile_id for profile_id, _ in ranked] == [profiles['anna'].pk, profiles['jan'].pk]
+    assert 0 < ranked[1][1] < ranked[0][1] <= 1
+    assert matching.best_candidates(job.id, limit=1) == ranked[:1]
+    assert matching.best_candidates(job.id, profile_ids=[profiles['jan'].pk]) == ranked[1:]
+
+    assert [job_id for job_id, _ in matching.recommended_jobs(profiles['anna'].pk)] == [job.id]
+    assert [job_id for job_id, _ in matching.recommended_jobs(profiles['ewa'].pk)] == [welder.id]
+
+
+@pytest.mark.django_db
+def test_rebuild_matches_incremental_vectors(recruiter, profiles):
+    job = create_job(recruiter, 'Programista Python', 'Python, Django, PostgreSQL')
+    ranked = matching.best_candidates(job.id)
+    Job.objects.bulk_create([Job(title='Kierowca', recruiter=recruiter, description='Opis',
+                                 requirements='Prawo jazdy kat. C')])
+
+    call_command('rebuild_match_vectors', verbosity=0)
+    assert MatchTerm.objects.get(term='kierowca').document_count == 1
+    assert Job.objects.get(title='Kierowca').match_terms.exists()
+    # Dokumenty dodane przez bulk_create zmieniają wagi IDF, ale nie kolejność kandydatów
+    assert [profile_id for profile_id, _ in matching.best_candidates(job.id)] == \
+        [profile_id for profile_id, _ in ranked]
+
+
+@pytest.mark.django_db
+def test_matching_views(recruiter, profiles):
+    job = create_job(recruiter, 'Programista Python', 'Python, Django, PostgreSQL')
+    Application.objects.create(job=job, applicant=profiles['jan'].user, cover_letter='List')
+    Application.objects.create(job=job, applicant=profiles['ewa'].user, cover_letter='List')
+    Application.objects.create(job=job, applicant=profiles['anna'].user, cover_letter='List')
+
+    client = Client()
+    client.force_login(recruiter)
+    response = client.get(reverse('jobs:registered_applications_for_job', args=[job.id]))
+    assert [application.applicant_id for application in response.context['applications']] == \
+        [profiles['anna'].pk, profiles['jan'].pk, profiles['ewa'].pk]
+
+    response = client.get(reverse('jobs:job_candidate_matches', args=[job.id]))
+    assert [candidate.pk for candidate in response.context['candidates']] == [profiles['anna'].pk, profiles['jan'].pk]
+    assert all(candidate.has_applied for candidate in response.context['candidates'])
+    assert client.get(reverse('jobs:recommended_jobs')).status_code == 403
+
+    client.force_login(profiles['anna'].user)
+    response = client.get(reverse('jobs:recommended_jobs'))
+    assert [recommended.id for recommended in response.context['jobs']] == [job.id]
+    assert client.get(reverse('jobs:job_candidate_matches', args=[job.id])).status_code == 404
@@ -0,0 +1,80 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from accounts.models import RecruiterProfile
+from kirismor.media import content_hash, is_hashed_name, rehash_name
+
+User = get_user_model()
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.MEDIA_ACCEL = ''
+    (tmp_path / 'profiles').mkdir()
+    (tmp_path / 'profiles' / 'anna.png').write_bytes(CONTENT)
+    (tmp_path / 'profiles' / 'anna.3f9c2a1b0d4e.png').write_bytes(CONTENT)
+    return tmp_path
+
+
+def body(response):
+    return b''.join(response.streaming_content) if response.streaming else response.content
+
+
+def test_serves_file_with_validators(client, media, settings):
+    response = client.get('/media/profiles/anna.png')
+    assert response.status_code == 200 and body(response) == CONTENT
+    assert response['Content-Type'] == 'image/png' and response['Accept-Ranges'] == 'bytes'
+    assert response['Cache-Control'] == f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}'
+
+    not_modified = client.get('/media/profiles/anna.png', HTTP_IF_NONE_MATCH=response['ETag'])
+    assert not_modified.status_code == 304 and not_modified['ETag'] == response['ETag']
+
+    hashed = client.get('/media/profiles/anna.3f9c2a1b0d4e.png')
+    assert hashed['Cache-Control'] == f'public, max-age={settings.MEDIA_HASHED_MAX_AGE}, immutable'
+    assert client.get('/media/profiles/missing.png').status_code == 404
+    assert client.get('/media/../settings.py').status_code == 404
+
+
+def test_byte_ranges(client, media):
+    response = client.get('/media/profiles/anna.png', HTTP_RANGE='bytes=10-19')
+    assert response.status_code == 206 and body(response) == CONTENT[10:20]
+    assert response['Content-Range'] == f'bytes 10-19/{len(CONTENT)}' and response['Content-Length'] == '10'
+
+    assert body(client.get('/media/profiles/anna.png', HTTP_RANGE='bytes=-5')) == CONTENT[-5:]
+    assert body(client.get('/media/profiles/anna.png', HTTP_RANGE='bytes=1000-')) == CONTENT[1000:]
+
+    unsatisfiable = client.get('/media/profiles/anna.png', HTTP_RANGE=f'bytes={len(CONTENT)}-')
+    assert unsatisfiable.status_code == 416 and unsatisfiable['Content-Range'] == f'bytes */{len(CONTENT)}'
+
+    # Nieaktualny If-Range: cały plik zamiast zakresu
+    stale = client.get('/media/profiles/anna.png', HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"0-0"')
+    assert stale.status_code == 200 and body(stale) == CONTENT
+
+
+@pytest.mark.parametrize('accel, header, value', [
+    ('nginx', 'X-Accel-Redirect', '/protected-media/profiles/anna.3f9c2a1b0d4e.png'),
+    ('sendfile', 'X-Sendfile', None),
+])
+def test_front_proxy_headers(client, media, settings, accel, header, value):
+    settings.MEDIA_ACCEL = accel
+    response = client.get('/media/profiles/anna.3f9c2a1b0d4e.png', HTTP_RANGE='bytes=0-9')
+    assert response.status_code == 200 and response.content == b''
+    assert response[header] == (value or str(media / 'profiles' / 'anna.3f9c2a1b0d4e.png'))
+    assert response['Content-Type'] == 'image/png' and 'immutable' in response['Cache-Control']
+    assert response['ETag']
+
+
+@pytest.mark.django_db
+def test_uploaded_photos_get_content_hashed_names(media):
+    user = User.objects.create_user(email='recruiter@example.com', password=None, role='recruiter')
+    profile = RecruiterProfile.objects.create(
+        user=user, first_name='Anna', last_name='Nowak', phone_number='+48123456789', location='Kraków', bio='Bio',
+        photo=SimpleUploadedFile('Moje Zdjęcie.PNG', CONTENT, content_type='image/png'),
+    )
+    assert profile.photo.name == f'profiles/Moje_Zdjęcie.{content_hash(CONTENT)}.png'
+    assert is_hashed_name(profile.photo.name) and not is_hashed_name('profiles/anna.png')
+    assert rehash_name(profile.photo.name, b'new') == f'profiles/Moje_Zdjęcie.{content_hash(b"new")}.png'
+    assert rehash_name('profiles/anna.png', b'new') == 'profiles/anna.png'
@@ -0,0 +1,100 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import Client
+from django.urls import reverse
+from jobs.models import Job
+from kirismor.page_cache import CACHE_HEADER
+from news.models import News
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+    yield
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def recruiter():
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def jobs(recruiter):
+    return [
+        Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis',
+                           requirements='Wymagania', salary=Decimal('5000.00'))
+        for number in range(2)
+    ]
+
+
+@pytest.mark.django_db
+def test_anonymous_page_is_served_from_cache(client, jobs, django_assert_num_queries):
+    url = reverse('jobs:public_job_list')
+    assert client.get(url)[CACHE_HEADER] == 'MISS'
+    with django_assert_num_queries(0):
+        response = client.get(url)
+    assert response[CACHE_HEADER] == 'HIT'
+    assert 'Oferta 1' in response.content.decode()
+
+    # Inne parametry zapytania to osobna strona
+    assert client.get(url, {'q': 'oferta'})[CACHE_HEADER] == 'MISS'
+
+
+@pytest.mark.django_db
+def test_languages_are_cached_separately(client, jobs):
+    url = reverse('about')
+    assert client.get(url, HTTP_ACCEPT_LANGUAGE='pl')[CACHE_HEADER] == 'MISS'
+    assert client.get(url, HTTP_ACCEPT_LANGUAGE='en')[CACHE_HEADER] == 'MISS'
+    assert client.get(url, HTTP_ACCEPT_LANGUAGE='en')[CACHE_HEADER] == 'HIT'
+    assert client.get(url, HTTP_ACCEPT_LANGUAGE='pl')[CACHE_HEADER] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_authenticated_users_bypass_cache(client, jobs):
+    client.login(email='recruiter@example.com', password='password')
+    url = reverse('jobs:public_job_list')
+    client.get(url)
+    assert CACHE_HEADER not in client.get(url)
+
+
+@pytest.mark.django_db
+def test_job_changes_invalidate_related_pages(client, recruiter, jobs):
+    list_url = reverse('jobs:public_job_list')
+    first_url = reverse('jobs:public_job_detail', args=[jobs[0].id])
+    second_url = reverse('jobs:public_job_detail', args=[jobs[1].id])
+    for url in (list_url, first_url, second_url):
+        client.get(url)
+
+    jobs[0].title = 'Zmieniona oferta'
+    jobs[0].save()
+
+    response = client.get(first_url)
+    assert response[CACHE_HEADER] == 'MISS'
+    assert 'Zmieniona oferta' in response.content.decode()
+    assert client.get(list_url)[CACHE_HEADER] == 'MISS'
+    assert client.get(second_url)[CACHE_HEADER] == 'HIT'
+
+
+@pytest.mark.django_db
+def test_news_changes_invalidate_news_list(client):
+    url = reverse('news:all_news_view')
+    client.get(url, {'format': 'json'})
+    assert client.get(url, {'format': 'json'})[CACHE_HEADER] == 'HIT'
+
+    News.objects.create(title='Nowość', content='Treść', role='candidate')
+    response = client.get(url, {'format': 'json'})
+    assert response[CACHE_HEADER] == 'MISS'
+    assert response.json()['news'][0]['title'] == 'Nowość'
@@ -0,0 +1,116 @@
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import Client
+from django.urls import reverse
+from jobs.models import Job, Application
+from kirismor.pagination import CursorPaginator, encode_cursor, NEXT
+
+User = get_user_model()
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+@pytest.fixture
+def recruiter():
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def jobs(recruiter):
+    return [
+        Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis',
+                           requirements='Wymagania', salary=Decimal('5000.00'))
+        for number in range(25)
+    ]
+
+
+def walk(paginator, cursor=None, attribute='next_cursor'):
+    pages = []
+    while True:
+        page = paginator.page(cursor)
+        pages.append([job.id for job in page])
+        cursor = getattr(page, attribute)
+        if cursor is None:
+            return pages, page
+
+
+@pytest.mark.django_db
+def test_cursor_paginator_walks_forward_and_back(jobs):
+    ordering = ('-created_at', '-id')
+    expected = list(Job.objects.order_by(*ordering).values_list('id', flat=True))
+    paginator = CursorPaginator(Job.objects.all(), 10, ordering)
+
+    pages, last_page = walk(paginator)
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert sum(pages, []) == expected
+    assert not last_page.has_next() and last_page.has_previous()
+
+    back_pages, first_page = walk(paginator, last_page.previous_cursor, 'previous_cursor')
+    assert back_pages == [pages[1], pages[0]]
+    assert first_page.has_next() and not first_page.has_previous()
+
+
+@pytest.mark.django_db
+def test_cursor_paginator_ignores_invalid_cursor(jobs):
+    paginator = CursorPaginator(Job.objects.all(), 10, ('-created_at', '-id'))
+    first_ids = [job.id for job in paginator.page()]
+    assert [job.id for job in paginator.page('nie-kursor')] == first_ids
+    assert [job.id for job in paginator.page(encode_cursor(NEXT, ['x']))] == first_ids
+
+
+@pytest.mark.django_db
+def test_job_list_view_cursor_mode(client, jobs):
+    client.login(email='recruiter@example.com', password='password')
+    response = client.get(reverse('jobs:job_list'), {'cursor': '', 'json': 'true'})
+    data = response.json()
+    assert len(data['jobs']) == 10
+    assert data['previous_cursor'] is None
+    assert f'cursor={data["next_cursor"]}' in data['pagination']
+    assert 'page=' not in data['pagination']
+
+    response = client.get(reverse('jobs:job_list'), {'cursor': data['next_cursor']})
+    assert response.status_code == 200
+    page_obj = response.context['page_obj']
+    assert page_obj.is_cursor and page_obj.has_previous() and page_obj.has_next()
+    second_page = client.get(reverse('jobs:job_list'), {'page': 2, 'json': 'true'}).json()['jobs']
+    assert [job.id for job in response.context['jobs']] == [job['id'] for job in second_page]
+    assert page_obj.next_url.encode() in response.content.replace(b'&amp;', b'&')
+
+
+@pytest.mark.django_db
+def test_search_with_cursor_uses_relevance_pages(client, recruiter, jobs):
+    best = Job.objects.create(title='Programista Python', recruiter=recruiter, description='Python i Django',
+                              requirements='Python', salary=Decimal('5000.00'))
+    Job.objects.filter(pk=best.pk).update(created_at=jobs[0].created_at - timedelta(days=1))
+    Job.objects.filter(pk=jobs[-1].pk).update(description='Opis, mile widziany Python')
+
+    response = client.get(reverse('jobs:public_job_list'), {'cursor': '', 'q': 'python'})
+    assert response.status_code == 200
+    page_obj = response.context['page_obj']
+    assert not getattr(page_obj, 'is_cursor', False)
+    numbered = client.get(reverse('jobs:public_job_list'), {'q': 'python'})
+    assert [job.id for job in page_obj] == [job.id for job in numbered.context['page_obj']] == [best.id, jobs[-1].id]
+
+    response = client.get(reverse('jobs:public_job_list'), {'cursor': '', 'q': ''})
+    assert response.context['page_obj'].is_cursor
+
+
+@pytest.mark.django_db
+def test_recruiter_applications_view_cursor_mode(client, recruiter, jobs):
+    client.login(email='recruiter@example.com', password='password')
+    for job in jobs[:12]:
+        Application.objects.create(job=job, applicant=recruiter, status='submitted')
+
+    data = client.get(reverse('jobs:recruiter_applications'), {'cursor': '', 'json': 'true'}).json()
+    assert len(data['applications']) == 10
+    data = client.get(reverse('jobs:recruiter_applications'), {'cursor': data['next_cursor'], 'json': 'true'}).json()
+    assert len(data['applications']) == 2
+    assert data['next_cursor'] is None and data['previous_cursor']
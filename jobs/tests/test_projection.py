@@ -0,0 +1,94 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.urls import reverse
+from accounts.models import ClientProfile, RecruiterProfile, Task
+from jobs.models import Application, Job
+from kirismor import projection
+from kirismor.projection import Column, Projection, date_format, dumps, truncate
+from kirismor.query_monitor import record_queries
+
+User = get_user_model()
+
+AJAX = {'HTTP_X_REQUESTED_WITH': 'XMLHttpRequest'}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    cache.clear()
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def recruiter(db):
+    user = User.objects.create_user(email='recruiter@example.com', password=None, role='recruiter', is_active=True)
+    RecruiterProfile.objects.create(user=user, first_name='Anna', last_name='Nowak', phone_number='+48123456789',
+                                    location='Kraków', bio='B' * 500, photo='profiles/anna.png')
+    return user
+
+
+def test_projection_rows(recruiter):
+    candidate = User.objects.create_user(email='candidate@example.com', password=None, role='candidate')
+    job = Job.objects.create(title='Oferta', recruiter=recruiter, description='Opis', requirements='Wymagania')
+    Application.objects.create(job=job, applicant=candidate, status='reviewed', cover_letter='List')
+
+    applications = Projection(
+        Application,
+        job_title='job__title',
+        applicant=Column(('applicant__email', 'status'), transform=lambda email, status: f'{email}/{status}'),
+        status=Column(display=True),
+        created_at=Column(transform=date_format('%Y')),
+    )
+    queryset = applications.project(Application.objects.all(), 'id')
+    assert applications.rows(queryset) == [{
+        'job_title': 'Oferta',
+        'applicant': 'candidate@example.com/reviewed',
+        'status': Application(status='reviewed').get_status_display(),
+        'created_at': str(datetime.date.today().year),
+    }]
+    assert truncate(3)('abcdef') == 'abc'
+
+
+def test_dumps_does_not_depend_on_encoder(monkeypatch):
+    data = {'salary': Decimal('1500.50'), 'date': datetime.date(2024, 5, 1), 'text': 'Zażółć'}
+    encoded = dumps(data)
+    monkeypatch.setattr(projection, 'orjson', None)
+    assert dumps(data) == encoded
+    assert json.loads(encoded) == {'salary': '1500.50', 'date': '2024-05-01', 'text': 'Zażółć'}
+
+
+def test_recruiter_ajax_list_is_projected(client, recruiter):
+    client.force_login(recruiter)
+    with record_queries() as recorder:
+        data = client.get(reverse('accounts:recruiters'), **AJAX).json()
+    assert data['recruiters'] == [{
+        'id': recruiter.pk, 'first_name': 'Anna', 'last_name': 'Nowak', 'bio': 'B' * 500,
+        'photo': '/media/profiles/anna.png',
+    }]
+    profile_queries = [sql for _, sql, _, _ in recorder.queries if 'accounts_recruiterprofile' in sql]
+    assert profile_queries and not any('phone_number' in sql for sql in profile_queries)
+
+
+def test_client_ajax_list_is_projected(client, recruiter):
+    user = User.objects.create_user(email='client@example.com', password=None, role='client')
+    ClientProfile.objects.create(user=user, phone_number='+48123456789', location='Gdańsk', bio='Bio',
+                                 company_name='Firma', industry='IT')
+    client.force_login(recruiter)
+    data = client.get(reverse('accounts:client_list'), **AJAX).json()
+    assert data['clients'] == [{'id': user.pk, 'company_name': 'Firma', 'bio': 'Bio', 'photo': None}]
+
+
+def test_task_ajax_list_matches_model_display(client, recruiter):
+    task = Task.objects.create(title='Zadanie', description='D' * 50, priority='high', status='in_progress',
+                               due_date=datetime.date(2024, 5, 1), created_by=recruiter)
+    client.force_login(recruiter)
+    for params in ({}, {'cursor': ''}):
+        data = client.get(reverse('accounts:task_list'), params, **AJAX).json()
+        assert data['tasks'] == [{
+            'id': task.id, 'title': 'Zadanie', 'description': 'D' * 30,
+            'priority': task.get_priority_display(), 'status': task.get_status_display(), 'due_date': '01 May 2024',
+        }]
@@ -0,0 +1,274 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import count
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from django.test import Client
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from accounts.models import CandidateProfile, ClientProfile, RecruiterProfile, Task
+from jobs.models import Job, Application, GuestFeedback, TempGuestFeedback, Like, Favorite, SavedSearch
+from kirismor.query_monitor import record_queries
+from news.models import News
+from requests.models import JobRequest, JobRequestStatusUpdate, FavoriteRecruiter
+
+User = get_user_model()
+
+# Liczba wierszy powiązanych z każdym obiektem w pierwszym pomiarze; drugi pomiar używa 10 * N
+N = 3
+
+_numbers = count()
+
+# Trasy sprawdzane dla zalogowanego użytkownika o danej roli (None - gość).
+# Argumenty tras są wypełniane obiektami z zasianej bazy danych (patrz route_kwargs).
+ROUTES = {
+    'home': None,
+    'about': None,
+    'contact': None,
+    'set_language': 'candidate',
+    'accounts:register': None,
+    'accounts:dashboard': 'candidate',
+    'accounts:create_profile': None,
+    'accounts:login': None,
+    'accounts:logout': 'candidate',
+    'accounts:profile_detail': 'candidate',
+    'accounts:profile_edit': 'candidate',
+    'accounts:task_list': 'recruiter',
+    'accounts:task_create': 'recruiter',
+    'accounts:task_update': 'recruiter',
+    'accounts:task_delete': 'recruiter',
+    'accounts:recruiters': 'client',
+    'accounts:client_list': 'recruiter',
+    'accounts:task_detail': 'recruiter',
+    'accounts:verify_email': None,
+    'accounts:verified': None,
+    'accounts:registration_complete': None,
+    'accounts:change_password': 'candidate',
+    'jobs:job_list': 'candidate',
+    'jobs:create_job': 'recruiter',
+    'jobs:job_detail': 'candidate',
+    'jobs:application_list': 'candidate',
+    'jobs:create_application': 'candidate',
+    'jobs:guest_feedback': None,
+    'jobs:guest_feedback_thanks': None,
+    'jobs:public_job_list': None,
+    'jobs:public_job_detail': None,
+    'jobs:guest_feedback_applications': 'recruiter',
+    'jobs:recruiter_applications': 'recruiter',
+    'jobs:registered_applications_for_job': 'recruiter',
+    'jobs:guest_applications': 'recruiter',
+    'jobs:update_job_status': 'recruiter',
+    'jobs:application_detail': 'recruiter',
+    'jobs:recruiter_job_list': 'recruiter',
+    'jobs:guest_feedback_applications_for_job': 'recruiter',
+    'jobs:update_application_status': 'recruiter',
+    'jobs:like_job': 'candidate',
+    'jobs:favorite_job': 'candidate',
+    'jobs:toggle_like': 'candidate',
+    'jobs:toggle_favorite': 'candidate',
+    'jobs:batch_reactions': 'candidate',
+    'jobs:liked_jobs_list': 'candidate',
+    'jobs:favorited_jobs_list': 'candidate',
+    'jobs:guest_feedback_verify': None,
+    'jobs:guest_feedback_verified': None,
+    'jobs:guest_feedback_confirmation': None,
+    'jobs:saved_search_list': 'candidate',
+    'jobs:saved_search_delete': 'candidate',
+    'jobs:job_candidate_matches': 'recruiter',
+    'jobs:recommended_jobs': 'candidate',
+    'requests:client_job_request_list': 'client',
+    'requests:client_job_request_create': 'client',
+    'requests:client_job_request_delete': 'client',
+    'requests:recruiter_job_request_list': 'recruiter',
+    'requests:recruiter_job_request_update': 'recruiter',
+    'requests:recruiter_list': 'client',
+    'requests:client_job_request_detail': 'client',
+    'requests:recruiter_job_request_detail': 'recruiter',
+    'requests:recruiter_detail_view': 'client',
+    'requests:add_to_favorites': 'client',
+    'news:news_list': 'candidate',
+    'news:all_news_view': None,
+}
+
+
+def named_routes(resolver=None, namespace=None):
+    """
+    Zwraca nazwy wszystkich tras projektu (z przestrzenią nazw aplikacji), z pominięciem panelu administracyjnego.
+    """
+    resolver = resolver or get_resolver()
+    names = set()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.namespace == 'admin':
+                continue
+            inner = ':'.join(filter(None, [namespace, pattern.namespace])) or None
+            names |= named_routes(pattern, inner)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(f'{namespace}:{pattern.name}' if namespace else pattern.name)
+    return names
+
+
+def make_user(role, **extra):
+    # Bez hasła: testy logują przez force_login, a haszowanie hasła spowalniałoby zasiewanie setek kont
+    user = User.objects.create_user(email=f'{role}{next(_numbers)}@example.com', password=None, role=role, **extra)
+    user.is_active = True
+    user.save()
+    return user
+
+
+def make_candidate():
+    user = make_user('candidate')
+    CandidateProfile.objects.create(user=user, first_name='Jan', last_name='Kowalski', phone_number='+48123456789',
+                                    location='Warszawa', bio='Bio', date_of_birth=date(1990, 1, 1),
+                                    skills='Python')
+    return user
+
+
+def make_recruiter():
+    user = make_user('recruiter')
+    RecruiterProfile.objects.create(user=user, first_name='Anna', last_name='Nowak', phone_number='+48123456789',
+                                    location='Kraków', bio='Bio')
+    return user
+
+
+def make_client():
+    user = make_user('client')
+    ClientProfile.objects.create(user=user, phone_number='+48123456789', location='Gdańsk', bio='Bio',
+                                 company_name='Firma', industry='IT')
+    return user
+
+
+@pytest.fixture
+def world(db):
+    """
+    Główni użytkownicy każdej roli i obiekty, do których odwołują się argumenty tras.
+    """
+    recruiter, candidate, client = make_recruiter(), make_candidate(), make_client()
+    job = Job.objects.create(title='Oferta', recruiter=recruiter, description='Opis', requirements='Python, Django',
+                             salary=Decimal('5000.00'))
+    return {
+        'recruiter': recruiter,
+        'candidate': candidate,
+        'client': client,
+        'job': job,
+        'application': Application.objects.create(job=job, applicant=candidate, cover_letter='List'),
+        'task': Task.objects.create(created_by=recruiter, title='Zadanie', description='Opis', priority='low',
+                                    due_date=date.today()),
+        'job_request': JobRequest.objects.create(employer=client, recruiter=recruiter, title='Zapotrzebowanie',
+                                                 description='Opis', requirements='Wymagania'),
+        'unverified': make_user('candidate', is_verified=False),
+        'temp_feedback': TempGuestFeedback.objects.create(job=job, email='temp@example.com', message='Opinia'),
+        'saved_search': SavedSearch.objects.create(user=candidate, query='python'),
+    }
+
+
+def seed(world, rows):
+    """
+    Dodaje `rows` wierszy każdego rodzaju powiązanych z głównymi obiektami.
+    """
+    recruiter, candidate, client, job = world['recruiter'], world['candidate'], world['client'], world['job']
+    for number in range(rows):
+        other_candidate = make_candidate()
+        other_recruiter = make_recruiter()
+        other_job = Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis',
+                                       requirements='Python')
+        Application.objects.create(job=job, applicant=other_candidate, cover_letter='List')
+        Application.objects.create(job=job, applicant=None, cover_letter='List gościa')
+        Application.objects.create(job=other_job, applicant=candidate, cover_letter='List')
+        GuestFeedback.objects.create(job=job, email=f'guest{next(_numbers)}@example.com', message='Opinia',
+                                     is_verified=True)
+        Like.objects.create(user=candidate, job=other_job)
+        Favorite.objects.create(user=candidate, job=other_job)
+        SavedSearch.objects.create(user=candidate, query=f'python {number}')
+        Task.objects.create(created_by=recruiter, title=f'Zadanie {number}', description='Opis', priority='low',
+                            due_date=date.today() + timedelta(days=number))
+        job_request = JobRequest.objects.create(employer=client, recruiter=recruiter, title=f'Zapotrzebowanie',
+                                                description='Opis', requirements='Wymagania')
+        for target in (job_request, world['job_request']):
+            JobRequestStatusUpdate.objects.create(job_request=target, new_status='processing',
+                                                  updated_by=recruiter, message='Aktualizacja')
+        FavoriteRecruiter.objects.create(user=client, recruiter=other_recruiter.recruiter_profile)
+        make_client()
+        for role in ('candidate', 'client', 'recruiter'):
+            News.objects.create(title=f'Aktualność {number}', content='Treść', role=role)
+
+
+def route_kwargs(name, world):
+    """
+    Zwraca argumenty trasy wskazujące obiekty z zasianej bazy danych.
+    """
+    kwargs = {
+        'set_language': {'language': 'pl'},
+        'accounts:verify_email': {'token': world['unverified'].generate_verification_token()},
+        'jobs:guest_feedback_verify': {'token': world['temp_feedback'].generate_verification_token()},
+        'requests:recruiter_detail_view': {'pk': world['recruiter'].recruiter_profile.pk},
+        'requests:add_to_favorites': {'recruiter_id': world['recruiter'].recruiter_profile.pk},
+    }
+    if name in kwargs:
+        return kwargs[name]
+    arguments = {}
+    route = reverse_route(name)
+    if '<int:job_id>' in route:
+        arguments['job_id'] = world['job'].pk
+    if '<int:application_id>' in route:
+        arguments['application_id'] = world['application'].pk
+    if '<int:task_id>' in route:
+        arguments['task_id'] = world['task'].pk
+    if '<int:search_id>' in route:
+        arguments['search_id'] = world['saved_search'].pk
+    if '<int:pk>' in route:
+        arguments['pk'] = world['task'].pk if name.startswith('accounts:') else world['job_request'].pk
+    return arguments
+
+
+def reverse_route(name):
+    """
+    Zwraca wzorzec trasy (np. 'jobs/<int:job_id>/') dla nazwy z przestrzenią nazw.
+    """
+    resolver = get_resolver()
+    *namespaces, url_name = name.split(':')
+    prefix = ''
+    for namespace in namespaces:
+        prefix_pattern, resolver = resolver.namespace_dict[namespace]
+        prefix += prefix_pattern
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLPattern) and pattern.name == url_name:
+            return prefix + str(pattern.pattern)
+    raise LookupError(name)
+
+
+def measure(world, name, rows):
+    """
+    Zasiewa `rows` wierszy, wykonuje żądanie GET do trasy i zwraca (liczba zapytań, kod odpowiedzi).
+
+    Zmiany (zasiane wiersze i skutki żądania, np. polubienie oferty) są wycofywane, więc kolejny pomiar
+    zaczyna od tego samego stanu.
+    """
+    with transaction.atomic():
+        seed(world, rows)
+        for alias in ('default', 'pages'):
+            caches[alias].clear()
+        client = Client()
+        role = ROUTES[name]
+        if role:
+            client.force_login(world[role])
+        url = reverse(name, kwargs=route_kwargs(name, world))
+        with record_queries() as recorder:
+            response = client.get(url)
+        transaction.set_rollback(True)
+    assert response.status_code < 500
+    return recorder.count, response.status_code
+
+
+def test_every_route_has_a_budget_check():
+    assert named_routes() == set(ROUTES)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('name', sorted(ROUTES))
+def test_query_count_does_not_grow_with_data(world, name):
+    small = measure(world, name, N)
+    large = measure(world, name, 10 * N)
+    assert large == small, f'{name}: {small[0]} zapytań dla {N} wierszy, {large[0]} dla {10 * N}'
@@ -0,0 +1,75 @@
+import json
+import logging
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import Client
+from django.urls import reverse
+from jobs.models import Job
+from kirismor.query_monitor import QueryBudgetExceeded, fingerprint, record_queries
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+
+
+@pytest.fixture
+def jobs(db):
+    recruiters = [User.objects.create_user(email=f'recruiter{number}@example.com', password='password',
+                                           role='recruiter') for number in range(6)]
+    return [Job.objects.create(title=f'Oferta {number}', recruiter=recruiter, description='Opis',
+                               requirements='Wymagania') for number, recruiter in enumerate(recruiters)]
+
+
+def test_fingerprint_ignores_literals_and_in_lists():
+    assert fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s) AND a = 1') == \
+        fingerprint('SELECT *  FROM t WHERE id IN (%s) AND a = 25')
+    assert fingerprint("SELECT * FROM t WHERE name = 'x'") == 'SELECT * FROM t WHERE name = ?'
+
+
+@pytest.mark.django_db
+def test_recorder_detects_duplicates_and_n_plus_one(jobs):
+    with record_queries() as recorder:
+        list(Job.objects.all())
+        list(Job.objects.all())
+        emails = [job.recruiter.email for job in Job.objects.all()]
+    assert len(emails) == 6
+    assert recorder.count == 9
+    assert list(recorder.duplicates().values()) == [3]
+    [(sql, count)] = recorder.n_plus_one().items()
+    assert count == 6
+    assert 'accounts_user' in sql
+
+
+@pytest.mark.django_db
+def test_middleware_is_disabled_by_default(jobs):
+    response = Client().get(reverse('jobs:public_job_list'))
+    assert 'Server-Timing' not in response
+
+
+@pytest.mark.django_db
+def test_middleware_adds_server_timing_and_log(jobs, settings, caplog):
+    settings.QUERY_MONITOR_ENABLED = True
+    with caplog.at_level(logging.INFO, logger='kirismor.queries'):
+        response = Client().get(reverse('jobs:public_job_list'))
+    assert response['Server-Timing'].startswith('sql;dur=')
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record['view'] == 'jobs:public_job_list'
+    assert record['queries'] > 0
+    assert f'desc="{record["queries"]} queries"' in response['Server-Timing']
+
+
+@pytest.mark.django_db
+def test_middleware_raises_when_budget_is_exceeded(jobs, settings):
+    settings.QUERY_MONITOR_ENABLED = True
+    settings.QUERY_MONITOR_RAISE = True
+    settings.QUERY_BUDGETS = {'jobs:public_job_list': 1}
+    with pytest.raises(QueryBudgetExceeded):
+        Client().get(reverse('jobs:public_job_list'))
+
+    settings.QUERY_BUDGETS = {'jobs:public_job_list': 50}
+    assert Client().get(reverse('jobs:public_job_list')).status_code == 200
@@ -0,0 +1,165 @@
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from accounts.models import Task
+from jobs.models import Job, Application, GuestFeedback
+from news.models import News
+from requests.models import JobRequest
+
+User = get_user_model()
+
+# Liczba wierszy na użytkownika w zasianej bazie danych
+ROWS = 30
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    cache.clear()
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+    yield
+    cache.clear()
+
+
+def make_user(email, role):
+    user = User.objects.create_user(email=email, password='password', role=role)
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def users(db):
+    """
+    Zasiana baza danych: kilku rekruterów, kandydatów i klientów, każdy z własnymi wierszami.
+    """
+    recruiters = [make_user(f'recruiter{number}@example.com', 'recruiter') for number in range(3)]
+    candidates = [make_user(f'candidate{number}@example.com', 'candidate') for number in range(3)]
+    clients = [make_user(f'client{number}@example.com', 'client') for number in range(3)]
+
+    jobs = Job.objects.bulk_create([
+        Job(title=f'Oferta {number}', recruiter=recruiter, description='Opis', requirements='Wymagania',
+            salary=Decimal('5000.00'), status='open' if number % 3 else 'closed')
+        for recruiter in recruiters for number in range(ROWS)
+    ])
+    Application.objects.bulk_create([
+        Application(job=job, applicant=candidate, cover_letter='List')
+        for candidate in candidates for job in jobs[::3]
+    ])
+    GuestFeedback.objects.bulk_create([
+        GuestFeedback(job=job, email=f'guest{number}@example.com', message='Opinia', is_verified=bool(number % 2))
+        for number, job in enumerate(jobs)
+    ])
+    News.objects.bulk_create([
+        News(title=f'Aktualność {number}', content='Treść', role=role)
+        for role in ('candidate', 'client', 'recruiter') for number in range(ROWS)
+    ])
+    # bulk_create pomija Task.save(), który wymaga profilu rekrutera
+    Task.objects.bulk_create([
+        Task(created_by=recruiter, title=f'Zadanie {number}', description='Opis', priority='low',
+             due_date=date.today() + timedelta(days=number))
+        for recruiter in recruiters for number in range(ROWS)
+    ])
+    JobRequest.objects.bulk_create([
+        JobRequest(employer=client, recruiter=recruiter, title=f'Zapotrzebowanie {number}', description='Opis',
+                   requirements='Wymagania')
+        for client in clients for recruiter in recruiters for number in range(ROWS // 3)
+    ])
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    return {'recruiter': recruiters[0], 'candidate': candidates[0], 'client': clients[0]}
+
+
+def query_plan(sql, params=None):
+    """
+    Zwraca plan zapytania (EXPLAIN w PostgreSQL, EXPLAIN QUERY PLAN w SQLite) jako tekst.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Na małej bazie testowej planista wybrałby pełny odczyt tabeli nawet przy dobrym indeksie,
+            # więc wyłączamy go, aby sprawdzić, czy indeks w ogóle może zostać użyty
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                cursor.execute(f'EXPLAIN {sql}', params)
+                return '\n'.join(row[0] for row in cursor.fetchall())
+            finally:
+                cursor.execute('RESET enable_seqscan')
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return '\n'.join(row[-1] for row in cursor.fetchall())
+
+
+def sequential_scans(plan, tables):
+    """
+    Zwraca tabele z listy `tables`, które plan zapytania odczytuje w całości (bez indeksu).
+    """
+    if connection.vendor == 'postgresql':
+        return [table for table in tables if re.search(rf'Seq Scan on {table}\b', plan)]
+    # SQLite: "SCAN tabela" bez "USING ... INDEX" oznacza pełny odczyt tabeli
+    return [table for table in tables if re.search(rf'^SCAN {table}$', plan, re.M)]
+
+
+def uses_index(plan, index):
+    """
+    Sprawdza, czy plan zapytania odczytuje wiersze przez indeks o podanej nazwie. Z enable_seqscan = off
+    PostgreSQL zamiast pełnego odczytu tabeli przegląda cały indeks klucza głównego, więc sam brak "Seq Scan"
+    nie dowodzi, że indeks widoku istnieje.
+    """
+    if connection.vendor == 'postgresql':
+        return bool(re.search(rf'Index (Only )?Scan (Backward )?using {index}\b', plan))
+    return bool(re.search(rf'USING (COVERING )?INDEX {index}\b', plan))
+
+
+# Widok, rola zalogowanego użytkownika, główna tabela widoku i indeksy, z których może korzystać jej odczyt
+VIEWS = [
+    ('jobs:job_list', 'candidate', 'jobs_job', ['job_status_created_idx']),
+    ('jobs:public_job_list', None, 'jobs_job', ['job_status_created_idx']),
+    ('jobs:recruiter_job_list', 'recruiter', 'jobs_job', ['job_recruiter_title_idx']),
+    # Aplikacje ze wszystkich ofert rekrutera: sortowanie obejmuje złączenie, więc planista może wybrać
+    # indeks klucza obcego job_id zamiast (job, -created_at, -id)
+    ('jobs:recruiter_applications', 'recruiter', 'jobs_application',
+     ['application_job_created_idx', 'jobs_application_job_id_7bb7e966']),
+    ('jobs:application_list', 'candidate', 'jobs_application', ['application_applicant_job_idx']),
+    ('news:news_list', 'candidate', 'news_news', ['news_role_date_idx']),
+    ('news:all_news_view', None, 'news_news', ['news_date_idx']),
+    ('accounts:dashboard', 'client', 'news_news', ['news_role_date_idx']),
+    ('accounts:task_list', 'recruiter', 'accounts_task', ['task_created_by_due_idx']),
+    ('requests:client_job_request_list', 'client', 'requests_jobrequest', ['jobrequest_employer_idx']),
+    ('requests:recruiter_job_request_list', 'recruiter', 'requests_jobrequest', ['jobrequest_recruiter_idx']),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name, role, table, indexes', VIEWS)
+def test_view_queries_use_indexes(users, url_name, role, table, indexes):
+    client = Client()
+    if role:
+        client.force_login(users[role])
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(reverse(url_name))
+    assert response.status_code == 200
+
+    queries = [query['sql'] for query in context.captured_queries
+               if query['sql'].startswith('SELECT') and f'"{table}"' in query['sql']]
+    assert queries, f'{url_name} nie odczytuje tabeli {table}'
+    plans = [query_plan(sql) for sql in queries]
+    for sql, plan in zip(queries, plans):
+        assert not sequential_scans(plan, [table]), f'{url_name}: pełny odczyt tabeli {table}\n{sql}'
+    assert any(uses_index(plan, index) for plan in plans for index in indexes), \
+        f'{url_name}: żadne zapytanie nie używa indeksu {", ".join(indexes)}\n' + '\n\n'.join(plans)
+
+
+@pytest.mark.django_db
+def test_guest_feedback_lookup_uses_index(users):
+    queryset = GuestFeedback.objects.filter(email='guest1@example.com', is_verified=True)
+    sql, params = queryset.query.sql_with_params()
+    plan = query_plan(sql, params)
+    assert not sequential_scans(plan, ['jobs_guestfeedback'])
+    assert uses_index(plan, 'guestfeedback_email_idx')
@@ -0,0 +1,251 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from jobs import reactions
+from jobs.models import Job, Like
+from jobs.reactions import (add_reaction, apply_pending_counts, flush_counters, reconcile_counters, set_reactions,
+                            user_reaction_ids)
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def candidate():
+    user = User.objects.create_user(email='candidate@example.com', password='password', role='candidate')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def job(candidate):
+    return Job.objects.create(title='Oferta', recruiter=candidate, description='Opis', requirements='Wymagania',
+                              salary=Decimal('5000.00'))
+
+
+def make_users(count):
+    return [User.objects.create_user(email=f'user{number}@example.com', password='password', role='candidate')
+            for number in range(count)]
+
+
+@pytest.mark.django_db
+def test_like_and_favorite_views_update_counters(candidate, job):
+    client = Client()
+    client.login(email='candidate@example.com', password='password')
+    client.get(reverse('jobs:like_job', args=[job.id]))
+    client.get(reverse('jobs:like_job', args=[job.id]))
+    client.get(reverse('jobs:favorite_job', args=[job.id]))
+    job.refresh_from_db()
+    assert (job.likes_count, job.favorites_count) == (1, 1)
+    assert job.popularity() == 2
+
+
+@pytest.mark.django_db
+def test_job_save_keeps_counters(candidate, job):
+    add_reaction(candidate, job.id, 'like')
+    job.status = Job.JobStatus.CLOSED
+    job.save()
+    job.refresh_from_db()
+    assert job.likes_count == 1
+    assert job.status == Job.JobStatus.CLOSED
+
+
+@pytest.mark.django_db
+def test_job_list_renders_reactions_without_extra_queries(candidate, job):
+    client = Client()
+    client.login(email='candidate@example.com', password='password')
+    add_reaction(candidate, job.id, 'like')
+    client.get(reverse('jobs:job_list'))
+
+    with CaptureQueriesContext(connection) as queries:
+        data = client.get(reverse('jobs:job_list'), {'json': 'true'}).json()
+    assert not [query for query in queries if 'jobs_like' in query['sql'] or 'jobs_favorite' in query['sql']]
+    assert data['jobs'][0]['likes_count'] == 1
+    assert data['jobs'][0]['liked'] is True
+    assert data['jobs'][0]['favorited'] is False
+
+
+@pytest.fixture
+def hot_counters(settings, monkeypatch):
+    # Testy używają locmem, który w normalnej konfiguracji nie pozwala na buforowanie liczników
+    monkeypatch.setattr(reactions, 'SHARED_CACHE_BACKENDS', (settings.CACHES['default']['BACKEND'],))
+    settings.JOB_COUNTER_HOT_THRESHOLD = 2
+    settings.JOB_COUNTER_BATCH_SIZE = 5
+
+
+@pytest.mark.django_db
+def test_hot_job_counters_are_batched(job, hot_counters, django_capture_on_commit_callbacks):
+    users = make_users(4)
+    with django_capture_on_commit_callbacks(execute=True):
+        for user in users:
+            add_reaction(user, job.id, 'like')
+        set_reactions(users[0], [job.id], 'like', active=False)
+
+    job.refresh_from_db()
+    assert job.likes_count == 2
+    assert apply_pending_counts([job])[0].likes_count == 3
+
+    assert flush_counters() == 1
+    job.refresh_from_db()
+    assert job.likes_count == 3
+    assert apply_pending_counts([job])[0].likes_count == 3
+    assert flush_counters() == 0
+
+
+@pytest.mark.django_db
+def test_hot_job_counters_are_not_buffered_in_process_local_cache(job, settings):
+    settings.JOB_COUNTER_HOT_THRESHOLD = 2
+    for user in make_users(4):
+        add_reaction(user, job.id, 'like')
+
+    job.refresh_from_db()
+    assert job.likes_count == 4
+    assert not cache.get_many([f'jobs:counters:likes_count:added:{job.id}'])
+
+
+@pytest.mark.django_db
+def test_rolled_back_reaction_is_not_buffered(job, hot_counters, django_capture_on_commit_callbacks):
+    users = make_users(3)
+    with django_capture_on_commit_callbacks(execute=True):
+        for user in users[:2]:
+            add_reaction(user, job.id, 'like')
+        with pytest.raises(RuntimeError), transaction.atomic():
+            add_reaction(users[2], job.id, 'like')
+            raise RuntimeError
+
+    job.refresh_from_db()
+    assert job.likes_count == 2
+    assert apply_pending_counts([job])[0].likes_count == 2
+
+
+@pytest.mark.django_db
+def test_flush_tolerates_evicted_buffer(job, hot_counters, monkeypatch):
+    def evicted(key, delta=1):
+        raise ValueError(f"Key '{key}' not found")
+
+    cache.set(f'jobs:counters:likes_count:added:{job.id}', 3, None)
+    monkeypatch.setattr(cache, 'decr', evicted)
+    assert flush_counters() == 1
+    job.refresh_from_db()
+    assert job.likes_count == 3
+
+
+@pytest.mark.django_db
+def test_reconcile_recomputes_counters(candidate, job):
+    other = Job.objects.create(title='Inna', recruiter=candidate, description='Opis', requirements='Wymagania')
+    Like.objects.create(user=candidate, job=job)
+    Job.objects.filter(pk=other.pk).update(likes_count=7, favorites_count=3)
+
+    assert reconcile_counters(batch_size=1) == 2
+    job.refresh_from_db()
+    other.refresh_from_db()
+    assert (job.likes_count, job.favorites_count) == (1, 0)
+    assert (other.likes_count, other.favorites_count) == (0, 0)
+
+    Job.objects.filter(pk=job.pk).update(likes_count=5)
+    call_command('reconcile_job_counters')
+    job.refresh_from_db()
+    assert job.likes_count == 1
+
+
+@pytest.fixture
+def client(candidate):
+    client = Client()
+    client.login(email='candidate@example.com', password='password')
+    return client
+
+
+@pytest.mark.django_db
+def test_toggle_endpoint_returns_state_and_count(client, job):
+    url = reverse('jobs:toggle_like', args=[job.id])
+    assert client.post(url).json() == {'job_id': job.id, 'kind': 'like', 'active': True, 'count': 1}
+    assert client.post(url).json() == {'job_id': job.id, 'kind': 'like', 'active': False, 'count': 0}
+    assert client.get(url).status_code == 405
+
+    # Jawny stan jest idempotentny: powtórzone żądanie (podwójne kliknięcie) nie odwraca zmiany
+    url = reverse('jobs:toggle_favorite', args=[job.id])
+    assert client.post(url, {'active': '1'}).json()['count'] == 1
+    assert client.post(url, {'active': '1'}).json() == {'job_id': job.id, 'kind': 'favorite', 'active': True,
+                                                        'count': 1}
+    job.refresh_from_db()
+    assert (job.likes_count, job.favorites_count) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_toggle_endpoint_for_missing_job(client, job):
+    response = client.post(reverse('jobs:toggle_like', args=[job.id + 100]))
+    assert response.status_code == 404
+    assert not Like.objects.exists()
+
+
+@pytest.mark.django_db
+def test_repeated_insert_does_not_raise_or_double_count(candidate, job):
+    assert set_reactions(candidate, [job.id], 'like', active=True) == [job.id]
+    # Drugie wstawienie jest pomijane przez ON CONFLICT DO NOTHING zamiast zgłaszać IntegrityError
+    assert set_reactions(candidate, [job.id], 'like', active=True) == []
+    assert set_reactions(candidate, [job.id], 'like', active=False) == [job.id]
+    assert set_reactions(candidate, [job.id], 'like', active=False) == []
+    job.refresh_from_db()
+    assert job.likes_count == 0
+
+
+@pytest.mark.django_db
+def test_batch_reactions(client, candidate, job, django_capture_on_commit_callbacks):
+    other = Job.objects.create(title='Inna oferta', recruiter=candidate, description='Opis',
+                               requirements='Wymagania')
+    assert user_reaction_ids(candidate, 'like') == frozenset()
+    url = reverse('jobs:batch_reactions')
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(url, {'kind': 'like', 'job_id': [job.id, other.id, other.id + 100], 'active': '1'})
+    assert response.json() == {'kind': 'like', 'jobs': [
+        {'job_id': job.id, 'active': True, 'count': 1},
+        {'job_id': other.id, 'active': True, 'count': 1},
+    ]}
+    assert user_reaction_ids(candidate, 'like') == {job.id, other.id}
+
+    response = client.post(url, {'kind': 'like', 'job_id': [other.id], 'active': '0'})
+    assert response.json()['jobs'] == [{'job_id': other.id, 'active': False, 'count': 0}]
+    assert client.post(url, {'kind': 'unknown', 'job_id': [job.id]}).status_code == 400
+    assert client.post(url, {'kind': 'like', 'job_id': ['abc']}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_user_reaction_set_is_reloaded_after_commit(candidate, job, django_capture_on_commit_callbacks):
+    assert user_reaction_ids(candidate, 'like') == frozenset()
+    with pytest.raises(RuntimeError), transaction.atomic():
+        add_reaction(candidate, job.id, 'like')
+        raise RuntimeError
+    assert user_reaction_ids(candidate, 'like') == frozenset()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        add_reaction(candidate, job.id, 'like')
+    assert user_reaction_ids(candidate, 'like') == {job.id}
+
+
+@pytest.mark.django_db
+def test_batch_reactions_update_counters_with_one_query(client, candidate, job, settings):
+    settings.JOB_REACTION_BATCH_LIMIT = 3
+    jobs = [job] + [Job.objects.create(title=f'Oferta {number}', recruiter=candidate, description='Opis',
+                                       requirements='Wymagania') for number in range(2)]
+    url = reverse('jobs:batch_reactions')
+    with CaptureQueriesContext(connection) as queries:
+        client.post(url, {'kind': 'like', 'job_id': [other.id for other in jobs], 'active': '1'})
+    assert len([query for query in queries if query['sql'].startswith('UPDATE "jobs_job"')]) == 1
+    assert list(Job.objects.order_by('pk').values_list('likes_count', flat=True)) == [1, 1, 1]
+
+    response = client.post(url, {'kind': 'like', 'job_id': [job.id] * 4, 'active': '0'})
+    assert response.status_code == 400
+    assert Like.objects.count() == 3
@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from jobs.models import Job
+from jobs.search import search_jobs, tokenize_query
+
+User = get_user_model()
+
+
+@pytest.fixture
+def recruiter():
+    user = User.objects.create_user(email='recruiter@example.com', password='password', role='recruiter')
+    user.is_active = True
+    user.save()
+    return user
+
+
+@pytest.fixture
+def jobs(recruiter):
+    return [
+        Job.objects.create(title='Python Developer', recruiter=recruiter, description='Backend work.',
+                           requirements='Django', salary=Decimal('9000.00')),
+        Job.objects.create(title='Magazynier', recruiter=recruiter, description='Praca z Python raportami.',
+                           requirements='Wózek widłowy', salary=Decimal('4500.00')),
+        Job.objects.create(title='Spawacz', recruiter=recruiter, description='Spawanie MIG/MAG.',
+                           requirements='Uprawnienia', salary=Decimal('6000.00'), status='closed'),
+    ]
+
+
+def test_tokenize_query():
+    assert tokenize_query('  Python, python & DJANGO!  ') == ['python', 'django']
+    assert tokenize_query('') == []
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first(jobs):
+    results = list(search_jobs(Job.objects.all(), 'python'))
+    assert results == [jobs[0], jobs[1]]
+
+
+@pytest.mark.django_db
+def test_search_matches_prefixes_and_all_terms(jobs):
+    assert list(search_jobs(Job.objects.all(), 'maga')) == [jobs[1]]
+    assert list(search_jobs(Job.objects.all(), 'python django')) == [jobs[0]]
+
+
+@pytest.mark.django_db
+def test_search_index_follows_updates_and_deletes(jobs):
+    job = jobs[2]
+    job.title = 'Operator CNC'
+    job.save()
+    assert list(search_jobs(Job.objects.all(), 'cnc')) == [job]
+    assert list(search_jobs(Job.objects.all(), 'spawacz')) == []
+
+    job.delete()
+    assert list(search_jobs(Job.objects.all(), 'cnc')) == []
+
+
+@pytest.mark.django_db
+def test_search_index_covers_bulk_create(recruiter):
+    Job.objects.bulk_create([
+        Job(title=f'Kierowca {i}', recruiter=recruiter, description='Trasy krajowe', requirements='Prawo jazdy C')
+        for i in range(3)
+    ])
+    assert search_jobs(Job.objects.all(), 'kierowca').count() == 3
+
+
+@pytest.mark.django_db
+def test_job_list_views_use_search_index(client, recruiter, jobs):
+    response = client.get(reverse('jobs:public_job_list'), {'q': 'python'})
+    assert [job.id for job in response.context['jobs']] == [jobs[0].id, jobs[1].id]
+
+    client.login(email='recruiter@example.com', password='password')
+    response = client.get(reverse('jobs:job_list'), {'q': 'magazynier', 'json': 'true'})
+    assert [job['id'] for job in response.json()['jobs']] == [jobs[1].id]
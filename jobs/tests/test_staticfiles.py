@@ -0,0 +1,58 @@
+import gzip
+
+import pytest
+from django.core.management import call_command
+from django.templatetags.static import static
+from django.urls import reverse
+from kirismor.staticfiles import minify_css
+
+
+def test_minify_css_keeps_strings_and_selectors():
+    css = '''
+    /* komentarz */
+    a :hover , .b > .c {
+        content: "x  /* y */" ;
+        margin : 0 auto;
+    }
+    @media (min-width: 600px) { .d { color: red; } }
+    '''
+    assert minify_css(css) == ('a :hover,.b>.c{content:"x  /* y */";margin :0 auto}'
+                               '@media (min-width:600px){.d{color:red}}')
+
+
+def test_static_urls_are_not_hashed_before_build():
+    assert static('css/style.css') == '/static/css/style.css'
+
+
+@pytest.fixture
+def built(settings, tmp_path):
+    settings.STATIC_ROOT = str(tmp_path)
+    call_command('build_static', verbosity=0)
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_build_and_serve_precompressed_assets(client, built, settings):
+    bundle_url = static('css/style.min.css')
+    assert bundle_url.startswith('/static/css/style.min.') and bundle_url != '/static/css/style.min.css'
+
+    plain = client.get(bundle_url)
+    content = b''.join(plain.streaming_content)
+    assert plain.status_code == 200 and 'Content-Encoding' not in plain
+    assert plain['Content-Type'].startswith('text/css') and 'Accept-Encoding' in plain['Vary']
+    assert plain['Cache-Control'] == f'public, max-age={settings.STATIC_HASHED_MAX_AGE}, immutable'
+    assert b'/*' not in content and b'\n' not in content
+
+    compressed = client.get(bundle_url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+    assert compressed['Content-Encoding'] == 'gzip' and compressed['Content-Type'].startswith('text/css')
+    assert gzip.decompress(b''.join(compressed.streaming_content)) == content
+    refused = client.get(bundle_url, HTTP_ACCEPT_ENCODING='gzip;q=0')
+    assert 'Content-Encoding' not in refused
+
+    unhashed = client.get('/static/css/style.css')
+    assert unhashed['Cache-Control'] == f'public, max-age={settings.STATIC_CACHE_MAX_AGE}'
+
+    html = client.get(reverse('about')).content.decode()
+    assert f'<link rel="stylesheet" href="{bundle_url}">' in html
+    assert static('images/logo-64.png') in html and static('images/background-1380.webp') in html
+    assert '<source type="image/webp" srcset="' + static('images/logo-64.webp') + ' 64w' in html
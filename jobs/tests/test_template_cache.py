@@ -0,0 +1,59 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.template import engines
+from django.urls import reverse
+from kirismor.template_cache import FRAGMENT_CACHE_ALIAS, template_names
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings):
+    caches[settings.PAGE_CACHE_ALIAS].clear()
+    caches[FRAGMENT_CACHE_ALIAS].clear()
+    yield
+    caches[FRAGMENT_CACHE_ALIAS].clear()
+
+
+def login(client, role):
+    user = User.objects.create_user(email=f'{role}@example.com', password='password', role=role)
+    user.is_active = True
+    user.save()
+    client.force_login(user)
+    session = client.session
+    session['role'] = role
+    session.save()
+
+
+def test_warm_templates_fills_cached_loader():
+    loader = engines['django'].engine.template_loaders[0]
+    assert loader.__class__.__module__ == 'django.template.loaders.cached'
+    loader.reset()
+    assert 'home/base.html' in template_names()
+
+    call_command('warm_templates', verbosity=0)
+    assert {'home/base.html', 'jobs/job_list.html'} <= set(loader.get_template_cache)
+
+
+@pytest.mark.django_db
+def test_navbar_fragment_is_cached_per_role(client):
+    anonymous = client.get(reverse('about')).content.decode()
+    assert reverse('accounts:login') in anonymous and reverse('jobs:create_job') not in anonymous
+
+    login(client, 'recruiter')
+    recruiter = client.get(reverse('about')).content.decode()
+    assert reverse('jobs:create_job') in recruiter and reverse('accounts:login') not in recruiter
+
+    # Zmiana roli w sesji daje inny fragment, a nie menu zapamiętane dla rekrutera
+    session = client.session
+    session['role'] = 'client'
+    session.save()
+    menu = client.get(reverse('about')).content.decode()
+    assert reverse('requests:client_job_request_create') in menu and reverse('jobs:create_job') not in menu
+
+    fragments = caches[FRAGMENT_CACHE_ALIAS]
+    assert len(fragments._cache) == 4
+    call_command('warm_templates', verbosity=0)
+    assert not fragments._cache
@@ -0,0 +1,82 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import Http404
+from django.urls import reverse
+from jobs.models import Job, TempGuestFeedback, GuestFeedback
+from kirismor.tokens import get_object_for_token, make_token
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(email='user@example.com', password='password', role='candidate')
+
+
+@pytest.fixture
+def temp_feedback(user):
+    job = Job.objects.create(title='Oferta', recruiter=user, description='Opis', requirements='Wymagania')
+    return TempGuestFeedback.objects.create(job=job, email='guest@example.com', message='Opinia')
+
+
+@pytest.mark.django_db
+def test_signed_token_is_resolved_by_primary_key(user, django_assert_num_queries):
+    token = make_token('verify-email', user.pk)
+    with django_assert_num_queries(1) as context:
+        assert get_object_for_token(User, 'verify-email', token) == user
+    assert context.captured_queries[0]['sql'].endswith(f'WHERE "accounts_user"."id" = {user.pk} LIMIT 21')
+
+
+@pytest.mark.django_db
+def test_token_is_bound_to_purpose_and_expires(user, settings):
+    token = make_token('verify-email', user.pk)
+    with pytest.raises(Http404):
+        get_object_for_token(User, 'verify-feedback', token)
+    with pytest.raises(Http404):
+        get_object_for_token(User, 'verify-email', token[:-1] + ('A' if token[-1] != 'A' else 'B'))
+
+    settings.VERIFICATION_TOKEN_MAX_AGE = -1
+    with pytest.raises(Http404):
+        get_object_for_token(User, 'verify-email', token, legacy_field='verification_token')
+
+
+@pytest.mark.django_db
+def test_legacy_token_still_works(user, settings):
+    settings.LEGACY_VERIFICATION_TOKENS_UNTIL = '2999-12-31'
+    user.verification_token = 'a' * 64
+    user.save()
+    assert get_object_for_token(User, 'verify-email', 'a' * 64, legacy_field='verification_token') == user
+    with pytest.raises(Http404):
+        get_object_for_token(User, 'verify-email', 'a' * 64)
+
+    settings.LEGACY_VERIFICATION_TOKENS_UNTIL = '2000-01-01'
+    with pytest.raises(Http404):
+        get_object_for_token(User, 'verify-email', 'a' * 64, legacy_field='verification_token')
+
+
+@pytest.mark.django_db
+def test_malformed_token_does_not_query_legacy_field(client, user, settings, django_assert_num_queries):
+    settings.LEGACY_VERIFICATION_TOKENS_UNTIL = '2999-12-31'
+    for token in ('abc', 'A' * 64, 'a' * 63, 'a' * 64 + 'x'):
+        with django_assert_num_queries(0), pytest.raises(Http404):
+            get_object_for_token(User, 'verify-email', token, legacy_field='verification_token')
+    assert client.get(reverse('accounts:verify_email', args=['garbage'])).status_code == 404
+
+
+@pytest.mark.django_db
+def test_verify_views_accept_signed_tokens(client, user, temp_feedback):
+    response = client.get(reverse('accounts:verify_email', args=[user.generate_verification_token()]))
+    assert response.url == reverse('accounts:verified')
+    user.refresh_from_db()
+    assert user.is_verified and user.is_active
+
+    url = reverse('jobs:guest_feedback_verify', args=[temp_feedback.generate_verification_token()])
+    assert client.get(url).status_code == 302
+    assert GuestFeedback.objects.filter(email='guest@example.com', is_verified=True).exists()
+    # Token jest jednorazowy: tymczasowa opinia została usunięta
+    assert client.get(url).status_code == 404
+
+
+def test_token_payload_is_the_primary_key():
+    assert signing.loads(make_token('verify-email', 15), salt='kirismor.tokens.verify-email') == 15
@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 from django.urls import reverse
 from django.test import Client
@@ -137,15 +138,17 @@ def test_favorite_job(client, candidate, recruiter, job):
 
 
 @pytest.mark.django_db
-def test_verify_feedback_view(client, recruiter, job):
+def test_verify_feedback_view(client, recruiter, job, settings):
+    settings.LEGACY_VERIFICATION_TOKENS_UNTIL = '2999-12-31'
+    token = hashlib.sha256(b'guest@example.com').hexdigest()
     temp_feedback = TempGuestFeedback.objects.create(
         job=job,
         email='guest@example.com',
         message='This is my feedback',
         phone_number='1234567890',
-        verification_token='testtoken'
+        verification_token=token
     )
-    response = client.get(reverse('jobs:guest_feedback_verify', args=['testtoken']))
+    response = client.get(reverse('jobs:guest_feedback_verify', args=[token]))
     assert response.status_code == 302
     assert GuestFeedback.objects.filter(job=job, email='guest@example.com', is_verified=True).exists()
 
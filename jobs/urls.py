@@ -43,8 +43,15 @@ urlpatterns = [
          name='update_application_status'),
     path('like/<int:job_id>/', views.like_job, name='like_job'),
     path('favorite/<int:job_id>/', views.favorite_job, name='favorite_job'),
+    path('like/<int:job_id>/toggle/', views.toggle_like, name='toggle_like'),
+    path('favorite/<int:job_id>/toggle/', views.toggle_favorite, name='toggle_favorite'),
+    path('reactions/batch/', views.batch_reactions, name='batch_reactions'),
     path('liked/', LikedJobsListView.as_view(), name='liked_jobs_list'),
     path('favorited/', FavoritedJobsListView.as_view(), name='favorited_jobs_list'),
+    path('saved-searches/', views.saved_search_list_view, name='saved_search_list'),
+    path('saved-searches/<int:search_id>/delete/', views.delete_saved_search_view, name='saved_search_delete'),
+    path('jobs/<int:job_id>/candidate_matches/', views.job_candidate_matches_view, name='job_candidate_matches'),
+    path('recommended/', views.recommended_jobs_view, name='recommended_jobs'),
     path('guest/feedback/<int:job_id>/', views.guest_feedback_view, name='guest_feedback'),
     path('guest/feedback/verify/<str:token>/', views.verify_feedback_view, name='guest_feedback_verify'),
     path('guest/feedback/verified/', views.guest_feedback_verified_view, name='guest_feedback_verified'),
@@ -1,17 +1,32 @@
 from django.conf.urls.static import static
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
+from django.core.paginator import PageNotAnInteger, EmptyPage
 from django.db.models import Q
 from django.http import HttpResponseForbidden, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse
-from django.utils.html import escape
+from django.conf import settings
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import require_POST
+from kirismor.pagination import (PaginationMixin, CountedPaginator, CursorPaginator, LIST_STYLE, CURSOR_PARAM,
+                                 attach_cursor_urls, count_json, cursor_json, generate_pagination_html,
+                                 is_cursor_request, page_window)
+from kirismor.page_cache import cache_anonymous_page
+from kirismor.db_router import replica_reads
+from kirismor.projection import Column, Projection, date_format, json_response, truncate
 from django.views.generic import ListView
-from .models import Job, Application, GuestFeedback, Like, Favorite, TempGuestFeedback
-from .forms import JobForm, ApplicationForm, GuestFeedbackForm
+from .models import Job, Application, GuestFeedback, Like, Favorite, TempGuestFeedback, SavedSearch
+from .forms import JobForm, ApplicationForm, GuestFeedbackForm, SavedSearchForm
 from django.contrib import messages
 from jobs.utils import send_verification_email
+from kirismor.tokens import get_object_for_token
+from jobs.search import search_jobs, MAX_QUERY_LENGTH
+from jobs.reactions import (add_reaction, apply_pending_counts, user_reaction_ids, set_reactions, toggle_reaction,
+                             reaction_counts, KINDS)
+from jobs.alerts import queue_job_alerts
+from jobs.matching import best_candidates, recommended_jobs
+from accounts.models import CandidateProfile, User
 from django.utils.translation import gettext as _
 
 """
@@ -23,8 +38,9 @@ Importy:
 2. from django.contrib.auth.mixins import LoginRequiredMixin
    - Importuje mixin `LoginRequiredMixin`, który zapewnia, że widoki oparte na klasach są dostępne tylko dla zalogowanych użytkowników.
 
-3. from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-   - Importuje klasy `Paginator`, `PageNotAnInteger`, `EmptyPage`, które są używane do paginacji wyników w widokach.
+3. from django.core.paginator import PageNotAnInteger, EmptyPage
+   - Importuje wyjątki `PageNotAnInteger` i `EmptyPage`, które są używane do obsługi nieprawidłowych numerów stron
+     w paginacji wyników.
 
 4. from django.db.models import Q
    - Importuje klasę `Q`, która umożliwia tworzenie złożonych zapytań bazodanowych z operatorem OR i NOT.
@@ -41,30 +57,84 @@ Importy:
 8. from django.urls import reverse
    - Importuje funkcję `reverse`, która jest używana do generowania URL na podstawie nazw wzorców.
 
-9. from django.utils.html import escape
-   - Importuje funkcję `escape`, która zabezpiecza tekst przed wstrzyknięciem złośliwego kodu HTML.
+9. from django.conf import settings
+   - Importuje ustawienia projektu (maksymalna liczba zapisanych wyszukiwań kandydata).
 
-10. from django.views.generic import ListView
+10. from django.utils.decorators import method_decorator
+    - Importuje funkcję `method_decorator`, która pozwala użyć dekoratora widoku funkcyjnego w widoku opartym na klasie.
+
+11. from django.views.decorators.http import require_POST
+    - Importuje dekorator `require_POST`, który ogranicza widok do żądań POST (zwraca 405 dla innych metod).
+
+12. from kirismor.pagination import PaginationMixin, CountedPaginator, CursorPaginator, LIST_STYLE, CURSOR_PARAM, ...
+    - Importuje wspólną implementację paginacji: mixin dla widoków list, paginator z licznikiem w pamięci
+      podręcznej, paginator kursorowy (keyset) oraz funkcje pomocnicze do budowy linków paginacji
+      (również w trybie kursorowym) i odpowiedzi JSON.
+
+13. from kirismor.page_cache import cache_anonymous_page
+    - Importuje dekorator `cache_anonymous_page`, który zapisuje w pamięci podręcznej strony wyświetlane anonimowym
+      użytkownikom.
+
+14. from kirismor.db_router import replica_reads
+    - Importuje dekorator `replica_reads`, który kieruje odczyty widoku do repliki bazy danych.
+
+15. from kirismor.projection import Column, Projection, date_format, json_response, truncate
+    - Importuje deklaratywne projekcje kolumn dla odpowiedzi JSON list (zapytania .values() zamiast obiektów
+      modeli), przekształcenia wartości kolumn oraz funkcję zwracającą odpowiedź JSON zakodowaną jednokrotnie.
+
+16. from django.views.generic import ListView
     - Importuje `ListView`, klasę widoku generycznego służącą do wyświetlania listy obiektów.
 
-11. from .models import Job, Application, GuestFeedback, Like, Favorite, TempGuestFeedback
-    - Importuje modele `Job`, `Application`, `GuestFeedback`, `Like`, `Favorite`, `TempGuestFeedback` z bieżącego modułu models.
+17. from .models import Job, Application, GuestFeedback, Like, Favorite, TempGuestFeedback, SavedSearch
+    - Importuje modele `Job`, `Application`, `GuestFeedback`, `Like`, `Favorite`, `TempGuestFeedback`, `SavedSearch` z bieżącego modułu models.
 
-12. from .forms import JobForm, ApplicationForm, GuestFeedbackForm
-    - Importuje formularze `JobForm`, `ApplicationForm`, `GuestFeedbackForm` z bieżącego modułu forms.
+18. from .forms import JobForm, ApplicationForm, GuestFeedbackForm, SavedSearchForm
+    - Importuje formularze `JobForm`, `ApplicationForm`, `GuestFeedbackForm`, `SavedSearchForm` z bieżącego modułu forms.
 
-13. from django.contrib import messages
+19. from django.contrib import messages
     - Importuje moduł `messages`, który umożliwia dodawanie komunikatów dla użytkowników.
 
-14. from jobs.utils import send_verification_email
+20. from jobs.utils import send_verification_email
     - Importuje funkcję `send_verification_email` z modułu `jobs.utils`, która jest używana do wysyłania e-maili weryfikacyjnych.
 
-15. from django.utils.translation import gettext as _
+21. from kirismor.tokens import get_object_for_token
+    - Importuje funkcję `get_object_for_token`, która sprawdza podpisany token weryfikacyjny i pobiera tymczasową
+      opinię po kluczu głównym (z obsługą tokenów zapisanych w bazie danych przed wprowadzeniem podpisów).
+
+22. from jobs.search import search_jobs, MAX_QUERY_LENGTH
+    - Importuje funkcję `search_jobs`, która filtruje oferty pracy z użyciem indeksu pełnotekstowego, oraz
+      maksymalną długość zapytania wyszukiwania.
+
+23. from jobs.reactions import add_reaction, apply_pending_counts, user_reaction_ids, set_reactions, ...
+    - Importuje funkcje obsługujące polubienia i ulubione oferty: zapis i przełączanie reakcji (również dla wielu
+      ofert naraz) wraz z licznikiem oferty, bieżące liczniki, zbuforowane zmiany liczników oraz zbiory ofert,
+      na które zareagował użytkownik (z pamięci podręcznej).
+
+24. from jobs.alerts import queue_job_alerts
+    - Importuje funkcję `queue_job_alerts`, która dodaje utworzoną lub ponownie otwartą ofertę pracy do kolejki
+      dopasowania do zapisanych wyszukiwań kandydatów (powiadomienia wysyła komenda send_job_alerts).
+
+25. from jobs.matching import best_candidates, recommended_jobs
+    - Importuje funkcje dopasowania kandydatów do ofert pracy (podobieństwo wektorów TF-IDF umiejętności
+      kandydata oraz tytułu i wymagań oferty): najlepsi kandydaci dla oferty i polecane oferty dla kandydata.
+
+26. from accounts.models import CandidateProfile, User
+    - Importuje model `CandidateProfile`, używany do wyświetlenia najlepiej dopasowanych kandydatów, oraz modele,
+      których zmiany unieważniają liczbę wyników wyszukiwania aplikacji rekrutera (nazwiska i e-maile kandydatów).
+
+27. from django.utils.translation import gettext as _
     - Importuje funkcję `gettext` jako `_`, która jest używana do tłumaczenia tekstów w aplikacji.
 """
 
+# Długie kolumny tekstowe pomijane na listach ofert (listy wyświetlają skrót opisu Job.excerpt)
+JOB_LIST_DEFERRED = ('description', 'requirements')
 
-class JobListView(LoginRequiredMixin, ListView):
+# Długie kolumny tekstowe pomijane na listach aplikacji rekrutera (wyświetlane tylko na stronie szczegółów aplikacji)
+APPLICATION_LIST_DEFERRED = ('cover_letter', 'job__description', 'job__requirements',
+                             'applicant__candidate_profile__bio', 'applicant__candidate_profile__skills')
+
+
+class JobListView(LoginRequiredMixin, PaginationMixin, ListView):
     """
     Widok listy ofert pracy dla zalogowanych użytkowników.
 
@@ -73,52 +143,54 @@ class JobListView(LoginRequiredMixin, ListView):
         - template_name: Nazwa szablonu używanego do renderowania widoku.
         - context_object_name: Nazwa obiektu kontekstu, który będzie dostępny w szablonie.
         - paginate_by: Liczba elementów na stronę.
+        - cursor_ordering: Klucz sortowania w trybie paginacji kursorowej (?cursor=).
+        - numbered_only_params: Wyszukiwanie (?q=) jest sortowane według trafności, więc używa paginacji numerowanej.
+        - count_key: Nazwa licznika wierszy w pamięci podręcznej (kirismor.counting).
+        - projection: Kolumny odpowiedzi JSON (?json=true), pobierane z bazy danych przez .values().
     """
     model = Job
     template_name = 'jobs/job_list.html'
     context_object_name = 'jobs'
     paginate_by = 10
+    cursor_ordering = ('-created_at', '-id')
+    numbered_only_params = ('q',)
+    count_key = 'job_list'
+    pagination_style = LIST_STYLE
+    pagination_params = ('q',)
+    projection = Projection(Job, id='id', title='title', description=Column('excerpt', transform=truncate(100)),
+                            salary='salary', likes_count='likes_count', favorites_count='favorites_count')
 
     def get_queryset(self):
         """
         Pobiera zestaw danych do wyświetlenia w widoku.
 
         Filtruje oferty pracy na podstawie statusu (tylko otwarte oferty) i opcjonalnie na podstawie zapytania
-        wyszukiwania przekazanego w parametrze 'q'.
+        wyszukiwania przekazanego w parametrze 'q'. Wyszukiwanie korzysta z indeksu pełnotekstowego
+        (jobs.search), a wyniki są sortowane według trafności.
 
         Zwraca:
             QuerySet: Posortowany zestaw danych ofert pracy.
         """
-        search_query = escape(self.request.GET.get('q', '')[:100])
-        queryset = Job.objects.filter(status=Job.JobStatus.OPEN)
-        if search_query:
-            queryset = queryset.filter(
-                Q(salary__icontains=search_query) |
-                Q(title__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(requirements__icontains=search_query)
-            )
-        return queryset.order_by('-created_at')
+        search_query = self.request.GET.get('q', '')[:MAX_QUERY_LENGTH]
+        queryset = Job.objects.filter(status=Job.JobStatus.OPEN).defer(*JOB_LIST_DEFERRED)
+        return search_jobs(queryset, search_query)
 
     def get_context_data(self, **kwargs):
         """
         Przygotowuje dane kontekstu dla szablonu.
 
         Dodaje do kontekstu informacje o polubionych i ulubionych ofertach pracy użytkownika oraz zakres paginacji.
+        Liczniki polubień i ulubionych są kolumnami modelu Job, więc nie wymagają dodatkowych zapytań.
 
         Zwraca:
             dict: Dane kontekstu dla szablonu.
         """
         context = super().get_context_data(**kwargs)
-        context['liked_jobs'] = Like.objects.filter(user=self.request.user).values_list('job_id', flat=True)
-        context['favorited_jobs'] = Favorite.objects.filter(user=self.request.user).values_list('job_id', flat=True)
-
-        page_obj = context['page_obj']
-        paginator = context['paginator']
-        range_size = 2
-        start_page = max(1, page_obj.number - range_size)
-        end_page = min(paginator.num_pages, page_obj.number + range_size)
-        context['page_range'] = range(start_page, end_page + 1)
+        # Zbiory polubionych i ulubionych ofert użytkownika pochodzą z pamięci podręcznej (jobs.reactions)
+        context['liked_jobs'] = user_reaction_ids(self.request.user, 'like')
+        context['favorited_jobs'] = user_reaction_ids(self.request.user, 'favorite')
+        apply_pending_counts(context['jobs'])
+        context['page_range'] = page_window(context['page_obj'])
         return context
 
     def render_to_response(self, context, **response_kwargs):
@@ -126,48 +198,26 @@ class JobListView(LoginRequiredMixin, ListView):
         Renderuje odpowiedź HTTP.
 
         Jeśli w parametrze zapytania 'json' przekazano wartość 'true', zwraca dane w formacie JSON, w przeciwnym razie
-        renderuje szablon HTML.
+        renderuje szablon HTML. W trybie kursorowym odpowiedź JSON zawiera kursory następnej i poprzedniej strony.
 
         Zwraca:
             HttpResponse: Odpowiedź HTTP.
         """
-        if self.request.GET.get('json', '').lower() == 'true':
-            jobs = [
-                {
-                    'id': job.id,
-                    'title': job.title,
-                    'description': job.description[:100],
-                    'salary': job.salary
-                }
-                for job in context['jobs']
-            ]
+        if self.is_json_request():
+            jobs = self.projection.rows(context['jobs'])
+            for job in jobs:
+                job['liked'] = job['id'] in context['liked_jobs']
+                job['favorited'] = job['id'] in context['favorited_jobs']
             page_obj = context['page_obj']
             pagination_html = self.generate_pagination_html(page_obj, context['page_range'])
-            return JsonResponse({'jobs': jobs, 'pagination': pagination_html})
+            return json_response({'jobs': jobs, 'pagination': pagination_html, **cursor_json(page_obj),
+                                  **count_json(page_obj)})
         return super().render_to_response(context, **response_kwargs)
 
-    def generate_pagination_html(self, page_obj, page_range):
-        """
-        Generuje HTML dla paginacji.
-
-        Zwraca:
-            str: HTML dla paginacji.
-        """
-        pagination_html = ''
-        query = escape(self.request.GET.get('q', ''))
-        if page_obj.has_previous():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={page_obj.previous_page_number()}&q={query}">Previous</a></li>'
-        for num in page_range:
-            if num == page_obj.number:
-                pagination_html += f'<li class="page-item active"><span class="page-link">{num}</span></li>'
-            else:
-                pagination_html += f'<li class="page-item"><a class="page-link" href="?page={num}&q={query}">{num}</a></li>'
-        if page_obj.has_next():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={page_obj.next_page_number()}&q={query}">Next</a></li>'
-        return pagination_html
-
 
-class PublicJobListView(ListView):
+@replica_reads
+@method_decorator(cache_anonymous_page('jobs'), name='dispatch')
+class PublicJobListView(PaginationMixin, ListView):
     """
     Widok publicznej listy ofert pracy.
 
@@ -176,32 +226,37 @@ class PublicJobListView(ListView):
         - template_name: Nazwa szablonu używanego do renderowania widoku.
         - context_object_name: Nazwa obiektu kontekstu, który będzie dostępny w szablonie.
         - paginate_by: Liczba elementów na stronę.
+        - cursor_ordering: Klucz sortowania w trybie paginacji kursorowej (?cursor=).
+        - numbered_only_params: Wyszukiwanie (?q=) jest sortowane według trafności, więc używa paginacji numerowanej.
+        - count_key: Nazwa licznika wierszy w pamięci podręcznej (kirismor.counting).
+        - projection: Kolumny odpowiedzi JSON (?json=true), pobierane z bazy danych przez .values().
     """
     model = Job
     template_name = 'home/public_job_list.html'
     context_object_name = 'jobs'
     paginate_by = 7
+    cursor_ordering = ('-created_at', '-id')
+    numbered_only_params = ('q',)
+    count_key = 'public_job_list'
+    pagination_style = LIST_STYLE
+    pagination_params = ('q',)
+    projection = Projection(Job, id='id', title='title', description=Column('excerpt', transform=truncate(100)),
+                            salary='salary')
 
     def get_queryset(self):
         """
         Pobiera zestaw danych do wyświetlenia w widoku.
 
         Filtruje oferty pracy na podstawie statusu (tylko otwarte oferty) i opcjonalnie na podstawie zapytania
-        wyszukiwania przekazanego w parametrze 'q'.
+        wyszukiwania przekazanego w parametrze 'q'. Wyszukiwanie korzysta z indeksu pełnotekstowego
+        (jobs.search), a wyniki są sortowane według trafności.
 
         Zwraca:
             QuerySet: Posortowany zestaw danych ofert pracy.
         """
-        search_query = escape(self.request.GET.get('q', '')[:100])
-        queryset = Job.objects.filter(status=Job.JobStatus.OPEN)
-        if search_query:
-            queryset = queryset.filter(
-                Q(salary__icontains=search_query) |
-                Q(title__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(requirements__icontains=search_query)
-            )
-        return queryset.order_by('-created_at')
+        search_query = self.request.GET.get('q', '')[:MAX_QUERY_LENGTH]
+        queryset = Job.objects.filter(status=Job.JobStatus.OPEN).defer(*JOB_LIST_DEFERRED)
+        return search_jobs(queryset, search_query)
 
     def get_context_data(self, **kwargs):
         """
@@ -213,15 +268,7 @@ class PublicJobListView(ListView):
             dict: Dane kontekstu dla szablonu.
         """
         context = super().get_context_data(**kwargs)
-        page_obj = context['page_obj']
-        paginator = context['paginator']
-
-        # Рассчитаем диапазон страниц вокруг текущей страницы
-        range_size = 2
-        start_page = max(1, page_obj.number - range_size)
-        end_page = min(paginator.num_pages, page_obj.number + range_size)
-
-        context['page_range'] = range(start_page, end_page + 1)
+        context['page_range'] = page_window(context['page_obj'])
         return context
 
     def render_to_response(self, context, **response_kwargs):
@@ -229,46 +276,18 @@ class PublicJobListView(ListView):
         Renderuje odpowiedź HTTP.
 
         Jeśli w parametrze zapytania 'json' przekazano wartość 'true', zwraca dane w formacie JSON, w przeciwnym razie
-        renderuje szablon HTML.
+        renderuje szablon HTML. W trybie kursorowym odpowiedź JSON zawiera kursory następnej i poprzedniej strony.
 
         Zwraca:
             HttpResponse: Odpowiedź HTTP.
         """
-        if self.request.GET.get('json', '').lower() == 'true':
-            jobs = [
-                {
-                    'id': job.id,
-                    'title': job.title,
-                    'description': job.description[:100],
-                    'salary': job.salary
-                }
-                for job in context['jobs']
-            ]
+        if self.is_json_request():
             page_obj = context['page_obj']
             pagination_html = self.generate_pagination_html(page_obj, context['page_range'])
-            return JsonResponse({'jobs': jobs, 'pagination': pagination_html})
+            return json_response({'jobs': self.projection.rows(context['jobs']), 'pagination': pagination_html,
+                                  **cursor_json(page_obj), **count_json(page_obj)})
         return super().render_to_response(context, **response_kwargs)
 
-    def generate_pagination_html(self, page_obj, page_range):
-        """
-        Generuje HTML dla paginacji.
-
-        Zwraca:
-            str: HTML dla paginacji.
-        """
-        pagination_html = ''
-        query = escape(self.request.GET.get('q', ''))
-        if page_obj.has_previous():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={page_obj.previous_page_number()}&q={query}">Previous</a></li>'
-        for num in page_range:
-            if num == page_obj.number:
-                pagination_html += f'<li class="page-item active"><span class="page-link">{num}</span></li>'
-            else:
-                pagination_html += f'<li class="page-item"><a class="page-link" href="?page={num}&q={query}">{num}</a></li>'
-        if page_obj.has_next():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={page_obj.next_page_number()}&q={query}">Next</a></li>'
-        return pagination_html
-
 
 @login_required
 def common_create_job_view(request):
@@ -277,6 +296,7 @@ def common_create_job_view(request):
 
     - Jeśli metoda żądania to POST, przetwarza dane formularza.
     - Jeśli formularz jest poprawny, zapisuje nową ofertę pracy z przypisaniem zalogowanego użytkownika jako rekrutera.
+    - Otwartą ofertę dodaje do kolejki dopasowania do zapisanych wyszukiwań kandydatów (jobs.alerts).
     - Po zapisaniu nowej oferty pracy przekierowuje użytkownika na stronę szczegółów oferty pracy.
     - Jeśli metoda żądania to GET, wyświetla pusty formularz do tworzenia nowej oferty pracy.
 
@@ -292,6 +312,7 @@ def common_create_job_view(request):
             job = form.save(commit=False)  # Tworzy obiekt Job, ale nie zapisuje go jeszcze w bazie danych
             job.recruiter = request.user  # Przypisuje zalogowanego użytkownika jako rekrutera
             job.save()  # Zapisuje obiekt Job w bazie danych
+            queue_job_alerts(job)  # Powiadomienia dla kandydatów z pasującymi zapisanymi wyszukiwaniami
             return redirect('jobs:job_detail', job_id=job.pk)  # Przekierowuje na stronę szczegółów oferty pracy
     else:
         form = JobForm()  # Tworzy pusty formularz
@@ -347,12 +368,12 @@ def application_list_view(request):
             applicant=request.user,
             job__title__icontains=search_query,
             job__status=Job.JobStatus.OPEN  # Filtruje tylko otwarte oferty pracy
-        ).select_related('job')
+        ).select_related('job').defer('job__description', 'job__requirements')
     else:
         applications = Application.objects.filter(
             applicant=request.user,
             job__status=Job.JobStatus.OPEN  # Filtruje tylko otwarte oferty pracy
-        ).select_related('job')
+        ).select_related('job').defer('job__description', 'job__requirements')
 
     context = {
         'applications': applications,
@@ -398,6 +419,7 @@ def create_application_view(request, job_id):
                   {'form': form, 'job': job})  # Renderuje stronę HTML z formularzem
 
 
+@cache_anonymous_page('job:{job_id}')
 def public_job_detail_view(request, job_id):
     """
     Widok szczegółów publicznej oferty pracy.
@@ -473,7 +495,8 @@ def verify_feedback_view(request, token):
     """
     Widok do weryfikacji opinii gości na podstawie tokenu weryfikacyjnego.
 
-    - Pobiera tymczasową opinię gościa na podstawie tokenu weryfikacyjnego.
+    - Sprawdza podpis i ważność tokenu weryfikacyjnego i pobiera tymczasową opinię gościa po kluczu głównym
+      (tokeny sprzed wprowadzenia podpisów są wyszukiwane w polu verification_token).
     - Tworzy nową opinię gościa jako zweryfikowaną.
     - Usuwa tymczasową opinię gościa.
 
@@ -484,7 +507,9 @@ def verify_feedback_view(request, token):
     Returns:
         HttpResponse: Przekierowanie na stronę z potwierdzeniem weryfikacji opinii.
     """
-    temp_feedback = get_object_or_404(TempGuestFeedback, verification_token=token)
+    temp_feedback = get_object_for_token(TempGuestFeedback.objects.select_related('job'),
+                                         TempGuestFeedback.VERIFICATION_TOKEN_PURPOSE, token,
+                                         legacy_field='verification_token')
     feedback = GuestFeedback(
         job=temp_feedback.job,
         email=temp_feedback.email,
@@ -555,7 +580,7 @@ def guest_feedback_applications_view(request):
         return HttpResponseForbidden("Access Denied")  # Sprawdza, czy użytkownik jest rekruterem
 
     feedbacks = GuestFeedback.objects.filter(
-        job__recruiter=request.user)  # Pobiera opinie gości dla ofert pracy rekrutera
+        job__recruiter=request.user).select_related('job')  # Pobiera opinie gości dla ofert pracy rekrutera
 
     search_query = request.GET.get('q', '')  # Pobiera zapytanie wyszukiwania z parametrów URL
     if search_query:
@@ -569,13 +594,39 @@ def guest_feedback_applications_view(request):
                   context)  # Renderuje stronę HTML z listą opinii gości
 
 
+def applicant_name(first_name, last_name, email):
+    """
+    Zwraca imię i nazwisko aplikującego lub jego email, jeśli nie ma profilu kandydata
+    (jak Application.get_applicant_full_name).
+    """
+    if first_name is None:
+        return email
+    return f'{first_name} {last_name}'
+
+
+# Modele, których zmiany unieważniają zapamiętaną liczbę wyników wyszukiwania aplikacji rekrutera: wyszukiwanie
+# obejmuje tytuł oferty oraz imię, nazwisko i e-mail kandydata (kirismor.counting)
+APPLICATION_SEARCH_COUNT_MODELS = (Application, Job, CandidateProfile, User)
+
+# Kolumny odpowiedzi JSON listy aplikacji rekrutera
+APPLICATION_PROJECTION = Projection(
+    Application,
+    id='id',
+    job_title='job__title',
+    applicant_name=Column(('applicant__candidate_profile__first_name', 'applicant__candidate_profile__last_name',
+                           'applicant__email'), transform=applicant_name),
+    status=Column(display=True),
+    created_at=Column(transform=date_format('%Y-%m-%d %H:%M:%S')),
+)
+
+
 @login_required
 def recruiter_applications_view(request):
     """
     Widok wyświetlający aplikacje na oferty pracy rekrutera. Dostępny tylko dla zalogowanych użytkowników z rolą rekrutera.
 
     - Sprawdza, czy zalogowany użytkownik jest rekruterem. Jeśli nie, zwraca błąd 403 (Access Denied).
-    - Pobiera aplikacje na oferty pracy przypisane do zalogowanego rekrutera.
+    - Pobiera aplikacje zarejestrowanych użytkowników na oferty pracy przypisane do zalogowanego rekrutera.
     - Umożliwia filtrowanie aplikacji na podstawie zapytania wyszukiwania.
     - Umożliwia paginację wyników.
 
@@ -591,8 +642,9 @@ def recruiter_applications_view(request):
     search_query = request.GET.get('search', '')  # Pobiera zapytanie wyszukiwania z parametrów URL
     page = request.GET.get('page', 1)  # Pobiera numer strony z parametrów URL
 
-    applications = Application.objects.filter(job__recruiter=request.user).select_related('job',
-                                                                                          'applicant__candidate_profile')
+    applications = Application.objects.filter(job__recruiter=request.user, applicant__isnull=False).select_related(
+        'job', 'applicant__candidate_profile').defer(*APPLICATION_LIST_DEFERRED)
+    # Aplikacje gości są wyświetlane w guest_applications_view
 
     # Mapa statusów aplikacji
     status_mapping = {
@@ -617,40 +669,34 @@ def recruiter_applications_view(request):
 
     applications = applications.order_by('-created_at')  # Sortowanie aplikacji według daty utworzenia
 
-    paginator = Paginator(applications, 10)  # Paginacja wyników, 10 aplikacji na stronę
-    try:
-        applications_page = paginator.page(page)
-    except PageNotAnInteger:
-        applications_page = paginator.page(1)  # Jeśli numer strony nie jest liczbą, wyświetla pierwszą stronę
-    except EmptyPage:
-        applications_page = paginator.page(
-            paginator.num_pages)  # Jeśli numer strony przekracza liczbę stron, wyświetla ostatnią stronę
+    json_requested = request.GET.get('json', '').lower() == 'true'
+    if json_requested:
+        # Odpowiedź JSON pobiera tylko kolumny projekcji (bez obiektów aplikacji, ofert i profili)
+        applications = APPLICATION_PROJECTION.project(applications, 'created_at', 'id')
+
+    if is_cursor_request(request):
+        # Tryb kursorowy: stały koszt strony bez COUNT(*) i OFFSET
+        paginator = CursorPaginator(applications, 10, ('-created_at', '-id'))
+        applications_page = attach_cursor_urls(paginator.page(request.GET.get(CURSOR_PARAM)), request)
+    else:
+        # Paginacja wyników, 10 aplikacji na stronę; liczba aplikacji jest zapamiętywana w pamięci podręcznej
+        paginator = CountedPaginator(applications, 10, count_key='recruiter_applications',
+                                     count_models=APPLICATION_SEARCH_COUNT_MODELS if search_query else None)
+        try:
+            applications_page = paginator.page(page)
+        except PageNotAnInteger:
+            applications_page = paginator.page(1)  # Jeśli numer strony nie jest liczbą, wyświetla pierwszą stronę
+        except EmptyPage:
+            applications_page = paginator.page(
+                paginator.num_pages)  # Jeśli numer strony przekracza liczbę stron, wyświetla ostatnią stronę
 
     # Obsługa odpowiedzi AJAX
-    if request.GET.get('json', '').lower() == 'true':
-        applications_list = [
-            {
-                'id': application.id,
-                'job_title': application.job.title,
-                'applicant_name': application.get_applicant_full_name(),
-                'status': application.get_status_display(),
-                'created_at': application.created_at.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            for application in applications_page
-        ]
-
-        pagination_html = ''
-        if applications_page.has_previous():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={applications_page.previous_page_number()}&search={search_query}">Previous</a></li>'
-        for num in paginator.page_range:
-            if num == applications_page.number:
-                pagination_html += f'<li class="page-item active"><span class="page-link">{num}</span></li>'
-            else:
-                pagination_html += f'<li class="page-item"><a class="page-link" href="?page={num}&search={search_query}">{num}</a></li>'
-        if applications_page.has_next():
-            pagination_html += f'<li class="page-item"><a class="page-link" href="?page={applications_page.next_page_number()}&search={search_query}">Next</a></li>'
+    if json_requested:
+        applications_list = APPLICATION_PROJECTION.rows(applications_page)
 
-        return JsonResponse({'applications': applications_list, 'pagination': pagination_html})
+        pagination_html = generate_pagination_html(applications_page, {'search': search_query})
+        return json_response({'applications': applications_list, 'pagination': pagination_html,
+                              **cursor_json(applications_page), **count_json(applications_page)})
 
     context = {
         'applications': applications_page,
@@ -667,7 +713,8 @@ def registered_applications_for_job_view(request, job_id):
     Widok wyświetlający aplikacje zarejestrowanych użytkowników na konkretną ofertę pracy.
 
     - Pobiera ofertę pracy na podstawie podanego identyfikatora (job_id) i sprawdza, czy zalogowany użytkownik jest rekruterem tej oferty.
-    - Pobiera aplikacje na daną ofertę pracy.
+    - Pobiera aplikacje na daną ofertę pracy i sortuje je według dopasowania umiejętności kandydata do oferty
+      (jobs.matching).
 
     Args:
         request (HttpRequest): Obiekt żądania HTTP.
@@ -678,7 +725,16 @@ def registered_applications_for_job_view(request, job_id):
     """
     job = get_object_or_404(Job, id=job_id,
                             recruiter=request.user)  # Pobiera ofertę pracy lub zwraca błąd 404, jeśli nie istnieje
-    applications = job.applications.select_related('applicant')  # Pobiera aplikacje na daną ofertę pracy
+    applications = list(job.applications.filter(applicant__isnull=False).select_related(
+        'applicant__candidate_profile').defer('cover_letter', 'applicant__candidate_profile__bio',
+                                              'applicant__candidate_profile__skills'))
+    # Pobiera aplikacje zarejestrowanych użytkowników na daną ofertę pracy (bez długich kolumn tekstowych)
+
+    scores = dict(best_candidates(job.id, profile_ids={application.applicant_id for application in applications}))
+    for application in applications:
+        application.match_score = scores.get(application.applicant_id, 0.0)
+    applications.sort(key=lambda application: application.match_score, reverse=True)
+    # Najlepiej dopasowani kandydaci na początku listy (przy równym dopasowaniu kolejność się nie zmienia)
 
     context = {
         'job': job,
@@ -715,6 +771,7 @@ def update_job_status(request, job_id):
     - Pobiera ofertę pracy na podstawie podanego identyfikatora (job_id) i sprawdza, czy zalogowany użytkownik jest rekruterem tej oferty.
     - Jeśli metoda żądania to POST, przetwarza dane formularza.
     - Jeśli formularz jest poprawny, zapisuje zmiany w ofercie pracy.
+    - Ponownie otwartą ofertę dodaje do kolejki dopasowania do zapisanych wyszukiwań kandydatów (jobs.alerts).
     - Jeśli metoda żądania to GET, wyświetla formularz z aktualnymi danymi oferty pracy.
 
     Args:
@@ -731,9 +788,12 @@ def update_job_status(request, job_id):
             "You are not authorized to update this job.")  # Sprawdza, czy użytkownik jest rekruterem tej oferty
 
     if request.method == 'POST':
+        was_open = job.is_open()  # Formularz zmienia obiekt oferty podczas walidacji
         form = JobForm(request.POST, instance=job)  # Przetwarza dane formularza
         if form.is_valid():
             form.save()
+            if not was_open:
+                queue_job_alerts(job)
             return redirect('jobs:job_detail', job_id=job.pk)  # Przekierowuje po zapisaniu zmian
     else:
         form = JobForm(instance=job)  # Wyświetla formularz z aktualnymi danymi oferty pracy
@@ -787,7 +847,7 @@ def recruiter_job_list_view(request):
         HttpResponse: Renderowana strona HTML z listą ofert pracy.
     """
     search_query = request.GET.get('search', '')  # Pobiera zapytanie wyszukiwania z parametrów URL
-    jobs = Job.objects.filter(recruiter=request.user)
+    jobs = Job.objects.filter(recruiter=request.user).defer(*JOB_LIST_DEFERRED)
 
     status_mapping = {
         'Otwarta': 'open',
@@ -871,7 +931,7 @@ def like_job(request, job_id):
     Widok do polubienia oferty pracy. Dostępny tylko dla zalogowanych użytkowników.
 
     - Pobiera ofertę pracy na podstawie podanego identyfikatora (job_id).
-    - Tworzy rekord polubienia oferty pracy dla zalogowanego użytkownika.
+    - Tworzy rekord polubienia oferty pracy dla zalogowanego użytkownika i zwiększa licznik polubień oferty.
 
     Args:
         request (HttpRequest): Obiekt żądania HTTP.
@@ -881,7 +941,7 @@ def like_job(request, job_id):
         HttpResponse: Przekierowanie do listy ofert pracy.
     """
     job = get_object_or_404(Job, pk=job_id)
-    Like.objects.get_or_create(user=request.user, job=job)
+    add_reaction(request.user, job.pk, 'like')  # Zapisuje polubienie i atomowo zwiększa licznik oferty
     return redirect('jobs:job_list')  # Przekierowuje do listy ofert pracy
 
 
@@ -891,7 +951,7 @@ def favorite_job(request, job_id):
     Widok do dodania oferty pracy do ulubionych. Dostępny tylko dla zalogowanych użytkowników.
 
     - Pobiera ofertę pracy na podstawie podanego identyfikatora (job_id).
-    - Tworzy rekord ulubionych ofert pracy dla zalogowanego użytkownika.
+    - Tworzy rekord ulubionych ofert pracy dla zalogowanego użytkownika i zwiększa licznik ulubionych oferty.
 
     Args:
         request (HttpRequest): Obiekt żądania HTTP.
@@ -901,10 +961,101 @@ def favorite_job(request, job_id):
         HttpResponse: Przekierowanie do listy ofert pracy.
     """
     job = get_object_or_404(Job, pk=job_id)
-    Favorite.objects.get_or_create(user=request.user, job=job)
+    add_reaction(request.user, job.pk, 'favorite')  # Zapisuje ulubioną ofertę i atomowo zwiększa licznik oferty
     return redirect('jobs:job_list')  # Przekierowuje do listy ofert pracy
 
 
+def _reaction_response(request, job_id, kind):
+    """
+    Przełącza reakcję użytkownika na ofertę pracy i zwraca jej nowy stan w formacie JSON.
+    Parametr POST `active` ('1' lub '0') ustawia konkretny stan zamiast przełączania, więc ponowione żądanie
+    (np. podwójne kliknięcie) nie odwraca poprzedniej zmiany.
+    """
+    if 'active' in request.POST:
+        active = request.POST['active'] in ('1', 'true')
+        set_reactions(request.user, [job_id], kind, active)
+    else:
+        active = toggle_reaction(request.user, job_id, kind)
+    counts = reaction_counts([job_id], kind)
+    if job_id not in counts:
+        return JsonResponse({'error': _('Oferta pracy nie istnieje.')}, status=404)
+    return JsonResponse({'job_id': job_id, 'kind': kind, 'active': active, 'count': counts[job_id]})
+
+
+@login_required
+@require_POST
+def toggle_like(request, job_id):
+    """
+    Widok AJAX przełączający polubienie oferty pracy. Dostępny tylko dla zalogowanych użytkowników.
+
+    - Dodaje lub usuwa polubienie jednym zapytaniem INSERT ... ON CONFLICT DO NOTHING lub DELETE,
+      bez wcześniejszego pobierania oferty.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP (POST).
+        job_id (int): Identyfikator oferty pracy.
+
+    Returns:
+        JsonResponse: Nowy stan polubienia i liczba polubień oferty, np.
+        {"job_id": 5, "kind": "like", "active": true, "count": 12}.
+    """
+    return _reaction_response(request, job_id, 'like')
+
+
+@login_required
+@require_POST
+def toggle_favorite(request, job_id):
+    """
+    Widok AJAX przełączający dodanie oferty pracy do ulubionych. Dostępny tylko dla zalogowanych użytkowników.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP (POST).
+        job_id (int): Identyfikator oferty pracy.
+
+    Returns:
+        JsonResponse: Nowy stan i liczba dodań oferty do ulubionych.
+    """
+    return _reaction_response(request, job_id, 'favorite')
+
+
+@login_required
+@require_POST
+def batch_reactions(request):
+    """
+    Widok AJAX ustawiający reakcję użytkownika na wiele ofert pracy naraz.
+
+    - Parametry POST: `kind` ('like' lub 'favorite'), `job_id` (powtarzany dla każdej oferty)
+      oraz `active` ('1' - dodanie, '0' - usunięcie reakcji).
+    - Nieistniejące oferty są pomijane.
+    - Żądanie z więcej niż JOB_REACTION_BATCH_LIMIT ofertami jest odrzucane z kodem 400.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP (POST).
+
+    Returns:
+        JsonResponse: Stan i licznik każdej istniejącej oferty, np.
+        {"kind": "like", "jobs": [{"job_id": 5, "active": true, "count": 12}]}.
+    """
+    kind = request.POST.get('kind')
+    if kind not in KINDS:
+        return JsonResponse({'error': _('Nieprawidłowy rodzaj reakcji.')}, status=400)
+    raw_ids = request.POST.getlist('job_id')
+    if len(raw_ids) > settings.JOB_REACTION_BATCH_LIMIT:
+        return JsonResponse({'error': _('Zbyt wiele ofert pracy w jednym żądaniu.')}, status=400)
+    try:
+        job_ids = [int(job_id) for job_id in raw_ids]
+    except ValueError:
+        return JsonResponse({'error': _('Nieprawidłowy identyfikator oferty pracy.')}, status=400)
+    active = request.POST.get('active', '1') in ('1', 'true')
+
+    set_reactions(request.user, job_ids, kind, active)
+    counts = reaction_counts(job_ids, kind)
+    return JsonResponse({
+        'kind': kind,
+        'jobs': [{'job_id': job_id, 'active': active, 'count': count} for job_id, count in sorted(counts.items())],
+    })
+
+
 class LikedJobsListView(LoginRequiredMixin, ListView):
     """
     Klasa widoku listy polubionych ofert pracy. Dostępna tylko dla zalogowanych użytkowników.
@@ -928,7 +1079,7 @@ class LikedJobsListView(LoginRequiredMixin, ListView):
             QuerySet: Zestaw zapytań zawierający polubione oferty pracy.
         """
         liked_job_ids = Like.objects.filter(user=self.request.user).values_list('job_id', flat=True)
-        return Job.objects.filter(id__in=liked_job_ids)
+        return Job.objects.filter(id__in=liked_job_ids).defer(*JOB_LIST_DEFERRED)
 
 
 class FavoritedJobsListView(LoginRequiredMixin, ListView):
@@ -954,5 +1105,118 @@ class FavoritedJobsListView(LoginRequiredMixin, ListView):
             QuerySet: Zestaw zapytań zawierający ulubione oferty pracy.
         """
         favorited_job_ids = Favorite.objects.filter(user=self.request.user).values_list('job_id', flat=True)
-        return Job.objects.filter(id__in=favorited_job_ids)
+        return Job.objects.filter(id__in=favorited_job_ids).defer(*JOB_LIST_DEFERRED)
+
+
+@login_required
+def saved_search_list_view(request):
+    """
+    Widok zapisanych wyszukiwań kandydata. Dostępny tylko dla zalogowanych kandydatów.
+
+    - Wyświetla zapisane wyszukiwania użytkownika i formularz nowego wyszukiwania (słowa kluczowe mogą pochodzić
+      z parametru 'q' listy ofert pracy).
+    - Jeśli metoda żądania to POST i formularz jest poprawny, zapisuje wyszukiwanie (najwyżej SAVED_SEARCH_LIMIT
+      wyszukiwań na kandydata). O nowych ofertach pasujących do wyszukiwania kandydat jest powiadamiany zbiorczą
+      wiadomością e-mail (komenda send_job_alerts).
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+
+    Returns:
+        HttpResponse: Renderowana strona HTML z zapisanymi wyszukiwaniami lub przekierowanie po zapisaniu.
+    """
+    if request.user.role != 'candidate':
+        return HttpResponseForbidden("Access Denied")  # Sprawdza, czy użytkownik jest kandydatem
+
+    searches = SavedSearch.objects.filter(user=request.user).order_by('-created_at')
+    if request.method == 'POST':
+        form = SavedSearchForm(request.POST)
+        if searches.count() >= settings.SAVED_SEARCH_LIMIT:
+            form.add_error(None, _('Osiągnięto limit zapisanych wyszukiwań ({limit}).').format(
+                limit=settings.SAVED_SEARCH_LIMIT))
+        elif form.is_valid():
+            saved_search = form.save(commit=False)
+            saved_search.user = request.user
+            saved_search.save()
+            messages.success(request, _('Wyszukiwanie zostało zapisane.'))
+            return redirect('jobs:saved_search_list')
+    else:
+        form = SavedSearchForm(initial={'query': request.GET.get('q', '')[:MAX_QUERY_LENGTH]})
+    return render(request, 'jobs/saved_search_list.html', {'form': form, 'searches': searches})
+
+
+@login_required
+@require_POST
+def delete_saved_search_view(request, search_id):
+    """
+    Widok usuwania zapisanego wyszukiwania. Dostępny tylko dla właściciela wyszukiwania.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+        search_id (int): Identyfikator zapisanego wyszukiwania.
+
+    Returns:
+        HttpResponse: Przekierowanie do listy zapisanych wyszukiwań.
+    """
+    saved_search = get_object_or_404(SavedSearch, pk=search_id, user=request.user)
+    saved_search.delete()
+    messages.success(request, _('Wyszukiwanie zostało usunięte.'))
+    return redirect('jobs:saved_search_list')
 
+
+@login_required
+def job_candidate_matches_view(request, job_id):
+    """
+    Widok najlepiej dopasowanych kandydatów do oferty pracy. Dostępny tylko dla rekrutera tej oferty.
+
+    - Wyświetla MATCH_RESULTS_LIMIT kandydatów, których umiejętności są najbardziej podobne do tytułu i wymagań
+      oferty (jobs.matching), wraz z informacją, czy kandydat już aplikował na ofertę.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+        job_id (int): Identyfikator oferty pracy.
+
+    Returns:
+        HttpResponse: Renderowana strona HTML z listą kandydatów.
+    """
+    job = get_object_or_404(Job.objects.only('id', 'title', 'recruiter_id'), id=job_id, recruiter=request.user)
+    matches = best_candidates(job.id, limit=settings.MATCH_RESULTS_LIMIT)
+    profiles = CandidateProfile.objects.defer('bio').in_bulk([profile_id for profile_id, _score in matches])
+    applied = set(job.applications.filter(applicant_id__in=list(profiles)).values_list('applicant_id', flat=True))
+
+    candidates = []
+    for profile_id, score in matches:
+        profile = profiles.get(profile_id)
+        if profile is not None:
+            profile.match_score = score
+            profile.has_applied = profile_id in applied
+            candidates.append(profile)
+    return render(request, 'jobs/job_candidate_matches.html', {'job': job, 'candidates': candidates})
+
+
+@login_required
+def recommended_jobs_view(request):
+    """
+    Widok ofert pracy polecanych kandydatowi. Dostępny tylko dla zalogowanych kandydatów.
+
+    - Wyświetla MATCH_RESULTS_LIMIT otwartych ofert, których tytuł i wymagania są najbardziej podobne
+      do umiejętności z profilu kandydata (jobs.matching).
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+
+    Returns:
+        HttpResponse: Renderowana strona HTML z listą polecanych ofert pracy.
+    """
+    if request.user.role != 'candidate':
+        return HttpResponseForbidden("Access Denied")  # Sprawdza, czy użytkownik jest kandydatem
+
+    matches = recommended_jobs(request.user.pk, limit=settings.MATCH_RESULTS_LIMIT)
+    found = Job.objects.only('id', 'title', 'salary', 'excerpt').in_bulk([job_id for job_id, _score in matches])
+    jobs = []
+    for job_id, score in matches:
+        job = found.get(job_id)
+        if job is not None:
+            job.match_score = score
+            jobs.append(job)
+    return render(request, 'jobs/recommended_jobs.html', {'jobs': jobs})
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.db.models.signals import post_save, post_delete
+
+"""
+Importy:
+- import hashlib: Importuje funkcje skrótu, używane do budowy krótkich kluczy pamięci podręcznej z treści zapytania SQL.
+- import json: Importuje moduł json, używany do odczytu planu zapytania zwracanego przez EXPLAIN (FORMAT JSON).
+- import time: Importuje moduł time, używany do generowania numerów wersji liczników.
+- from django.conf import settings: Importuje ustawienia projektu (limit czasu pamięci podręcznej i próg szacowania).
+- from django.core.cache import caches: Importuje dostęp do skonfigurowanych pamięci podręcznych Django.
+- from django.db import connections: Importuje połączenia z bazą danych, używane do odczytu statystyk planisty.
+- from django.db.models.signals import post_save, post_delete: Importuje sygnały, na podstawie których unieważniane
+  są zapamiętane liczniki.
+
+Moduł zawiera warstwę liczenia wierszy dla paginacji:
+- count_rows: zwraca liczbę wierszy zestawu danych z pamięci podręcznej, a przy jej braku dokładny COUNT(*) lub,
+  powyżej progu COUNT_ESTIMATE_THRESHOLD, szacunek planisty PostgreSQL (pg_class.reltuples / EXPLAIN).
+- track_model: unieważnia liczniki modelu po utworzeniu, usunięciu lub zmianie statusu wiersza.
+"""
+
+# Domyślny czas przechowywania liczników w pamięci podręcznej (sekundy)
+DEFAULT_TIMEOUT = 300
+
+# Domyślny próg, powyżej którego zamiast dokładnego COUNT(*) używany jest szacunek planisty
+DEFAULT_ESTIMATE_THRESHOLD = 100000
+
+
+def _cache():
+    return caches[getattr(settings, 'COUNT_CACHE_ALIAS', 'default')]
+
+
+def _version_key(model):
+    return f'counts:version:{model._meta.label_lower}'
+
+
+def model_version(model):
+    """
+    Zwraca bieżącą wersję liczników modelu. Zmiana wersji unieważnia wszystkie zapamiętane liczniki modelu.
+    """
+    return _cache().get_or_set(_version_key(model), time.time_ns, None)
+
+
+def invalidate_counts(model):
+    """
+    Unieważnia wszystkie zapamiętane liczniki dla podanego modelu.
+    """
+    _cache().set(_version_key(model), time.time_ns(), None)
+
+
+def estimate_count(queryset):
+    """
+    Szacuje liczbę wierszy zestawu danych na podstawie statystyk planisty PostgreSQL.
+
+    - Zestaw bez filtrów: pg_class.reltuples tabeli modelu.
+    - Zestaw z filtrami: liczba wierszy ("Plan Rows") z planu EXPLAIN.
+
+    Args:
+        queryset (QuerySet): Zestaw danych do oszacowania.
+
+    Returns:
+        int: Szacowana liczba wierszy lub None, jeśli baza danych nie udostępnia szacunków.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    queryset = queryset.order_by()
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                           [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        # reltuples = -1 oznacza tabelę, dla której nie zebrano jeszcze statystyk
+        if row and row[0] >= 0:
+            return int(row[0])
+        return None
+    plan = json.loads(queryset.explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def count_rows(queryset, key, models=None):
+    """
+    Zwraca liczbę wierszy zestawu danych, korzystając z pamięci podręcznej.
+
+    Licznik jest zapamiętywany pod kluczem zbudowanym z nazwy `key` (np. nazwy widoku), wersji liczników modeli
+    oraz treści zapytania SQL (czyli filtrów). Jeśli szacunek planisty przekracza próg
+    COUNT_ESTIMATE_THRESHOLD, zwracany jest szacunek zamiast dokładnego COUNT(*).
+
+    Args:
+        queryset (QuerySet): Zestaw danych do policzenia.
+        key (str): Nazwa licznika, np. 'public_job_list'.
+        models (iterable): Modele, których zmiany unieważniają licznik (domyślnie model zestawu danych).
+
+    Returns:
+        tuple: Liczba wierszy oraz informacja, czy jest dokładna (True) czy szacowana (False).
+    """
+    models = models or (queryset.model,)
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(f'{sql}|{params!r}'.encode('utf-8')).hexdigest()
+    versions = '.'.join(str(model_version(model)) for model in models)
+    cache_key = f'counts:{key}:{versions}:{digest}'
+
+    cache = _cache()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    threshold = getattr(settings, 'COUNT_ESTIMATE_THRESHOLD', DEFAULT_ESTIMATE_THRESHOLD)
+    estimate = estimate_count(queryset) if threshold is not None else None
+    if estimate is not None and estimate >= threshold:
+        result = (estimate, False)
+    else:
+        result = (queryset.count(), True)
+    cache.set(cache_key, result, getattr(settings, 'COUNT_CACHE_TIMEOUT', DEFAULT_TIMEOUT))
+    return result
+
+
+def track_model(model, fields=('status',)):
+    """
+    Podłącza unieważnianie liczników modelu do sygnałów post_save i post_delete.
+
+    Liczniki są unieważniane po utworzeniu i usunięciu wiersza oraz po zapisie, który może zmienić jedno z pól
+    `fields` (pełny zapis lub zapis z update_fields zawierającym takie pole). Operacje masowe (bulk_create,
+    QuerySet.update) nie wysyłają sygnałów - po nich należy wywołać invalidate_counts.
+
+    Args:
+        model (Model): Klasa modelu.
+        fields (tuple): Pola, których zmiana wpływa na liczniki (np. status).
+    """
+    def on_save(sender, instance, created, update_fields=None, **kwargs):
+        if created or update_fields is None or set(fields) & set(update_fields):
+            invalidate_counts(sender)
+
+    def on_delete(sender, **kwargs):
+        invalidate_counts(sender)
+
+    uid = f'counts_{model._meta.label_lower}'
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f'{uid}_delete')
@@ -0,0 +1,426 @@
+import bisect
+import itertools
+import multiprocessing
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+"""
+Importy:
+- import bisect: Importuje wyszukiwanie binarne, używane do losowania ofert pracy według rozkładu Zipfa.
+- import itertools: Importuje narzędzia iteracyjne, używane do budowy skumulowanych wag rozkładu.
+- import multiprocessing: Importuje pulę procesów, w których opcjonalnie generowane są porcje danych.
+- import random: Importuje generator liczb losowych z ziarnem (dane powtarzalne).
+- import time: Importuje licznik czasu perf_counter, używany do raportu przepustowości.
+- from contextlib import ExitStack, contextmanager: Importuje narzędzia do tymczasowego wyłączenia auto_now_add.
+- from datetime import timedelta: Importuje typ przesunięcia w czasie, używany do rozkładu dat.
+- import django: Importuje Django, aby zainicjalizować aplikacje w procesach roboczych.
+- from django.apps import apps: Importuje rejestr aplikacji, używany do pobierania modeli w procesach roboczych.
+- from django.contrib.auth.hashers import make_password: Importuje funkcję haszującą hasło (raz dla wszystkich kont).
+- from django.db import connection, connections, transaction: Importuje połączenia z bazą danych i transakcje.
+- from django.utils import timezone: Importuje funkcje obsługi stref czasowych.
+
+Moduł zawiera generator danych testowych o zadanej skali (komenda generate_data):
+- Wiersze są tworzone porcjami przez bulk_create, każda porcja we własnej transakcji.
+- Dane są powtarzalne: każda porcja ma własny generator liczb losowych wyznaczony przez ziarno, etap i numer porcji,
+  więc wynik nie zależy od kolejności wykonania porcji w procesach roboczych. Daty są liczone względem chwili
+  uruchomienia.
+- Rozkłady są skośne: popularność ofert pracy (aplikacje i opinie gości) ma rozkład Zipfa, a aplikacje napływają
+  falami tuż po publikacji oferty.
+"""
+
+# Liczba generowanych obiektów przy skali 1; skala 100 daje 1 mln ofert pracy i 10 mln aplikacji
+BASE_COUNTS = {
+    'candidates': 1000,
+    'recruiters': 100,
+    'clients': 100,
+    'jobs': 10000,
+    'tasks': 1000,
+    'applications': 100000,
+    'guest_feedbacks': 10000,
+    'job_requests': 1000,
+    'status_updates': 2000,
+    'news': 100,
+}
+
+# Kolejność etapów: każdy etap może odwoływać się do obiektów utworzonych we wcześniejszych etapach
+PHASES = list(BASE_COUNTS)
+
+# Rodzaje obiektów, do których odwołują się klucze obce generowanych wierszy
+REQUIRES = {
+    'jobs': ['recruiters'],
+    'tasks': ['recruiters'],
+    'applications': ['jobs', 'candidates'],
+    'guest_feedbacks': ['jobs'],
+    'job_requests': ['clients', 'recruiters'],
+    'status_updates': ['job_requests'],
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_DAYS = 365
+DEFAULT_ZIPF_EXPONENT = 1.1
+
+# Średni czas od publikacji oferty do złożenia aplikacji (dni)
+APPLICATION_DELAY_DAYS = 4
+
+LOCALES = ['pl_PL', 'de_DE', 'en_US', 'ru_RU', 'uk_UA', 'ka_GE', 'tr_TR']
+POOL_SIZE = 500
+
+# Kontekst etapu dostępny w procesie wykonującym porcję (ustawiany przez _init_worker)
+_context = {}
+
+
+def scaled_counts(scale=1.0, factors=None):
+    """
+    Zwraca liczbę obiektów każdego rodzaju: BASE_COUNTS * scale * factors[rodzaj].
+
+    Args:
+        scale (float): Wspólny mnożnik skali.
+        factors (dict): Dodatkowe mnożniki dla wybranych rodzajów, np. {'applications': 2}.
+
+    Returns:
+        dict: Słownik {rodzaj: liczba obiektów}.
+    """
+    factors = factors or {}
+    unknown = set(factors) - set(BASE_COUNTS)
+    if unknown:
+        raise ValueError(f'Nieznane rodzaje danych: {", ".join(sorted(unknown))}')
+    return {name: max(0, round(count * scale * factors.get(name, 1))) for name, count in BASE_COUNTS.items()}
+
+
+def check_counts(counts):
+    """
+    Sprawdza, czy każdy generowany rodzaj ma obiekty, do których mogą odwoływać się jego klucze obce.
+
+    Raises:
+        ValueError: Jeśli np. mają powstać aplikacje, ale żadna oferta pracy.
+    """
+    for name, required in REQUIRES.items():
+        missing = [other for other in required if counts.get(name) and not counts.get(other)]
+        if missing:
+            raise ValueError(f'{name} wymaga co najmniej jednego obiektu: {", ".join(missing)}')
+
+
+def build_pools(seed):
+    """
+    Przygotowuje słowniki imion, miast, firm, stanowisk i tekstów generowane raz przez Faker.
+
+    Losowanie z gotowych słowników jest o rzędy wielkości szybsze niż wywołanie Faker dla każdego wiersza.
+    Każde locale ma osobną instancję z ziarnem (Faker z wieloma locale losuje locale globalnym generatorem).
+    """
+    from faker import Faker
+
+    pools = {key: [] for key in ('first_names', 'last_names', 'cities', 'companies', 'jobs', 'phones', 'texts')}
+    per_locale = POOL_SIZE // len(LOCALES) + 1
+    for index, locale in enumerate(LOCALES):
+        fake = Faker(locale)
+        fake.seed_instance(seed * 100 + index)
+        for _ in range(per_locale):
+            pools['first_names'].append(fake.first_name()[:100])
+            pools['last_names'].append(fake.last_name()[:100])
+            pools['cities'].append(fake.city()[:100])
+            pools['companies'].append(fake.company()[:100])
+            pools['jobs'].append(fake.job()[:200])
+            pools['phones'].append(fake.phone_number()[:15])
+            pools['texts'].append(fake.text(max_nb_chars=300))
+    return pools
+
+
+def zipf_cum_weights(size, exponent):
+    """
+    Zwraca skumulowane wagi rozkładu Zipfa: obiekt o pozycji r ma wagę 1 / r ** exponent.
+    """
+    return list(itertools.accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+
+
+@contextmanager
+def _explicit_dates(*fields):
+    # bulk_create nadpisuje pola auto_now_add bieżącą datą; generator ustawia daty sam
+    with ExitStack() as stack:
+        for model_label, name in fields:
+            field = apps.get_model(model_label)._meta.get_field(name)
+            field.auto_now_add = False
+            stack.callback(setattr, field, 'auto_now_add', True)
+        yield
+
+
+def _moment(rng, start, end):
+    return start + (end - start) * rng.random()
+
+
+def _pick_job(rng):
+    # Oferty są uporządkowane według popularności (losowa permutacja), wagi mają rozkład Zipfa
+    popular = _context['popular_jobs']
+    weights = _context['job_weights']
+    return popular[bisect.bisect(weights, rng.random() * weights[-1])]
+
+
+def _after(rng, moment, mean_days):
+    """
+    Zwraca chwilę po `moment` odległą o czas z rozkładu wykładniczego (nie późniejszą niż chwila uruchomienia).
+    """
+    now = _context['now']
+    delay = timedelta(days=rng.expovariate(1 / mean_days))
+    return moment + delay if moment + delay < now else _moment(rng, moment, now)
+
+
+def _build_users(role, profile_label, profile_fields):
+    def build(rng, ordinals):
+        User = apps.get_model('accounts.User')
+        Profile = apps.get_model(profile_label)
+        prefix, password = _context['prefix'], _context['password']
+        users = User.objects.bulk_create([
+            User(email=f'{prefix}.{role}.{ordinal}@example.com', password=password, role=role, is_active=True,
+                 is_verified=True)
+            for ordinal in ordinals
+        ])
+        Profile.objects.bulk_create([Profile(user_id=user.pk, **profile_fields(rng)) for user in users])
+        return [user.pk for user in users], 2 * len(users)
+    return build
+
+
+def _person(rng):
+    pools = _context['pools']
+    return {
+        'first_name': rng.choice(pools['first_names']),
+        'last_name': rng.choice(pools['last_names']),
+        'phone_number': rng.choice(pools['phones']),
+        'location': rng.choice(pools['cities']),
+        'bio': rng.choice(pools['texts']),
+    }
+
+
+def _candidate_profile(rng):
+    return {**_person(rng), 'date_of_birth': timezone.localdate() - timedelta(days=rng.randint(18 * 365, 60 * 365)),
+            'skills': rng.choice(_context['pools']['texts'])}
+
+
+def _client_profile(rng):
+    pools = _context['pools']
+    return {'phone_number': rng.choice(pools['phones']), 'location': rng.choice(pools['cities']),
+            'bio': rng.choice(pools['texts']), 'company_name': rng.choice(pools['companies']),
+            'industry': rng.choice(pools['jobs'])[:50]}
+
+
+def _build_jobs(rng, ordinals):
+    Job = apps.get_model('jobs.Job')
+    pools, recruiters = _context['pools'], _context['recruiters']
+    with _explicit_dates(('jobs.Job', 'created_at')):
+        jobs = Job.objects.bulk_create([
+            Job(title=rng.choice(pools['jobs']), recruiter_id=rng.choice(recruiters),
+                description=rng.choice(pools['texts']), requirements=rng.choice(pools['texts']),
+                salary=round(rng.uniform(3000, 20000), 2), created_at=_moment(rng, _context['start'], _context['now']),
+                status='open' if rng.random() < 0.75 else 'closed')
+            for _ in ordinals
+        ])
+    return [(job.pk, job.created_at) for job in jobs], len(jobs)
+
+
+def _build_tasks(rng, ordinals):
+    Task = apps.get_model('accounts.Task')
+    pools, recruiters, today = _context['pools'], _context['recruiters'], timezone.localdate()
+    tasks = Task.objects.bulk_create([
+        Task(created_by_id=rng.choice(recruiters), title=rng.choice(pools['jobs']), description=rng.choice(pools['texts']),
+             priority=rng.choice(['low', 'medium', 'high']), due_date=today + timedelta(days=rng.randint(-30, 90)),
+             status=rng.choice(['open', 'in_progress', 'completed']))
+        for _ in ordinals
+    ])
+    return [], len(tasks)
+
+
+def _build_applications(rng, ordinals):
+    Application = apps.get_model('jobs.Application')
+    pools, candidates = _context['pools'], _context['candidates']
+    applications = []
+    for _ in ordinals:
+        job_id, posted = _pick_job(rng)
+        applications.append(Application(
+            job_id=job_id, applicant_id=rng.choice(candidates), cover_letter=rng.choice(pools['texts']),
+            created_at=_after(rng, posted, APPLICATION_DELAY_DAYS),
+            status=rng.choices(['submitted', 'reviewed', 'accepted', 'rejected'], weights=[60, 25, 5, 10])[0],
+        ))
+    with _explicit_dates(('jobs.Application', 'created_at')):
+        Application.objects.bulk_create(applications)
+    return [], len(applications)
+
+
+def _build_guest_feedbacks(rng, ordinals):
+    GuestFeedback = apps.get_model('jobs.GuestFeedback')
+    pools, prefix = _context['pools'], _context['prefix']
+    feedbacks = []
+    for ordinal in ordinals:
+        job_id, posted = _pick_job(rng)
+        feedbacks.append(GuestFeedback(
+            job_id=job_id, email=f'{prefix}.guest.{ordinal}@example.com', message=rng.choice(pools['texts']),
+            phone_number=rng.choice(pools['phones']), created_at=_after(rng, posted, APPLICATION_DELAY_DAYS),
+            is_verified=rng.random() < 0.9,
+        ))
+    with _explicit_dates(('jobs.GuestFeedback', 'created_at')):
+        GuestFeedback.objects.bulk_create(feedbacks)
+    return [], len(feedbacks)
+
+
+def _build_job_requests(rng, ordinals):
+    JobRequest = apps.get_model('requests.JobRequest')
+    pools = _context['pools']
+    with _explicit_dates(('requests.JobRequest', 'created_at')):
+        job_requests = JobRequest.objects.bulk_create([
+            JobRequest(employer_id=rng.choice(_context['clients']), recruiter_id=rng.choice(_context['recruiters']),
+                       title=rng.choice(pools['jobs']), description=rng.choice(pools['texts'])[:500],
+                       requirements=rng.choice(pools['texts'])[:300],
+                       created_at=_moment(rng, _context['start'], _context['now']),
+                       status=rng.choice(['pending', 'processing', 'completed']))
+            for _ in ordinals
+        ])
+    return [(job_request.pk, job_request.recruiter_id, job_request.created_at) for job_request in job_requests], \
+        len(job_requests)
+
+
+def _build_status_updates(rng, ordinals):
+    JobRequestStatusUpdate = apps.get_model('requests.JobRequestStatusUpdate')
+    pools = _context['pools']
+    updates = []
+    for _ in ordinals:
+        job_request_id, recruiter_id, created = rng.choice(_context['job_requests'])
+        updates.append(JobRequestStatusUpdate(
+            job_request_id=job_request_id, updated_by_id=recruiter_id, message=rng.choice(pools['texts']),
+            new_status=rng.choice(['pending', 'processing', 'completed']), updated_at=_after(rng, created, 7),
+        ))
+    with _explicit_dates(('requests.JobRequestStatusUpdate', 'updated_at')):
+        JobRequestStatusUpdate.objects.bulk_create(updates)
+    return [], len(updates)
+
+
+def _build_news(rng, ordinals):
+    News = apps.get_model('news.News')
+    pools = _context['pools']
+    with _explicit_dates(('news.News', 'date_posted')):
+        news = News.objects.bulk_create([
+            News(title=rng.choice(pools['jobs']), content=rng.choice(pools['texts']),
+                 date_posted=_moment(rng, _context['start'], _context['now']),
+                 role=rng.choice(['candidate', 'client', 'recruiter']))
+            for _ in ordinals
+        ])
+    return [], len(news)
+
+
+BUILDERS = {
+    'candidates': _build_users('candidate', 'accounts.CandidateProfile', _candidate_profile),
+    'recruiters': _build_users('recruiter', 'accounts.RecruiterProfile', _person),
+    'clients': _build_users('client', 'accounts.ClientProfile', _client_profile),
+    'jobs': _build_jobs,
+    'tasks': _build_tasks,
+    'applications': _build_applications,
+    'guest_feedbacks': _build_guest_feedbacks,
+    'job_requests': _build_job_requests,
+    'status_updates': _build_status_updates,
+    'news': _build_news,
+}
+
+
+def _init_worker(context):
+    if not apps.ready:
+        django.setup()
+    _context.clear()
+    _context.update(context)
+
+
+def _run_chunk(task):
+    phase, index, first, count = task
+    rng = random.Random(f'{_context["seed"]}:{phase}:{index}')
+    with transaction.atomic():
+        refs, rows = BUILDERS[phase](rng, range(first, first + count))
+    return index, refs, rows
+
+
+def _run_phase(phase, total, context, chunk_size, workers):
+    tasks = [(phase, index, first, min(chunk_size, total - first))
+             for index, first in enumerate(range(0, total, chunk_size))]
+    if workers > 1 and len(tasks) > 1:
+        # Procesy potomne otwierają własne połączenia; odziedziczone połączenie nie może być współdzielone
+        connections.close_all()
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(context,)) as pool:
+            results = pool.map(_run_chunk, tasks)
+    else:
+        _init_worker(context)
+        results = [_run_chunk(task) for task in tasks]
+    results.sort(key=lambda result: result[0])
+    refs = [ref for _, chunk_refs, _ in results for ref in chunk_refs]
+    return refs, sum(rows for _, _, rows in results)
+
+
+def _invalidate_caches():
+    # bulk_create nie wysyła sygnałów, więc zapamiętane liczniki, strony, wyróżnione oferty i kanały aktualności
+    # są unieważniane ręcznie
+    from jobs.featured import invalidate_featured_jobs
+    from kirismor.counting import invalidate_counts
+    from kirismor.page_cache import invalidate_pages
+    from news.feed import invalidate_news_feed
+
+    for label in ('jobs.Job', 'jobs.Application', 'news.News'):
+        invalidate_counts(apps.get_model(label))
+    invalidate_pages('jobs', 'news')
+    invalidate_featured_jobs()
+    invalidate_news_feed()
+
+
+def generate(counts, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, prefix='gen', days=DEFAULT_DAYS,
+             zipf_exponent=DEFAULT_ZIPF_EXPONENT, report=None):
+    """
+    Generuje dane testowe i zwraca raport przepustowości.
+
+    Args:
+        counts (dict): Liczba obiektów każdego rodzaju (patrz scaled_counts).
+        seed (int): Ziarno generatora; to samo ziarno i rozmiar porcji dają te same dane.
+        chunk_size (int): Liczba obiektów w jednym bulk_create (i jednej transakcji).
+        workers (int): Liczba procesów generujących porcje równolegle.
+        prefix (str): Prefiks adresów e-mail (pozwala wygenerować kolejny zestaw w tej samej bazie).
+        days (int): Długość okresu (w dniach przed chwilą uruchomienia), w którym rozkładane są daty.
+        zipf_exponent (float): Wykładnik rozkładu Zipfa popularności ofert pracy.
+        report (callable): Funkcja wywoływana z wierszem raportu po zakończeniu każdego etapu.
+
+    Returns:
+        list: Lista słowników {'phase', 'objects', 'rows', 'seconds', 'rows_per_second'}.
+    """
+    check_counts(counts)
+    now = timezone.now()
+    context = {
+        'seed': seed,
+        'prefix': prefix,
+        'now': now,
+        'start': now - timedelta(days=days),
+        'password': make_password('password'),
+        'pools': build_pools(seed),
+    }
+    results = []
+    for phase in PHASES:
+        total = counts.get(phase, 0)
+        started = time.perf_counter()
+        refs, rows = _run_phase(phase, total, context, chunk_size, workers) if total else ([], 0)
+        seconds = time.perf_counter() - started
+        if phase in ('candidates', 'recruiters', 'clients', 'job_requests'):
+            context[phase] = refs
+        elif phase == 'jobs':
+            popular = refs[:]
+            random.Random(f'{seed}:popularity').shuffle(popular)
+            context['popular_jobs'] = popular
+            context['job_weights'] = zipf_cum_weights(len(popular), zipf_exponent)
+        row = {'phase': phase, 'objects': total, 'rows': rows, 'seconds': round(seconds, 3),
+               'rows_per_second': round(rows / seconds) if seconds else 0}
+        results.append(row)
+        if report:
+            report(row)
+
+    _invalidate_caches()
+    if connection.vendor == 'postgresql':
+        # Aktualne statystyki planisty (szacowanie liczby wierszy w kirismor.counting i wybór indeksów)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    return results
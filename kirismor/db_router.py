@@ -0,0 +1,171 @@
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+"""
+Importy:
+- import logging: Importuje moduł logowania (logger 'kirismor.db_router'), używany do zgłaszania niedostępnych replik.
+- import random: Importuje losowanie, używane do rozkładania odczytów między repliki.
+- import time: Importuje zegar monotoniczny, używany do odstępów między sprawdzeniami stanu replik.
+- from contextvars import ContextVar: Importuje zmienną kontekstu, przechowującą stan bieżącego żądania
+  (działa także w widokach asynchronicznych).
+- from django.conf import settings: Importuje ustawienia projektu (aliasy replik, czas przypięcia, sprawdzanie stanu).
+- from django.core.exceptions import MiddlewareNotUsed: Importuje wyjątek wyłączający middleware, gdy brak replik.
+- from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections: Importuje alias bazy głównej, wyjątek błędu
+  bazy danych i połączenia z bazami danych.
+
+Moduł kieruje odczyty wybranych widoków do replik bazy danych (ustawienie DATABASE_REPLICAS):
+- replica_reads: oznacza widok (funkcję lub klasę widoku), którego odczyty mogą trafiać do repliki.
+- ReplicaRouterMiddleware: wybiera dla żądania zdrową replikę i przypina użytkownika do bazy głównej na
+  DATABASE_REPLICA_PIN_SECONDS sekund po każdym zapisie (ciasteczko), aby po przekierowaniu widział własne zmiany.
+- ReplicaRouter: router bazy danych; zapisy i odczyty pozostałych widoków (oraz komend i zadań) trafiają do
+  bazy głównej.
+"""
+
+logger = logging.getLogger('kirismor.db_router')
+
+# Ciasteczko przypinające użytkownika do bazy głównej po zapisie
+PIN_COOKIE = 'kirismor_primary'
+
+DEFAULT_PIN_SECONDS = 5
+DEFAULT_HEALTH_INTERVAL = 30
+
+# Stan bieżącego żądania: {'replica': alias repliki lub None, 'wrote': czy żądanie zapisywało dane}
+_request_state = ContextVar('kirismor_db_router_state', default=None)
+
+# Wynik ostatniego sprawdzenia stanu repliki w tym procesie: {alias: (zdrowa, chwila sprawdzenia)}
+_health = {}
+
+
+def replica_reads(view):
+    """
+    Oznacza widok, którego odczyty mogą trafiać do repliki (przeglądanie list, wyszukiwanie).
+
+    Działa jako dekorator funkcji widoku oraz klasy widoku.
+    """
+    view.replica_reads = True
+    return view
+
+
+def _marked(view_func):
+    view_class = getattr(view_func, 'view_class', None)
+    return getattr(view_func, 'replica_reads', False) or getattr(view_class, 'replica_reads', False)
+
+
+def _check_replica(alias):
+    connection = connections[alias]
+    try:
+        connection.ensure_connection()
+        max_lag = getattr(settings, 'DATABASE_REPLICA_MAX_LAG', None)
+        if max_lag is not None and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())')
+                lag = cursor.fetchone()[0]
+            if lag is not None and lag > max_lag:
+                logger.warning('Replika %s jest opóźniona o %.1f s (limit %s s).', alias, lag, max_lag)
+                return False
+    except DatabaseError as error:
+        logger.warning('Replika %s jest niedostępna: %s', alias, error)
+        return False
+    return True
+
+
+def replica_is_healthy(alias):
+    """
+    Zwraca stan repliki. Sprawdzenie (połączenie i opcjonalnie opóźnienie replikacji) jest wykonywane
+    co najwyżej raz na DATABASE_REPLICA_HEALTH_INTERVAL sekund w każdym procesie.
+    """
+    interval = getattr(settings, 'DATABASE_REPLICA_HEALTH_INTERVAL', DEFAULT_HEALTH_INTERVAL)
+    healthy, checked_at = _health.get(alias, (None, 0))
+    now = time.monotonic()
+    if healthy is None or now - checked_at >= interval:
+        healthy = _check_replica(alias)
+        _health[alias] = (healthy, now)
+    return healthy
+
+
+def reset_health():
+    """
+    Zapomina wyniki sprawdzeń stanu replik (następny odczyt sprawdzi je ponownie).
+    """
+    _health.clear()
+
+
+def choose_replica():
+    """
+    Zwraca losową zdrową replikę lub None, jeśli żadna nie jest dostępna (odczyt z bazy głównej).
+    """
+    healthy = [alias for alias in getattr(settings, 'DATABASE_REPLICAS', []) if replica_is_healthy(alias)]
+    return random.choice(healthy) if healthy else None
+
+
+class ReplicaRouter:
+    """
+    Router bazy danych: odczyty widoków oznaczonych replica_reads trafiają do repliki wybranej przez
+    ReplicaRouterMiddleware, wszystkie pozostałe odczyty i wszystkie zapisy do bazy głównej.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        return state['replica'] if state else None
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state:
+            state['wrote'] = True
+        # Jawnie baza główna: obiekt odczytany z repliki nie może zostać zapisany w replice
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Repliki zawierają te same dane co baza główna
+        databases = {DEFAULT_DB_ALIAS, *getattr(settings, 'DATABASE_REPLICAS', [])}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Repliki otrzymują schemat przez replikację z bazy głównej
+        if db in getattr(settings, 'DATABASE_REPLICAS', []):
+            return False
+        return None
+
+
+class ReplicaRouterMiddleware:
+    """
+    Middleware wybierające bazę danych dla odczytów żądania.
+
+    - Żądanie GET/HEAD do widoku oznaczonego replica_reads czyta ze zdrowej repliki, chyba że użytkownik jest
+      przypięty do bazy głównej.
+    - Żądanie, które zapisywało dane (lub użyło metody innej niż GET/HEAD/OPTIONS), przypina użytkownika do bazy
+      głównej na DATABASE_REPLICA_PIN_SECONDS sekund, aby np. nowa oferta pracy była widoczna po przekierowaniu
+      mimo opóźnienia replikacji.
+
+    Gdy DATABASE_REPLICAS jest puste, middleware jest pomijane przy starcie.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'DATABASE_REPLICAS', []):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = {'replica': None, 'wrote': False}
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+
+        if state['wrote'] or request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            pin_seconds = getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', DEFAULT_PIN_SECONDS)
+            response.set_cookie(PIN_COOKIE, '1', max_age=pin_seconds, httponly=True, samesite='Lax')
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method in ('GET', 'HEAD') and _marked(view_func) and PIN_COOKIE not in request.COOKIES:
+            _request_state.get()['replica'] = choose_replica()
@@ -0,0 +1,86 @@
+from django.db import models
+from django.db.models.functions import Substr
+
+"""
+Importy:
+- from django.db import models: Importuje moduł modeli Django, rozszerzany o pole ExcerptField.
+- from django.db.models.functions import Substr: Importuje funkcję SQL SUBSTR, używaną do uzupełniania skrótów
+  istniejących wierszy jednym zapytaniem UPDATE.
+
+Moduł zawiera kolumny ze skrótem (początkiem) długich pól tekstowych dla widoków list:
+- ExcerptField: pole CharField z początkiem pola źródłowego, aktualizowane przy każdym zapisie obiektu
+  (również przez bulk_create). Listy pobierają skrót zamiast pełnego tekstu (QuerySet.defer).
+- make_excerpt: funkcja budująca skrót tekstu.
+- backfill_excerpts: uzupełnia skróty istniejących wierszy (używana w migracjach danych).
+"""
+
+# Domyślna długość skrótu: najdłuższy fragment wyświetlany na listach (truncatewords/truncatechars) z zapasem
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """
+    Zwraca pierwsze `length` znaków tekstu (pusty ciąg dla None).
+    """
+    return (text or '')[:length]
+
+
+class ExcerptField(models.CharField):
+    """
+    Kolumna ze skrótem pola tekstowego `source` modelu.
+
+    Wartość jest ustawiana w pre_save, czyli przy save() i bulk_create(). Zmiany wykonane przez QuerySet.update()
+    lub bulk_update() pola źródłowego nie aktualizują skrótu, a save(update_fields=[...]) aktualizuje go tylko
+    wtedy, gdy lista zawiera pole skrótu.
+
+    Args:
+        source (str): Nazwa pola tekstowego, z którego budowany jest skrót.
+        max_length (int): Długość skrótu (domyślnie EXCERPT_LENGTH).
+    """
+
+    def __init__(self, source=None, max_length=EXCERPT_LENGTH, **kwargs):
+        self.source = source
+        kwargs.setdefault('editable', False)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('default', '')
+        super().__init__(max_length=max_length, **kwargs)
+
+    def pre_save(self, model_instance, add):
+        value = make_excerpt(getattr(model_instance, self.source), self.max_length)
+        setattr(model_instance, self.attname, value)
+        return value
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        if kwargs.get('max_length') == EXCERPT_LENGTH:
+            del kwargs['max_length']
+        for option, value, default in (('editable', self.editable, False), ('blank', self.blank, True),
+                                       ('default', self.default, '')):
+            if value == default:
+                kwargs.pop(option, None)
+            else:
+                kwargs[option] = value
+        return name, path, args, kwargs
+
+
+def excerpt_fields(model):
+    """
+    Zwraca pola ExcerptField modelu.
+    """
+    return [field for field in model._meta.concrete_fields if isinstance(field, ExcerptField)]
+
+
+def backfill_excerpts(model, using=None):
+    """
+    Uzupełnia skróty wszystkich wierszy modelu jednym zapytaniem UPDATE.
+
+    Args:
+        model (Model): Model (również model historyczny z migracji).
+        using (str): Alias bazy danych (w migracji: schema_editor.connection.alias).
+
+    Returns:
+        int: Liczba zaktualizowanych wierszy.
+    """
+    updates = {field.name: Substr(field.source, 1, field.max_length) for field in excerpt_fields(model)}
+    return model._default_manager.using(using).update(**updates) if updates else 0
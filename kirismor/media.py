@@ -0,0 +1,283 @@
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import secrets
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.urls import re_path
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.deconstruct import deconstructible
+from django.utils.http import http_date, parse_http_date_safe
+from django.utils.text import get_valid_filename
+
+"""
+Importy:
+- import hashlib: Importuje funkcje skrótu, używane do nazw plików zależnych od ich zawartości.
+- import mimetypes: Importuje rozpoznawanie typu MIME pliku po rozszerzeniu.
+- import os: Importuje operacje na plikach (stat, odczyt fragmentów pliku).
+- import posixpath: Importuje operacje na ścieżkach w formacie POSIX (nazwy plików w magazynie plików).
+- import re: Importuje wyrażenia regularne, używane do rozpoznawania nazw z sumą kontrolną i nagłówka Range.
+- import secrets: Importuje losowe tokeny, używane w nazwach plików, których zawartości nie da się odczytać.
+- from urllib.parse import quote, urlsplit: Importuje kodowanie ścieżki w nagłówku X-Accel-Redirect oraz podział
+  adresu MEDIA_URL.
+- from django.conf import settings: Importuje ustawienia projektu (MEDIA_ROOT, MEDIA_URL, tryb wydawania plików).
+- from django.core.exceptions import SuspiciousFileOperation: Importuje wyjątek ścieżki spoza MEDIA_ROOT.
+- from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse: Importuje klasy odpowiedzi
+  HTTP i wyjątek braku pliku.
+- from django.urls import re_path: Importuje funkcję definiującą trasę URL plików multimedialnych.
+- from django.utils._os import safe_join: Importuje bezpieczne łączenie ścieżek (ochrona przed '../').
+- from django.utils.cache import get_conditional_response: Importuje obsługę żądań warunkowych
+  (If-None-Match, If-Modified-Since).
+- from django.utils.deconstruct import deconstructible: Importuje dekorator pozwalający zapisać obiekt upload_to
+  w migracjach.
+- from django.utils.http import http_date, parse_http_date_safe: Importuje formatowanie i odczyt dat HTTP.
+- from django.utils.text import get_valid_filename: Importuje oczyszczanie nazw przesyłanych plików.
+
+Moduł wydaje pliki przesłane przez użytkowników (MEDIA_ROOT) zamiast django.views.static.serve:
+- serve_media: widok pliku z nagłówkami ETag, Last-Modified i Cache-Control, obsługą żądań warunkowych i zakresów
+  bajtów (Range). W zależności od ustawienia MEDIA_ACCEL plik wysyła serwer proxy (nginx: X-Accel-Redirect,
+  Apache/lighttpd: X-Sendfile) albo Django (FileResponse, które używa wsgi.file_wrapper/sendfile serwera WSGI).
+- file_response, resolve_file, cache_control: wspólna obsługa odpowiedzi z plikiem (również kirismor.staticfiles).
+- media_urlpatterns: trasa URL widoku dla MEDIA_URL (działa również przy DEBUG = False).
+- HashedUploadTo: upload_to pól plików nadające nazwy z sumą kontrolną zawartości,
+  np. 'profiles/anna.3f9c2a1b0d4e.jpg'. Zawartość pliku pod taką nazwą (i jego miniatur) się nie zmienia - zmieniony
+  plik otrzymuje nową nazwę (rehash_name) - więc jest wydawany z Cache-Control: immutable.
+
+Przykładowa konfiguracja nginx dla MEDIA_ACCEL = 'nginx' i MEDIA_ACCEL_PREFIX = '/protected-media/':
+
+    location /protected-media/ {
+        internal;
+        alias /srv/kirismor/media/;
+    }
+"""
+
+# Nazwa z sumą kontrolną zawartości (HashedUploadTo), również miniatury takiego pliku ('-200' przed rozszerzeniem)
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}(?:-\d+)?\.[^./]+$')
+
+# Pojedynczy zakres bajtów nagłówka Range: 'bytes=0-99', 'bytes=100-' lub 'bytes=-100' (ostatnie 100 bajtów)
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+CHUNK_SIZE = 64 * 1024
+
+
+@deconstructible
+class HashedUploadTo:
+    """
+    upload_to pola pliku: zapisuje plik w katalogu `directory` pod nazwą z 12 znakami skrótu SHA-256 zawartości.
+
+    Zawartość jest odczytywana z przesyłanego pliku przypisanego do pola `field_name` (formularze, przypisanie
+    UploadedFile). Gdy plik jest zapisywany inaczej (FieldFile.save()), nazwa zawiera losowy token tej samej długości.
+
+    Args:
+        directory (str): Katalog w magazynie plików, np. 'profiles/'.
+        field_name (str): Nazwa pola pliku w modelu.
+    """
+
+    def __init__(self, directory, field_name='photo'):
+        self.directory = directory
+        self.field_name = field_name
+
+    def __call__(self, instance, filename):
+        field_file = getattr(instance, self.field_name, None)
+        if field_file and not field_file._committed:
+            token = content_hash(field_file.file)
+            field_file.file.seek(0)
+        else:
+            token = secrets.token_hex(6)
+        stem, extension = posixpath.splitext(get_valid_filename(posixpath.basename(filename)))
+        return posixpath.join(self.directory, f'{stem[:60]}.{token}{extension.lower()}')
+
+    def __eq__(self, other):
+        return (isinstance(other, HashedUploadTo) and
+                (self.directory, self.field_name) == (other.directory, other.field_name))
+
+
+def content_hash(content):
+    """
+    Zwraca 12 znaków skrótu SHA-256 zawartości (bajty lub plik Django).
+    """
+    digest = hashlib.sha256()
+    for chunk in ([content] if isinstance(content, bytes) else content.chunks()):
+        digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def rehash_name(name, content):
+    """
+    Zwraca nazwę pliku z sumą kontrolną nowej zawartości (np. po ponownym zapisie zdjęcia bez metadanych EXIF).
+    Nazwy bez sumy kontrolnej są zwracane bez zmian.
+    """
+    match = HASHED_NAME_RE.search(name)
+    if not match:
+        return name
+    return name[:match.start()] + re.sub(r'^\.[0-9a-f]{12}', f'.{content_hash(content)}', match.group())
+
+
+def is_hashed_name(path):
+    """
+    Sprawdza, czy nazwa pliku zawiera sumę kontrolną zawartości (plik pod tą nazwą nie zmienia się).
+    """
+    return bool(HASHED_NAME_RE.search(path))
+
+
+def cache_control(path, max_age, hashed_max_age):
+    """
+    Zwraca wartość nagłówka Cache-Control: `hashed_max_age` z 'immutable' dla nazw z sumą kontrolną, `max_age`
+    dla pozostałych.
+    """
+    if is_hashed_name(path):
+        return f'public, max-age={hashed_max_age}, immutable'
+    return f'public, max-age={max_age}'
+
+
+def resolve_file(root, path):
+    """
+    Zwraca pełną ścieżkę pliku `path` w katalogu `root`.
+
+    Raises:
+        Http404: Gdy plik nie istnieje lub ścieżka wychodzi poza `root`.
+    """
+    try:
+        full_path = safe_join(root, path)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+    return full_path
+
+
+def _byte_range(request, size, etag, mtime):
+    """
+    Zwraca zakres (początek, koniec włącznie) z nagłówka Range, None dla całego pliku lub False, gdy zakres jest
+    poza plikiem (416). Kilka zakresów w jednym nagłówku jest obsługiwanych jak żądanie całego pliku.
+    """
+    header = request.META.get('HTTP_RANGE')
+    if not header or request.method not in ('GET', 'HEAD'):
+        return None
+    # If-Range: zakres tylko wtedy, gdy klient ma bieżącą wersję pliku (wg ETag lub daty modyfikacji)
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if if_range and if_range != etag and parse_http_date_safe(if_range) != int(mtime):
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+            yield chunk
+
+
+def file_response(request, full_path, cache_control, content_type=None, encoding=None, accel=None):
+    """
+    Zwraca odpowiedź z plikiem.
+
+    - ETag (czas modyfikacji i rozmiar pliku, jak w nginx) i Last-Modified; żądania warunkowe otrzymują 304.
+    - accel = (nagłówek, wartość), np. ('X-Accel-Redirect', '/protected-media/a.jpg'): pusta odpowiedź z tym
+      nagłówkiem - plik i zakresy bajtów wysyła serwer proxy.
+    - Bez accel: FileResponse (cały plik) lub odpowiedź 206 z pojedynczym zakresem bajtów (Range).
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+        full_path (str): Pełna ścieżka pliku.
+        cache_control (str): Wartość nagłówka Cache-Control.
+        content_type (str): Typ MIME (domyślnie rozpoznany po rozszerzeniu `full_path`).
+        encoding (str): Wartość nagłówka Content-Encoding (np. 'br' dla pliku skompresowanego wcześniej).
+        accel (tuple): Nagłówek przekazujący wysyłkę pliku serwerowi proxy.
+
+    Returns:
+        HttpResponse: Odpowiedź z plikiem, 206, 304 lub 416.
+    """
+    stat = os.stat(full_path)
+    etag = f'"{int(stat.st_mtime):x}-{stat.st_size:x}"'
+    headers = {
+        'ETag': etag,
+        'Last-Modified': http_date(stat.st_mtime),
+        'Cache-Control': cache_control,
+        'Accept-Ranges': 'bytes',
+    }
+    if content_type is None:
+        content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None and accel:
+        response = HttpResponse(content_type=content_type)
+        response[accel[0]] = accel[1]
+    elif response is None:
+        byte_range = _byte_range(request, stat.st_size, etag, stat.st_mtime)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{stat.st_size}'
+        elif byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(_read_range(full_path, start, end - start + 1), status=206,
+                                             content_type=content_type)
+            response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+            response['Content-Length'] = str(end - start + 1)
+        else:
+            response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+    if encoding and response.status_code in (200, 206):
+        response['Content-Encoding'] = encoding
+    for header, value in headers.items():
+        response.headers.setdefault(header, value)
+    return response
+
+
+def serve_media(request, path):
+    """
+    Wydaje plik z MEDIA_ROOT (file_response).
+
+    Cache-Control: MEDIA_HASHED_MAX_AGE z 'immutable' dla nazw z sumą kontrolną, MEDIA_CACHE_MAX_AGE dla pozostałych.
+    MEDIA_ACCEL = 'nginx': nagłówek X-Accel-Redirect (MEDIA_ACCEL_PREFIX + ścieżka), MEDIA_ACCEL = 'sendfile':
+    nagłówek X-Sendfile z pełną ścieżką pliku; bez MEDIA_ACCEL plik wysyła Django.
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+        path (str): Ścieżka pliku względem MEDIA_ROOT.
+
+    Returns:
+        HttpResponse: Odpowiedź z plikiem, 206, 304 lub 416.
+
+    Raises:
+        Http404: Gdy plik nie istnieje lub ścieżka wychodzi poza MEDIA_ROOT.
+    """
+    full_path = resolve_file(settings.MEDIA_ROOT, path)
+    accel = None
+    if settings.MEDIA_ACCEL == 'nginx':
+        accel = ('X-Accel-Redirect', settings.MEDIA_ACCEL_PREFIX + quote(path))
+    elif settings.MEDIA_ACCEL:
+        accel = ('X-Sendfile', full_path)
+    return file_response(request, full_path,
+                         cache_control(path, settings.MEDIA_CACHE_MAX_AGE, settings.MEDIA_HASHED_MAX_AGE),
+                         accel=accel)
+
+
+def media_urlpatterns():
+    """
+    Zwraca trasę URL widoku serve_media dla MEDIA_URL (pustą listę, gdy MEDIA_URL wskazuje inny serwer).
+    """
+    if not settings.MEDIA_URL or urlsplit(settings.MEDIA_URL).netloc:
+        return []
+    prefix = re.escape(settings.MEDIA_URL.lstrip('/'))
+    return [re_path(rf'^{prefix}(?P<path>.*)$', serve_media)]
@@ -0,0 +1,144 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.db.models.signals import post_save, post_delete
+from django.utils.translation import get_language
+
+"""
+Importy:
+- import hashlib: Importuje funkcje skrótu, używane do budowy krótkich kluczy z adresu URL.
+- import time: Importuje moduł time, używany do generowania numerów wersji grup stron.
+- from functools import wraps: Importuje dekorator zachowujący nazwę i dokumentację dekorowanego widoku.
+- from django.conf import settings: Importuje ustawienia projektu (alias i czas przechowywania pamięci podręcznej).
+- from django.contrib.messages import get_messages: Importuje dostęp do komunikatów, aby nie zapisywać stron,
+  które je wyświetlają.
+- from django.core.cache import caches: Importuje dostęp do skonfigurowanych pamięci podręcznych Django.
+- from django.db.models.signals import post_save, post_delete: Importuje sygnały, na podstawie których unieważniane
+  są zapamiętane strony.
+- from django.utils.translation import get_language: Importuje funkcję zwracającą aktywny język
+  (ustawiony przez LocaleMiddleware).
+
+Moduł zawiera pamięć podręczną pełnych stron dla anonimowych użytkowników:
+- cache_anonymous_page: dekorator widoku zapisujący wyrenderowaną odpowiedź pod kluczem z adresu URL,
+  parametrów zapytania i aktywnego języka.
+- invalidate_pages / track_model: unieważnianie grup stron (np. 'jobs', 'job:15') po zmianie danych.
+"""
+
+# Nagłówek informujący, czy odpowiedź pochodzi z pamięci podręcznej stron
+CACHE_HEADER = 'X-Page-Cache'
+
+
+def _cache():
+    return caches[settings.PAGE_CACHE_ALIAS]
+
+
+def _version_key(group):
+    return f'pages:version:{group}'
+
+
+def invalidate_pages(*groups):
+    """
+    Unieważnia wszystkie zapamiętane strony należące do podanych grup.
+
+    Args:
+        *groups (str): Nazwy grup, np. 'jobs' lub 'job:15'.
+    """
+    _cache().set_many({_version_key(group): time.time_ns() for group in groups}, None)
+
+
+def page_cache_key(request, groups):
+    """
+    Buduje klucz strony z grup (wraz z ich bieżącymi wersjami), hosta, pełnej ścieżki z parametrami zapytania
+    oraz aktywnego języka.
+    """
+    cache = _cache()
+    keys = [_version_key(group) for group in groups]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    version = '.'.join(str(versions[key]) for key in keys)
+    url = hashlib.md5(f'{request.get_host()}{request.get_full_path()}'.encode('utf-8')).hexdigest()
+    return f'pages:{version}:{get_language()}:{url}'
+
+
+def _is_cacheable_request(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    if request.user.is_authenticated:
+        return False
+    # Strony z komunikatami (np. po wylogowaniu) są jednorazowe
+    return not len(get_messages(request))
+
+
+def _is_cacheable_response(request, response):
+    # Odpowiedzi ustawiające ciasteczka lub zawierające token CSRF są indywidualne dla odwiedzającego
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')
+    )
+
+
+def cache_anonymous_page(*groups, timeout=None):
+    """
+    Dekorator widoku zapisujący wyrenderowane strony dla anonimowych użytkowników.
+
+    Klucz strony obejmuje adres URL z parametrami zapytania i aktywny język z LocaleMiddleware, więc każda wersja
+    językowa jest przechowywana osobno. Zalogowani użytkownicy zawsze otrzymują świeżo wyrenderowaną stronę.
+    Grupy mogą zawierać argumenty widoku, np. 'job:{job_id}', aby unieważniać pojedyncze strony.
+
+    Args:
+        *groups (str): Grupy stron, do których należy widok.
+        timeout (int): Czas przechowywania strony w sekundach (domyślnie PAGE_CACHE_TIMEOUT).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            key = page_cache_key(request, [group.format(**kwargs) for group in groups])
+            cache = _cache()
+            response = cache.get(key)
+            if response is not None:
+                response[CACHE_HEADER] = 'HIT'
+                return response
+
+            response = view_func(request, *args, **kwargs)
+
+            def store(response):
+                if _is_cacheable_response(request, response):
+                    cache.set(key, response, settings.PAGE_CACHE_TIMEOUT if timeout is None else timeout)
+                response[CACHE_HEADER] = 'MISS'
+
+            if hasattr(response, 'render') and callable(response.render) and not response.is_rendered:
+                response.add_post_render_callback(store)
+            else:
+                store(response)
+            return response
+        return wrapper
+    return decorator
+
+
+def track_model(model, *groups):
+    """
+    Podłącza unieważnianie grup stron do sygnałów post_save i post_delete modelu.
+    Grupy mogą odwoływać się do zapisanego obiektu, np. 'job:{instance.pk}'.
+
+    Args:
+        model (Model): Klasa modelu.
+        *groups (str): Grupy stron zależne od modelu.
+    """
+    def on_change(sender, instance, **kwargs):
+        invalidate_pages(*[group.format(instance=instance) for group in groups])
+
+    uid = f'pages_{model._meta.label_lower}'
+    post_save.connect(on_change, sender=model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(on_change, sender=model, weak=False, dispatch_uid=f'{uid}_delete')
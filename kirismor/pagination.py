@@ -0,0 +1,444 @@
+import base64
+import binascii
+import json
+
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.html import escape
+from django.utils.http import urlencode
+from kirismor.counting import count_rows
+
+"""
+Importy:
+- import base64, binascii: Importują funkcje kodowania base64 używane do budowy nieprzezroczystych kursorów.
+- import json: Importuje moduł json, używany do serializacji pozycji kursora.
+- from django.core.paginator import Paginator: Importuje paginator Django, rozszerzany przez CountedPaginator.
+- from django.db.models import Q: Importuje klasę Q do budowy warunków stronicowania po kluczu (keyset).
+- from django.utils.functional import cached_property: Importuje dekorator zapamiętujący wynik liczenia wierszy.
+- from django.utils.html import escape: Importuje funkcję escape, zabezpieczającą generowany HTML.
+- from django.utils.http import urlencode: Importuje funkcję budującą bezpieczne parametry zapytania URL.
+- from kirismor.counting import count_rows: Importuje funkcję zwracającą licznik wierszy z pamięci podręcznej lub szacunek.
+
+Moduł zawiera wspólną implementację paginacji dla widoków list:
+- CursorPaginator / CursorPage: paginacja kursorowa (keyset) bez COUNT(*) i OFFSET, włączana parametrem ?cursor=.
+- CountedPaginator: paginacja numerowana z licznikiem wierszy z pamięci podręcznej lub szacunkiem (kirismor.counting).
+- generate_pagination_html: generowanie linków paginacji (numerowanej i kursorowej) dla odpowiedzi JSON.
+- PaginationMixin: mixin dla widoków ListView łączący oba mechanizmy.
+"""
+
+# Nazwa parametru URL z kursorem. Jego obecność (również pusta wartość) włącza tryb kursorowy.
+CURSOR_PARAM = 'cursor'
+
+# Znaczniki kierunku zapisane w kursorze
+NEXT = 'n'
+PREVIOUS = 'p'
+
+# Style znaczników HTML paginacji używane w aplikacji
+LIST_STYLE = {
+    'previous': '<li class="page-item"><a class="page-link" href="{url}">{label}</a></li>',
+    'page': '<li class="page-item"><a class="page-link" href="{url}">{label}</a></li>',
+    'current': '<li class="page-item active"><span class="page-link">{label}</span></li>',
+    'next': '<li class="page-item"><a class="page-link" href="{url}">{label}</a></li>',
+}
+
+BUTTON_STYLE = {
+    'previous': '<a class="btn btn-secondary pagination-link" href="{url}">{label}</a>',
+    'page': '<a class="pagination-link" href="{url}">{label}</a>',
+    'current': '<a class="pagination-link" href="{url}">{label}</a>',
+    'next': '<a class="btn btn-secondary ms-auto pagination-link" href="{url}">{label}</a>',
+}
+
+
+class InvalidCursor(ValueError):
+    """
+    Wyjątek zgłaszany, gdy kursor nie może zostać zdekodowany.
+    """
+
+
+def encode_cursor(direction, values):
+    """
+    Koduje pozycję w zestawie danych jako nieprzezroczysty token.
+
+    Args:
+        direction (str): Kierunek przeglądania (NEXT lub PREVIOUS).
+        values (list): Wartości kolumn sortowania wiersza granicznego.
+
+    Returns:
+        str: Token kursora bezpieczny do użycia w URL.
+    """
+    payload = json.dumps([direction, values], separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Dekoduje token kursora.
+
+    Args:
+        token (str): Token kursora z parametru URL.
+
+    Returns:
+        tuple: Kierunek oraz lista wartości kolumn sortowania.
+
+    Raises:
+        InvalidCursor: Jeśli token jest uszkodzony.
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, ValueError, TypeError, UnicodeError):
+        raise InvalidCursor(token)
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise InvalidCursor(token)
+    return direction, values
+
+
+class CursorPage:
+    """
+    Strona wyników paginacji kursorowej.
+
+    Atrybuty:
+        object_list (list): Obiekty na bieżącej stronie.
+        next_cursor (str): Kursor następnej strony lub None.
+        previous_cursor (str): Kursor poprzedniej strony lub None.
+        next_url (str): Adres następnej strony (ustawiany przez attach_cursor_urls).
+        previous_url (str): Adres poprzedniej strony (ustawiany przez attach_cursor_urls).
+    """
+    is_cursor = True
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.next_url = None
+        self.previous_url = None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginator kursorowy (keyset). Zamiast OFFSET filtruje wiersze za ostatnim elementem poprzedniej strony
+    według kolumn sortowania, a zamiast COUNT(*) pobiera jeden dodatkowy wiersz, aby sprawdzić, czy istnieje
+    następna strona. Koszt każdej strony jest stały, niezależnie od jej głębokości.
+
+    Args:
+        object_list (QuerySet): Zestaw danych do podziału na strony.
+        per_page (int): Liczba elementów na stronę.
+        ordering (tuple): Kolumny sortowania modelu, np. ('-created_at', '-id'). Ostatnia kolumna musi być
+            unikalna, aby kolejność była jednoznaczna.
+    """
+
+    def __init__(self, object_list, per_page, ordering):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [name.lstrip('-') for name in self.ordering]
+
+    def _position(self, obj):
+        # Wiersze projekcji (kirismor.projection) są słownikami
+        if isinstance(obj, dict):
+            return [obj[field] for field in self.fields]
+        return [getattr(obj, field) for field in self.fields]
+
+    def _parse_values(self, values):
+        if len(values) != len(self.fields):
+            raise InvalidCursor(values)
+        opts = self.object_list.model._meta
+        try:
+            return [opts.get_field(field).to_python(value) for field, value in zip(self.fields, values)]
+        except Exception:
+            raise InvalidCursor(values)
+
+    def _keyset_filter(self, values, forward):
+        """
+        Buduje warunek (a < x) OR (a = x AND b < y) ... dla wierszy leżących za pozycją kursora.
+        """
+        condition = Q()
+        for index, name in enumerate(self.ordering):
+            descending = name.startswith('-')
+            lookup = 'lt' if descending == forward else 'gt'
+            step = Q(**{f'{self.fields[index]}__{lookup}': values[index]})
+            for previous in range(index):
+                step &= Q(**{self.fields[previous]: values[previous]})
+            condition |= step
+        return condition
+
+    def page(self, cursor=None):
+        """
+        Zwraca stronę wyników dla podanego kursora. Pusty lub uszkodzony kursor oznacza pierwszą stronę.
+
+        Args:
+            cursor (str): Token kursora z parametru URL.
+
+        Returns:
+            CursorPage: Strona wyników.
+        """
+        direction, values = NEXT, None
+        if cursor:
+            try:
+                direction, raw_values = decode_cursor(cursor)
+                values = self._parse_values(raw_values)
+            except InvalidCursor:
+                direction, values = NEXT, None
+
+        forward = direction == NEXT
+        queryset = self.object_list
+        if values is not None:
+            queryset = queryset.filter(self._keyset_filter(values, forward))
+        if forward:
+            queryset = queryset.order_by(*self.ordering)
+        else:
+            queryset = queryset.order_by(*[name[1:] if name.startswith('-') else f'-{name}'
+                                           for name in self.ordering])
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not forward:
+            if not rows:
+                # Przed pozycją kursora nie ma już wierszy (np. zostały usunięte) - wracamy do pierwszej strony
+                return self.page()
+            rows.reverse()
+
+        # Idąc do przodu, dodatkowy wiersz oznacza następną stronę; idąc wstecz - poprzednią
+        has_next = has_more if forward else True
+        has_previous = values is not None if forward else has_more
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(NEXT, self._position(rows[-1]))
+        if rows and has_previous:
+            previous_cursor = encode_cursor(PREVIOUS, self._position(rows[0]))
+        return CursorPage(rows, self, next_cursor, previous_cursor)
+
+
+class CountedPaginator(Paginator):
+    """
+    Paginator numerowany, który zamiast wykonywać COUNT(*) przy każdym żądaniu korzysta z kirismor.counting:
+    licznik jest zapamiętywany w pamięci podręcznej, a dla bardzo dużych zestawów danych zastępowany szacunkiem
+    planisty bazy danych.
+
+    Args:
+        object_list (QuerySet): Zestaw danych do podziału na strony.
+        per_page (int): Liczba elementów na stronę.
+        count_key (str): Nazwa licznika w pamięci podręcznej (np. nazwa widoku).
+        count_models (tuple): Modele, których zmiany unieważniają licznik (domyślnie model zestawu danych).
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, count_key=None,
+                 count_models=None, **kwargs):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page, **kwargs)
+        self.count_key = count_key
+        self.count_models = count_models
+
+    @cached_property
+    def _counted(self):
+        return count_rows(self.object_list, self.count_key, self.count_models)
+
+    @cached_property
+    def count(self):
+        return self._counted[0]
+
+    @property
+    def count_is_exact(self):
+        """
+        Informuje, czy liczba wierszy jest dokładna (False oznacza szacunek planisty).
+        """
+        return self._counted[1]
+
+
+def is_cursor_request(request):
+    """
+    Sprawdza, czy żądanie używa paginacji kursorowej (parametr ?cursor=, również pusty).
+    """
+    return CURSOR_PARAM in request.GET
+
+
+def cursor_url(request, cursor):
+    """
+    Buduje adres strony dla podanego kursora, zachowując pozostałe parametry zapytania.
+    """
+    params = request.GET.copy()
+    params.pop('page', None)
+    params[CURSOR_PARAM] = cursor
+    return '?' + params.urlencode()
+
+
+def attach_cursor_urls(page, request):
+    """
+    Ustawia adresy następnej i poprzedniej strony na obiekcie CursorPage (używane w szablonach).
+    """
+    if page.has_next():
+        page.next_url = cursor_url(request, page.next_cursor)
+    if page.has_previous():
+        page.previous_url = cursor_url(request, page.previous_cursor)
+    return page
+
+
+def cursor_json(page_obj):
+    """
+    Zwraca kursory następnej i poprzedniej strony do dołączenia do odpowiedzi JSON (pusty słownik dla stron
+    numerowanych).
+    """
+    if not getattr(page_obj, 'is_cursor', False):
+        return {}
+    return {'next_cursor': page_obj.next_cursor, 'previous_cursor': page_obj.previous_cursor}
+
+
+def count_json(page_obj):
+    """
+    Zwraca liczbę wierszy i informację, czy jest dokładna, do dołączenia do odpowiedzi JSON (pusty słownik dla
+    stron kursorowych, które nie liczą wierszy).
+    """
+    if getattr(page_obj, 'is_cursor', False):
+        return {}
+    paginator = page_obj.paginator
+    return {'count': paginator.count, 'count_is_exact': getattr(paginator, 'count_is_exact', True)}
+
+
+def generate_pagination_html(page_obj, params=None, page_range=None, style=LIST_STYLE,
+                             previous_label='Previous', next_label='Next'):
+    """
+    Generuje HTML linków paginacji dla odpowiedzi JSON/AJAX.
+
+    Dla stron numerowanych tworzy linki do poprzedniej, kolejnych i następnej strony; dla stron kursorowych
+    tylko linki do poprzedniej i następnej strony (bez liczenia wszystkich wierszy).
+
+    Args:
+        page_obj (Page | CursorPage): Bieżąca strona.
+        params (dict): Dodatkowe parametry zachowywane w linkach (np. zapytanie wyszukiwania).
+        page_range (iterable): Numery stron do wyświetlenia (domyślnie wszystkie strony paginatora).
+        style (dict): Szablony znaczników (LIST_STYLE lub BUTTON_STYLE).
+        previous_label (str): Etykieta linku do poprzedniej strony.
+        next_label (str): Etykieta linku do następnej strony.
+
+    Returns:
+        str: HTML zawierający linki do paginacji.
+    """
+    params = {key: value for key, value in (params or {}).items() if value}
+
+    def url(**extra):
+        return escape('?' + urlencode({**params, **extra}))
+
+    html = ''
+    if getattr(page_obj, 'is_cursor', False):
+        if page_obj.has_previous():
+            html += style['previous'].format(url=url(cursor=page_obj.previous_cursor), label=previous_label)
+        if page_obj.has_next():
+            html += style['next'].format(url=url(cursor=page_obj.next_cursor), label=next_label)
+        return html
+
+    if page_range is None:
+        page_range = page_obj.paginator.page_range
+    if page_obj.has_previous():
+        html += style['previous'].format(url=url(page=page_obj.previous_page_number()), label=previous_label)
+    for num in page_range:
+        key = 'current' if num == page_obj.number else 'page'
+        html += style[key].format(url=url(page=num), label=num)
+    if page_obj.has_next():
+        html += style['next'].format(url=url(page=page_obj.next_page_number()), label=next_label)
+    return html
+
+
+def page_window(page_obj, range_size=2):
+    """
+    Zwraca zakres numerów stron wokół bieżącej strony (pusty dla stron kursorowych).
+    """
+    if getattr(page_obj, 'is_cursor', False):
+        return range(0)
+    start_page = max(1, page_obj.number - range_size)
+    end_page = min(page_obj.paginator.num_pages, page_obj.number + range_size)
+    return range(start_page, end_page + 1)
+
+
+class PaginationMixin:
+    """
+    Mixin paginacji dla widoków ListView.
+
+    - Generuje HTML linków paginacji dla odpowiedzi AJAX (generate_pagination_html).
+    - Jeśli widok ustawia `cursor_ordering`, obsługuje opcjonalny tryb kursorowy włączany parametrem ?cursor=.
+      Niepusty parametr z `numbered_only_params` (np. wyszukiwanie sortowane według trafności, której kursor nie
+      koduje) przełącza żądanie na paginację numerowaną.
+    - Jeśli widok ustawia `count_key`, paginacja numerowana korzysta z licznika w pamięci podręcznej (CountedPaginator).
+    - Jeśli widok ustawia `projection`, żądanie JSON (is_json_request) pobiera tylko kolumny projekcji
+      (kirismor.projection), a strona wyników zawiera słowniki zamiast obiektów modelu.
+
+    Atrybuty:
+        cursor_ordering (tuple): Kolumny sortowania dla trybu kursorowego lub None (tryb wyłączony).
+        numbered_only_params (tuple): Parametry zapytania, które wyłączają tryb kursorowy.
+        count_key (str): Nazwa licznika w pamięci podręcznej lub None (dokładny COUNT(*) przy każdym żądaniu).
+        pagination_style (dict): Szablony znaczników linków paginacji.
+        pagination_params (tuple): Parametry zapytania zachowywane w linkach paginacji.
+        projection (Projection): Kolumny odpowiedzi JSON lub None (strona zawiera obiekty modelu).
+    """
+    cursor_ordering = None
+    numbered_only_params = ()
+    count_key = None
+    pagination_style = BUTTON_STYLE
+    pagination_params = ()
+    projection = None
+
+    def is_json_request(self):
+        """
+        Zwraca True, jeśli żądanie oczekuje odpowiedzi JSON (parametr ?json=true).
+        """
+        return self.request.GET.get('json', '').lower() == 'true'
+
+    def get_cursor_ordering(self):
+        """
+        Zwraca klucz sortowania trybu kursorowego lub None, jeśli żądanie używa paginacji numerowanej.
+        """
+        if not is_cursor_request(self.request):
+            return None
+        if any(self.request.GET.get(param, '').strip() for param in self.numbered_only_params):
+            return None
+        return self.cursor_ordering
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        if self.count_key:
+            return CountedPaginator(queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page,
+                                    count_key=self.count_key, **kwargs)
+        return super().get_paginator(queryset, per_page, orphans, allow_empty_first_page, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor_ordering = self.get_cursor_ordering()
+        if self.projection is not None and self.is_json_request():
+            queryset = self.projection.project(queryset, *[name.lstrip('-') for name in cursor_ordering or ()])
+        if cursor_ordering:
+            paginator = CursorPaginator(queryset, page_size, cursor_ordering)
+            page = attach_cursor_urls(paginator.page(self.request.GET.get(CURSOR_PARAM)), self.request)
+            return paginator, page, page.object_list, page.has_other_pages()
+        return super().paginate_queryset(queryset, page_size)
+
+    def generate_pagination_html(self, page_obj, page_range=None):
+        """
+        Generuje HTML dla linków paginacji, zachowując parametry wymienione w `pagination_params`.
+
+        Args:
+            page_obj (Page | CursorPage): Obiekt strony zawierający informacje o bieżącej stronie.
+            page_range (iterable): Numery stron do wyświetlenia (domyślnie wszystkie).
+
+        Returns:
+            str: HTML zawierający linki do paginacji.
+        """
+        params = {name: self.request.GET.get(name, '') for name in self.pagination_params}
+        return generate_pagination_html(page_obj, params, page_range, self.pagination_style)
@@ -0,0 +1,164 @@
+import json
+
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.utils.encoding import force_str
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+"""
+Importy:
+- import json: Importuje moduł json, używany do kodowania odpowiedzi, gdy biblioteka orjson nie jest zainstalowana.
+- from django.core.files.storage import default_storage: Importuje magazyn plików, używany do budowy adresów URL
+  zdjęć zapisanych w kolumnach ImageField.
+- from django.core.serializers.json import DjangoJSONEncoder: Importuje koder JSON Django, obsługujący typy
+  Decimal, daty i teksty tłumaczone leniwie.
+- from django.http import HttpResponse: Importuje klasę odpowiedzi HTTP, zwracaną z gotową treścią JSON.
+- from django.utils.encoding import force_str: Importuje funkcję zamieniającą teksty tłumaczone leniwie na str.
+- import orjson (opcjonalnie): Importuje szybki koder JSON; bez niego używany jest moduł json.
+
+Moduł zawiera deklaratywne projekcje wierszy dla odpowiedzi JSON widoków list (AJAX):
+- Column: kolumna odpowiedzi - nazwa pola (lub pól) w zapytaniu .values() i opcjonalne przekształcenie wartości.
+- Projection: zestaw kolumn modelu; pobiera z bazy danych tylko potrzebne kolumny (.values()) i buduje wiersze
+  odpowiedzi bez tworzenia obiektów modeli.
+- truncate, date_format, file_url: przekształcenia wartości kolumn.
+- dumps, json_response: jednokrotne kodowanie odpowiedzi (orjson, jeśli jest zainstalowany).
+"""
+
+# Opcje orjson: daty są kodowane przez DjangoJSONEncoder, aby odpowiedź nie zależała od użytego kodera
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def dumps(data):
+    """
+    Koduje dane do JSON (bajty UTF-8). Typy spoza JSON (Decimal, daty, teksty tłumaczone leniwie) są kodowane
+    tak jak w JsonResponse.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_django_encoder.default, option=ORJSON_OPTIONS)
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(data, **kwargs):
+    """
+    Zwraca odpowiedź HTTP z danymi zakodowanymi jednokrotnie przez dumps().
+    """
+    kwargs.setdefault('content_type', 'application/json')
+    return HttpResponse(dumps(data), **kwargs)
+
+
+def truncate(length):
+    """
+    Przekształcenie skracające tekst do `length` znaków.
+    """
+    return lambda value: value[:length] if value else value
+
+
+def date_format(format_string):
+    """
+    Przekształcenie formatujące datę (lub datę i godzinę) według `format_string`.
+    """
+    return lambda value: value.strftime(format_string) if value else ''
+
+
+def file_url(value):
+    """
+    Przekształcenie zamieniające nazwę pliku (kolumna FileField/ImageField) na jego adres URL.
+    """
+    return default_storage.url(value) if value else None
+
+
+class Column:
+    """
+    Kolumna odpowiedzi JSON.
+
+    Args:
+        source (str | tuple): Nazwa pola w zapytaniu .values() (również przez relacje, np. 'job__title')
+            lub krotka nazw pól przekazywanych razem do przekształcenia. Domyślnie nazwa kolumny.
+        transform (callable): Funkcja przekształcająca wartość (lub wartości) pól.
+        display (bool): Czy zamiast wartości pola zwracać jej etykietę z `choices` (jak get_FOO_display).
+    """
+
+    def __init__(self, source=None, transform=None, display=False):
+        self.source = source
+        self.transform = transform
+        self.display = display
+
+
+class Projection:
+    """
+    Deklaratywna projekcja modelu dla odpowiedzi JSON.
+
+    Kolumny są podawane jako argumenty nazwane: nazwa klucza w odpowiedzi i nazwa pola (str) lub Column, np.:
+
+        Projection(Task, id='id', title='title', status=Column(display=True),
+                   due_date=Column(transform=date_format('%d %b %Y')))
+
+    Args:
+        model (Model): Model, którego dotyczy projekcja.
+        **columns: Kolumny odpowiedzi.
+    """
+
+    def __init__(self, model, **columns):
+        self.model = model
+        self.columns = []
+        for name, column in columns.items():
+            if not isinstance(column, Column):
+                column = Column(column)
+            sources = column.source or name
+            sources = (sources,) if isinstance(sources, str) else tuple(sources)
+            transform = column.transform
+            if column.display:
+                choices = {value: force_str(label) for value, label in self._field(sources[0]).flatchoices}
+                transform = self._display(choices, transform)
+            self.columns.append((name, sources, transform))
+        self.fields = list(dict.fromkeys(source for _, sources, _ in self.columns for source in sources))
+
+    def _field(self, path):
+        model = self.model
+        *relations, name = path.split('__')
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    @staticmethod
+    def _display(choices, transform):
+        def display(value):
+            label = choices.get(value, value)
+            return transform(label) if transform else label
+        return display
+
+    def project(self, queryset, *extra_fields):
+        """
+        Ogranicza zapytanie do kolumn projekcji (QuerySet.values()).
+
+        Args:
+            queryset (QuerySet): Zestaw danych modelu projekcji (filtry, sortowanie i adnotacje są zachowane).
+            *extra_fields: Dodatkowe pola potrzebne poza odpowiedzią (np. kolumny sortowania paginacji kursorowej).
+
+        Returns:
+            QuerySet: Zestaw danych zwracający słowniki.
+        """
+        return queryset.values(*dict.fromkeys([*self.fields, *extra_fields]))
+
+    def row(self, values):
+        """
+        Buduje wiersz odpowiedzi ze słownika zwróconego przez zapytanie z project().
+        """
+        row = {}
+        for name, sources, transform in self.columns:
+            arguments = [values[source] for source in sources]
+            row[name] = transform(*arguments) if transform else arguments[0]
+        return row
+
+    def rows(self, values_list):
+        """
+        Buduje wiersze odpowiedzi dla strony wyników.
+        """
+        return [self.row(values) for values in values_list]
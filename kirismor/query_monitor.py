@@ -0,0 +1,188 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+"""
+Importy:
+- import json: Importuje moduł json, używany do zapisu strukturalnej linii logu.
+- import logging: Importuje moduł logowania (logger 'kirismor.queries').
+- import re: Importuje wyrażenia regularne, używane do normalizacji zapytań SQL (odcisków).
+- import time: Importuje licznik czasu perf_counter, używany do pomiaru czasu zapytań.
+- from collections import Counter: Importuje licznik wystąpień, używany do wykrywania powtarzających się zapytań.
+- from contextlib import ExitStack, contextmanager: Importuje narzędzia do podłączenia rejestratora do wszystkich
+  połączeń z bazą danych naraz.
+- from django.conf import settings: Importuje ustawienia projektu (włączenie monitora i limity zapytań).
+- from django.core.exceptions import MiddlewareNotUsed: Importuje wyjątek wyłączający middleware przy starcie.
+- from django.db import connections: Importuje połączenia z bazami danych, do których podłączany jest rejestrator.
+
+Moduł zawiera pomiar zapytań SQL wykonywanych podczas obsługi żądania:
+- QueryRecorder / record_queries: rejestrator podłączany przez connection.execute_wrapper do wszystkich połączeń.
+- QueryMonitorMiddleware: middleware (włączane ustawieniem QUERY_MONITOR_ENABLED) zapisujące liczbę zapytań,
+  łączny czas SQL, powtórzone zapytania i podejrzenia N+1, dodające nagłówek Server-Timing i linię logu oraz
+  sprawdzające limit zapytań widoku (QUERY_BUDGETS).
+"""
+
+logger = logging.getLogger('kirismor.queries')
+
+# Domyślna liczba wykonań tego samego zapytania (z różnymi parametrami), od której zgłaszane jest podejrzenie N+1
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*%s\s*,?)+\)', re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+\b')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    Widok wykonał więcej zapytań SQL, niż pozwala jego limit (QUERY_BUDGETS).
+    """
+
+
+def fingerprint(sql):
+    """
+    Zwraca znormalizowaną postać zapytania: literały i listy IN są zastępowane symbolami zastępczymi,
+    więc to samo zapytanie z różnymi parametrami ma ten sam odcisk.
+    """
+    sql = _IN_LIST.sub('IN (...)', sql)
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+class QueryRecorder:
+    """
+    Rejestrator zapytań SQL podłączany przez connection.execute_wrapper.
+
+    Attributes:
+        queries (list): Lista krotek (alias bazy, zapytanie SQL, parametry, czas w sekundach).
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def wrapper(self, alias):
+        def execute(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                self.queries.append((alias, sql, params, time.perf_counter() - start))
+        return execute
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    @property
+    def duration(self):
+        """
+        Łączny czas zapytań w milisekundach.
+        """
+        return sum(query[3] for query in self.queries) * 1000
+
+    def duplicates(self):
+        """
+        Zwraca zapytania wykonane więcej niż raz z tymi samymi parametrami.
+
+        Returns:
+            dict: Słownik {odcisk zapytania: liczba wykonań}.
+        """
+        counts = Counter((sql, repr(params)) for _, sql, params, _ in self.queries)
+        return {fingerprint(sql): count for (sql, _), count in counts.items() if count > 1}
+
+    def n_plus_one(self, threshold=None):
+        """
+        Zwraca zapytania wykonane co najmniej `threshold` razy z różnymi parametrami (typowy wzorzec N+1:
+        leniwe ładowanie relacji w pętli).
+
+        Returns:
+            dict: Słownik {odcisk zapytania: liczba wykonań}.
+        """
+        threshold = threshold or getattr(settings, 'QUERY_MONITOR_N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)
+        counts = Counter(fingerprint(sql) for _, sql, _, _ in self.queries)
+        return {sql: count for sql, count in counts.items() if count >= threshold}
+
+
+@contextmanager
+def record_queries():
+    """
+    Rejestruje zapytania SQL wykonywane we wszystkich połączeniach z bazami danych.
+
+    Użycie:
+        with record_queries() as recorder:
+            ...
+        recorder.count
+    """
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder.wrapper(connection.alias)))
+        yield recorder
+
+
+def query_budget(request):
+    """
+    Zwraca limit zapytań dla widoku obsługującego żądanie: QUERY_BUDGETS[nazwa widoku] lub QUERY_BUDGET_DEFAULT.
+    """
+    match = request.resolver_match
+    budgets = getattr(settings, 'QUERY_BUDGETS', {})
+    if match is not None and match.view_name in budgets:
+        return budgets[match.view_name]
+    return getattr(settings, 'QUERY_BUDGET_DEFAULT', None)
+
+
+class QueryMonitorMiddleware:
+    """
+    Middleware mierzące zapytania SQL każdego żądania.
+
+    - Dodaje nagłówek Server-Timing (liczba zapytań i łączny czas SQL), widoczny w narzędziach przeglądarki.
+    - Zapisuje strukturalną linię logu (JSON) w loggerze 'kirismor.queries'; powtórzone zapytania, podejrzenia N+1
+      i przekroczenie limitu są logowane z poziomem WARNING.
+    - Przy QUERY_MONITOR_RAISE = True przekroczenie limitu zgłasza QueryBudgetExceeded (w testach).
+
+    Gdy QUERY_MONITOR_ENABLED jest wyłączone, middleware jest pomijane przy starcie, więc nie ma kosztu.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'QUERY_MONITOR_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_queries() as recorder:
+            response = self.get_response(request)
+
+        budget = query_budget(request)
+        duplicates = recorder.duplicates()
+        n_plus_one = recorder.n_plus_one()
+        over_budget = budget is not None and recorder.count > budget
+
+        response['Server-Timing'] = f'sql;dur={recorder.duration:.1f};desc="{recorder.count} queries"'
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': request.resolver_match.view_name if request.resolver_match else None,
+            'status': response.status_code,
+            'queries': recorder.count,
+            'sql_ms': round(recorder.duration, 1),
+            'budget': budget,
+            'duplicates': duplicates,
+            'n_plus_one': n_plus_one,
+        }
+        level = logging.WARNING if over_budget or duplicates or n_plus_one else logging.INFO
+        logger.log(level, json.dumps(record, ensure_ascii=False))
+
+        if over_budget and getattr(settings, 'QUERY_MONITOR_RAISE', False):
+            raise QueryBudgetExceeded(
+                f'{record["view"]}: {recorder.count} zapytań SQL przy limicie {budget}. '
+                f'Podejrzenia N+1: {n_plus_one}'
+            )
+        return response
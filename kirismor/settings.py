@@ -1,4 +1,7 @@
 import os
+import tempfile
+import django
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import gettext_lazy as _
 from pathlib import Path
 from dotenv import load_dotenv
@@ -34,7 +37,9 @@ INSTALLED_APPS = [
 
 # Middleware używane przez aplikację
 MIDDLEWARE = [
+    'kirismor.query_monitor.QueryMonitorMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'kirismor.db_router.ReplicaRouterMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -48,12 +53,21 @@ MIDDLEWARE = [
 ROOT_URLCONF = 'kirismor.urls'
 
 # Konfiguracja szablonów
+# - TEMPLATE_LOADERS: źródła szablonów (katalog templates/ i katalogi templates aplikacji). Poza trybem DEBUG są
+#   opakowane w cached.Loader, który kompiluje każdy szablon raz na proces serwera.
+# - TEMPLATE_WARMUP: kompilacja wszystkich szablonów z katalogu templates/ przy starcie procesu WSGI
+#   (kirismor.template_cache.warm_templates), aby pierwsze żądanie po wdrożeniu nie kompilowało szablonów.
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', str(not DEBUG)) == 'True'
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
+            'loaders': TEMPLATE_LOADERS if DEBUG else [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -61,6 +75,9 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'django.template.context_processors.i18n',
             ],
+            'libraries': {
+                'assets': 'kirismor.templatetags.assets',
+            },
         },
     },
 ]
@@ -69,6 +86,17 @@ TEMPLATES = [
 WSGI_APPLICATION = 'kirismor.wsgi.application'
 
 # Konfiguracja bazy danych
+# - DATABASE_CONN_MAX_AGE: czas (sekundy) utrzymywania połączenia między żądaniami; 0 zamyka je po każdym żądaniu,
+#   a 'None' utrzymuje bez limitu. DATABASE_CONN_HEALTH_CHECKS sprawdza połączenie przed ponownym użyciem,
+#   więc zerwane połączenie (np. po restarcie PostgreSQL) jest otwierane na nowo zamiast zwracać błąd.
+# - DATABASE_POOL = True: pula połączeń w procesie (serwery wielowątkowe / ASGI). Wymaga Django >= 5.1 i psycopg 3
+#   z psycopg_pool; wyklucza CONN_MAX_AGE (połączenia zwracane są do puli po każdym żądaniu).
+# - DATABASE_PGBOUNCER = True: połączenie przez pgbouncer w trybie transakcyjnym. Kursory po stronie serwera
+#   (QuerySet.iterator()) nie przetrwają między transakcjami, więc są wyłączone.
+DATABASE_CONN_MAX_AGE = os.getenv('DATABASE_CONN_MAX_AGE', '60')
+DATABASE_POOL = os.getenv('DATABASE_POOL') == 'True'
+DATABASE_PGBOUNCER = os.getenv('DATABASE_PGBOUNCER') == 'True'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -76,10 +104,49 @@ DATABASES = {
         'USER': os.getenv('DATABASE_USER'),
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('DATABASE_HOST'),
-        'PORT': '',
+        'PORT': os.getenv('DATABASE_PORT', ''),
+        'CONN_MAX_AGE': None if DATABASE_CONN_MAX_AGE == 'None' else int(DATABASE_CONN_MAX_AGE),
+        'CONN_HEALTH_CHECKS': os.getenv('DATABASE_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'DISABLE_SERVER_SIDE_CURSORS': DATABASE_PGBOUNCER,
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DATABASE_CONNECT_TIMEOUT', 10)),
+        },
     }
 }
 
+if DATABASE_POOL:
+    if django.VERSION < (5, 1):
+        raise ImproperlyConfigured('DATABASE_POOL wymaga Django 5.1 lub nowszego (oraz psycopg 3 z psycopg_pool).')
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DATABASE_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('DATABASE_POOL_MAX_SIZE', 10)),
+        'timeout': int(os.getenv('DATABASE_POOL_TIMEOUT', 10)),
+    }
+
+# Repliki do odczytu (kirismor.db_router): DATABASE_REPLICA_HOSTS = 'host1,host2:5433' tworzy aliasy replica1,
+# replica2, ... z tymi samymi danymi logowania co baza główna. Odczyty widoków oznaczonych replica_reads trafiają
+# do zdrowej repliki; po zapisie użytkownik czyta z bazy głównej przez DATABASE_REPLICA_PIN_SECONDS sekund.
+# Stan replik jest sprawdzany co DATABASE_REPLICA_HEALTH_INTERVAL sekund; DATABASE_REPLICA_MAX_LAG (sekundy)
+# odrzuca repliki PostgreSQL opóźnione bardziej niż limit.
+DATABASE_REPLICAS = []
+for number, address in enumerate(filter(None, os.getenv('DATABASE_REPLICA_HOSTS', '').split(',')), 1):
+    host, _, port = address.strip().partition(':')
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{number}')
+
+DATABASE_ROUTERS = ['kirismor.db_router.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DATABASE_REPLICA_PIN_SECONDS', 5))
+DATABASE_REPLICA_HEALTH_INTERVAL = int(os.getenv('DATABASE_REPLICA_HEALTH_INTERVAL', 30))
+DATABASE_REPLICA_MAX_LAG = float(os.getenv('DATABASE_REPLICA_MAX_LAG')) if os.getenv('DATABASE_REPLICA_MAX_LAG') \
+    else None
+
 # Walidatory haseł
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -128,11 +195,42 @@ LOCALE_PATHS = [
 # Ustawienia statycznych plików
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
+STATIC_ROOT = os.getenv('STATIC_ROOT', os.path.join(BASE_DIR, 'staticfiles'))
+
+# Budowanie plików statycznych (komenda build_static, kirismor.staticfiles): nazwy z sumą kontrolną zawartości,
+# warianty .gz/.br, zminifikowane pakiety CSS (nazwa pakietu: pliki źródłowe) i pochodne obrazów (szerokości w px)
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'kirismor.staticfiles.CompressedManifestStaticFilesStorage'},
+}
+STATIC_BUNDLES = {
+    'css/style.min.css': ['css/colors.css', 'css/style.css'],
+    'css/jobs.min.css': ['css/jobs.css'],
+    'css/accounts.min.css': ['css/accounts.css'],
+    'css/requests.min.css': ['css/requests.css'],
+    'css/communications.min.css': ['css/communications.css'],
+}
+STATIC_IMAGE_WIDTHS = {
+    'images/logo.png': [64, 128, 256],
+    'images/background.jpg': [1380],
+}
+# Czas przechowywania plików statycznych przez przeglądarki (sekundy): bez sumy kontrolnej w nazwie i z nią
+STATIC_CACHE_MAX_AGE = int(os.getenv('STATIC_CACHE_MAX_AGE', 60 * 60))
+STATIC_HASHED_MAX_AGE = int(os.getenv('STATIC_HASHED_MAX_AGE', 365 * 24 * 60 * 60))
 
 # Ustawienia plików mediów
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Wydawanie plików multimedialnych (kirismor.media): 'nginx' - nagłówek X-Accel-Redirect z MEDIA_ACCEL_PREFIX
+# (lokalizacja 'internal' w nginx), 'sendfile' - nagłówek X-Sendfile (Apache mod_xsendfile, lighttpd), pusta wartość -
+# plik wysyła Django. MEDIA_CACHE_MAX_AGE to czas przechowywania (sekundy) plików bez sumy kontrolnej w nazwie,
+# MEDIA_HASHED_MAX_AGE - plików z sumą kontrolną (Cache-Control: immutable).
+MEDIA_ACCEL = os.getenv('MEDIA_ACCEL', '')
+MEDIA_ACCEL_PREFIX = os.getenv('MEDIA_ACCEL_PREFIX', '/protected-media/')
+MEDIA_CACHE_MAX_AGE = int(os.getenv('MEDIA_CACHE_MAX_AGE', 60 * 60))
+MEDIA_HASHED_MAX_AGE = int(os.getenv('MEDIA_HASHED_MAX_AGE', 365 * 24 * 60 * 60))
+
 # Domyślne pole automatyczne
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -152,3 +250,114 @@ EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 
 # URL strony
 SITE_URL = 'http://localhost:8000'
+
+# Pamięć podręczna. CACHE_BACKEND = 'locmem' (domyślnie) przechowuje dane w pamięci procesu, a 'file' w katalogu
+# CACHE_DIR, współdzielonym przez wszystkie procesy serwera (zalecane przy kilku procesach, aby unieważnianie
+# stron i liczników było widoczne wszędzie). 'redis' i 'memcached' używają serwera pod adresem CACHE_LOCATION
+# (np. redis://127.0.0.1:6379 lub 127.0.0.1:11211, wymagają pakietu redis lub pymemcache); tylko one zapewniają
+# atomowe incr między procesami, wymagane przez buforowanie liczników popularnych ofert (JOB_COUNTER_HOT_THRESHOLD).
+# Każdy alias Redis ma osobną bazę (numer po ukośniku), aby czyszczenie jednego aliasu nie usuwało pozostałych.
+# Alias 'pages' przechowuje pełne strony dla anonimowych użytkowników, a 'template_fragments' fragmenty szablonów
+# ({% cache %}, np. menu nawigacji według roli i języka), czyszczone przy wdrożeniu komendą warm_templates.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+CACHE_DIR = os.getenv('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'kirismor-cache'))
+CACHE_LOCATION = os.getenv('CACHE_LOCATION',
+                           'redis://127.0.0.1:6379' if CACHE_BACKEND == 'redis' else '127.0.0.1:11211')
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+
+
+def cache_config(name, database, max_entries):
+    """
+    Zwraca konfigurację aliasu pamięci podręcznej dla backendu CACHE_BACKEND.
+    """
+    if CACHE_BACKEND == 'redis':
+        return {'BACKEND': CACHE_BACKENDS['redis'], 'LOCATION': f"{CACHE_LOCATION.rstrip('/')}/{database}"}
+    if CACHE_BACKEND == 'memcached':
+        return {'BACKEND': CACHE_BACKENDS['memcached'], 'LOCATION': CACHE_LOCATION, 'KEY_PREFIX': name}
+    location = os.path.join(CACHE_DIR, name) if CACHE_BACKEND == 'file' else f"kirismor-{name.replace('_', '-')}"
+    return {'BACKEND': CACHE_BACKENDS[CACHE_BACKEND], 'LOCATION': location, 'OPTIONS': {'MAX_ENTRIES': max_entries}}
+
+
+CACHES = {
+    'default': cache_config('default', 0, 10000),
+    'pages': cache_config('pages', 1, 5000),
+    'template_fragments': cache_config('template_fragments', 2, 1000),
+}
+
+# Pamięć podręczna stron dla anonimowych użytkowników (kirismor.page_cache): alias i czas przechowywania (sekundy)
+PAGE_CACHE_ALIAS = 'pages'
+PAGE_CACHE_TIMEOUT = int(os.getenv('PAGE_CACHE_TIMEOUT', 600))
+
+# Liczniki wierszy paginacji (kirismor.counting): czas przechowywania w pamięci podręcznej (sekundy)
+# oraz próg, powyżej którego zamiast dokładnego COUNT(*) używany jest szacunek planisty PostgreSQL
+COUNT_CACHE_TIMEOUT = int(os.getenv('COUNT_CACHE_TIMEOUT', 300))
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv('COUNT_ESTIMATE_THRESHOLD', 100000))
+
+# Karuzela wyróżnionych ofert pracy na stronie głównej (jobs.featured): liczba ofert i czas przechowywania
+# migawki w pamięci podręcznej (sekundy). Po tym czasie migawka jest odbudowywana, aby uwzględnić popularność.
+FEATURED_JOBS_LIMIT = int(os.getenv('FEATURED_JOBS_LIMIT', 10))
+FEATURED_JOBS_TIMEOUT = int(os.getenv('FEATURED_JOBS_TIMEOUT', 3600))
+
+# Kanał aktualności ról w panelu kontrolnym (news.feed): liczba najnowszych wiadomości w kanale (starsze są
+# dostępne przez kursor) i czas przechowywania kanału w pamięci podręcznej (sekundy)
+NEWS_FEED_LIMIT = int(os.getenv('NEWS_FEED_LIMIT', 20))
+NEWS_FEED_TIMEOUT = int(os.getenv('NEWS_FEED_TIMEOUT', 3600))
+
+# Liczniki polubień i ulubionych ofert (jobs.reactions): oferta z więcej niż JOB_COUNTER_HOT_THRESHOLD zmianami
+# w oknie JOB_COUNTER_HOT_WINDOW sekund jest "gorąca" - jej zmiany są buforowane i zapisywane partiami
+# po JOB_COUNTER_BATCH_SIZE zmian (lub komendą reconcile_job_counters --flush). 0 (domyślnie) wyłącza buforowanie.
+# Buforowanie działa tylko z CACHE_BACKEND = 'redis' lub 'memcached'; przy 'locmem' i 'file' liczniki są zawsze
+# zapisywane bezpośrednio w bazie danych.
+JOB_COUNTER_HOT_THRESHOLD = int(os.getenv('JOB_COUNTER_HOT_THRESHOLD', 0))
+JOB_COUNTER_HOT_WINDOW = int(os.getenv('JOB_COUNTER_HOT_WINDOW', 60))
+JOB_COUNTER_BATCH_SIZE = int(os.getenv('JOB_COUNTER_BATCH_SIZE', 20))
+
+# Maksymalna liczba ofert w jednym żądaniu zbiorczej zmiany reakcji (widok batch_reactions); większe żądania
+# są odrzucane z kodem 400
+JOB_REACTION_BATCH_LIMIT = int(os.getenv('JOB_REACTION_BATCH_LIMIT', 100))
+
+# Zapisane wyszukiwania i powiadomienia o nowych ofertach (jobs.alerts): maksymalna liczba zapisanych wyszukiwań
+# kandydata, liczba ofert w jednym zbiorczym powiadomieniu oraz liczba dopasowań zapisywanych jednym zapytaniem
+SAVED_SEARCH_LIMIT = int(os.getenv('SAVED_SEARCH_LIMIT', 20))
+JOB_ALERT_DIGEST_LIMIT = int(os.getenv('JOB_ALERT_DIGEST_LIMIT', 20))
+JOB_ALERT_BATCH_SIZE = int(os.getenv('JOB_ALERT_BATCH_SIZE', 5000))
+
+# Dopasowanie kandydatów do ofert pracy (jobs.matching): liczba wyników na stronach najlepszych kandydatów
+# i polecanych ofert oraz liczba dokumentów lub składowych wektorów przetwarzanych w jednej partii
+MATCH_RESULTS_LIMIT = int(os.getenv('MATCH_RESULTS_LIMIT', 20))
+MATCH_BATCH_SIZE = int(os.getenv('MATCH_BATCH_SIZE', 10000))
+
+# Kolejka wiadomości e-mail (accounts.outbox): liczba wiadomości wysyłanych przez jedno połączenie SMTP,
+# maksymalna liczba prób oraz opóźnienie pierwszej ponownej próby (sekundy, podwajane po każdej nieudanej próbie)
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', 100))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+EMAIL_OUTBOX_RETRY_DELAY = int(os.getenv('EMAIL_OUTBOX_RETRY_DELAY', 60))
+
+# Zdjęcia profilowe (accounts.photos): szerokości miniatur w pikselach (kwadratowe, w formatach WebP i JPEG),
+# jakość kompresji oraz kolejka przetwarzania (liczba zdjęć w partii, maksymalna liczba prób, opóźnienie ponowienia)
+PHOTO_THUMBNAIL_SIZES = [int(size) for size in os.getenv('PHOTO_THUMBNAIL_SIZES', '100,200,400').split(',')]
+PHOTO_THUMBNAIL_QUALITY = int(os.getenv('PHOTO_THUMBNAIL_QUALITY', 80))
+PHOTO_QUEUE_BATCH_SIZE = int(os.getenv('PHOTO_QUEUE_BATCH_SIZE', 20))
+PHOTO_QUEUE_MAX_ATTEMPTS = int(os.getenv('PHOTO_QUEUE_MAX_ATTEMPTS', 3))
+PHOTO_QUEUE_RETRY_DELAY = int(os.getenv('PHOTO_QUEUE_RETRY_DELAY', 300))
+
+# Czas ważności podpisanych tokenów weryfikacyjnych (kirismor.tokens) w sekundach
+VERIFICATION_TOKEN_MAX_AGE = int(os.getenv('VERIFICATION_TOKEN_MAX_AGE', 3 * 24 * 60 * 60))
+
+# Ostatni dzień (RRRR-MM-DD), do którego przyjmowane są niepodpisane tokeny wysłane przed wprowadzeniem podpisów
+# (wdrożenie + VERIFICATION_TOKEN_MAX_AGE). Pusta wartość wyłącza tokeny dotychczasowe.
+LEGACY_VERIFICATION_TOKENS_UNTIL = os.getenv('LEGACY_VERIFICATION_TOKENS_UNTIL', '2026-10-20')
+
+# Pomiar zapytań SQL każdego żądania (kirismor.query_monitor): nagłówek Server-Timing i log 'kirismor.queries'.
+# QUERY_BUDGETS to limity zapytań dla nazw widoków (np. {'jobs:job_list': 10}), QUERY_BUDGET_DEFAULT dla pozostałych;
+# przy QUERY_MONITOR_RAISE = True przekroczenie limitu zgłasza wyjątek (testy).
+QUERY_MONITOR_ENABLED = os.getenv('QUERY_MONITOR_ENABLED') == 'True'
+QUERY_MONITOR_RAISE = os.getenv('QUERY_MONITOR_RAISE') == 'True'
+QUERY_MONITOR_N_PLUS_ONE_THRESHOLD = int(os.getenv('QUERY_MONITOR_N_PLUS_ONE_THRESHOLD', 5))
+QUERY_BUDGETS = {}
+QUERY_BUDGET_DEFAULT = int(os.getenv('QUERY_BUDGET_DEFAULT')) if os.getenv('QUERY_BUDGET_DEFAULT') else None
@@ -0,0 +1,275 @@
+import gzip
+import io
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.http import Http404
+from django.urls import re_path
+from django.utils.cache import patch_vary_headers
+from PIL import Image
+from kirismor.media import cache_control, file_response, resolve_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+"""
+Importy:
+- import gzip: Importuje kompresję gzip, używaną do tworzenia wariantów .gz plików tekstowych.
+- import io: Importuje strumienie w pamięci, używane do kodowania pochodnych obrazów.
+- import mimetypes: Importuje rozpoznawanie typu MIME pliku po rozszerzeniu (typ pliku przed kompresją).
+- import os: Importuje sprawdzanie istnienia wariantów skompresowanych.
+- import posixpath: Importuje operacje na ścieżkach w formacie POSIX (nazwy plików statycznych).
+- import re: Importuje wyrażenia regularne, używane do minifikacji CSS i odczytu nagłówka Accept-Encoding.
+- from urllib.parse import urlsplit: Importuje podział adresu STATIC_URL.
+- from django.conf import settings: Importuje ustawienia projektu (STATIC_ROOT, pakiety CSS, rozmiary obrazów).
+- from django.contrib.staticfiles.storage import ManifestStaticFilesStorage: Importuje magazyn plików statycznych
+  z nazwami zawierającymi sumę kontrolną zawartości (plik staticfiles.json).
+- from django.core.files.base import ContentFile: Importuje plik z zawartością w pamięci, używany do zapisu pakietów,
+  pochodnych obrazów i wariantów skompresowanych.
+- from django.http import Http404: Importuje wyjątek braku pliku.
+- from django.urls import re_path: Importuje funkcję definiującą trasę URL plików statycznych.
+- from django.utils.cache import patch_vary_headers: Importuje dodawanie nagłówka Vary: Accept-Encoding.
+- from PIL import Image: Importuje bibliotekę Pillow, używaną do tworzenia pochodnych obrazów.
+- from kirismor.media import cache_control, file_response, resolve_file: Importuje wspólną obsługę odpowiedzi
+  z plikiem (ETag, żądania warunkowe, zakresy bajtów).
+- import brotli (opcjonalnie): Importuje kompresję Brotli; bez niej tworzone są tylko warianty .gz.
+
+Moduł zawiera etap budowania plików statycznych (komenda build_static / collectstatic) i ich wydawanie:
+- CompressedManifestStaticFilesStorage: magazyn plików statycznych, który podczas collectstatic buduje
+  zminifikowane pakiety CSS (STATIC_BUNDLES) i pochodne obrazów (STATIC_IMAGE_WIDTHS), nadaje wszystkim plikom
+  nazwy z sumą kontrolną i zapisuje skompresowane warianty .gz i .br.
+- minify_css: minifikacja CSS (komentarze i zbędne białe znaki).
+- serve_static: widok pliku z STATIC_ROOT wybierający wariant skompresowany według nagłówka Accept-Encoding.
+- static_urlpatterns: trasa URL widoku dla STATIC_URL.
+
+Przykładowa konfiguracja nginx (pliki statyczne bez udziału Django, moduł ngx_brotli jest opcjonalny):
+
+    location /static/ {
+        alias /srv/kirismor/staticfiles/;
+        gzip_static on;
+        brotli_static on;
+        location ~ "\\.[0-9a-f]{12}\\." { expires max; add_header Cache-Control "public, immutable"; }
+    }
+"""
+
+# Rozszerzenia plików tekstowych, dla których tworzone są warianty skompresowane
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.xml', '.map', '.ico'}
+
+# Warianty skompresowane w kolejności preferencji: kodowanie (Content-Encoding) i rozszerzenie pliku
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Wariant skompresowany jest zapisywany tylko wtedy, gdy jest mniejszy niż ta część oryginału
+MIN_COMPRESSION_RATIO = 0.95
+
+_CSS_TOKEN_RE = re.compile(r'/\*.*?\*/|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'', re.S)
+
+
+def _squeeze_css(css):
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r' ?([{};,>]) ?', r'\1', css)
+    return css.replace(': ', ':').replace(';}', '}')
+
+
+def minify_css(css):
+    """
+    Zwraca CSS bez komentarzy i zbędnych białych znaków. Teksty w cudzysłowach pozostają bez zmian.
+    """
+    strings = []
+
+    def replace(match):
+        if match.group().startswith('/*'):
+            return ''
+        strings.append(match.group())
+        return f'\x00{len(strings) - 1}\x00'
+
+    css = _squeeze_css(_CSS_TOKEN_RE.sub(replace, css)).strip()
+    return re.sub(r'\x00(\d+)\x00', lambda match: strings[int(match.group(1))], css)
+
+
+def derivative_name(name, width, extension=None):
+    """
+    Zwraca nazwę pochodnej obrazu o szerokości `width`, np. ('images/logo.png', 128, 'webp') -> 'images/logo-128.webp'.
+    """
+    stem, original_extension = posixpath.splitext(name)
+    return f'{stem}-{width}.{extension}' if extension else f'{stem}-{width}{original_extension}'
+
+
+def compress(content):
+    """
+    Zwraca warianty skompresowane zawartości: {rozszerzenie: bajty}, tylko mniejsze od oryginału.
+    """
+    variants = {'.gz': gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(content, quality=11)
+    return {extension: data for extension, data in variants.items()
+            if len(data) < len(content) * MIN_COMPRESSION_RATIO}
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Magazyn plików statycznych z nazwami zawierającymi sumę kontrolną zawartości, pakietami CSS, pochodnymi obrazów
+    i wariantami skompresowanymi (.gz, .br).
+
+    Dopóki pliki nie zostały zebrane (brak pliku staticfiles.json, np. w środowisku deweloperskim i w testach),
+    adresy plików nie zawierają sumy kontrolnej, zamiast błędu ManifestStaticFilesStorage.
+    """
+    manifest_strict = False
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def is_built(self, name):
+        """
+        Sprawdza, czy plik (np. pakiet CSS lub pochodna obrazu) jest w manifeście zebranych plików.
+        """
+        return not settings.DEBUG and self.hash_key(name) in self.hashed_files
+
+    def _write(self, name, content):
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(content))
+
+    def _read(self, paths, name):
+        storage, path = paths[name]
+        with storage.open(path) as file:
+            return file.read()
+
+    def build_bundles(self, paths):
+        """
+        Zapisuje zminifikowane pakiety CSS (STATIC_BUNDLES) i dodaje je do plików przetwarzanych przez collectstatic.
+        """
+        for bundle, sources in settings.STATIC_BUNDLES.items():
+            css = '\n'.join(self._read(paths, source).decode('utf-8') for source in sources if source in paths)
+            self._write(bundle, minify_css(css).encode('utf-8'))
+            paths[bundle] = (self, bundle)
+            yield bundle
+
+    def build_images(self, paths):
+        """
+        Zapisuje pochodne obrazów o szerokościach STATIC_IMAGE_WIDTHS w formacie oryginału (zoptymalizowane)
+        i WebP, oraz dodaje je do plików przetwarzanych przez collectstatic.
+        """
+        for name, widths in settings.STATIC_IMAGE_WIDTHS.items():
+            if name not in paths:
+                continue
+            image = Image.open(io.BytesIO(self._read(paths, name)))
+            image_format = image.format
+            for width in widths:
+                resized = image.copy()
+                resized.thumbnail((width, width * image.height // image.width), Image.LANCZOS)
+                for extension, target_format in ((None, image_format), ('webp', 'WEBP')):
+                    frame = resized
+                    options = {'optimize': True}
+                    if target_format == 'JPEG':
+                        frame = resized.convert('RGB')
+                        options.update(quality=82, progressive=True)
+                    elif target_format == 'WEBP':
+                        options = {'quality': 80, 'method': 6}
+                    buffer = io.BytesIO()
+                    frame.save(buffer, target_format, **options)
+                    derivative = derivative_name(name, width, extension)
+                    self._write(derivative, buffer.getvalue())
+                    paths[derivative] = (self, derivative)
+                    yield derivative
+
+    def compress_files(self, names):
+        """
+        Zapisuje warianty .gz i .br (jeśli biblioteka brotli jest zainstalowana) plików tekstowych.
+        """
+        for name in names:
+            if posixpath.splitext(name)[1] not in COMPRESSIBLE_EXTENSIONS or not self.exists(name):
+                continue
+            with self.open(name) as file:
+                content = file.read()
+            for extension, data in compress(content).items():
+                self._write(name + extension, data)
+                yield name + extension
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            yield from super().post_process(paths, dry_run, **options)
+            return
+        for name in [*self.build_bundles(paths), *self.build_images(paths)]:
+            yield name, name, True
+        processed = set()
+        for name, hashed_name, was_processed in super().post_process(paths, dry_run, **options):
+            if not isinstance(was_processed, Exception) and hashed_name:
+                processed.update((name, hashed_name))
+            yield name, hashed_name, was_processed
+        for name in self.compress_files(sorted(processed)):
+            yield name, name, True
+
+
+def _accepted_encodings(request):
+    accepted = set()
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        encoding, _, parameters = item.strip().partition(';')
+        if not re.match(r'^\s*q\s*=\s*0(\.0*)?\s*$', parameters):
+            accepted.add(encoding.strip().lower())
+    return accepted
+
+
+def serve_static(request, path):
+    """
+    Wydaje plik z STATIC_ROOT (file_response) - dla serwerów bez osobnej obsługi plików statycznych.
+
+    - Gdy klient akceptuje kodowanie br lub gzip i istnieje wariant skompresowany (.br, .gz), wysyłany jest wariant
+      z nagłówkiem Content-Encoding; odpowiedź zawiera Vary: Accept-Encoding.
+    - Cache-Control: STATIC_HASHED_MAX_AGE z 'immutable' dla nazw z sumą kontrolną, STATIC_CACHE_MAX_AGE dla
+      pozostałych.
+    - Przy DEBUG = True pliki niezebrane przez collectstatic są wydawane z katalogów źródłowych
+      (django.contrib.staticfiles.views.serve).
+
+    Args:
+        request (HttpRequest): Obiekt żądania HTTP.
+        path (str): Ścieżka pliku względem STATIC_ROOT.
+
+    Returns:
+        HttpResponse: Odpowiedź z plikiem, 206, 304 lub 416.
+
+    Raises:
+        Http404: Gdy plik nie istnieje.
+    """
+    try:
+        full_path = resolve_file(settings.STATIC_ROOT, path)
+    except Http404:
+        if settings.DEBUG:
+            from django.contrib.staticfiles.views import serve
+            return serve(request, path)
+        raise
+
+    content_type = mimetypes.guess_type(full_path)[0]
+    control = cache_control(path, settings.STATIC_CACHE_MAX_AGE, settings.STATIC_HASHED_MAX_AGE)
+    variants = [(encoding, full_path + extension) for encoding, extension in ENCODINGS
+                if os.path.isfile(full_path + extension)]
+    accepted = _accepted_encodings(request)
+    for encoding, variant_path in variants:
+        if encoding in accepted:
+            response = file_response(request, variant_path, control, content_type=content_type, encoding=encoding)
+            break
+    else:
+        response = file_response(request, full_path, control, content_type=content_type)
+    if variants:
+        patch_vary_headers(response, ['Accept-Encoding'])
+    return response
+
+
+def static_urlpatterns():
+    """
+    Zwraca trasę URL widoku serve_static dla STATIC_URL (pustą listę, gdy STATIC_URL wskazuje inny serwer
+    lub STATIC_ROOT nie jest ustawiony).
+    """
+    if not settings.STATIC_ROOT or not settings.STATIC_URL or urlsplit(settings.STATIC_URL).netloc:
+        return []
+    prefix = re.escape(settings.STATIC_URL.lstrip('/'))
+    return [re_path(rf'^{prefix}(?P<path>.*)$', serve_static)]
@@ -0,0 +1,70 @@
+import time
+from pathlib import Path
+
+from django.core.cache import caches
+from django.template import TemplateSyntaxError, engines
+
+"""
+Importy:
+- import time: Importuje moduł time, używany do pomiaru czasu kompilacji szablonów.
+- from pathlib import Path: Importuje operacje na ścieżkach, używane do wyszukiwania plików szablonów.
+- from django.core.cache import caches: Importuje dostęp do pamięci podręcznej fragmentów szablonów.
+- from django.template import TemplateSyntaxError, engines: Importuje wyjątek błędu składni szablonu i dostęp
+  do skonfigurowanego silnika szablonów.
+
+Moduł zawiera obsługę szablonów po wdrożeniu:
+- warm_templates: kompilacja wszystkich szablonów z katalogów DIRS (templates/), dzięki której cached.Loader
+  procesu serwera ma je gotowe przed pierwszym żądaniem.
+- clear_fragments: unieważnianie fragmentów zapisanych znacznikiem {% cache %} (menu nawigacji
+  i stopka w templates/home/base.html), aby po wdrożeniu nie wyświetlać fragmentów ze starych szablonów.
+"""
+
+# Alias pamięci podręcznej używany przez znacznik {% cache %}
+FRAGMENT_CACHE_ALIAS = 'template_fragments'
+
+# Rozszerzenia plików kompilowanych przez warm_templates
+TEMPLATE_EXTENSIONS = {'.html', '.txt', '.xml'}
+
+
+def _engine():
+    return engines['django'].engine
+
+
+def template_names():
+    """
+    Zwraca posortowane nazwy wszystkich szablonów z katalogów DIRS silnika szablonów, np. 'home/base.html'.
+    """
+    names = set()
+    for directory in _engine().dirs:
+        root = Path(directory)
+        names.update(path.relative_to(root).as_posix() for path in root.rglob('*')
+                     if path.is_file() and path.suffix in TEMPLATE_EXTENSIONS)
+    return sorted(names)
+
+
+def warm_templates():
+    """
+    Kompiluje wszystkie szablony z template_names(). Przy włączonym cached.Loader skompilowane szablony zostają
+    w pamięci procesu, więc pierwsze żądanie ich nie kompiluje.
+
+    Returns:
+        tuple: (liczba skompilowanych szablonów, słownik {nazwa: błąd składni}, czas w sekundach).
+    """
+    started = time.monotonic()
+    engine = _engine()
+    compiled, errors = 0, {}
+    for name in template_names():
+        try:
+            engine.get_template(name)
+        except TemplateSyntaxError as error:
+            errors[name] = error
+        else:
+            compiled += 1
+    return compiled, errors, time.monotonic() - started
+
+
+def clear_fragments():
+    """
+    Usuwa wszystkie fragmenty szablonów z pamięci podręcznej (alias FRAGMENT_CACHE_ALIAS).
+    """
+    caches[FRAGMENT_CACHE_ALIAS].clear()
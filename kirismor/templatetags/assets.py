@@ -0,0 +1,90 @@
+from django import template
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+from kirismor.staticfiles import derivative_name
+
+"""
+Importy:
+- from django import template: Importuje moduł szablonów Django, używany do rejestracji znaczników.
+- from django.conf import settings: Importuje ustawienia projektu (STATIC_BUNDLES, STATIC_IMAGE_WIDTHS).
+- from django.contrib.staticfiles.storage import staticfiles_storage: Importuje magazyn plików statycznych,
+  używany do sprawdzenia, czy pakiet lub pochodna obrazu zostały zbudowane.
+- from django.templatetags.static import static: Importuje funkcję zwracającą adres URL pliku statycznego.
+- from django.utils.html import format_html, format_html_join: Importuje funkcje budujące bezpieczny kod HTML.
+- from kirismor.staticfiles import derivative_name: Importuje funkcję zwracającą nazwę pochodnej obrazu.
+
+Znaczniki plików zbudowanych przez build_static (kirismor.staticfiles). Przed zbudowaniem (środowisko deweloperskie,
+testy) zwracają pliki źródłowe.
+
+Użycie:
+    {% load assets %}
+    {% stylesheet 'css/style.min.css' %}
+    {% static_image 'images/logo.png' 50 alt='Logo' css_class='rounded-circle' %}
+    <link rel="icon" href="{% static_image_url 'images/logo.png' 64 %}">
+    background-image: {% static_image_set 'images/background.jpg' 1380 %};
+"""
+
+register = template.Library()
+
+
+def is_built(name):
+    """
+    Sprawdza, czy plik został zbudowany przez build_static (jest w manifeście magazynu plików statycznych).
+    """
+    return getattr(staticfiles_storage, 'is_built', lambda name: False)(name)
+
+
+@register.simple_tag
+def stylesheet(bundle):
+    """
+    Zwraca element <link> zminifikowanego pakietu CSS lub, przed zbudowaniem, elementy <link> jego plików źródłowych.
+    """
+    names = [bundle] if is_built(bundle) else settings.STATIC_BUNDLES[bundle]
+    return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((static(name),) for name in names))
+
+
+@register.simple_tag
+def static_image_url(name, width, extension=None):
+    """
+    Zwraca adres URL pochodnej obrazu o szerokości `width` (w formacie `extension`, domyślnie formacie oryginału)
+    lub oryginału przed zbudowaniem.
+    """
+    derivative = derivative_name(name, width, extension)
+    return static(derivative if is_built(derivative) else name)
+
+
+@register.simple_tag
+def static_image_set(name, width):
+    """
+    Zwraca wartość CSS obrazu tła: image-set() z pochodnymi WebP i w formacie oryginału lub url() oryginału.
+    """
+    webp = derivative_name(name, width, 'webp')
+    if not is_built(webp):
+        return format_html('url("{}")', static(name))
+    return format_html('image-set(url("{}") type("image/webp"), url("{}") type("{}"))', static(webp),
+                       static(derivative_name(name, width)),
+                       'image/png' if name.endswith('.png') else 'image/jpeg')
+
+
+@register.simple_tag
+def static_image(name, size, alt='', css_class='', style=''):
+    """
+    Zwraca obraz wyświetlany w rozmiarze `size` pikseli CSS (szerokość): element <picture> z pochodnymi WebP
+    i w formacie oryginału (srcset) lub, przed zbudowaniem, element <img> z oryginałem.
+    """
+    widths = settings.STATIC_IMAGE_WIDTHS.get(name, [])
+    attributes = format_html('alt="{}" class="{}" style="{}" width="{}"', alt, css_class, style, size)
+    if not widths or not is_built(derivative_name(name, widths[0], 'webp')):
+        return format_html('<img src="{}" {}>', static(name), attributes)
+
+    def srcset(extension):
+        return ', '.join(f'{static(derivative_name(name, width, extension))} {width}w' for width in widths)
+
+    fallback = next((width for width in widths if width >= 2 * int(size)), widths[-1])
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}px"><img src="{}" srcset="{}" sizes="{}px" {}>'
+        '</picture>',
+        srcset('webp'), size, static(derivative_name(name, fallback)), srcset(None), size, attributes,
+    )
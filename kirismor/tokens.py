@@ -0,0 +1,88 @@
+import re
+from datetime import date
+
+from django.conf import settings
+from django.core import signing
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+
+"""
+Importy:
+- import re: Importuje wyrażenia regularne, używane do rozpoznania formatu tokenów sprzed wprowadzenia podpisów.
+- from datetime import date: Importuje klasę date, używaną do odczytania daty wyłączenia tokenów dotychczasowych.
+- from django.conf import settings: Importuje ustawienia projektu (czas ważności tokenów weryfikacyjnych).
+- from django.core import signing: Importuje podpisywanie danych kluczem SECRET_KEY (HMAC) wraz ze znacznikiem czasu.
+- from django.http import Http404: Importuje wyjątek zwracający odpowiedź 404 dla wygasłych i nieprawidłowych tokenów.
+- from django.shortcuts import get_object_or_404: Importuje funkcję zwracającą obiekt lub odpowiedź 404.
+- from django.utils import timezone: Importuje funkcję timezone.localdate, porównywaną z datą wyłączenia tokenów
+  dotychczasowych.
+
+Moduł zawiera bezstanowe tokeny weryfikacyjne:
+- make_token: podpisuje identyfikator obiektu, więc token nie musi być zapisywany w bazie danych.
+- get_object_for_token: sprawdza podpis i ważność tokenu i pobiera obiekt po kluczu głównym. Tokeny wygenerowane
+  przed wprowadzeniem podpisów (skróty SHA-256) są wyszukiwane w dotychczasowym polu modelu, ale tylko do dnia
+  LEGACY_VERIFICATION_TOKENS_UNTIL. Pole nie ma indeksu, więc inne napisy nie trafiają do bazy danych.
+"""
+
+# Domyślny czas ważności tokenów weryfikacyjnych (sekundy)
+DEFAULT_MAX_AGE = 3 * 24 * 60 * 60
+
+# Format tokenów sprzed wprowadzenia podpisów: skrót SHA-256 zapisany szesnastkowo
+LEGACY_TOKEN_PATTERN = re.compile(r'[0-9a-f]{64}')
+
+
+def _salt(purpose):
+    # Osobna sól dla każdego zastosowania: token weryfikacji e-maila nie zadziała jako token opinii gościa
+    return f'kirismor.tokens.{purpose}'
+
+
+def legacy_tokens_accepted():
+    """
+    Sprawdza, czy tokeny sprzed wprowadzenia podpisów są jeszcze przyjmowane (LEGACY_VERIFICATION_TOKENS_UNTIL).
+    """
+    until = getattr(settings, 'LEGACY_VERIFICATION_TOKENS_UNTIL', '')
+    return bool(until) and timezone.localdate() <= date.fromisoformat(until)
+
+
+def make_token(purpose, pk):
+    """
+    Tworzy podpisany token zawierający identyfikator obiektu i czas utworzenia.
+
+    Args:
+        purpose (str): Zastosowanie tokenu, np. 'verify-email'.
+        pk (int): Klucz główny obiektu.
+
+    Returns:
+        str: Token bezpieczny do użycia w ścieżce adresu URL.
+    """
+    return signing.dumps(pk, salt=_salt(purpose))
+
+
+def get_object_for_token(queryset, purpose, token, legacy_field=None):
+    """
+    Zwraca obiekt wskazany przez token lub zgłasza Http404.
+
+    Podpisany token daje wyszukiwanie po kluczu głównym. Jeśli token nie jest podpisany, a podano `legacy_field`,
+    obiekt jest wyszukiwany po tym polu (tokeny wysłane przed wprowadzeniem podpisów), o ile token ma ich format
+    i nie minął dzień LEGACY_VERIFICATION_TOKENS_UNTIL. Wygasły token jest odrzucany.
+
+    Args:
+        queryset (QuerySet | Model): Zbiór, w którym wyszukiwany jest obiekt.
+        purpose (str): Zastosowanie tokenu, takie samo jak w make_token.
+        token (str): Token z adresu URL.
+        legacy_field (str): Pole modelu z dotychczasowym tokenem.
+
+    Returns:
+        Model: Znaleziony obiekt.
+    """
+    max_age = getattr(settings, 'VERIFICATION_TOKEN_MAX_AGE', DEFAULT_MAX_AGE)
+    try:
+        pk = signing.loads(token, salt=_salt(purpose), max_age=max_age)
+    except signing.SignatureExpired:
+        raise Http404('Token wygasł.')
+    except signing.BadSignature:
+        if legacy_field is None or not LEGACY_TOKEN_PATTERN.fullmatch(token) or not legacy_tokens_accepted():
+            raise Http404('Nieprawidłowy token.')
+        return get_object_or_404(queryset, **{legacy_field: token})
+    return get_object_or_404(queryset, pk=pk)
@@ -5,16 +5,16 @@ from django.views.i18n import set_language
 
 from accounts import views
 from accounts.views import HomeView, AboutView, ContactView
-from django.conf import settings
-from django.conf.urls.static import static
+from kirismor.media import media_urlpatterns
+from kirismor.staticfiles import static_urlpatterns
 
 """
 Importy modułów Django:
 - admin: Panel administracyjny Django.
 - path, include: Funkcje Django do definiowania tras URL.
 - set_language: Widok Django do zmiany języka.
-- settings: Konfiguracja ustawień projektu.
-- static: Funkcja do obsługi plików statycznych.
+- media_urlpatterns: Trasa URL plików przesłanych przez użytkowników (kirismor.media).
+- static_urlpatterns: Trasa URL zebranych plików statycznych z wariantami skompresowanymi (kirismor.staticfiles).
 """
 
 urlpatterns = [
@@ -28,7 +28,7 @@ urlpatterns = [
     path('set-language/', set_language, name='set_language'),
     path('news/', include('news.urls')),
     path('set_language/<str:language>/', views.set_language, name='set_language'),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+] + media_urlpatterns() + static_urlpatterns()
 
 """
 Definiowanie tras URL w projekcie Django:
@@ -43,5 +43,7 @@ Definiowanie tras URL w projekcie Django:
 - news/: Moduł odpowiedzialny za zarządzanie aktualnościami.
 - set_language/<str:language>/: Widok zmiany języka dla podanego kodu języka.
 
-Do tego dodajemy obsługę plików statycznych za pomocą static(), używając MEDIA_URL i MEDIA_ROOT z ustawień projektu.
+Do tego dodajemy trasę MEDIA_URL dla plików przesłanych przez użytkowników (media_urlpatterns): w produkcji pliki
+wysyła serwer proxy (X-Accel-Redirect/X-Sendfile), a Django ustawia nagłówki ETag i Cache-Control. Trasa STATIC_URL
+wydaje pliki zebrane przez build_static, gdy przed aplikacją nie ma serwera obsługującego pliki statyczne.
 """
@@ -9,8 +9,16 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kirismor.settings')
 
 application = get_wsgi_application()
+
+# Kompilacja szablonów przy starcie procesu (TEMPLATE_WARMUP), zanim trafi do niego pierwsze żądanie.
+# Przy serwerze ładującym aplikację przed utworzeniem procesów roboczych (np. gunicorn --preload) wszystkie
+# procesy dziedziczą skompilowane szablony.
+if settings.TEMPLATE_WARMUP:
+    from kirismor.template_cache import warm_templates
+    warm_templates()
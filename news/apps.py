@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, post_delete
 
 
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'news'
+
+    def ready(self):
+        from kirismor import counting, page_cache
+        from news.feed import invalidate_news_feed
+        from news.models import News
+
+        # Licznik paginacji listy wiadomości jest unieważniany po dodaniu, edycji lub usunięciu wiadomości
+        counting.track_model(News, fields=())
+        # Lista wszystkich wiadomości w pamięci podręcznej stron (kirismor.page_cache)
+        page_cache.track_model(News, 'news')
+
+        # Kanały aktualności ról (news.feed) są odbudowywane po dodaniu, edycji lub usunięciu wiadomości
+        post_save.connect(invalidate_news_feed, sender=News, dispatch_uid='news_feed_save')
+        post_delete.connect(invalidate_news_feed, sender=News, dispatch_uid='news_feed_delete')
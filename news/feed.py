@@ -0,0 +1,152 @@
+import datetime
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.urls import reverse
+from django.utils.http import urlencode
+from kirismor.pagination import CURSOR_PARAM, CursorPaginator
+from news.models import News
+
+"""
+Importy:
+- import datetime: Importuje moduł datetime, używany do zamiany wersji aktualności na datę nagłówka Last-Modified.
+- import time: Importuje moduł time, używany do generowania numeru wersji aktualności.
+- from django.conf import settings: Importuje ustawienia projektu (długość kanału i czas przechowywania).
+- from django.core.cache import cache: Importuje domyślną pamięć podręczną, w której przechowywane są kanały ról.
+- from django.db import transaction: Importuje moduł transakcji, używany do odbudowy kanałów po zatwierdzeniu zmian.
+- from django.urls import reverse: Importuje funkcję budującą adres listy starszych wiadomości.
+- from django.utils.http import urlencode: Importuje funkcję budującą parametr kursora w adresie URL.
+- from kirismor.pagination import CURSOR_PARAM, CursorPaginator: Importuje paginację kursorową, która wyznacza
+  kursor kolejnych wiadomości za kanałem.
+- from news.models import News: Importuje model News.
+
+Moduł zawiera kanał aktualności dla ról użytkowników (panel kontrolny dashboard_view i news_list_view).
+Kanał każdej roli zawiera NEWS_FEED_LIMIT najnowszych wiadomości i kursor kolejnych (starszych) wiadomości,
+jest przechowywany w pamięci podręcznej i odbudowywany po dodaniu, zmianie lub usunięciu wiadomości, więc
+w stanie ustalonym panel kontrolny nie wykonuje zapytań o aktualności.
+
+Wersja aktualności (news_version) zmienia się przy każdej zmianie wiadomości i służy jako walidator
+odpowiedzi JSON all_news_view (nagłówki ETag i Last-Modified).
+"""
+
+# Klucz kanału roli w pamięci podręcznej
+FEED_CACHE_KEY = 'news:feed:{role}'
+
+# Klucz wersji aktualności (czas ostatniej zmiany w nanosekundach)
+VERSION_CACHE_KEY = 'news:version'
+
+# Kolejność wiadomości w kanale i w kolejnych stronach (kursor)
+FEED_ORDERING = ('-date_posted', '-id')
+
+# Role, dla których budowane są kanały
+FEED_ROLES = [role for role, _ in News._meta.get_field('role').choices]
+
+
+def feed_paginator(role):
+    """
+    Zwraca paginator kursorowy wiadomości roli ze stronami długości kanału (NEWS_FEED_LIMIT).
+    """
+    return CursorPaginator(News.objects.filter(role=role), settings.NEWS_FEED_LIMIT, FEED_ORDERING)
+
+
+def build_feed(role):
+    """
+    Oblicza kanał aktualności roli.
+
+    Args:
+        role (str): Rola użytkownika (candidate, client, recruiter).
+
+    Returns:
+        dict: Słownik z listą 'news' (słowniki z polami id, title, content i date_posted) oraz 'next_cursor',
+            czyli kursorem starszych wiadomości (None, gdy kanał zawiera wszystkie wiadomości roli).
+    """
+    page = feed_paginator(role).page()
+    return {
+        'news': [
+            {'id': news.id, 'title': news.title, 'content': news.content, 'date_posted': news.date_posted}
+            for news in page
+        ],
+        'next_cursor': page.next_cursor,
+    }
+
+
+def refresh_feed(role):
+    """
+    Odbudowuje kanał roli i zapisuje go w pamięci podręcznej.
+
+    Returns:
+        dict: Nowy kanał.
+    """
+    feed = build_feed(role)
+    cache.set(FEED_CACHE_KEY.format(role=role), feed, settings.NEWS_FEED_TIMEOUT)
+    return feed
+
+
+def refresh_feeds():
+    """
+    Odbudowuje kanały wszystkich ról.
+    """
+    for role in FEED_ROLES:
+        refresh_feed(role)
+
+
+def get_feed(role):
+    """
+    Zwraca kanał roli z pamięci podręcznej, odbudowując go, jeśli go brakuje.
+
+    Args:
+        role (str): Rola użytkownika.
+
+    Returns:
+        dict: Kanał aktualności (patrz build_feed). Dla nieznanej roli kanał jest pusty.
+    """
+    if role not in FEED_ROLES:
+        return {'news': [], 'next_cursor': None}
+    feed = cache.get(FEED_CACHE_KEY.format(role=role))
+    if feed is None:
+        feed = refresh_feed(role)
+    return feed
+
+
+def feed_context(role):
+    """
+    Zwraca kontekst szablonu dashboard/dashboard.html z kanałem roli: listę 'news_list' i adres starszych
+    wiadomości 'news_next_url' (news_list_view z kursorem) lub None.
+    """
+    feed = get_feed(role)
+    next_url = None
+    if feed['next_cursor']:
+        next_url = f"{reverse('news:news_list')}?{urlencode({CURSOR_PARAM: feed['next_cursor']})}"
+    return {'news_list': feed['news'], 'news_next_url': next_url}
+
+
+def news_version():
+    """
+    Zwraca wersję aktualności: czas ostatniej zmiany wiadomości w nanosekundach. Gdy wersji brakuje w pamięci
+    podręcznej, zapisywana jest nowa (klienci otrzymają jednorazowo pełną odpowiedź zamiast 304).
+    """
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(VERSION_CACHE_KEY, version, None)
+        version = cache.get(VERSION_CACHE_KEY, version)
+    return version
+
+
+def news_last_modified():
+    """
+    Zwraca wersję aktualności jako datę (UTC) do nagłówka Last-Modified.
+    """
+    return datetime.datetime.fromtimestamp(news_version() / 1e9, tz=datetime.timezone.utc)
+
+
+def invalidate_news_feed(**kwargs):
+    """
+    Zmienia wersję aktualności, usuwa kanały ról z pamięci podręcznej i odbudowuje je po zatwierdzeniu transakcji.
+    Podłączone do sygnałów post_save i post_delete modelu News w NewsConfig.ready.
+    """
+    cache.set(VERSION_CACHE_KEY, time.time_ns(), None)
+    cache.delete_many([FEED_CACHE_KEY.format(role=role) for role in FEED_ROLES])
+    transaction.on_commit(refresh_feeds)
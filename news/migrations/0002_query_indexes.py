@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['role', '-date_posted', '-id'], name='news_role_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-date_posted', '-id'], name='news_date_idx'),
+        ),
+    ]
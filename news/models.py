@@ -31,6 +31,14 @@ class News(models.Model):
         verbose_name=_("Rola")
     )
 
+    class Meta:
+        indexes = [
+            # Aktualności dla roli użytkownika (news_list_view, dashboard_view) i wszystkie aktualności (all_news_view),
+            # sortowane od najnowszych
+            models.Index(fields=['role', '-date_posted', '-id'], name='news_role_date_idx'),
+            models.Index(fields=['-date_posted', '-id'], name='news_date_idx'),
+        ]
+
     def __str__(self):
         """
         Zwraca reprezentację tekstową modelu.
@@ -0,0 +1,76 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from news.feed import get_feed
+from news.models import News
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def candidate_client():
+    user = User.objects.create_user(email='candidate@example.com', password='password', role='candidate')
+    user.is_active = True
+    user.save()
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_feed_is_cached_and_rebuilt_after_changes(django_assert_num_queries, django_capture_on_commit_callbacks):
+    News.objects.create(title='Dla kandydatów', content='Treść', role='candidate')
+    News.objects.create(title='Dla klientów', content='Treść', role='client')
+    assert [news['title'] for news in get_feed('candidate')['news']] == ['Dla kandydatów']
+    with django_assert_num_queries(0):
+        get_feed('candidate')
+
+    with django_capture_on_commit_callbacks(execute=True):
+        News.objects.create(title='Nowa', content='Treść', role='candidate')
+    with django_assert_num_queries(0):
+        assert [news['title'] for news in get_feed('candidate')['news']] == ['Nowa', 'Dla kandydatów']
+    assert get_feed('') == {'news': [], 'next_cursor': None}
+
+
+@pytest.mark.django_db
+def test_dashboard_reads_feed_and_links_older_news(candidate_client, settings, django_assert_num_queries):
+    settings.NEWS_FEED_LIMIT = 2
+    for number in range(3):
+        News.objects.create(title=f'Wiadomość {number}', content='Treść', role='candidate')
+
+    candidate_client.get(reverse('accounts:dashboard'))
+    with django_assert_num_queries(2):  # sesja i użytkownik
+        response = candidate_client.get(reverse('accounts:dashboard'))
+    assert [news['title'] for news in response.context['news_list']] == ['Wiadomość 2', 'Wiadomość 1']
+
+    older = candidate_client.get(response.context['news_next_url'])
+    assert [news.title for news in older.context['news_list']] == ['Wiadomość 0']
+    assert older.context['news_next_url'] is None and older.context['news_previous_url']
+
+
+@pytest.mark.django_db
+def test_news_json_conditional_requests(client, django_assert_num_queries):
+    News.objects.create(title='Pierwsza', content='Treść', role='candidate')
+    url = reverse('news:all_news_view')
+    response = client.get(url, {'format': 'json'})
+    assert response.status_code == 200 and response['ETag'] and response['Last-Modified']
+
+    with django_assert_num_queries(0):
+        not_modified = client.get(url, {'format': 'json'}, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert not_modified.status_code == 304
+    assert client.get(url, {'format': 'json'}, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code == 304
+    assert 'ETag' not in client.get(url)
+
+    News.objects.create(title='Druga', content='Treść', role='candidate')
+    changed = client.get(url, {'format': 'json'}, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert changed.status_code == 200 and changed['ETag'] != response['ETag']
+    assert [news['title'] for news in changed.json()['news']] == ['Druga', 'Pierwsza']
@@ -55,3 +55,18 @@ class NewsViewsTest(TestCase):
 
         date_posted_list = [news['date_posted'] for news in json_response['news']]
         self.assertEqual(date_posted_list, sorted(date_posted_list, reverse=True))
+
+    def test_all_news_view_cursor_json(self):
+        for number in range(8):
+            News.objects.create(title=f'News {number}', content='Content', role='candidate')
+        response = self.client.get(reverse('news:all_news_view'), {'format': 'json', 'cursor': ''})
+        data = response.json()
+        self.assertEqual(len(data['news']), 7)
+        self.assertTrue(data['has_next'])
+        self.assertNotIn('total_pages', data)
+
+        response = self.client.get(reverse('news:all_news_view'), {'format': 'json', 'cursor': data['next_cursor']})
+        data = response.json()
+        self.assertEqual(len(data['news']), 3)
+        self.assertFalse(data['has_next'])
+        self.assertTrue(data['has_previous'])
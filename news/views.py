@@ -1,14 +1,22 @@
-from django.core.paginator import Paginator
 from django.http import JsonResponse
 from django.shortcuts import render, redirect
+from django.views.decorators.http import condition
+from .feed import feed_context, feed_paginator, news_last_modified, news_version
 from .models import News
+from kirismor.db_router import replica_reads
+from kirismor.page_cache import cache_anonymous_page
+from kirismor.pagination import CountedPaginator, CursorPaginator, CURSOR_PARAM, attach_cursor_urls, cursor_json, is_cursor_request
 
 """
 Importy:
-- from django.core.paginator import Paginator: Importuje klasę Paginator z Django, która służy do paginacji (dzielenia na strony) wyników zapytań.
 - from django.http import JsonResponse: Importuje klasę JsonResponse, która pozwala na zwracanie odpowiedzi w formacie JSON.
 - from django.shortcuts import render, redirect: Importuje funkcje render i redirect, które umożliwiają renderowanie szablonów i przekierowanie użytkownika.
+- from django.views.decorators.http import condition: Importuje dekorator obsługujący żądania warunkowe (If-None-Match, If-Modified-Since) na podstawie nagłówków ETag i Last-Modified.
+- from .feed import feed_context, feed_paginator, news_last_modified, news_version: Importuje kanał aktualności ról z pamięci podręcznej, paginator starszych wiadomości roli oraz wersję aktualności, używaną jako ETag i Last-Modified.
 - from .models import News: Importuje model News z bieżącego modułu, aby móc pracować z danymi w widokach.
+- from kirismor.db_router import replica_reads: Importuje dekorator kierujący odczyty widoku do repliki bazy danych.
+- from kirismor.page_cache import cache_anonymous_page: Importuje dekorator zapisujący w pamięci podręcznej strony wyświetlane anonimowym użytkownikom.
+- from kirismor.pagination import CountedPaginator, CursorPaginator, CURSOR_PARAM, attach_cursor_urls, cursor_json, is_cursor_request: Importuje paginację kursorową (keyset), używaną zamiast numerów stron, gdy żądanie zawiera parametr 'cursor'.
 """
 
 
@@ -16,6 +24,9 @@ def news_list_view(request):
     """
     Widok dla wyświetlania listy wiadomości dla zalogowanego użytkownika.
 
+    Pierwsza strona to kanał aktualności roli z pamięci podręcznej (news.feed); starsze wiadomości (parametr
+    'cursor' z adresu kanału) są pobierane z bazy danych paginacją kursorową.
+
     Args:
         request (HttpRequest): Obiekt reprezentujący żądanie HTTP.
 
@@ -24,16 +35,40 @@ def news_list_view(request):
     """
     if request.user.is_authenticated:
         role = request.user.role
-        news_list = News.objects.filter(role=role).order_by('-date_posted')
-        return render(request, 'dashboard/dashboard.html', {'news_list': news_list, 'role': role})
+        cursor = request.GET.get(CURSOR_PARAM)
+        if not cursor:
+            return render(request, 'dashboard/dashboard.html', {'role': role, **feed_context(role)})
+        page_obj = attach_cursor_urls(feed_paginator(role).page(cursor), request)
+        return render(request, 'dashboard/dashboard.html', {
+            'role': role,
+            'news_list': page_obj,
+            'news_next_url': page_obj.next_url,
+            'news_previous_url': page_obj.previous_url,
+        })
     else:
         return redirect('news:all_news_view')
 
 
+def _json_etag(request):
+    if request.GET.get('format') == 'json':
+        return str(news_version())
+
+
+def _json_last_modified(request):
+    if request.GET.get('format') == 'json':
+        return news_last_modified()
+
+
+@condition(etag_func=_json_etag, last_modified_func=_json_last_modified)
+@replica_reads
+@cache_anonymous_page('news')
 def all_news_view(request):
     """
     Widok dla wyświetlania listy wszystkich wiadomości z paginacją.
 
+    Odpowiedzi JSON zawierają nagłówki ETag i Last-Modified z wersji aktualności (news.feed.news_version), więc
+    odpytujący klienci otrzymują 304 bez zapytań do bazy danych, dopóki wiadomości się nie zmienią.
+
     Args:
         request (HttpRequest): Obiekt reprezentujący żądanie HTTP.
 
@@ -48,8 +83,13 @@ def all_news_view(request):
     except ValueError:
         page_number = 1
 
-    paginator = Paginator(news_list, 7)  # Pokazuje 7 wiadomości na stronę
-    page_obj = paginator.get_page(page_number)
+    if is_cursor_request(request):
+        # Tryb kursorowy: kolejne strony bez COUNT(*) i OFFSET, z kursorami zamiast numerów stron
+        paginator = CursorPaginator(news_list, 7, ('-date_posted', '-id'))
+        page_obj = attach_cursor_urls(paginator.page(request.GET.get(CURSOR_PARAM)), request)
+    else:
+        paginator = CountedPaginator(news_list, 7, count_key='all_news')  # Pokazuje 7 wiadomości na stronę
+        page_obj = paginator.get_page(page_number)
 
     if request.GET.get('format') == 'json':
         news_data = [
@@ -60,12 +100,20 @@ def all_news_view(request):
             }
             for news in page_obj
         ]
+        if is_cursor_request(request):
+            return JsonResponse({
+                'news': news_data,
+                'has_next': page_obj.has_next(),
+                'has_previous': page_obj.has_previous(),
+                **cursor_json(page_obj)
+            })
         return JsonResponse({
             'news': news_data,
             'page_number': page_obj.number,
             'has_next': page_obj.has_next(),
             'has_previous': page_obj.has_previous(),
-            'total_pages': paginator.num_pages
+            'total_pages': paginator.num_pages,
+            'count_is_exact': paginator.count_is_exact
         })
 
     return render(request, 'news/all_news_list.html', {'page_obj': page_obj, 'paginator': paginator})
@@ -73,6 +121,6 @@ def all_news_view(request):
 
 """
 Funkcje:
-- news_list_view: Funkcja widoku wyświetlająca listę wiadomości dla zalogowanego użytkownika na podstawie jego roli. Jeśli użytkownik nie jest zalogowany, następuje przekierowanie do widoku all_news_view.
-- all_news_view: Funkcja widoku wyświetlająca listę wszystkich wiadomości z paginacją. Jeśli żądanie zawiera parametr 'format' równy 'json', zwraca dane w formacie JSON, w przeciwnym razie renderuje stronę HTML z listą wiadomości.
+- news_list_view: Funkcja widoku wyświetlająca listę wiadomości dla zalogowanego użytkownika na podstawie jego roli (kanał aktualności z pamięci podręcznej, a starsze wiadomości przez kursor). Jeśli użytkownik nie jest zalogowany, następuje przekierowanie do widoku all_news_view.
+- all_news_view: Funkcja widoku wyświetlająca listę wszystkich wiadomości z paginacją. Jeśli żądanie zawiera parametr 'format' równy 'json', zwraca dane w formacie JSON (z obsługą żądań warunkowych), w przeciwnym razie renderuje stronę HTML z listą wiadomości.
 """
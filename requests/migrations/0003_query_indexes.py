@@ -0,0 +1,23 @@
+# Generated by Django 5.0.4 on 2026-10-17 12:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('requests', '0002_alter_jobrequest_recruiter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobrequest',
+            index=models.Index(fields=['employer', '-created_at'], name='jobrequest_employer_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobrequest',
+            index=models.Index(fields=['recruiter', '-created_at'], name='jobrequest_recruiter_idx'),
+        ),
+    ]
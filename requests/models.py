@@ -101,10 +101,16 @@ class JobRequest(models.Model):
     class Meta:
         verbose_name = _('Zapotrzebowanie na pracę')
         verbose_name_plural = _('Zapotrzebowania na pracę')
+        indexes = [
+            models.Index(fields=['employer', '-created_at'], name='jobrequest_employer_idx'),
+            models.Index(fields=['recruiter', '-created_at'], name='jobrequest_recruiter_idx'),
+        ]
         """
         Meta:
         - verbose_name: Tłumaczenie nazwy pojedynczej.
         - verbose_name_plural: Tłumaczenie nazwy mnogiej.
+        - indexes: Indeksy list zapotrzebowań pracodawcy i rekrutera (client_job_request_list_view,
+          recruiter_job_request_list_view), sortowanych od najnowszych.
         """
 
     def __str__(self):
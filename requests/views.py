@@ -1,27 +1,41 @@
 from django.contrib.auth.decorators import login_required
 from django.db.models import Q, Count, Case, When, IntegerField
-from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse_lazy, reverse
 from django.core.paginator import Paginator
 from .models import JobRequest, JobRequestStatusUpdate, FavoriteRecruiter
 from .forms import JobRequestForm, JobRequestStatusUpdateForm
 from accounts.models import RecruiterProfile
+from kirismor.db_router import replica_reads
+from kirismor.pagination import generate_pagination_html, BUTTON_STYLE
+from kirismor.projection import Column, Projection, json_response, truncate
 
 """
 Importy:
 - from django.contrib.auth.decorators import login_required: Importuje dekorator, który wymaga zalogowania się użytkownika, aby uzyskać dostęp do widoku.
 - from django.db.models import Q: Importuje klasę Q do tworzenia złożonych zapytań do bazy danych.
 - from django.db.models import Count, Case, When, IntegerField: Importuje funkcje do agregacji, warunków i tworzenia pól całkowitych w zapytaniach.
-- from django.http import JsonResponse: Importuje klasę JsonResponse, która pozwala na zwracanie odpowiedzi w formacie JSON.
 - from django.shortcuts import render, redirect, get_object_or_404: Importuje funkcje skrótów do renderowania szablonów, przekierowań i uzyskiwania obiektów lub zgłaszania błędu 404.
 - from django.urls import reverse_lazy, reverse: Importuje funkcje do odwracania nazw URL.
 - from django.core.paginator import Paginator: Importuje klasę Paginator do paginacji wyników zapytań.
 - from .models import JobRequest, JobRequestStatusUpdate, FavoriteRecruiter: Importuje modele JobRequest, JobRequestStatusUpdate i FavoriteRecruiter z bieżącego modułu.
 - from .forms import JobRequestForm, JobRequestStatusUpdateForm: Importuje formularze JobRequestForm i JobRequestStatusUpdateForm z bieżącego modułu.
 - from accounts.models import RecruiterProfile: Importuje model RecruiterProfile z modułu 'accounts'.
+- from kirismor.db_router import replica_reads: Importuje dekorator kierujący odczyty widoku do repliki bazy danych.
+- from kirismor.pagination import generate_pagination_html, BUTTON_STYLE: Importuje wspólną funkcję generującą linki paginacji oraz styl przycisków używany na liście rekruterów.
+- from kirismor.projection import Column, Projection, json_response, truncate: Importuje deklaratywną projekcję kolumn dla odpowiedzi AJAX (zapytanie .values() zamiast obiektów modeli) oraz funkcję zwracającą odpowiedź JSON zakodowaną jednokrotnie.
 """
 
+# Kolumny odpowiedzi AJAX listy rekruterów ('is_favorite' to adnotacja zapytania w recruiter_list_view)
+RECRUITER_PROJECTION = Projection(
+    RecruiterProfile,
+    id='user_id',
+    first_name='first_name',
+    last_name='last_name',
+    bio=Column('bio_excerpt', transform=truncate(100)),
+    is_favorite='is_favorite',
+)
+
 
 @login_required
 def client_job_request_list_view(request):
@@ -38,8 +52,10 @@ def client_job_request_list_view(request):
         Pobiera zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (pracodawcą)
         i renderuje stronę z listą zapotrzebowań.
     """
-    job_requests = JobRequest.objects.filter(employer=request.user)
-    # Pobiera wszystkie zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (pracodawcą)
+    job_requests = JobRequest.objects.filter(employer=request.user).select_related(
+        'recruiter__recruiter_profile').order_by('-created_at')
+    # Pobiera wszystkie zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (pracodawcą), od najnowszych,
+    # wraz z rekruterem i jego profilem (jedno zapytanie zamiast dwóch na każde zapotrzebowanie)
 
     return render(request, 'job_requests/client_job_request_list.html', {'job_requests': job_requests})
     # Renderuje szablon 'client_job_request_list.html' z danymi zapotrzebowań pracy
@@ -137,13 +153,14 @@ def recruiter_job_request_list_view(request):
         Pobiera zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (rekruterem)
         i renderuje stronę z listą zapotrzebowań.
     """
-    job_requests = JobRequest.objects.filter(recruiter=request.user)
-    # Pobiera wszystkie zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (rekruterem)
+    job_requests = JobRequest.objects.filter(recruiter=request.user).order_by('-created_at')
+    # Pobiera wszystkie zapotrzebowania pracy powiązane z zalogowanym użytkownikiem (rekruterem), od najnowszych
 
     return render(request, 'job_requests/recruiter_job_request_list.html', {'job_requests': job_requests})
     # Renderuje szablon 'recruiter_job_request_list.html' z danymi zapotrzebowań pracy
 
 
+@replica_reads
 @login_required
 def recruiter_list_view(request):
     """
@@ -174,10 +191,17 @@ def recruiter_list_view(request):
                 output_field=IntegerField(),
             )
         )
-    ).order_by('-is_favorite', 'first_name', 'last_name')
+    ).select_related('user').defer('bio').order_by('-is_favorite', 'first_name', 'last_name')
     # Filtruje rekruterów na podstawie wyszukiwanego zapytania (wyszukując w imieniu i nazwisku),
     # a następnie dodaje adnotację 'is_favorite', która sprawdza, czy bieżący użytkownik dodał rekrutera do ulubionych.
     # Rekruterzy są sortowani według tego, czy są ulubieni, a następnie według imienia i nazwiska.
+    # Konto użytkownika rekrutera (recruiter.user.pk w szablonie) jest pobierane w tym samym zapytaniu.
+    # Pełna biografia nie jest pobierana - lista wyświetla jej skrót (RecruiterProfile.bio_excerpt).
+
+    is_ajax = request.headers.get('x-requested-with') == 'XMLHttpRequest'
+    if is_ajax:
+        recruiters = RECRUITER_PROJECTION.project(recruiters)
+        # Żądanie AJAX pobiera tylko kolumny odpowiedzi JSON (słowniki zamiast obiektów RecruiterProfile)
 
     paginator = Paginator(recruiters, 6)
     # Tworzy obiekt paginatora dla rekruterów, ustawiając 6 rekruterów na stronę
@@ -188,28 +212,14 @@ def recruiter_list_view(request):
     page_obj = paginator.get_page(page_number)
     # Pobiera obiekty rekruterów dla bieżącej strony
 
-    if request.headers.get('x-requested-with') == 'XMLHttpRequest':
+    if is_ajax:
         # Jeśli żądanie jest AJAX, zwraca dane w formacie JSON
-        recruiters_data = []
-        for recruiter in page_obj:
-            recruiter_data = {
-                'id': recruiter.user.id,
-                'first_name': recruiter.first_name,
-                'last_name': recruiter.last_name,
-                'bio': recruiter.bio[:100],
-                'is_favorite': recruiter.is_favorite,
-            }
-            recruiters_data.append(recruiter_data)
-
-        pagination_html = ''
-        if page_obj.has_previous():
-            pagination_html += f'<a class="btn btn-secondary pagination-link" href="?page={page_obj.previous_page_number()}&q={search_query}">Poprzednia</a>'
-        for num in page_obj.paginator.page_range:
-            pagination_html += f'<a class="pagination-link" href="?page={num}&q={search_query}">{num}</a>'
-        if page_obj.has_next():
-            pagination_html += f'<a class="btn btn-secondary ms-auto pagination-link" href="?page={page_obj.next_page_number()}&q={search_query}">Następna</a>'
-
-        return JsonResponse({'recruiters': recruiters_data, 'pagination': pagination_html})
+        recruiters_data = RECRUITER_PROJECTION.rows(page_obj)
+
+        pagination_html = generate_pagination_html(page_obj, {'q': search_query}, style=BUTTON_STYLE,
+                                                   previous_label='Poprzednia', next_label='Następna')
+
+        return json_response({'recruiters': recruiters_data, 'pagination': pagination_html})
 
     return render(request, 'job_requests/recruiter_list.html', {
         'page_obj': page_obj,
@@ -344,8 +354,8 @@ def client_job_request_detail_view(request, pk):
     job_request = get_object_or_404(JobRequest, pk=pk)
     # Pobiera obiekt JobRequest z bazy danych na podstawie klucza głównego (pk) lub zwraca błąd 404, jeśli nie istnieje
 
-    status_updates = JobRequestStatusUpdate.objects.filter(job_request=job_request)
-    # Pobiera wszystkie aktualizacje statusu powiązane z tym zapotrzebowaniem
+    status_updates = JobRequestStatusUpdate.objects.filter(job_request=job_request).select_related('updated_by')
+    # Pobiera wszystkie aktualizacje statusu powiązane z tym zapotrzebowaniem wraz z autorami aktualizacji
 
     return render(request, 'job_requests/client_job_request_detail.html', {
         'job_request': job_request,
@@ -23,12 +23,12 @@ document.addEventListener('DOMContentLoaded', function () {
     function updateRecruitersUI(data) {
         const container = document.querySelector('#recruiters-container');
         // Generowanie kodu HTML dla listy rekruterów
-        container.innerHTML = JSON.parse(data.recruiters).map(item => `
+        container.innerHTML = data.recruiters.map(item => `
             <li class="list-group-item d-flex align-items-center p-4 mb-4 shadow-lg rounded border-0">
-                <img src="${item.fields.photo || '/static/images/recruiter.png'}" class="rounded-circle me-4 border border-primary" style="width: 85px; height: 85px; object-fit: cover;" alt="">
+                <img src="${item.photo || '/static/images/recruiter.png'}" class="rounded-circle me-4 border border-primary" style="width: 85px; height: 85px; object-fit: cover;" alt="">
                 <div>
-                    <h4 class="fw-bold text-primary mb-2">${item.fields.first_name} ${item.fields.last_name}</h4>
-                    <p class="text-muted">${item.fields.bio}</p>
+                    <h4 class="fw-bold text-primary mb-2">${item.first_name} ${item.last_name}</h4>
+                    <p class="text-muted">${item.bio}</p>
                 </div>
             </li>
         `).join('');
@@ -40,12 +40,12 @@ document.addEventListener('DOMContentLoaded', function () {
     function updateClientsUI(data) {
         const container = document.querySelector('#clients-container');
         // Generowanie kodu HTML dla listy klientów
-        container.innerHTML = JSON.parse(data.clients).map(item => `
+        container.innerHTML = data.clients.map(item => `
             <li class="list-group-item d-flex align-items-center p-4 mb-4 shadow-lg rounded border-0">
-                <img src="${item.fields.photo || '/static/images/Icon_2.png'}" class="rounded-circle me-4 border border-primary" style="width: 85px; height: 85px; object-fit: cover;" alt="">
+                <img src="${item.photo || '/static/images/Icon_2.png'}" class="rounded-circle me-4 border border-primary" style="width: 85px; height: 85px; object-fit: cover;" alt="">
                 <div>
-                    <h4 class="fw-bold text-primary mb-2">${item.fields.company_name}</h4>
-                    <p class="text-muted">${item.fields.bio}</p>
+                    <h4 class="fw-bold text-primary mb-2">${item.company_name}</h4>
+                    <p class="text-muted">${item.bio}</p>
                 </div>
             </li>
         `).join('');
@@ -0,0 +1,47 @@
+// JavaScript do przełączania polubień i ulubionych ofert pracy bez przeładowania strony
+document.addEventListener('DOMContentLoaded', function() {
+    const jobList = document.getElementById('job-list');
+    if (!jobList) {
+        return;
+    }
+    const csrfToken = jobList.dataset.csrfToken; // Token CSRF wymagany dla żądań POST
+
+    jobList.addEventListener('click', function(event) {
+        const button = event.target.closest('.reaction-toggle');
+        if (!button) {
+            return;
+        }
+        event.preventDefault(); // Zapobieganie przejściu pod adres linka (wersja bez JavaScriptu)
+        if (button.dataset.pending) {
+            return; // Ignorowanie kolejnych kliknięć, dopóki serwer nie odpowie
+        }
+        button.dataset.pending = '1';
+
+        // Wysyłamy docelowy stan zamiast prośby o przełączenie, więc powtórzone żądanie niczego nie odwraca
+        const body = new URLSearchParams({'active': button.dataset.active === '1' ? '0' : '1'});
+        fetch(button.dataset.url, {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrfToken},
+            body: body,
+        })
+            .then(function(response) {
+                if (!response.ok) {
+                    throw new Error(response.statusText);
+                }
+                return response.json();
+            })
+            .then(function(data) {
+                // Aktualizacja etykiety i licznika na podstawie odpowiedzi serwera
+                button.dataset.active = data.active ? '1' : '0';
+                button.querySelector('.reaction-label').textContent =
+                    data.active ? button.dataset.labelActive : button.dataset.labelInactive;
+                button.querySelector('.reaction-count').textContent = data.count;
+            })
+            .catch(function(error) {
+                console.error(error);
+            })
+            .finally(function() {
+                delete button.dataset.pending;
+            });
+    });
+});